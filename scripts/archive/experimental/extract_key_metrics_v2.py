@@ -3,7 +3,7 @@
 Phase 2 (ENHANCED v2.0): Targeted Section Extraction
 
 Implements all four optimizations:
-1. ✅ Grep-based section indexing (0 LLM tokens)
+1. ✅ Single-pass section indexing (0 LLM tokens)
 2. ✅ Section-by-section extraction with validation
 3. ✅ Progressive enhancement (expand reads if data missing)
 4. ✅ Checkpointing for resumable extraction
@@ -184,7 +184,7 @@ def create_extraction_roadmap(
     print("=" * 70)
 
     # Phase 2a: Create index (0 tokens)
-    print("\n📍 Phase 2a: Creating section index (grep-based, 0 tokens)...")
+    print("\n📍 Phase 2a: Creating section index (single-pass scan, 0 tokens)...")
     indexer = ExtractionIndexer(markdown_files)
 
     # Check for cached index
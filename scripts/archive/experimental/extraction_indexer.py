@@ -2,23 +2,42 @@
 """
 Phase 2 Enhancement: Section Indexing and Targeted Extraction
 
-Implements grep-based section discovery to enable:
+Implements in-process section discovery to enable:
 1. Minimal token usage (read only needed sections)
 2. No context window issues (never read entire files)
 3. Guaranteed accuracy (read complete sections)
 4. Progressive enhancement (expand if data missing)
 5. Checkpointing (resume failed extractions)
 
+Each markdown file is memory-mapped and scanned once: a single compiled
+regex (the alternation of every section marker) finds candidate lines, and
+only those lines are tested against the individual markers. Matches keep
+grep -n -i -E semantics (first matching line per marker, markers never span
+lines) and record line numbers and byte offsets. Scan results are persisted
+next to the markdown (<file>.sections.json) and reused while the file is
+unchanged, and sections are read back directly from their byte ranges.
+
 Token reduction: ~140K → ~15K (89% reduction)
 """
 
+import hashlib
 import json
-import subprocess
+import mmap
+import os
 import re
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
+# Scan results are stored next to each markdown file as <file>.sections.json
+SCAN_SUFFIX = '.sections.json'
+SCAN_FORMAT = 1
+
+# Bytes of the mapped file lowercased and scanned at a time (cut at a line end)
+_SCAN_BLOCK = 1024 * 1024
+
 
 @dataclass
 class SectionLocation:
@@ -28,6 +47,8 @@ class SectionLocation:
     end_line: int
     section_name: str
     estimated_tokens: int
+    start_offset: Optional[int] = None   # byte offset of start_line
+    end_offset: Optional[int] = None     # byte offset just past end_line (clipped to the file)
 
     @property
     def length(self) -> int:
@@ -39,7 +60,7 @@ class ExtractionIndexer:
     """
     Creates an index of where financial data sections are located in markdown files.
 
-    Uses grep to find sections without reading files (0 LLM tokens).
+    Scans files in-process without reading them into the LLM (0 LLM tokens).
     Enables targeted reads of only the needed sections.
     """
 
@@ -47,17 +68,17 @@ class ExtractionIndexer:
     SECTION_MARKERS = {
         'balance_sheet': [
             'Consolidated Balance Sheet',
-            'Statement of Financial Position',
+            'Statements? of Financial Position',
             'Balance Sheet'
         ],
         'income_statement': [
             'Consolidated Statement.*Operations',
-            'Statement of.*Income',
-            'Statement of Operations'
+            'Statements? of.*Income',
+            'Statements? of Operations'
         ],
         'cash_flow': [
             'Consolidated Statement.*Cash Flow',
-            'Statement of Cash Flow',
+            'Statements? of Cash Flows?',
             'Cash Flow Statement'
         ],
         'ffo_affo': [
@@ -97,10 +118,11 @@ class ExtractionIndexer:
         self.markdown_files = [Path(f) for f in markdown_files]
         self.index: Dict[str, SectionLocation] = {}
         self.checkpoint_dir: Optional[Path] = None
+        self._scans: Dict[Path, Dict] = {}
 
     def create_index(self, save_to: Optional[Path] = None) -> Dict[str, SectionLocation]:
         """
-        Create section index using grep (0 LLM tokens)
+        Create section index with one scan per file (0 LLM tokens)
 
         Args:
             save_to: Optional path to save index JSON
@@ -125,54 +147,103 @@ class ExtractionIndexer:
         print(f"\n✅ Index created: {len(self.index)}/{len(self.SECTION_MARKERS)} sections found\n")
         return self.index
 
+    def scan_file(self, md_file: Path) -> Dict:
+        """
+        Marker matches for one file, from its persisted scan when still current
+
+        Args:
+            md_file: Markdown file
+
+        Returns:
+            scan_markdown() result
+        """
+        md_file = Path(md_file)
+        if md_file in self._scans:
+            return self._scans[md_file]
+
+        stat = md_file.stat()
+        markers_digest = markers_fingerprint(self.SECTION_MARKERS)
+        scan_path = md_file.with_name(md_file.name + SCAN_SUFFIX)
+        scan = None
+        try:
+            with open(scan_path, 'r') as f:
+                scan = json.load(f)
+            if (scan.get('format'), scan.get('size'), scan.get('mtime_ns'), scan.get('markers')) != \
+                    (SCAN_FORMAT, stat.st_size, stat.st_mtime_ns, markers_digest):
+                scan = None
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        if scan is None:
+            scan = scan_markdown(md_file, self.SECTION_MARKERS)
+            scan.update(format=SCAN_FORMAT, size=stat.st_size, mtime_ns=stat.st_mtime_ns, markers=markers_digest)
+            _write_json_atomic(scan_path, scan)
+
+        self._scans[md_file] = scan
+        return scan
+
+    def locate(self, section_name: str) -> Optional[SectionLocation]:
+        """
+        Location of one section, without building (or printing) the full index
+
+        Args:
+            section_name: Key of SECTION_MARKERS
+
+        Returns:
+            SectionLocation if found, None otherwise
+        """
+        if section_name not in self.index:
+            location = self._find_section(section_name, self.SECTION_MARKERS[section_name])
+            if location is None:
+                return None
+            self.index[section_name] = location
+        return self.index[section_name]
+
     def _find_section(self, section_name: str, patterns: List[str]) -> Optional[SectionLocation]:
         """
-        Find a section using grep patterns
+        Find a section from the per-file marker scans
+
+        Files are tried in order and, within a file, markers in order; the
+        first line matching the first marker found is the section start (the
+        order the previous one-grep-per-marker search used).
 
         Args:
             section_name: Name of section to find
-            patterns: List of regex patterns to search for
+            patterns: List of regex patterns to search for (SECTION_MARKERS entry)
 
         Returns:
             SectionLocation if found, None otherwise
         """
         for md_file in self.markdown_files:
-            for pattern in patterns:
-                try:
-                    # Use grep to find the pattern
-                    result = subprocess.run(
-                        ['grep', '-n', '-i', '-E', pattern, str(md_file)],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-
-                    if result.returncode == 0 and result.stdout:
-                        # Found it! Get the line number
-                        first_match = result.stdout.split('\n')[0]
-                        line_num = int(first_match.split(':')[0])
-
-                        # Estimate section end (read ahead to find boundary)
-                        end_line = self._estimate_section_end(md_file, line_num, section_name)
-
-                        # Estimate tokens (rough: 2.5 chars per token)
-                        section_length = end_line - line_num
-                        estimated_tokens = int(section_length * 100 / 2.5)  # Assume 100 chars/line avg
-
-                        return SectionLocation(
-                            file=md_file,
-                            start_line=line_num,
-                            end_line=end_line,
-                            section_name=section_name,
-                            estimated_tokens=estimated_tokens
-                        )
-
-                except subprocess.TimeoutExpired:
-                    print(f"   ⚠ Timeout searching for {pattern} in {md_file.name}")
-                    continue
-                except Exception as e:
-                    print(f"   ⚠ Error searching {pattern}: {e}")
+            try:
+                matches = self.scan_file(md_file)['matches'].get(section_name, {})
+            except OSError as e:
+                print(f"   ⚠ Error scanning {md_file.name}: {e}")
+                continue
+
+            for pattern_index in range(len(patterns)):
+                match = matches.get(str(pattern_index))
+                if match is None:
                     continue
+                line_num, start_offset = match
+
+                # Estimate section end (read ahead to find boundary)
+                with _mapped(md_file) as data:
+                    end_line, end_offset = _section_bounds(data, line_num, start_offset, section_name)
+
+                # Estimate tokens (rough: 2.5 chars per token)
+                section_length = end_line - line_num
+                estimated_tokens = int(section_length * 100 / 2.5)  # Assume 100 chars/line avg
+
+                return SectionLocation(
+                    file=md_file,
+                    start_line=line_num,
+                    end_line=end_line,
+                    section_name=section_name,
+                    estimated_tokens=estimated_tokens,
+                    start_offset=start_offset,
+                    end_offset=end_offset
+                )
 
         return None
 
@@ -188,49 +259,34 @@ class ExtractionIndexer:
         Returns:
             Estimated end line number
         """
-        # Default lengths for different section types
-        DEFAULT_LENGTHS = {
-            'balance_sheet': 150,
-            'income_statement': 120,
-            'cash_flow': 150,
-            'ffo_affo': 250,
-            'portfolio': 200,
-            'dilution': 100,
-            'debt_schedule': 150,
-            'liquidity': 80
-        }
-
-        default_length = DEFAULT_LENGTHS.get(section_name, 100)
-
-        # Read a chunk to find the actual boundary
         try:
-            with open(file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Look for section boundaries (markdown headers, horizontal rules, page breaks)
-            search_end = min(start_line + default_length + 50, len(lines))
-
-            for i in range(start_line, search_end):
-                line = lines[i].strip()
-
-                # Check for section boundaries
-                if i > start_line + 20:  # Don't end too early
-                    # Markdown section header
-                    if line.startswith('##') and not line.startswith('###'):
-                        return i - 1
-                    # Horizontal rule
-                    if line == '---' or line.startswith('---'):
-                        return i - 1
-                    # Page break
-                    if '<!-- Page' in line:
-                        return i - 1
-
-            # No boundary found, use default
-            return start_line + default_length
-
+            with _mapped(file) as data:
+                start_offset = _line_offset(data, 0, 1, start_line)
+                return _section_bounds(data, start_line, start_offset, section_name)[0]
         except Exception as e:
             print(f"   ⚠ Error estimating section end: {e}")
-            return start_line + default_length
+            return start_line + DEFAULT_SECTION_LENGTHS.get(section_name, 100)
+
+    def read_section(self, location: SectionLocation, expand_by: int = 0) -> str:
+        """
+        Read a section's lines, from its byte range when known
+
+        Args:
+            location: Section location
+            expand_by: Number of additional lines to read past end_line
+
+        Returns:
+            Section content (lines start_line..end_line + expand_by)
+        """
+        with _mapped(location.file) as data:
+            if location.start_offset is None or location.end_offset is None:
+                start = _line_offset(data, 0, 1, location.start_line)
+                end = _line_offset(data, start, location.start_line, location.end_line + 1)
+            else:
+                start, end = location.start_offset, location.end_offset
+            if expand_by:
+                end = _skip_lines(data, end, expand_by)
+            return bytes(data[start:end]).decode('utf-8')
 
     def _save_index(self, path: Path):
         """Save index to JSON file"""
@@ -240,7 +296,9 @@ class ExtractionIndexer:
                 'start_line': loc.start_line,
                 'end_line': loc.end_line,
                 'length': loc.length,
-                'estimated_tokens': loc.estimated_tokens
+                'estimated_tokens': loc.estimated_tokens,
+                'start_offset': loc.start_offset,
+                'end_offset': loc.end_offset
             }
             for name, loc in self.index.items()
         }
@@ -274,7 +332,9 @@ class ExtractionIndexer:
                 start_line=loc_dict['start_line'],
                 end_line=loc_dict['end_line'],
                 section_name=name,
-                estimated_tokens=loc_dict['estimated_tokens']
+                estimated_tokens=loc_dict['estimated_tokens'],
+                start_offset=loc_dict.get('start_offset'),
+                end_offset=loc_dict.get('end_offset')
             )
 
         print(f"✅ Index loaded: {len(indexer.index)} sections")
@@ -316,6 +376,188 @@ class ExtractionIndexer:
                 f.unlink()
 
 
+# Default section lengths (lines) when no boundary is found
+DEFAULT_SECTION_LENGTHS = {
+    'balance_sheet': 150,
+    'income_statement': 120,
+    'cash_flow': 150,
+    'ffo_affo': 250,
+    'portfolio': 200,
+    'dilution': 100,
+    'debt_schedule': 150,
+    'liquidity': 80
+}
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator:
+    """Read-only memory map of a file (empty bytes for an empty file)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def _skip_lines(data, offset: int, lines: int) -> int:
+    """Offset just past `lines` more lines from offset (clipped to the end of data)."""
+    for _ in range(lines):
+        newline = data.find(b'\n', offset)
+        if newline == -1:
+            return len(data)
+        offset = newline + 1
+    return offset
+
+
+def _line_offset(data, offset: int, line: int, target_line: int) -> int:
+    """Byte offset of target_line, walking forward from line (which starts at offset)."""
+    return _skip_lines(data, offset, max(0, target_line - line))
+
+
+def markers_fingerprint(markers: Dict[str, List[str]]) -> str:
+    """Digest of a section marker vocabulary (persisted scans are only reused for the same markers)."""
+    return hashlib.sha256(json.dumps(markers, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def _lower_pattern(pattern: str) -> str:
+    """Lowercase a marker's literals, leaving escapes (\\B, \\S, \\W, ...) intact."""
+    return re.sub(r'\\.|[^\\]+', lambda m: m.group(0) if m.group(0).startswith('\\') else m.group(0).lower(),
+                  pattern)
+
+
+def compile_markers(markers: Dict[str, List[str]]) -> Tuple[re.Pattern, Dict[str, List[re.Pattern]]]:
+    """
+    Compile section markers for a scan of lowercased bytes
+
+    Matching lowercased text with lowercased markers is grep -i for ASCII
+    markers, and several times faster in re than re.IGNORECASE.
+
+    Args:
+        markers: Section name -> marker regexes (grep -E syntax)
+
+    Returns:
+        (combined, per_section): one alternation of every marker, and each
+        section's individually compiled markers
+    """
+    per_section = {section: [re.compile(_lower_pattern(pattern).encode('utf-8')) for pattern in patterns]
+                   for section, patterns in markers.items()}
+    combined = re.compile(b'|'.join(b'(?:' + pattern.pattern + b')'
+                                    for patterns in per_section.values() for pattern in patterns))
+    return combined, per_section
+
+
+def scan_markdown(path: Path, markers: Dict[str, List[str]]) -> Dict:
+    """
+    Find the first line matching each section marker in one pass over a file
+
+    The mapped file is lowercased a block at a time and searched with the
+    combined marker regex; only candidate lines are tested against the
+    individual markers, since one marker's match can hide another's on the
+    same line. Markers never span lines ('.' does not match a newline).
+
+    Args:
+        path: Markdown file
+        markers: Section name -> marker regexes (grep -E syntax)
+
+    Returns:
+        dict with lines (line count) and matches: section -> {marker index
+        (str): [line number (1-based), byte offset of that line]}
+    """
+    combined, per_section = compile_markers(markers)
+    matches: Dict[str, Dict[str, List[int]]] = {section: {} for section in per_section}
+    remaining = sum(len(patterns) for patterns in per_section.values())
+    newlines = 0
+
+    with _mapped(path) as data:
+        size = len(data)
+        block_start = 0
+        while block_start < size:
+            block_end = data.find(b'\n', min(block_start + _SCAN_BLOCK, size) - 1)
+            block_end = size if block_end == -1 else block_end + 1
+            block = data[block_start:block_end]
+            block = block.lower() if remaining else block
+
+            pos = counted = 0
+            while remaining:
+                match = combined.search(block, pos)
+                if match is None:
+                    break
+                line_start = block.rfind(b'\n', 0, match.start()) + 1
+                line_end = block.find(b'\n', match.start())
+                line_end = len(block) if line_end == -1 else line_end
+                newlines += block.count(b'\n', counted, line_start)
+                counted = line_start
+
+                text = block[line_start:line_end]
+                for section, patterns in per_section.items():
+                    for index, pattern in enumerate(patterns):
+                        if str(index) not in matches[section] and pattern.search(text):
+                            matches[section][str(index)] = [newlines + 1, block_start + line_start]
+                            remaining -= 1
+                pos = line_end + 1
+
+            newlines += block.count(b'\n', counted)
+            block_start = block_end
+
+        line_count = newlines + (1 if size and data[size - 1:size] != b'\n' else 0)
+
+    return {'lines': line_count, 'matches': {section: m for section, m in matches.items() if m}}
+
+
+def _section_bounds(data, start_line: int, start_offset: int, section_name: str) -> Tuple[int, int]:
+    """
+    End line and end byte offset of a section starting at start_line
+
+    Ends two lines before the first markdown header (##), horizontal rule or
+    page-break comment more than 20 lines past the start, searching up to
+    the section's default length plus 50 lines; otherwise the default
+    length applies.
+
+    Returns:
+        (end_line, end_offset) where end_offset is just past end_line
+        (clipped to the end of the file)
+    """
+    default_length = DEFAULT_SECTION_LENGTHS.get(section_name, 100)
+    size = len(data)
+
+    # Walk line i (0-based, as in readlines()) from the line after start_line
+    offsets = {start_line: start_offset}    # 1-based line -> start offset
+    offset = _skip_lines(data, start_offset, 1)
+    i = start_line
+    while i < start_line + default_length + 50 and offset < size:
+        offsets[i + 1] = offset
+        newline = data.find(b'\n', offset)
+        line_end = size if newline == -1 else newline
+        text = bytes(data[offset:line_end]).decode('utf-8', errors='replace').strip()
+
+        if i > start_line + 20:  # Don't end too early
+            if (text.startswith('##') and not text.startswith('###')) or text.startswith('---') \
+                    or '<!-- Page' in text:
+                return i - 1, offsets[i]
+
+        offset = size if newline == -1 else newline + 1
+        i += 1
+
+    end_line = start_line + default_length
+    return end_line, _line_offset(data, start_offset, start_line, end_line + 1)
+
+
+def _write_json_atomic(path: Path, payload: Dict) -> None:
+    """Write JSON next to the markdown; an unwritable directory only disables persistence."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
 def main():
     """Test the indexer"""
     import sys
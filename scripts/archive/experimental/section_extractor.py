@@ -20,6 +20,52 @@ from dataclasses import dataclass, field
 from extraction_indexer import ExtractionIndexer, SectionLocation
 
 
+# Row-label patterns per balance sheet field, tried in order (find_row_by_label)
+BALANCE_SHEET_LABELS: Dict[str, List[str]] = {
+    'total_assets': [
+        r'total assets',
+        r'total.*assets'
+    ],
+    'cash': [
+        r'^cash$',
+        r'cash and.*equivalents',
+        r'cash.*restricted'
+    ],
+    'mortgages_noncurrent': [
+        r'mortgages.*payable.*non',
+        r'mortgages.*non.*current',
+        r'long.*term.*mortgages'
+    ],
+    'mortgages_current': [
+        r'mortgages.*payable.*current',
+        r'mortgages.*current',
+        r'current.*portion.*mortgages'
+    ],
+    'credit_facilities': [
+        r'credit.*facilit',
+        r'line.*of.*credit',
+        r'revolv.*credit'
+    ],
+    'total_liabilities': [
+        r'total.*liabilit'
+    ],
+    'total_unitholders_equity': [
+        r'total.*unitholders.*equity',
+        r'total.*shareholders.*equity',
+        r'total.*equity'
+    ],
+    'common_units_outstanding': [
+        r'units.*outstanding',
+        r'common.*units',
+        r'weighted.*average.*basic'
+    ],
+    'diluted_units_outstanding': [
+        r'diluted.*units',
+        r'weighted.*average.*diluted'
+    ],
+}
+
+
 @dataclass
 class ExtractionResult:
     """Result of extracting a section"""
@@ -301,7 +347,7 @@ class SectionExtractor:
 
     def read_section(self, location: SectionLocation, expand_by: int = 0) -> str:
         """
-        Read a section from markdown file
+        Read a section from markdown file (its indexed byte range)
 
         Args:
             location: Section location
@@ -311,18 +357,7 @@ class SectionExtractor:
             Section content as string
         """
         try:
-            with open(location.file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Calculate read range
-            start = location.start_line - 1  # 0-indexed
-            end = location.end_line + expand_by
-
-            # Read the section
-            section_lines = lines[start:end]
-            content = ''.join(section_lines)
-
-            return content
+            return self.indexer.read_section(location, expand_by=expand_by)
 
         except Exception as e:
             print(f"   ❌ Error reading section {location.section_name}: {e}")
@@ -345,82 +380,10 @@ class SectionExtractor:
         # Extract balance sheet items
         data = {}
 
-        # Assets
-        total_assets_row = util.find_row_by_label(rows, [
-            r'total assets',
-            r'total.*assets'
-        ])
-        if total_assets_row:
-            data['total_assets'] = util.extract_value_from_row(total_assets_row)
-
-        # Cash
-        cash_row = util.find_row_by_label(rows, [
-            r'^cash$',
-            r'cash and.*equivalents',
-            r'cash.*restricted'
-        ])
-        if cash_row:
-            data['cash'] = util.extract_value_from_row(cash_row)
-
-        # Mortgages (noncurrent)
-        mortgages_nc_row = util.find_row_by_label(rows, [
-            r'mortgages.*payable.*non',
-            r'mortgages.*non.*current',
-            r'long.*term.*mortgages'
-        ])
-        if mortgages_nc_row:
-            data['mortgages_noncurrent'] = util.extract_value_from_row(mortgages_nc_row)
-
-        # Mortgages (current)
-        mortgages_c_row = util.find_row_by_label(rows, [
-            r'mortgages.*payable.*current',
-            r'mortgages.*current',
-            r'current.*portion.*mortgages'
-        ])
-        if mortgages_c_row:
-            data['mortgages_current'] = util.extract_value_from_row(mortgages_c_row)
-
-        # Credit facilities
-        credit_row = util.find_row_by_label(rows, [
-            r'credit.*facilit',
-            r'line.*of.*credit',
-            r'revolv.*credit'
-        ])
-        if credit_row:
-            data['credit_facilities'] = util.extract_value_from_row(credit_row)
-
-        # Liabilities
-        total_liab_row = util.find_row_by_label(rows, [
-            r'total.*liabilit'
-        ])
-        if total_liab_row:
-            data['total_liabilities'] = util.extract_value_from_row(total_liab_row)
-
-        # Equity
-        equity_row = util.find_row_by_label(rows, [
-            r'total.*unitholders.*equity',
-            r'total.*shareholders.*equity',
-            r'total.*equity'
-        ])
-        if equity_row:
-            data['total_unitholders_equity'] = util.extract_value_from_row(equity_row)
-
-        # Units outstanding
-        units_row = util.find_row_by_label(rows, [
-            r'units.*outstanding',
-            r'common.*units',
-            r'weighted.*average.*basic'
-        ])
-        if units_row:
-            data['common_units_outstanding'] = util.extract_value_from_row(units_row)
-
-        # Diluted units
-        diluted_row = util.find_row_by_label(rows, [
-            r'diluted.*units',
-            r'weighted.*average.*diluted'
-        ])
-        if diluted_row:
-            data['diluted_units_outstanding'] = util.extract_value_from_row(diluted_row)
+        for field_name, label_patterns in BALANCE_SHEET_LABELS.items():
+            row = util.find_row_by_label(rows, label_patterns)
+            if row:
+                data[field_name] = util.extract_value_from_row(row)
 
         # Validate
         is_valid, errors, warnings = self.validator.validate_balance_sheet(data)
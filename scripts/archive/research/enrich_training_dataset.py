@@ -11,6 +11,12 @@ Usage:
       --input data/training_dataset_v2_base.csv \
       --output data/training_dataset_v2_enriched.csv \
       --lookback-months 3
+
+    # Market features from the local price store via the rolling panel
+    # (one vectorized pass instead of one price download per observation)
+    python scripts/enrich_training_dataset.py \
+      --input data/training_dataset_v2_base.csv \
+      --price-store .cache/price_store
 """
 
 import argparse
@@ -26,6 +32,7 @@ import time
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 try:
     from openbb import obb
@@ -38,15 +45,19 @@ except ImportError:
 class TrainingDatasetEnricher:
     """Enrich training dataset with historical market and macro features."""
 
-    def __init__(self, lookback_months: int = 3):
+    def __init__(self, lookback_months: int = 3, market_panel: Optional[pd.DataFrame] = None):
         """
         Initialize enricher.
 
         Args:
             lookback_months: Months before cut to observe features (default: 3)
                            This creates a lead time for early warning
+            market_panel: Output of market_risk_panel.build_market_risk_panel();
+                          when given, market features are looked up by
+                          (ticker, observation date) instead of downloaded
         """
         self.lookback_months = lookback_months
+        self.market_panel = market_panel
 
     def enrich_dataset(self, input_path: Path, output_path: Path):
         """
@@ -82,6 +93,15 @@ class TrainingDatasetEnricher:
         for col in market_features + macro_features:
             df[col] = None
 
+        # Point-in-time market features for all observations in one lookup
+        panel_features = None
+        if self.market_panel is not None:
+            from market_risk_panel import features_as_of
+            panel_features = features_as_of(
+                self.market_panel, df[['ticker', 'observation_date']],
+                date_column='observation_date'
+            ).set_index(df.index)
+
         # Enrich each observation
         for idx, row in df.iterrows():
             ticker = row['ticker']
@@ -92,7 +112,10 @@ class TrainingDatasetEnricher:
                   f"→ Observe {obs_date.strftime('%Y-%m')} ({self.lookback_months}mo prior)")
 
             # Get market risk features
-            market_data = self._get_historical_market_risk(ticker, obs_date)
+            if panel_features is not None:
+                market_data = self._market_risk_from_panel(panel_features.loc[idx])
+            else:
+                market_data = self._get_historical_market_risk(ticker, obs_date)
             if market_data:
                 df.loc[idx, 'market_price_stress_pct'] = market_data.get('price_stress_pct')
                 df.loc[idx, 'market_risk_score'] = market_data.get('risk_score')
@@ -117,8 +140,9 @@ class TrainingDatasetEnricher:
             else:
                 print(f"  ✗ Macro data unavailable")
 
-            # Rate limit to avoid overwhelming APIs
-            time.sleep(1)
+            # Rate limit the market data API (panel features come from the local price store)
+            if panel_features is None:
+                time.sleep(1)
 
         # Save enriched dataset
         print(f"\n✓ Saving enriched dataset to {output_path}...")
@@ -184,36 +208,63 @@ class TrainingDatasetEnricher:
             else:
                 momentum_3m = None
 
-            # Risk score (0-100 composite)
-            stress_points = min(price_stress_pct * 1.33, 40)  # 40% max
-            vol_points = min(volatility_90d * 0.75, 30)        # 30% max
-            momentum_points = max(0, -momentum_3m * 0.6) if momentum_3m else 15  # 30% max
-            risk_score = int(stress_points + vol_points + momentum_points)
-
-            # Risk level
-            if risk_score >= 70:
-                risk_level = "VERY HIGH"
-            elif risk_score >= 50:
-                risk_level = "HIGH"
-            elif risk_score >= 30:
-                risk_level = "MODERATE"
-            elif risk_score >= 15:
-                risk_level = "LOW"
-            else:
-                risk_level = "VERY LOW"
-
-            return {
-                'price_stress_pct': round(price_stress_pct, 1),
-                'risk_score': risk_score,
-                'volatility_90d': round(volatility_90d, 1),
-                'momentum_3m': round(momentum_3m, 1) if momentum_3m else None,
-                'risk_level': risk_level
-            }
+            return self._score_market_risk(price_stress_pct, volatility_90d, momentum_3m)
 
         except Exception as e:
             print(f"    ERROR: {str(e)[:100]}")
             return None
 
+    def _market_risk_from_panel(self, features: pd.Series) -> Optional[Dict]:
+        """
+        Market risk metrics from a market_risk_panel row (as of observation date).
+
+        Args:
+            features: Row of market_risk_panel.features_as_of()
+
+        Returns:
+            Dictionary with market risk metrics, or None if unavailable
+        """
+        if pd.isna(features.get('panel_date')) or features.get('history_days', 0) < 90:
+            return None
+
+        momentum_3m = features.get('momentum_3_month_pct')
+        return self._score_market_risk(
+            features['decline_from_peak_pct'],
+            features['volatility_90d_pct'],
+            None if pd.isna(momentum_3m) else momentum_3m
+        )
+
+    @staticmethod
+    def _score_market_risk(price_stress_pct: float,
+                           volatility_90d: float,
+                           momentum_3m: Optional[float]) -> Dict:
+        """Composite 0-100 market risk score from stress, volatility and momentum."""
+        # Risk score (0-100 composite)
+        stress_points = min(price_stress_pct * 1.33, 40)  # 40% max
+        vol_points = min(volatility_90d * 0.75, 30)        # 30% max
+        momentum_points = max(0, -momentum_3m * 0.6) if momentum_3m else 15  # 30% max
+        risk_score = int(stress_points + vol_points + momentum_points)
+
+        # Risk level
+        if risk_score >= 70:
+            risk_level = "VERY HIGH"
+        elif risk_score >= 50:
+            risk_level = "HIGH"
+        elif risk_score >= 30:
+            risk_level = "MODERATE"
+        elif risk_score >= 15:
+            risk_level = "LOW"
+        else:
+            risk_level = "VERY LOW"
+
+        return {
+            'price_stress_pct': round(price_stress_pct, 1),
+            'risk_score': risk_score,
+            'volatility_90d': round(volatility_90d, 1),
+            'momentum_3m': round(momentum_3m, 1) if momentum_3m else None,
+            'risk_level': risk_level
+        }
+
     def _get_historical_macro(self, obs_date: datetime) -> Optional[Dict]:
         """
         Get macro environment as of observation date.
@@ -367,6 +418,45 @@ class TrainingDatasetEnricher:
         print("\n" + "="*60)
 
 
+def build_panel_from_store(df: pd.DataFrame, store_dir: Path, provider: str,
+                           lookback_months: int) -> pd.DataFrame:
+    """
+    Rolling market-risk panel covering every observation in the dataset.
+
+    Args:
+        df: Base dataset with ticker and cut_date columns
+        store_dir: Price store directory
+        provider: Price provider
+        lookback_months: Months before cut to observe features
+
+    Returns:
+        market_risk_panel.build_market_risk_panel() output
+    """
+    from market_price_store import PriceStore
+    from market_risk_panel import build_market_risk_panel
+
+    fetcher = None
+    if OPENBB_AVAILABLE:
+        from openbb_market_monitor import _fetch_openbb_history as fetcher
+
+    cut_dates = pd.to_datetime(df['cut_date'])
+    start = cut_dates.min() - timedelta(days=lookback_months * 30 + 400)
+    end = cut_dates.max()
+
+    store = PriceStore(store_dir, offline=fetcher is None)
+    prices = {}
+    for ticker in df['ticker'].dropna().unique():
+        try:
+            prices[ticker] = store.get_history(ticker, provider, start, end, fetcher)
+        except Exception as e:
+            print(f"  WARNING: {ticker}: {str(e)[:100]} (using stored prices)")
+            prices[ticker] = store.load(ticker, provider, start, end)
+
+    panel = build_market_risk_panel(prices)
+    print(f"  Market risk panel: {panel['ticker'].nunique()} tickers, {len(panel)} rows")
+    return panel
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Enrich training dataset with market risk and macro features'
@@ -389,6 +479,18 @@ def main():
         default=3,
         help='Months before cut to observe features (default: 3 for early warning)'
     )
+    parser.add_argument(
+        '--price-store',
+        type=Path,
+        help='Local price store directory; market features come from a rolling '
+             'market-risk panel built from stored prices (missing ranges are '
+             'downloaded when OpenBB is available)'
+    )
+    parser.add_argument(
+        '--provider',
+        default='tmx',
+        help='Price provider for --price-store (default: tmx)'
+    )
 
     args = parser.parse_args()
 
@@ -397,12 +499,19 @@ def main():
         print(f"ERROR: Input file not found: {args.input}")
         sys.exit(1)
 
-    if not OPENBB_AVAILABLE:
+    if not OPENBB_AVAILABLE and not args.price_store:
         print("ERROR: OpenBB Platform not available. Install with: pip install openbb")
         sys.exit(1)
 
+    market_panel = None
+    if args.price_store:
+        market_panel = build_panel_from_store(
+            pd.read_csv(args.input), args.price_store, args.provider, args.lookback_months
+        )
+
     # Run enrichment
-    enricher = TrainingDatasetEnricher(lookback_months=args.lookback_months)
+    enricher = TrainingDatasetEnricher(lookback_months=args.lookback_months,
+                                       market_panel=market_panel)
     enricher.enrich_dataset(args.input, args.output)
 
     print(f"\n✓ Dataset enrichment complete!")
@@ -14,6 +14,17 @@ Usage:
     from calculate_credit_metrics import calculate_all_metrics
 
     metrics = calculate_all_metrics(financial_data)
+
+Portfolio-scale screening (NumPy/pandas, imported on demand so the
+single-issuer path stays dependency-free):
+    from calculate_credit_metrics.batch import calculate_all_metrics_batch
+
+    frame = calculate_all_metrics_batch(list_of_financial_data)
+
+Cached single-issuer path (skips recomputation for unchanged Phase 2 input):
+    from calculate_credit_metrics import calculate_all_metrics_cached
+
+    metrics, cache_hit = calculate_all_metrics_cached(financial_data)
 """
 
 # Import from fully-extracted modules
@@ -43,13 +54,16 @@ from .burn_rate import (
     calculate_sustainable_burn_rate
 )
 from .dilution import analyze_dilution
-from .coverage import calculate_coverage_ratios
+from .coverage import calculate_coverage_ratios, detect_reporting_period
 from .reconciliation import (
     generate_ffo_affo_reconciliation,
     format_reconciliation_table,
     format_acfo_reconciliation_table
 )
 
+# Content-addressed Phase 3 result cache
+from .cache import MetricsCache, calculate_all_metrics_cached
+
 # Import orchestrator (uses imports from submodules)
 from .reit_metrics import calculate_reit_metrics
 
@@ -93,12 +107,17 @@ __all__ = [
 
     # Coverage
     'calculate_coverage_ratios',
+    'detect_reporting_period',
 
     # Reconciliation
     'generate_ffo_affo_reconciliation',
     'format_reconciliation_table',
     'format_acfo_reconciliation_table',
 
+    # Result cache
+    'MetricsCache',
+    'calculate_all_metrics_cached',
+
     # Main entry point
     'calculate_all_metrics',
     'main'
@@ -49,6 +49,7 @@ from .reconciliation import (
     format_reconciliation_table,
     format_acfo_reconciliation_table
 )
+from .cache import MetricsCache, calculate_all_metrics_cached
 
 
 def calculate_all_metrics(financial_data):
@@ -234,6 +235,15 @@ def calculate_all_metrics(financial_data):
     return result
 
 
+def _output_is_current(output_path, result):
+    """True if output_path already holds exactly this result"""
+    try:
+        with open(output_path, 'r') as f:
+            return json.load(f) == result
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+
+
 def main():
     """Main execution - command-line interface"""
     import argparse
@@ -256,6 +266,16 @@ def main():
         default=None,
         help='Output path for calculated metrics (default: auto-generated from input path)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Recompute even if the Phase 2 input and calculation code are unchanged'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Phase 3 result cache directory (default: .cache/phase3_metrics in the repo root)'
+    )
 
     args = parser.parse_args()
 
@@ -294,14 +314,26 @@ def main():
         print("⚙️  Calculating REIT metrics...")
         print("⚙️  Calculating coverage ratios...")
 
-        result = calculate_all_metrics(financial_data)
+        # Content-addressed cache: unchanged Phase 2 input + unchanged code = same result
+        result, cache_hit = calculate_all_metrics_cached(
+            financial_data,
+            cache=MetricsCache(args.cache_dir),
+            use_cache=not args.no_cache,
+            calculate=calculate_all_metrics
+        )
 
-        # Save results
+        # Save results (skip the rewrite when a cached result is already on disk)
         output_path = Path(args.output)
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=2)
+        if cache_hit:
+            print("♻️  Phase 2 input and calculation code unchanged - using cached metrics")
+
+        if cache_hit and _output_is_current(output_path, result):
+            print(f"\n✅ Up to date: {output_path} (unchanged, not rewritten)")
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(result, f, indent=2)
 
-        print(f"\n✅ Success! Metrics calculated and saved to: {output_path}")
+            print(f"\n✅ Success! Metrics calculated and saved to: {output_path}")
 
         # Print summary
         print("\n📊 SUMMARY")
@@ -6,6 +6,47 @@ Per REALPAC ACFO White Paper (January 2023).
 """
 
 
+# ACFO adjustments (17 per REALPAC Jan 2023): component field -> adjustment number
+ACFO_ADJUSTMENT_FIELDS = {
+    # Working capital & financing
+    'change_in_working_capital': '1',
+    'interest_financing': '2',
+    # Joint ventures (3 fields, mutually exclusive)
+    'jv_distributions': '3a',
+    'jv_acfo': '3b',
+    'jv_notional_interest': '3c',
+    # Capital expenditures & leasing (MUST match AFFO)
+    'capex_sustaining_acfo': '4',
+    'capex_development_acfo': '4_dev',  # Disclosure only
+    'leasing_costs_external': '5',
+    'tenant_improvements_acfo': '6',
+    # Investment & tax items
+    'realized_investment_gains_losses': '7',
+    'taxes_non_operating': '8',
+    # Transaction costs
+    'transaction_costs_acquisitions': '9',
+    'transaction_costs_disposals': '10',
+    # Financing items
+    'deferred_financing_fees': '11',
+    'debt_termination_costs': '12',
+    'off_market_debt_favorable': '13a',
+    'off_market_debt_unfavorable': '13b',
+    # Interest timing
+    'interest_income_timing': '14a',
+    'interest_expense_timing': '14b',
+    # Puttable instruments (IAS 32)
+    'puttable_instruments_distributions': '15',
+    # ROU assets (IFRS 16) - 4 components
+    'rou_sublease_principal_received': '16a',
+    'rou_sublease_interest_received': '16b',
+    'rou_lease_principal_paid': '16c',
+    'rou_depreciation_amortization': '16d',
+    # Non-controlling interests
+    'non_controlling_interests_acfo': '17a',
+    'nci_puttable_units': '17b'
+}
+
+
 def calculate_acfo_from_components(financial_data):
     """
     Calculate ACFO from IFRS Cash Flow from Operations using REALPAC methodology (17 adjustments)
@@ -54,46 +95,7 @@ def calculate_acfo_from_components(financial_data):
 
     cfo = components['cash_flow_from_operations']
 
-    # Define all ACFO adjustments (17 adjustments per REALPAC Jan 2023)
-    # Adjustments 1-17 with clear categorization
-    adjustment_fields = {
-        # Working capital & financing
-        'change_in_working_capital': '1',
-        'interest_financing': '2',
-        # Joint ventures (3 fields, mutually exclusive)
-        'jv_distributions': '3a',
-        'jv_acfo': '3b',
-        'jv_notional_interest': '3c',
-        # Capital expenditures & leasing (MUST match AFFO)
-        'capex_sustaining_acfo': '4',
-        'capex_development_acfo': '4_dev',  # Disclosure only
-        'leasing_costs_external': '5',
-        'tenant_improvements_acfo': '6',
-        # Investment & tax items
-        'realized_investment_gains_losses': '7',
-        'taxes_non_operating': '8',
-        # Transaction costs
-        'transaction_costs_acquisitions': '9',
-        'transaction_costs_disposals': '10',
-        # Financing items
-        'deferred_financing_fees': '11',
-        'debt_termination_costs': '12',
-        'off_market_debt_favorable': '13a',
-        'off_market_debt_unfavorable': '13b',
-        # Interest timing
-        'interest_income_timing': '14a',
-        'interest_expense_timing': '14b',
-        # Puttable instruments (IAS 32)
-        'puttable_instruments_distributions': '15',
-        # ROU assets (IFRS 16) - 4 components
-        'rou_sublease_principal_received': '16a',
-        'rou_sublease_interest_received': '16b',
-        'rou_lease_principal_paid': '16c',
-        'rou_depreciation_amortization': '16d',
-        # Non-controlling interests
-        'non_controlling_interests_acfo': '17a',
-        'nci_puttable_units': '17b'
-    }
+    adjustment_fields = ACFO_ADJUSTMENT_FIELDS
 
     # Collect adjustments and track missing ones
     adjustments = {}
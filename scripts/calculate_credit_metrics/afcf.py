@@ -5,6 +5,56 @@ Extends ACFO analysis to measure cash available after ALL investing activities.
 Per REALPAC methodology with double-counting prevention.
 """
 
+
+# Investing activity components with sustainability classification
+# Following AFFO/ACFO principles: focus on recurring, sustainable cash flows
+CFI_COMPONENTS = {
+    # Recurring/Sustainable items (included in Sustainable AFCF)
+    'development_capex': {
+        'description': 'Development CAPEX (growth projects)',
+        'recurring': True,
+        'rationale': 'Ongoing portfolio improvement'
+    },
+    'property_acquisitions': {
+        'description': 'Property acquisitions',
+        'recurring': True,
+        'rationale': 'Routine growth investments (if < materiality threshold)'
+    },
+    'jv_capital_contributions': {
+        'description': 'JV capital contributions',
+        'recurring': True,
+        'rationale': 'Ongoing JV partnership investments'
+    },
+    'other_investing_outflows': {
+        'description': 'Other investing outflows',
+        'recurring': True,
+        'rationale': 'Routine investing activities'
+    },
+
+    # Non-recurring items (excluded from Sustainable AFCF)
+    'property_dispositions': {
+        'description': 'Property dispositions (proceeds)',
+        'recurring': False,
+        'rationale': 'Non-recurring asset sales'
+    },
+    'jv_return_of_capital': {
+        'description': 'JV return of capital',
+        'recurring': False,
+        'rationale': 'One-time JV exits'
+    },
+    'business_combinations': {
+        'description': 'Business combinations',
+        'recurring': False,
+        'rationale': 'Non-recurring M&A activity'
+    },
+    'other_investing_inflows': {
+        'description': 'Other investing inflows',
+        'recurring': False,
+        'rationale': 'Non-recurring proceeds'
+    }
+}
+
+
 def calculate_afcf(financial_data):
     """
     Calculate Adjusted Free Cash Flow (AFCF) using Two-Tier Methodology (v1.0.14)
@@ -82,53 +132,7 @@ def calculate_afcf(financial_data):
             'has_cfi_data': True
         }
 
-    # Define investing activity components with sustainability classification
-    # Following AFFO/ACFO principles: focus on recurring, sustainable cash flows
-    cfi_components = {
-        # Recurring/Sustainable items (included in Sustainable AFCF)
-        'development_capex': {
-            'description': 'Development CAPEX (growth projects)',
-            'recurring': True,
-            'rationale': 'Ongoing portfolio improvement'
-        },
-        'property_acquisitions': {
-            'description': 'Property acquisitions',
-            'recurring': True,
-            'rationale': 'Routine growth investments (if < materiality threshold)'
-        },
-        'jv_capital_contributions': {
-            'description': 'JV capital contributions',
-            'recurring': True,
-            'rationale': 'Ongoing JV partnership investments'
-        },
-        'other_investing_outflows': {
-            'description': 'Other investing outflows',
-            'recurring': True,
-            'rationale': 'Routine investing activities'
-        },
-
-        # Non-recurring items (excluded from Sustainable AFCF)
-        'property_dispositions': {
-            'description': 'Property dispositions (proceeds)',
-            'recurring': False,
-            'rationale': 'Non-recurring asset sales'
-        },
-        'jv_return_of_capital': {
-            'description': 'JV return of capital',
-            'recurring': False,
-            'rationale': 'One-time JV exits'
-        },
-        'business_combinations': {
-            'description': 'Business combinations',
-            'recurring': False,
-            'rationale': 'Non-recurring M&A activity'
-        },
-        'other_investing_inflows': {
-            'description': 'Other investing inflows',
-            'recurring': False,
-            'rationale': 'Non-recurring proceeds'
-        }
-    }
+    cfi_components = CFI_COMPONENTS
 
     # Collect CFI components and calculate BOTH total and sustainable net CFI
     cfi_breakdown = {}
@@ -0,0 +1,595 @@
+"""
+Vectorized batch calculation of credit metrics
+
+Portfolio-scale counterpart to calculate_all_metrics(). Flattens N Phase 2
+extractions into NumPy columns once, then computes leverage, REALPAC
+FFO/AFFO/ACFO, AFCF, coverage, burn rate, cash runway and dilution metrics as
+column operations instead of a Python loop over nested dicts.
+
+Column names mirror the nested calculate_all_metrics() output
+('leverage_metrics.total_debt', 'reit_metrics.ffo', 'afcf_metrics.afcf', ...),
+so each row of the batch frame equals the scalar metrics of the per-issuer
+result. Metrics that the per-issuer path omits or sets to None are NaN (None
+for text columns).
+
+Rows that calculate_all_metrics() would reject (KeyError/ValueError, e.g.
+missing balance sheet fields or non-positive interest expense) are kept with
+NaN metrics and the exception message in the 'error' column, so one bad
+extraction never aborts a screen of the whole universe.
+
+Usage:
+    from calculate_credit_metrics.batch import calculate_all_metrics_batch
+
+    frame = calculate_all_metrics_batch(extractions)
+    frame[['issuer_name', 'leverage_metrics.debt_to_assets_percent']]
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from .coverage import detect_reporting_period
+from .ffo_affo import FFO_ADJUSTMENT_FIELDS, AFFO_ADJUSTMENT_FIELDS
+from .acfo import ACFO_ADJUSTMENT_FIELDS
+from .afcf import CFI_COMPONENTS
+
+
+# Required fields checked by the per-issuer path, in the order it checks them
+LEVERAGE_REQUIRED_FIELDS = [
+    'balance_sheet.total_assets',
+    'balance_sheet.mortgages_noncurrent',
+    'balance_sheet.mortgages_current',
+    'balance_sheet.credit_facilities',
+    'balance_sheet.cash'
+]
+
+REPORTED_FFO_AFFO_FIELDS = [
+    'ffo_affo.ffo',
+    'ffo_affo.affo',
+    'ffo_affo.ffo_per_unit',
+    'ffo_affo.affo_per_unit',
+    'ffo_affo.distributions_per_unit'
+]
+
+COVERAGE_REQUIRED_FIELDS = [
+    'income_statement.noi',
+    'income_statement.interest_expense'
+]
+
+_MISSING = object()
+_NUMERIC_TYPES = (int, float)
+
+# Identity columns and the defaults calculate_all_metrics() reports when absent
+IDENTITY_FIELDS = {
+    'issuer_name': None,
+    'reporting_date': None,
+    'reporting_period': 'Unknown',
+    'currency': 'Unknown'
+}
+
+
+class _Columns:
+    """
+    Lazily flattened columns over a list of Phase 2 extraction dicts
+
+    Each dot-notation path is resolved once for all records (parent sections
+    are shared between fields) and cached as a float array (NaN where the key
+    is missing or None) plus a key-present mask.
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.n = len(records)
+        self._nodes_cache = {}
+        self._cache = {}
+
+    def _nodes(self, path):
+        """Raw value at path for every record (_MISSING where absent)"""
+        if path not in self._nodes_cache:
+            parent_path, _, key = path.rpartition('.')
+            parents = self._nodes(parent_path) if parent_path else self.records
+            self._nodes_cache[path] = [
+                node.get(key, _MISSING) if type(node) is dict else _MISSING
+                for node in parents
+            ]
+        return self._nodes_cache[path]
+
+    def _flatten(self, path):
+        nodes = self._nodes(path)
+        has_key = np.fromiter((node is not _MISSING for node in nodes), dtype=bool, count=self.n)
+        values = np.fromiter(
+            (node if type(node) in _NUMERIC_TYPES else np.nan for node in nodes),
+            dtype=float, count=self.n
+        )
+        return values, has_key
+
+    def value(self, path):
+        """Float column for path (NaN where missing or None)"""
+        if path not in self._cache:
+            self._cache[path] = self._flatten(path)
+        return self._cache[path][0]
+
+    def has(self, path):
+        """Boolean mask: path exists as a key (value may be None)"""
+        if path not in self._cache:
+            self._cache[path] = self._flatten(path)
+        return self._cache[path][1]
+
+    def zero_filled(self, path):
+        """Float column with missing/None treated as 0 (mirrors `.get(k, 0) or 0`)"""
+        return np.nan_to_num(self.value(path), nan=0.0)
+
+    def text(self, path, default=None):
+        """Object column of raw top-level values (for identity and period labels)"""
+        return np.array([record.get(path, default) for record in self.records], dtype=object)
+
+
+class _Errors:
+    """First-error-wins tracker reproducing calculate_all_metrics() exception order"""
+
+    def __init__(self, n):
+        self.ok = np.ones(n, dtype=bool)
+        self.messages = np.full(n, None, dtype=object)
+
+    def flag(self, mask, message):
+        newly_failed = mask & self.ok
+        self.messages[newly_failed] = message
+        self.ok &= ~mask
+
+    def require(self, cols, fields):
+        for field in fields:
+            self.flag(
+                ~cols.has(field),
+                f"Missing required field: {field}. Ensure Phase 2 extraction included this field."
+            )
+        # Present-but-null values fail later in the per-issuer arithmetic
+        for field in fields:
+            self.flag(np.isnan(cols.value(field)), f"Invalid {field}: null value in Phase 2 extraction.")
+
+
+def _where(mask, values, other=np.nan):
+    """np.where that broadcasts scalars and keeps float dtype"""
+    return np.where(mask, values, other)
+
+
+def _round(values, digits):
+    """
+    Round like the per-issuer path: Python's round() on each element
+
+    np.round scales, rounds and unscales, which disagrees with round() on
+    some half values (np.round(-0.525, 2) == -0.52, round(-0.525, 2) == -0.53).
+    NaN and inf pass through unchanged.
+    """
+    values = np.asarray(values, dtype=float)
+    rounded = np.fromiter((round(v, digits) if math.isfinite(v) else v for v in values.ravel().tolist()),
+                          dtype=float, count=values.size)
+    return rounded.reshape(values.shape)
+
+
+def _label(mask, label):
+    """Object column holding label where mask is True, else None"""
+    out = np.full(mask.shape, None, dtype=object)
+    out[mask] = label
+    return out
+
+
+def _count_present(cols, section, fields):
+    """Number of non-None component fields per row"""
+    count = np.zeros(cols.n, dtype=np.int64)
+    for field in fields:
+        count += ~np.isnan(cols.value(f'{section}.{field}'))
+    return count
+
+
+def _quality(count, strong, moderate):
+    """Map component counts to 'strong' / 'moderate' / 'limited'"""
+    return np.select([count >= strong, count >= moderate], ['strong', 'moderate'], 'limited').astype(object)
+
+
+def calculate_all_metrics_batch(financial_data_list):
+    """
+    Calculate credit metrics for many issuer-periods as column operations
+
+    Args:
+        financial_data_list (iterable of dict): Phase 2 extractions, one per issuer-period
+
+    Returns:
+        pandas.DataFrame: One row per input, in input order. Identity columns
+        (issuer_name, reporting_date, reporting_period, currency, error) followed
+        by dotted metric columns matching calculate_all_metrics() output keys.
+    """
+
+    records = list(financial_data_list)
+    cols = _Columns(records)
+    n = cols.n
+    errors = _Errors(n)
+    out = {}
+
+    # Issuer identification (calculate_all_metrics raises before any metric)
+    errors.flag(~cols.has('issuer_name'), 'Missing issuer_name in financial_data')
+    errors.flag(~cols.has('reporting_date'), 'Missing reporting_date in financial_data')
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # ------------------------------------------------------------------
+        # Leverage
+        # ------------------------------------------------------------------
+        errors.require(cols, LEVERAGE_REQUIRED_FIELDS)
+
+        mortgages_noncurrent = cols.value('balance_sheet.mortgages_noncurrent')
+        mortgages_current = cols.value('balance_sheet.mortgages_current')
+        credit_facilities = cols.value('balance_sheet.credit_facilities')
+        debentures = cols.value('balance_sheet.senior_unsecured_debentures')
+        has_debentures = cols.has('balance_sheet.senior_unsecured_debentures')
+        total_assets = cols.value('balance_sheet.total_assets')
+
+        for name, values in (('mortgages_noncurrent', mortgages_noncurrent),
+                             ('mortgages_current', mortgages_current),
+                             ('credit_facilities', credit_facilities)):
+            errors.flag(values < 0, f"Invalid {name}: debt components cannot be negative. Check Phase 2 extraction.")
+        errors.flag(has_debentures & np.isnan(debentures),
+                    'Invalid senior_unsecured_debentures: null value in Phase 2 extraction.')
+        errors.flag(has_debentures & (debentures < 0),
+                    'Invalid senior_unsecured_debentures: debt cannot be negative.')
+
+        total_debt = mortgages_noncurrent + mortgages_current + credit_facilities
+        total_debt = _where(has_debentures, total_debt + debentures, total_debt)
+        net_debt = total_debt - cols.value('balance_sheet.cash')
+
+        errors.flag(total_assets <= 0, 'Invalid total_assets: assets must be positive. Check Phase 2 extraction.')
+
+        out['leverage_metrics.total_debt'] = total_debt
+        out['leverage_metrics.net_debt'] = net_debt
+        out['leverage_metrics.gross_assets'] = total_assets
+        out['leverage_metrics.debt_to_assets_percent'] = _round((total_debt / total_assets) * 100, 2)
+        out['leverage_metrics.net_debt_ratio'] = _round((net_debt / total_assets) * 100, 2)
+
+        # ------------------------------------------------------------------
+        # REIT metrics: issuer-reported FFO/AFFO
+        # ------------------------------------------------------------------
+        units = cols.value('balance_sheet.common_units_outstanding')
+        units_diluted = cols.value('balance_sheet.diluted_units_outstanding')
+        has_units = units > 0
+        has_units_diluted = units_diluted > 0
+
+        reported = cols.has('ffo_affo')
+        for field in REPORTED_FFO_AFFO_FIELDS:
+            reported = reported & cols.has(field)
+
+        reported_ffo_pu = cols.value('ffo_affo.ffo_per_unit')
+        reported_affo_pu = cols.value('ffo_affo.affo_per_unit')
+        distributions_pu = cols.value('ffo_affo.distributions_per_unit')
+        errors.flag(reported & (np.isnan(reported_ffo_pu) | np.isnan(reported_affo_pu) | np.isnan(distributions_pu)),
+                    'Invalid ffo_affo: null per-unit value in Phase 2 extraction.')
+        errors.flag(reported & (reported_ffo_pu == 0), 'float division by zero')
+
+        # ------------------------------------------------------------------
+        # REIT metrics: FFO (A-U) and AFFO (V-Z) from components
+        # ------------------------------------------------------------------
+        net_income = cols.value('ffo_affo_components.net_income_ifrs')
+        calculated = cols.has('ffo_affo_components') & ~np.isnan(net_income)
+
+        ffo_adjustments = np.zeros(n)
+        for field, letter in FFO_ADJUSTMENT_FIELDS.items():
+            adjustment = cols.zero_filled(f'ffo_affo_components.{field}')
+            if letter == 'U':
+                ffo_adjustments = ffo_adjustments - adjustment
+            else:
+                ffo_adjustments = ffo_adjustments + adjustment
+        ffo_raw = net_income + ffo_adjustments
+        ffo_calculated = _round(ffo_raw, 0)
+
+        affo_adjustments = np.zeros(n)
+        for field in AFFO_ADJUSTMENT_FIELDS:
+            affo_adjustments = affo_adjustments + cols.zero_filled(f'ffo_affo_components.{field}')
+        affo_raw = ffo_calculated + affo_adjustments
+        affo_calculated = _round(affo_raw, 0)
+
+        ffo_pu_calculated = _where(calculated & has_units, _round(ffo_raw / units, 4))
+        ffo_pu_diluted_calculated = _where(calculated & has_units_diluted, _round(ffo_raw / units_diluted, 4))
+        affo_pu_calculated = _where(calculated & has_units, _round(affo_raw / units, 4))
+        affo_pu_diluted_calculated = _where(calculated & has_units_diluted, _round(affo_raw / units_diluted, 4))
+
+        errors.flag(~reported & ~calculated, (
+            "Missing FFO/AFFO data. Need either: "
+            "(1) issuer-reported ffo_affo section, or "
+            "(2) ffo_affo_components section to calculate"
+        ))
+
+        # Payout ratios on the calculated path need both per-unit values and reported distributions
+        calculated_payout = (
+            ~reported & calculated
+            & ~np.isnan(ffo_pu_calculated) & ~np.isnan(affo_pu_calculated)
+            & cols.has('ffo_affo.distributions_per_unit')
+        )
+        errors.flag(calculated_payout & ((ffo_pu_calculated == 0) | (affo_pu_calculated == 0)),
+                    'float division by zero')
+
+        ffo_pu = _where(reported, reported_ffo_pu, ffo_pu_calculated)
+        affo_pu = _where(reported, reported_affo_pu, affo_pu_calculated)
+        has_distributions = reported | calculated_payout
+        distributions = _where(has_distributions, distributions_pu)
+
+        affo_payout_reported = _where(reported_affo_pu > 0,
+                                      _round((distributions_pu / reported_affo_pu) * 100, 1), 0.0)
+
+        out['reit_metrics.ffo'] = _where(reported, cols.value('ffo_affo.ffo'), _where(calculated, ffo_calculated))
+        out['reit_metrics.affo'] = _where(reported, cols.value('ffo_affo.affo'), _where(calculated, affo_calculated))
+        out['reit_metrics.ffo_per_unit'] = ffo_pu
+        out['reit_metrics.affo_per_unit'] = affo_pu
+        out['reit_metrics.ffo_per_unit_diluted'] = _where(
+            reported, cols.value('ffo_affo.ffo_per_unit_diluted'), ffo_pu_diluted_calculated)
+        out['reit_metrics.affo_per_unit_diluted'] = _where(
+            reported, cols.value('ffo_affo.affo_per_unit_diluted'), affo_pu_diluted_calculated)
+        out['reit_metrics.distributions_per_unit'] = distributions
+        out['reit_metrics.ffo_payout_ratio'] = _where(has_distributions, _round((distributions / ffo_pu) * 100, 1))
+        out['reit_metrics.affo_payout_ratio'] = _where(
+            reported, affo_payout_reported,
+            _where(calculated_payout, _round((distributions / affo_pu) * 100, 1)))
+        out['reit_metrics.ffo_calculated'] = _where(calculated, ffo_calculated)
+        out['reit_metrics.affo_calculated'] = _where(calculated, affo_calculated)
+
+        source = _label(reported, 'issuer_reported')
+        source[~reported & calculated] = 'calculated_from_components'
+        out['reit_metrics.source'] = source
+
+        # ------------------------------------------------------------------
+        # REIT metrics: ACFO (17 adjustments) from components
+        # ------------------------------------------------------------------
+        cfo = cols.value('acfo_components.cash_flow_from_operations')
+        acfo_available = cols.has('acfo_components') & ~np.isnan(cfo)
+
+        acfo_adjustments = np.zeros(n)
+        for field in ACFO_ADJUSTMENT_FIELDS:
+            acfo_adjustments = acfo_adjustments + cols.zero_filled(f'acfo_components.{field}')
+        acfo_raw = cfo + acfo_adjustments
+        acfo_calculated = _round(acfo_raw, 0)
+
+        # Note: ACFO is in thousands and units are a raw count (see acfo.py)
+        acfo_pu_calculated = _where(acfo_available & has_units, _round(acfo_raw / (units / 1000), 4))
+        acfo_pu_diluted_calculated = _where(acfo_available & has_units_diluted,
+                                            _round(acfo_raw / (units_diluted / 1000), 4))
+
+        reported_acfo = cols.value('ffo_affo.acfo')
+        acfo_from_components = acfo_available & np.isnan(reported_acfo)
+        reit_acfo = _where(acfo_available, _where(np.isnan(reported_acfo), acfo_calculated, reported_acfo))
+        reit_acfo_pu = _where(acfo_from_components, acfo_pu_calculated)
+
+        acfo_payout = acfo_from_components & ~np.isnan(reit_acfo_pu) & has_distributions
+        errors.flag(acfo_payout & (reit_acfo_pu == 0), 'float division by zero')
+
+        out['reit_metrics.acfo'] = reit_acfo
+        out['reit_metrics.acfo_calculated'] = _where(acfo_available, acfo_calculated)
+        out['reit_metrics.acfo_per_unit'] = reit_acfo_pu
+        out['reit_metrics.acfo_per_unit_diluted'] = _where(acfo_from_components, acfo_pu_diluted_calculated)
+        out['reit_metrics.acfo_payout_ratio'] = _where(acfo_payout, _round((distributions / reit_acfo_pu) * 100, 1))
+
+        # ------------------------------------------------------------------
+        # Coverage ratios
+        # ------------------------------------------------------------------
+        errors.require(cols, COVERAGE_REQUIRED_FIELDS)
+
+        noi = cols.value('income_statement.noi')
+        interest_expense = cols.value('income_statement.interest_expense')
+        errors.flag(interest_expense <= 0, 'Invalid interest_expense: interest expense must be positive.')
+
+        # Period detection is string parsing - run it once per distinct label
+        periods = cols.text('reporting_period', '')
+        period_lookup = {period: detect_reporting_period(period) for period in set(periods)}
+        annualization_factor = np.array([period_lookup[p][0] for p in periods], dtype=float)
+        detected_period = np.array([period_lookup[p][1] for p in periods], dtype=object)
+
+        out['coverage_ratios.noi_interest_coverage'] = _round(noi / interest_expense, 2)
+        out['coverage_ratios.annualized_interest_expense'] = interest_expense * annualization_factor
+        out['coverage_ratios.period_interest_expense'] = interest_expense
+        out['coverage_ratios.annualization_factor'] = annualization_factor
+        out['coverage_ratios.detected_period'] = detected_period
+
+        # ------------------------------------------------------------------
+        # ACFO metrics (top-level acfo_metrics section)
+        # ------------------------------------------------------------------
+        acfo_metrics = acfo_available & (
+            cols.has('cash_flow_operating')
+            | (cols.has('ffo_affo_components') & cols.has('acfo_components'))
+        )
+        acfo_count = _count_present(cols, 'acfo_components', ACFO_ADJUSTMENT_FIELDS)
+
+        out['acfo_metrics.acfo'] = _where(acfo_metrics, acfo_calculated)
+        out['acfo_metrics.cash_flow_from_operations'] = _where(acfo_metrics, cfo)
+        out['acfo_metrics.total_adjustments'] = _where(acfo_metrics, _round(acfo_adjustments, 0))
+        out['acfo_metrics.available_adjustments'] = _where(acfo_metrics, acfo_count)
+        out['acfo_metrics.acfo_per_unit'] = _where(acfo_metrics, acfo_pu_calculated)
+        out['acfo_metrics.acfo_per_unit_diluted'] = _where(acfo_metrics, acfo_pu_diluted_calculated)
+        out['acfo_metrics.data_quality'] = _where(acfo_metrics, _quality(acfo_count, 12, 6), None)
+
+        # ------------------------------------------------------------------
+        # AFCF (two-tier: sustainable = ACFO + recurring CFI)
+        # ------------------------------------------------------------------
+        acfo_for_afcf = _where(acfo_available, reit_acfo,
+                               _where(acfo_metrics, acfo_calculated, cols.value('acfo_calculated')))
+        acfo_for_afcf = _where(np.isnan(acfo_for_afcf), cols.value('reit_metrics.acfo'), acfo_for_afcf)
+        afcf_available = cols.has('cash_flow_investing') & ~np.isnan(acfo_for_afcf)
+
+        net_cfi_total = np.zeros(n)
+        net_cfi_sustainable = np.zeros(n)
+        for component, component_info in CFI_COMPONENTS.items():
+            value = cols.zero_filled(f'cash_flow_investing.{component}')
+            net_cfi_total = net_cfi_total + value
+            if component_info['recurring']:
+                net_cfi_sustainable = net_cfi_sustainable + value
+        cfi_count = _count_present(cols, 'cash_flow_investing', CFI_COMPONENTS)
+
+        afcf_raw = acfo_for_afcf + net_cfi_sustainable
+        afcf = _where(afcf_available, _round(afcf_raw, 0))
+
+        out['afcf_metrics.afcf'] = afcf
+        out['afcf_metrics.afcf_sustainable'] = afcf
+        out['afcf_metrics.net_cfi_sustainable'] = _where(afcf_available, _round(net_cfi_sustainable, 0))
+        out['afcf_metrics.afcf_total'] = _where(afcf_available, _round(acfo_for_afcf + net_cfi_total, 0))
+        out['afcf_metrics.net_cfi_total'] = _where(afcf_available, _round(net_cfi_total, 0))
+        out['afcf_metrics.non_recurring_cfi'] = _where(afcf_available,
+                                                       _round(net_cfi_total - net_cfi_sustainable, 0))
+        out['afcf_metrics.acfo_starting_point'] = _where(afcf_available, acfo_for_afcf)
+        out['afcf_metrics.available_components'] = _where(afcf_available, cfi_count)
+        out['afcf_metrics.afcf_per_unit'] = _where(afcf_available & has_units, _round(afcf_raw / units, 4))
+        out['afcf_metrics.afcf_per_unit_diluted'] = _where(afcf_available & has_units_diluted,
+                                                           _round(afcf_raw / units_diluted, 4))
+        out['afcf_metrics.data_quality'] = _where(afcf_available, _quality(cfi_count, 6, 3), None)
+
+        # ------------------------------------------------------------------
+        # AFCF coverage (period amounts; outflows are negative in Phase 2 data)
+        # ------------------------------------------------------------------
+        has_financing = cols.has('cash_flow_financing')
+        afcf_coverage = afcf_available & has_financing
+
+        principal_repayments = np.abs(cols.zero_filled('cash_flow_financing.debt_principal_repayments'))
+        total_distributions = (
+            np.abs(cols.zero_filled('cash_flow_financing.distributions_common'))
+            + np.abs(cols.zero_filled('cash_flow_financing.distributions_preferred'))
+            + np.abs(cols.zero_filled('cash_flow_financing.distributions_nci'))
+        )
+        new_financing = (
+            cols.zero_filled('cash_flow_financing.new_debt_issuances')
+            + cols.zero_filled('cash_flow_financing.equity_issuances')
+        )
+        total_debt_service = interest_expense + principal_repayments
+        total_obligations = total_debt_service + total_distributions
+
+        out['afcf_coverage.afcf_debt_service_coverage'] = _where(
+            afcf_coverage & (total_debt_service > 0), _round(afcf / total_debt_service, 2))
+        out['afcf_coverage.afcf_distribution_coverage'] = _where(
+            afcf_coverage & (total_distributions > 0), _round(afcf / total_distributions, 2))
+        out['afcf_coverage.afcf_payout_ratio'] = _where(
+            afcf_coverage & (total_distributions > 0) & (afcf != 0),
+            _round((total_distributions / afcf) * 100, 1))
+        out['afcf_coverage.afcf_self_funding_ratio'] = _where(
+            afcf_coverage & (total_obligations > 0), _round(afcf / total_obligations, 2))
+        out['afcf_coverage.afcf_self_funding_capacity'] = _where(
+            afcf_coverage, _round(afcf - total_obligations, 0))
+        out['afcf_coverage.total_debt_service'] = _where(
+            afcf_coverage, _where(total_debt_service > 0, total_debt_service, 0.0))
+        out['afcf_coverage.total_distributions'] = _where(
+            afcf_coverage, _where(total_distributions > 0, total_distributions, 0.0))
+        out['afcf_coverage.net_financing_needs'] = _where(
+            afcf_coverage, total_debt_service + total_distributions - new_financing)
+
+        # ------------------------------------------------------------------
+        # Burn rate (forward-looking: mandatory obligations, no new financing)
+        # ------------------------------------------------------------------
+        period_months = np.rint(12 / annualization_factor)
+        applicable = afcf_coverage & (afcf < total_obligations)
+        covered = afcf_coverage & ~applicable
+        period_deficit = afcf - total_obligations
+        monthly_burn = _where(applicable, _round(period_deficit / period_months, 2))
+
+        out['burn_rate_analysis.applicable'] = pd.arrays.BooleanArray(applicable, ~afcf_available)
+        out['burn_rate_analysis.afcf'] = afcf
+        out['burn_rate_analysis.period_months'] = _where(afcf_coverage, period_months)
+        out['burn_rate_analysis.mandatory_obligations'] = _where(afcf_coverage, total_obligations)
+        out['burn_rate_analysis.self_funding_ratio'] = _where(
+            afcf_coverage & (total_obligations > 0), _round(afcf / total_obligations, 2))
+        out['burn_rate_analysis.period_burn_rate'] = _where(applicable, _round(period_deficit, 2))
+        out['burn_rate_analysis.monthly_burn_rate'] = monthly_burn
+        out['burn_rate_analysis.monthly_surplus'] = _where(covered, _round(period_deficit / period_months, 2))
+
+        # ------------------------------------------------------------------
+        # Cash runway, liquidity risk and sustainable burn
+        # ------------------------------------------------------------------
+        available_cash = (
+            cols.zero_filled('liquidity.cash_and_equivalents')
+            + cols.zero_filled('liquidity.marketable_securities')
+            - cols.zero_filled('liquidity.restricted_cash')
+        )
+        total_liquidity = available_cash + cols.zero_filled('liquidity.undrawn_credit_facilities')
+        burn_abs = np.abs(monthly_burn)
+
+        runway_base = applicable & cols.has('liquidity') & (monthly_burn != 0)
+        runway_valid = runway_base & (available_cash > 0)
+        extended_valid = runway_valid & (total_liquidity > 0)
+        runway_raw = available_cash / burn_abs
+        extended_raw = total_liquidity / burn_abs
+        runway_months = _where(runway_valid, _round(runway_raw, 1))
+
+        out['cash_runway.available_cash'] = _where(runway_base, _round(available_cash, 2))
+        out['cash_runway.total_available_liquidity'] = _where(runway_base, _round(total_liquidity, 2))
+        out['cash_runway.runway_months'] = runway_months
+        out['cash_runway.runway_years'] = _where(runway_valid, _round(runway_raw / 12, 1))
+        out['cash_runway.extended_runway_months'] = _where(extended_valid, _round(extended_raw, 1))
+        out['cash_runway.extended_runway_years'] = _where(extended_valid, _round(extended_raw / 12, 1))
+
+        risk_level = np.select(
+            [runway_months < 6, runway_months < 12, runway_months < 24],
+            ['CRITICAL', 'HIGH', 'MODERATE'],
+            'LOW'
+        ).astype(object)
+        out['liquidity_risk.risk_level'] = _where(runway_valid, risk_level, None)
+        out['liquidity_risk.risk_score'] = _where(
+            runway_valid, np.select([runway_months < 6, runway_months < 12, runway_months < 24], [4, 3, 2], 1))
+
+        sustainable_burn = available_cash / 24
+        excess_burn = burn_abs - sustainable_burn
+        out['sustainable_burn.available_cash'] = _where(runway_valid, _round(available_cash, 2))
+        out['sustainable_burn.actual_monthly_burn'] = _where(runway_valid, monthly_burn)
+        out['sustainable_burn.sustainable_monthly_burn'] = _where(runway_valid, _round(sustainable_burn, 2))
+        out['sustainable_burn.excess_burn_per_month'] = _where(runway_valid, _round(excess_burn, 2))
+        out['sustainable_burn.excess_burn_annualized'] = _where(runway_valid, _round(excess_burn * 12, 2))
+
+        # ------------------------------------------------------------------
+        # Portfolio metrics
+        # ------------------------------------------------------------------
+        has_portfolio = cols.has('portfolio')
+
+        def _get_or(path, default):
+            return _where(cols.has(path), cols.value(path), default)
+
+        def _truthy_or(primary, fallback):
+            value = cols.value(primary)
+            return _where(~np.isnan(value) & (value != 0), value, _get_or(fallback, 0.0))
+
+        out['portfolio_metrics.total_properties'] = _where(
+            has_portfolio, _where(cols.has('portfolio.property_count'), cols.value('portfolio.property_count'),
+                                  _get_or('portfolio.total_properties', 0.0)))
+        out['portfolio_metrics.gla_sf'] = _where(has_portfolio, cols.zero_filled('portfolio.total_gla_sf'))
+        out['portfolio_metrics.occupancy_rate'] = _where(has_portfolio, _get_or('portfolio.occupancy_rate', 0.0))
+        out['portfolio_metrics.occupancy_including_commitments'] = _where(
+            has_portfolio,
+            _truthy_or('portfolio.occupancy_with_commitments', 'portfolio.occupancy_including_commitments'))
+        out['portfolio_metrics.same_property_noi_growth'] = _where(
+            has_portfolio,
+            _truthy_or('portfolio.same_property_noi_growth_6m', 'portfolio.same_property_noi_growth'))
+
+        # ------------------------------------------------------------------
+        # Dilution
+        # ------------------------------------------------------------------
+        has_dilution = cols.has('dilution_detail')
+        basic_units = cols.value('dilution_detail.basic_units')
+        diluted_units = cols.value('dilution_detail.diluted_units_reported')
+        dilution_pct = cols.value('dilution_detail.dilution_percentage')
+        dilution_pct = _where(np.isnan(dilution_pct) & (basic_units > 0),
+                              ((diluted_units - basic_units) / basic_units) * 100, dilution_pct)
+
+        materiality = np.select(
+            [np.isnan(dilution_pct), dilution_pct < 1.0, dilution_pct < 3.0, dilution_pct < 7.0],
+            ['unknown', 'minimal', 'low', 'moderate'],
+            'high'
+        ).astype(object)
+        out['dilution_analysis.dilution_percentage'] = _where(
+            has_dilution & (dilution_pct != 0), _round(dilution_pct, 2))
+        out['dilution_analysis.dilution_materiality'] = _where(has_dilution, materiality, None)
+
+    # Rows the per-issuer path would reject carry no metrics
+    failed = ~errors.ok
+    for key, values in out.items():
+        if isinstance(values, pd.arrays.BooleanArray):
+            values[failed] = pd.NA
+        elif values.dtype == object:
+            values[failed] = None
+        else:
+            out[key] = np.where(failed, np.nan, values)
+
+    frame = pd.DataFrame({field: cols.text(field, default) for field, default in IDENTITY_FIELDS.items()})
+    frame['error'] = errors.messages
+    return pd.concat([frame, pd.DataFrame(out)], axis=1)
+
+
+__all__ = ['calculate_all_metrics_batch']
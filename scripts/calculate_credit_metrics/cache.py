@@ -0,0 +1,214 @@
+"""
+Content-addressed cache for Phase 3 results
+
+Phase 3 is a pure function of the Phase 2 extraction and the calculation
+code. Results are stored under a key that hashes both:
+
+- the canonicalized Phase 2 JSON (sorted keys, compact separators), and
+- a fingerprint of this package's source files plus __version__.
+
+Re-running the pipeline on an unchanged phase2_extracted_data.json returns
+the stored result instead of recomputing. Any edit to the calculation
+modules changes the fingerprint, so a methodology tweak recomputes every
+issuer exactly once and later runs hit the cache again.
+
+Entries are JSON files in a cache directory. The directory is bounded by
+total size; least-recently-used entries (by file mtime, refreshed on every
+hit) are evicted first.
+"""
+
+import copy
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / '.cache' / 'phase3_metrics'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB (~1,000 issuer-periods)
+
+
+@lru_cache(maxsize=8)
+def calculation_fingerprint(*extra_sources):
+    """
+    Fingerprint of the calculation code (package version + module sources)
+
+    Args:
+        *extra_sources: Additional source files that define the calculation
+            (e.g. the standalone calculate_credit_metrics.py script)
+
+    Returns:
+        str: Hex digest that changes whenever any calculate_credit_metrics
+            module (or extra source) changes
+    """
+    from . import __version__
+
+    digest = hashlib.sha256(__version__.encode('utf-8'))
+    package_dir = Path(__file__).resolve().parent
+    for module_path in sorted(package_dir.glob('*.py')) + [Path(p) for p in extra_sources]:
+        digest.update(module_path.name.encode('utf-8'))
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(financial_data, fingerprint=None):
+    """
+    Content-addressed key for a Phase 2 input
+
+    Args:
+        financial_data: Phase 2 extraction dictionary
+        fingerprint: Calculation fingerprint (default: calculation_fingerprint())
+
+    Returns:
+        str: SHA-256 hex digest of the canonical input and calculation fingerprint
+    """
+    canonical = json.dumps(financial_data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    digest = hashlib.sha256((fingerprint or calculation_fingerprint()).encode('utf-8'))
+    digest.update(canonical.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class MetricsCache:
+    """Size-bounded LRU store of Phase 3 results keyed by cache_key()"""
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory for cache entries (default: <repo>/.cache/phase3_metrics)
+            max_bytes: Total size bound for the cache directory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key):
+        return self.cache_dir / f'{key}.json'
+
+    def get(self, key):
+        """
+        Look up a cached result
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            dict: Cached Phase 3 result, or None on a miss (or unreadable entry)
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r') as f:
+                result = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key, result):
+        """
+        Store a result and evict least-recently-used entries over the size bound
+
+        Args:
+            key: Key from cache_key()
+            result: Phase 3 result dictionary (must be JSON-serializable)
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Atomic write so concurrent pipeline runs never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    def evict(self):
+        """
+        Delete least-recently-used entries until the cache fits in max_bytes
+
+        Returns:
+            int: Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Remove all cache entries"""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob('*.json'):
+                path.unlink(missing_ok=True)
+
+
+def calculate_all_metrics_cached(financial_data, cache=None, use_cache=True, calculate=None):
+    """
+    calculate_all_metrics() with a content-addressed result cache
+
+    Args:
+        financial_data: Phase 2 extraction dictionary
+        cache: MetricsCache instance (default: MetricsCache() in the default directory)
+        use_cache: False to always recompute (the result is still stored)
+        calculate: Calculation function (default: calculate_all_metrics). When
+            it lives outside this package, its source file joins the fingerprint.
+
+    Returns:
+        tuple: (result, cache_hit) where result is the Phase 3 metrics dict
+
+    Raises:
+        KeyError, ValueError: As calculate_all_metrics() (failures are not cached)
+    """
+    if calculate is None:
+        from ._core import calculate_all_metrics as calculate
+
+    cache = cache if cache is not None else MetricsCache()
+
+    source = Path(inspect.getsourcefile(calculate)).resolve()
+    extra_sources = () if source.parent == Path(__file__).resolve().parent else (str(source),)
+    key = cache_key(financial_data, calculation_fingerprint(*extra_sources))
+
+    if use_cache:
+        result = cache.get(key)
+        if result is not None:
+            return result, True
+
+    # calculate_all_metrics() annotates its input; keep the caller's dict as loaded
+    result = calculate(copy.deepcopy(financial_data))
+    cache.put(key, result)
+    return result, False
+
+
+__all__ = [
+    'DEFAULT_CACHE_DIR',
+    'DEFAULT_MAX_BYTES',
+    'calculation_fingerprint',
+    'cache_key',
+    'MetricsCache',
+    'calculate_all_metrics_cached',
+]
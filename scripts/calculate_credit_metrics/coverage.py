@@ -7,43 +7,19 @@ Functions for calculating debt service coverage and interest coverage ratios.
 from .validation import validate_required_fields
 
 
-def calculate_coverage_ratios(financial_data):
+def detect_reporting_period(reporting_period):
     """
-    Calculate interest coverage and EBITDA-based ratios
+    Map a reporting period label to its interest annualization factor
 
     Args:
-        financial_data (dict): Validated JSON from Phase 2 extraction
+        reporting_period (str): Phase 2 reporting_period (e.g., 'Q2 2025', 'Six months ended June 30')
 
     Returns:
-        dict: Coverage ratios
-
-    Raises:
-        KeyError: If required fields are missing
-        ValueError: If calculations produce invalid results
+        tuple: (annualization_factor, period_label). period_label is
+               'quarterly_assumed' when the period could not be detected.
     """
 
-    required_fields = [
-        'income_statement.noi',
-        'income_statement.interest_expense'
-    ]
-    validate_required_fields(financial_data, required_fields)
-
-    income = financial_data['income_statement']
-
-    noi = income['noi']
-    interest_expense = income['interest_expense']
-
-    if interest_expense <= 0:
-        raise ValueError(
-            f"Invalid interest_expense: {interest_expense}. "
-            f"Interest expense must be positive."
-        )
-
-    # NOI / Interest Coverage (period coverage is same as annualized if both same period)
-    noi_interest_coverage = noi / interest_expense
-
-    # Detect reporting period to determine correct annualization factor
-    reporting_period = financial_data.get('reporting_period', '').lower()
+    reporting_period = (reporting_period or '').lower()
 
     # REIT Quarterly Pattern: Q1=3mo, Q2=6mo, Q3=9mo, Q4=12mo
     if 'q2' in reporting_period or ' q2' in reporting_period:
@@ -79,12 +55,56 @@ def calculate_coverage_ratios(financial_data):
         annualization_factor = 1
         period_label = 'annual'
     else:
-        # Default to quarterly with warning if period unclear
-        print(f"⚠️  WARNING: Unable to detect reporting period from '{financial_data.get('reporting_period', 'Unknown')}'")
-        print(f"   Defaulting to quarterly (×4 multiplier). Verify annualized interest expense manually.")
+        # Default to quarterly if period unclear (caller decides whether to warn)
         annualization_factor = 4
         period_label = 'quarterly_assumed'
 
+    return annualization_factor, period_label
+
+
+def calculate_coverage_ratios(financial_data):
+    """
+    Calculate interest coverage and EBITDA-based ratios
+
+    Args:
+        financial_data (dict): Validated JSON from Phase 2 extraction
+
+    Returns:
+        dict: Coverage ratios
+
+    Raises:
+        KeyError: If required fields are missing
+        ValueError: If calculations produce invalid results
+    """
+
+    required_fields = [
+        'income_statement.noi',
+        'income_statement.interest_expense'
+    ]
+    validate_required_fields(financial_data, required_fields)
+
+    income = financial_data['income_statement']
+
+    noi = income['noi']
+    interest_expense = income['interest_expense']
+
+    if interest_expense <= 0:
+        raise ValueError(
+            f"Invalid interest_expense: {interest_expense}. "
+            f"Interest expense must be positive."
+        )
+
+    # NOI / Interest Coverage (period coverage is same as annualized if both same period)
+    noi_interest_coverage = noi / interest_expense
+
+    # Detect reporting period to determine correct annualization factor
+    annualization_factor, period_label = detect_reporting_period(
+        financial_data.get('reporting_period', '')
+    )
+    if period_label == 'quarterly_assumed':
+        print(f"⚠️  WARNING: Unable to detect reporting period from '{financial_data.get('reporting_period', 'Unknown')}'")
+        print(f"   Defaulting to quarterly (×4 multiplier). Verify annualized interest expense manually.")
+
     annualized_interest = interest_expense * annualization_factor
 
     return {
@@ -96,4 +116,4 @@ def calculate_coverage_ratios(financial_data):
     }
 
 
-__all__ = ['calculate_coverage_ratios']
+__all__ = ['detect_reporting_period', 'calculate_coverage_ratios']
@@ -6,6 +6,41 @@ following REALPAC White Paper (January 2022) guidelines.
 """
 
 
+# FFO adjustments (A-U) per REALPAC: component field -> adjustment letter
+FFO_ADJUSTMENT_FIELDS = {
+    'unrealized_fv_changes': 'A',
+    'depreciation_real_estate': 'B',
+    'amortization_tenant_allowances': 'C',
+    'amortization_intangibles': 'D',
+    'gains_losses_property_sales': 'E',
+    'tax_on_disposals': 'F',
+    'deferred_taxes': 'G',
+    'impairment_losses_reversals': 'H',
+    'revaluation_gains_losses': 'I',
+    'transaction_costs_business_comb': 'J',
+    'foreign_exchange_gains_losses': 'K',
+    'sale_foreign_operations': 'L',
+    'fv_changes_hedges': 'M',
+    'goodwill_impairment': 'N',
+    'puttable_instruments_effects': 'O',
+    'discontinued_operations': 'P',
+    'equity_accounted_adjustments': 'Q',
+    'incremental_leasing_costs': 'R',
+    'property_taxes_ifric21': 'S',
+    'rou_asset_revenue_expense': 'T',
+    'non_controlling_interests_ffo': 'U'
+}
+
+# AFFO adjustments (V-Z) per REALPAC: component field -> adjustment letter
+AFFO_ADJUSTMENT_FIELDS = {
+    'capex_sustaining': 'V',
+    'leasing_costs': 'W',
+    'tenant_improvements': 'X',
+    'straight_line_rent': 'Y',
+    'non_controlling_interests_affo': 'Z'
+}
+
+
 def calculate_ffo_from_components(financial_data):
     """
     Calculate FFO from IFRS net income using REALPAC methodology (adjustments A-U)
@@ -52,30 +87,7 @@ def calculate_ffo_from_components(financial_data):
 
     net_income = components['net_income_ifrs']
 
-    # Define all FFO adjustments (A-U) per REALPAC
-    adjustment_fields = {
-        'unrealized_fv_changes': 'A',
-        'depreciation_real_estate': 'B',
-        'amortization_tenant_allowances': 'C',
-        'amortization_intangibles': 'D',
-        'gains_losses_property_sales': 'E',
-        'tax_on_disposals': 'F',
-        'deferred_taxes': 'G',
-        'impairment_losses_reversals': 'H',
-        'revaluation_gains_losses': 'I',
-        'transaction_costs_business_comb': 'J',
-        'foreign_exchange_gains_losses': 'K',
-        'sale_foreign_operations': 'L',
-        'fv_changes_hedges': 'M',
-        'goodwill_impairment': 'N',
-        'puttable_instruments_effects': 'O',
-        'discontinued_operations': 'P',
-        'equity_accounted_adjustments': 'Q',
-        'incremental_leasing_costs': 'R',
-        'property_taxes_ifric21': 'S',
-        'rou_asset_revenue_expense': 'T',
-        'non_controlling_interests_ffo': 'U'
-    }
+    adjustment_fields = FFO_ADJUSTMENT_FIELDS
 
     # Collect adjustments and track missing ones
     adjustments = {}
@@ -182,14 +194,8 @@ def calculate_affo_from_ffo(financial_data, ffo):
 
     components = financial_data['ffo_affo_components']
 
-    # Define AFFO adjustments (V-Z) per REALPAC - all are subtractions from FFO
-    adjustment_fields = {
-        'capex_sustaining': 'V',
-        'leasing_costs': 'W',
-        'tenant_improvements': 'X',
-        'straight_line_rent': 'Y',
-        'non_controlling_interests_affo': 'Z'
-    }
+    # AFFO adjustments are all subtractions from FFO
+    adjustment_fields = AFFO_ADJUSTMENT_FIELDS
 
     # Collect adjustments and track missing ones
     adjustments = {}
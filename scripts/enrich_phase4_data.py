@@ -14,6 +14,9 @@ Usage:
         --ticker REI-UN.TO \
         --output Issuer_Reports/RioCan_REIT/temp/phase4_enriched_data.json
 
+    # Many issuers: model loaded once, macro fetched once, one batched prediction
+    python scripts/enrich_phase4_data.py --batch "Issuer_Reports/*/temp/phase3_calculated_metrics.json"
+
 Author: Claude Code
 Version: 1.0.0
 Date: 2025-10-22
@@ -21,7 +24,6 @@ Date: 2025-10-22
 
 import argparse
 import json
-import pickle
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -34,20 +36,82 @@ import pandas as pd
 try:
     # Market monitor
     sys.path.insert(0, str(Path(__file__).parent))
-    from openbb_market_monitor import MarketDataMonitor
+    from openbb_market_monitor import (
+        AsyncMarketDataCollector,
+        MarketDataMonitor,
+        collect_market_assessments,
+        load_ticker_universe,
+    )
     from openbb_macro_monitor import EnhancedMacroMonitor
+    from macro_series_cache import MacroSeriesCache, set_default_cache
+    from model_artifact import ModelArtifact, load_model_artifact
 except ImportError as e:
     print(f"ERROR: Cannot import OpenBB monitoring modules: {e}")
     print("Ensure openbb_market_monitor.py and openbb_macro_monitor.py exist")
     sys.exit(1)
 
 
+DEFAULT_MODEL_FILE = "models/distribution_cut_logistic_regression_v2.2.pkl"
+
+
+def load_prediction_model(model_file) -> ModelArtifact:
+    """
+    Load a trained distribution cut model.
+
+    Reads the model's metadata sidecar (<model>.model.json) when present; the
+    estimator itself is unpickled on first prediction. Legacy pickles without
+    a sidecar are loaded eagerly.
+
+    Args:
+        model_file: Path to the model pickle
+
+    Returns:
+        ModelArtifact (feature schema, encodings, selector, scaler, metrics)
+
+    Raises:
+        FileNotFoundError: If the model file does not exist
+        ModelSchemaError: If the metadata or estimator does not match the schema
+    """
+    return load_model_artifact(model_file)
+
+
+def predict_cut_probabilities(artifact: ModelArtifact, feature_rows) -> tuple:
+    """
+    Score many feature vectors in one pass.
+
+    Models with a fused scorer (v2.2 logistic regression) are scored with one
+    NumPy matrix-vector product; others go through the unpickled estimator
+    after feature selection and scaling.
+
+    Args:
+        artifact: Model from load_prediction_model()
+        feature_rows: List of feature dicts from Phase4DataEnricher._prepare_features()
+
+    Returns:
+        tuple: (cut probabilities in 0-1, predicted class labels), one per row
+
+    Raises:
+        ModelSchemaError: If a feature dict does not match the model's feature schema
+    """
+    X = artifact.feature_matrix(feature_rows)
+
+    if artifact.fused_scorer is not None:
+        return artifact.fused_scorer.predict_proba(X), artifact.fused_scorer.predict(X)
+
+    # Apply feature selection (28 → 15 for v2.2), then scale
+    X_scaled = artifact.transform(X)
+
+    model = artifact.estimator
+    return model.predict_proba(X_scaled)[:, 1], model.predict(X_scaled)
+
+
 class Phase4DataEnricher:
     """
     Enriches Phase 3 calculated metrics with market, macro, and predictive data.
     """
 
-    def __init__(self, phase3_file: str, ticker: str, model_file: str = "models/distribution_cut_logistic_regression_v2.2.pkl"):
+    def __init__(self, phase3_file: str, ticker: str, model_file: str = DEFAULT_MODEL_FILE,
+                 artifact: Optional[ModelArtifact] = None, phase3_data: Optional[Dict] = None):
         """
         Initialize enricher.
 
@@ -58,16 +122,18 @@ class Phase4DataEnricher:
             phase3_file: Path to Phase 3 calculated metrics JSON
             ticker: REIT ticker symbol (e.g., 'REI-UN.TO')
             model_file: Path to trained prediction model pickle file
+            artifact: Already-loaded model (portfolio runs load it once); skips model_file
+            phase3_data: Already-loaded Phase 3 metrics (skips reading phase3_file)
         """
         self.phase3_file = Path(phase3_file)
         self.ticker = ticker
         self.model_file = Path(model_file)
 
         # Load Phase 3 data
-        self.phase3_data = self._load_phase3_data()
+        self.phase3_data = phase3_data if phase3_data is not None else self._load_phase3_data()
 
         # Load prediction model
-        self.model_data = self._load_model()
+        self.artifact = artifact if artifact is not None else self._load_model()
 
     def _load_phase3_data(self) -> Dict:
         """Load Phase 3 calculated metrics."""
@@ -80,20 +146,16 @@ class Phase4DataEnricher:
         print(f"✓ Loaded Phase 3 data: {self.phase3_file}")
         return data
 
-    def _load_model(self) -> Dict:
+    def _load_model(self) -> ModelArtifact:
         """Load trained prediction model."""
-        if not self.model_file.exists():
-            raise FileNotFoundError(f"Model file not found: {self.model_file}")
-
-        with open(self.model_file, 'rb') as f:
-            model_data = pickle.load(f)
+        artifact = load_prediction_model(self.model_file)
 
         print(f"✓ Loaded prediction model: {self.model_file}")
-        print(f"  Model type: {model_data.get('model_type', 'unknown')}")
-        print(f"  Version: {model_data.get('version', 'unknown')}")
-        print(f"  F1 Score: {model_data.get('metrics', {}).get('f1', 'N/A'):.3f}")
+        print(f"  Model type: {artifact.model_type}")
+        print(f"  Version: {artifact.version}")
+        print(f"  F1 Score: {artifact.metrics.get('f1', 'N/A'):.3f}")
 
-        return model_data
+        return artifact
 
     def collect_market_data(self, lookback_days: int = 365) -> Dict:
         """
@@ -229,71 +291,13 @@ class Phase4DataEnricher:
             # Extract features from Phase 3 data (28 features for v2.2)
             features = self._prepare_features(market_data, macro_data)
 
-            # Load model components
-            model = self.model_data['model']
-            scaler = self.model_data['scaler']
-            selector = self.model_data['selector']
-            selected_features = self.model_data['selected_features']
-            target_encoder = self.model_data['target_encoder']
-
-            # Create feature vector (28 features for v2.2)
-            X = pd.DataFrame([features])
-
-            # Apply feature selection (28 → 15 for v2.2)
-            X_selected = selector.transform(X)
-
-            # Scale features
-            X_scaled = scaler.transform(X_selected)
-
-            # Predict
-            y_pred_proba = model.predict_proba(X_scaled)[0]
-            y_pred = model.predict(X_scaled)[0]
-
-            # Get prediction details
-            cut_probability = y_pred_proba[1] * 100  # Probability of "target" class
-            risk_level = self._classify_risk(cut_probability)
-            risk_badge = self._get_risk_badge(risk_level)
-
-            # Get top 5 risk drivers
-            feature_importance = pd.DataFrame({
-                'feature': selected_features,
-                'coefficient': model.coef_[0],
-                'abs_coefficient': np.abs(model.coef_[0])
-            }).sort_values('abs_coefficient', ascending=False)
-
-            top_drivers = []
-            for i, row in feature_importance.head(5).iterrows():
-                feature_value = X[row['feature']].iloc[0] if row['feature'] in X.columns else 0
-                direction = "Increases" if row['coefficient'] > 0 else "Decreases"
-
-                top_drivers.append({
-                    'rank': len(top_drivers) + 1,
-                    'feature': row['feature'],
-                    'value': feature_value,
-                    'coefficient': row['coefficient'],
-                    'direction': direction
-                })
-
-            result = {
-                'model_version': self.model_data['version'],
-                'prediction_date': datetime.now().strftime('%Y-%m-%d'),
-                'cut_probability_pct': round(cut_probability, 1),
-                'predicted_class': target_encoder.inverse_transform([y_pred])[0],
-                'risk_level': risk_level,
-                'risk_badge': risk_badge,
-                'confidence': 'High' if abs(cut_probability - 50) > 30 else 'Moderate',
-                'top_drivers': top_drivers,
-                'model_performance': {
-                    'f1_score': self.model_data['metrics']['f1'],
-                    'roc_auc': self.model_data['metrics']['roc_auc'],
-                    'accuracy': self.model_data['metrics']['accuracy']
-                }
-            }
+            probabilities, predictions = predict_cut_probabilities(self.artifact, [features])
+            result = self._build_prediction_result(features, probabilities[0], predictions[0])
 
             print(f"✓ Prediction complete")
-            print(f"  Cut probability: {cut_probability:.1f}%")
-            print(f"  Risk level: {risk_level}")
-            print(f"  Top driver: {top_drivers[0]['feature']} ({top_drivers[0]['direction']})")
+            print(f"  Cut probability: {result['cut_probability_pct']:.1f}%")
+            print(f"  Risk level: {result['risk_level']}")
+            print(f"  Top driver: {result['top_drivers'][0]['feature']} ({result['top_drivers'][0]['direction']})")
 
             return result
 
@@ -303,6 +307,58 @@ class Phase4DataEnricher:
             traceback.print_exc()
             return self._generate_prediction_fallback()
 
+    def _build_prediction_result(self, features: Dict, cut_probability: float, y_pred) -> Dict:
+        """
+        Format a model score as the distribution_cut_prediction section.
+
+        Args:
+            features: Feature dict from _prepare_features()
+            cut_probability: Probability of a cut (0-1)
+            y_pred: Predicted (encoded) class
+
+        Returns:
+            Prediction results dictionary
+        """
+        selected_features = self.artifact.selected_features
+        if self.artifact.fused_scorer is not None:
+            coefficients = self.artifact.fused_scorer.coefficients
+        else:
+            coefficients = self.artifact.estimator.coef_[0]
+
+        cut_probability = cut_probability * 100  # Probability of "target" class
+        risk_level = self._classify_risk(cut_probability)
+        risk_badge = self._get_risk_badge(risk_level)
+
+        # Get top 5 risk drivers (largest absolute coefficients)
+        top_drivers = []
+        for i in np.argsort(-np.abs(coefficients), kind='stable')[:5]:
+            feature = selected_features[i]
+            direction = "Increases" if coefficients[i] > 0 else "Decreases"
+
+            top_drivers.append({
+                'rank': len(top_drivers) + 1,
+                'feature': feature,
+                'value': features.get(feature, 0),
+                'coefficient': float(coefficients[i]),
+                'direction': direction
+            })
+
+        return {
+            'model_version': self.artifact.version,
+            'prediction_date': datetime.now().strftime('%Y-%m-%d'),
+            'cut_probability_pct': round(cut_probability, 1),
+            'predicted_class': self.artifact.decode_target(y_pred),
+            'risk_level': risk_level,
+            'risk_badge': risk_badge,
+            'confidence': 'High' if abs(cut_probability - 50) > 30 else 'Moderate',
+            'top_drivers': top_drivers,
+            'model_performance': {
+                'f1_score': self.artifact.metrics['f1'],
+                'roc_auc': self.artifact.metrics['roc_auc'],
+                'accuracy': self.artifact.metrics['accuracy']
+            }
+        }
+
     def _prepare_features(self, market_data: Dict, macro_data: Dict) -> Dict:
         """
         Prepare feature vector from Phase 3 data for model v2.2.
@@ -402,18 +458,13 @@ class Phase4DataEnricher:
         dilution = phase3.get('dilution_analysis', {})
         features['dilution_percentage'] = dilution.get('dilution_percentage') or 0
 
-        # Encode categorical feature: dilution_materiality (1 feature)
+        # Encode categorical feature: dilution_materiality (1 feature, encoding from the model artifact)
         dilution_materiality_str = dilution.get('dilution_materiality', 'low')
-        materiality_encoding = {'minimal': 0, 'low': 1, 'moderate': 2, 'high': 3}
-        features['dilution_materiality'] = materiality_encoding.get(dilution_materiality_str, 1)
+        features['dilution_materiality'] = self.artifact.encode('dilution_materiality', dilution_materiality_str)
 
         # Sector (from Phase 2 or default) - encode as numeric (1 feature)
         sector_str = phase3.get('sector', 'Other')
-        sector_encoding = {
-            'Retail': 0, 'Office': 1, 'Industrial': 2, 'Residential': 3,
-            'Diversified': 4, 'Healthcare': 5, 'Storage': 6, 'Other': 7
-        }
-        features['sector'] = sector_encoding.get(sector_str, 7)
+        features['sector'] = self.artifact.encode('sector', sector_str)
 
         # Total: 28 features (3+4+3+6+2+3+2+2+2+1 = 28)
         return features
@@ -604,12 +655,38 @@ class Phase4DataEnricher:
         prediction_data = self.run_prediction_model(market_data, macro_data)
 
         # Merge everything
-        enriched = {
+        enriched = self.assemble(market_data, macro_data, distribution_data, prediction_data)
+
+        print(f"\n{'='*60}")
+        print("✅ ENRICHMENT COMPLETE")
+        print(f"{'='*60}")
+        print(f"  Market risk collected: {'✓' if 'error' not in market_data else '✗'}")
+        print(f"  Macro data collected: {'✓' if 'error' not in macro_data else '✗'}")
+        print(f"  Distribution history: {'✓' if distribution_data.get('data_quality') != 'unavailable' else '✗'}")
+        print(f"  Prediction generated: {'✓' if 'error' not in prediction_data else '✗'}")
+
+        return enriched
+
+    def assemble(self, market_data: Dict, macro_data: Dict, distribution_data: Dict,
+                 prediction_data: Dict) -> Dict:
+        """
+        Merge collected sections into the phase4_enriched_data.json structure.
+
+        Args:
+            market_data: Market assessment (or fallback)
+            macro_data: Macro assessment (or fallback)
+            distribution_data: Distribution history (or fallback)
+            prediction_data: Prediction results (or fallback)
+
+        Returns:
+            Enriched data dictionary
+        """
+        return {
             'metadata': {
                 'ticker': self.ticker,
                 'enrichment_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'phase3_source': str(self.phase3_file),
-                'model_version': self.model_data.get('version', 'unknown')
+                'model_version': self.artifact.version
             },
             'phase3_metrics': self.phase3_data,
             'market_risk': market_data,
@@ -618,16 +695,6 @@ class Phase4DataEnricher:
             'distribution_cut_prediction': prediction_data
         }
 
-        print(f"\n{'='*60}")
-        print("✅ ENRICHMENT COMPLETE")
-        print(f"{'='*60}")
-        print(f"  Market risk collected: {'✓' if 'error' not in market_data else '✗'}")
-        print(f"  Macro data collected: {'✓' if 'error' not in macro_data else '✗'}")
-        print(f"  Distribution history: {'✓' if distribution_data.get('data_quality') != 'unavailable' else '✗'}")
-        print(f"  Prediction generated: {'✓' if 'error' not in prediction_data else '✗'}")
-
-        return enriched
-
     def save(self, enriched_data: Dict, output_file: str):
         """Save enriched data to JSON file."""
         output_path = Path(output_file)
@@ -653,24 +720,314 @@ class Phase4DataEnricher:
         print(f"   File size: {output_path.stat().st_size / 1024:.1f} KB")
 
 
+PORTFOLIO_DEFAULT_GLOB = "Issuer_Reports/*/temp/phase3_calculated_metrics.json"
+PHASE4_OUTPUT_FILE = "phase4_enriched_data.json"
+REIT_UNIVERSE_FILE = Path(__file__).resolve().parent.parent / 'config' / 'canadian_reits.yaml'
+
+
+def resolve_issuer_ticker(issuer_folder: str, universe: Dict[str, str]) -> Optional[str]:
+    """
+    Map an Issuer_Reports folder name to a ticker.
+
+    'Artis_REIT' matches 'Artis REIT' exactly; otherwise a single universe
+    name starting with the folder name ('Allied_Properties' ->
+    'Allied Properties REIT') is accepted.
+
+    Args:
+        issuer_folder: Issuer folder name (underscores for spaces)
+        universe: REIT name -> ticker mapping (config/canadian_reits.yaml)
+
+    Returns:
+        Ticker symbol, or None if the folder matches no (or several) REITs
+    """
+    name = issuer_folder.replace('_', ' ').lower()
+    by_name = {reit.lower(): ticker for reit, ticker in universe.items()}
+    if name in by_name:
+        return by_name[name]
+
+    candidates = [ticker for reit, ticker in by_name.items() if reit.startswith(name + ' ')]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def discover_enrichment_jobs(source: str = PORTFOLIO_DEFAULT_GLOB, universe: Optional[Dict[str, str]] = None):
+    """
+    Resolve a --batch source into enrichment jobs.
+
+    The source is either a JSON manifest or a glob over Phase 3 metrics files.
+    A manifest is a list of objects with "phase3" and "ticker" keys and an
+    optional "output" path; relative paths are resolved against the manifest's
+    directory. Glob matches (Issuer_Reports/<Issuer>/temp/...) take their
+    ticker from the issuer folder name via the REIT universe.
+
+    Args:
+        source: Manifest JSON path or glob pattern
+        universe: REIT name -> ticker mapping (default: config/canadian_reits.yaml)
+
+    Returns:
+        tuple: (jobs, skipped) where jobs is a list of dicts with 'phase3',
+            'ticker' and 'output' keys, and skipped lists Phase 3 files whose
+            ticker could not be resolved
+
+    Raises:
+        ValueError: If a manifest entry is malformed
+    """
+    import glob
+
+    jobs = []
+    skipped = []
+    source_path = Path(source)
+
+    if source_path.is_file() and source_path.suffix == '.json':
+        base = source_path.parent
+        with open(source_path, 'r') as f:
+            entries = json.load(f)
+
+        for entry in entries:
+            if not (isinstance(entry, dict) and entry.get('phase3') and entry.get('ticker')):
+                raise ValueError(
+                    f"Invalid manifest entry in {source_path}: {entry!r}\n"
+                    f"Expected an object with 'phase3' and 'ticker' keys"
+                )
+            phase3 = base / entry['phase3']
+            output = base / entry['output'] if entry.get('output') else phase3.parent / PHASE4_OUTPUT_FILE
+            jobs.append({'phase3': str(phase3), 'ticker': entry['ticker'], 'output': str(output)})
+        return jobs, skipped
+
+    if universe is None:
+        universe = load_ticker_universe(REIT_UNIVERSE_FILE)
+
+    for match in sorted(glob.glob(source)):
+        phase3 = Path(match)
+        # Issuer_Reports/<Issuer>/temp/phase3_calculated_metrics.json
+        ticker = resolve_issuer_ticker(phase3.parent.parent.name, universe)
+        if ticker is None:
+            skipped.append(str(phase3))
+        else:
+            jobs.append({'phase3': str(phase3), 'ticker': ticker,
+                         'output': str(phase3.parent / PHASE4_OUTPUT_FILE)})
+
+    return jobs, skipped
+
+
+def enrich_portfolio(
+    jobs,
+    model_file: str = DEFAULT_MODEL_FILE,
+    market_lookback_days: int = 365,
+    macro_lookback_months: int = 120,
+    collector: Optional[AsyncMarketDataCollector] = None,
+    macro_monitor: Optional[EnhancedMacroMonitor] = None,
+    artifact: Optional[ModelArtifact] = None
+) -> Dict:
+    """
+    Enrich many issuers with shared model, macro and market work.
+
+    The model is loaded once, the macro assessment is collected once (while
+    market prices download), market data for all tickers is collected
+    concurrently, and all issuers are scored with a single predict_proba call.
+    Jobs sharing a ticker share its market data; predictions and outputs are
+    per job, since each job scores its own Phase 3 metrics. Each job's
+    phase4_enriched_data.json has the same structure as a single-issuer
+    Phase4DataEnricher.enrich() run.
+
+    Args:
+        jobs: List of dicts with 'phase3', 'ticker' and 'output' keys
+        model_file: Path to trained prediction model pickle file
+        market_lookback_days: Market data lookback (default: 365 days)
+        macro_lookback_months: Macro data lookback (default: 120 months)
+        collector: Configured market collector (default: AsyncMarketDataCollector('tmx'))
+        macro_monitor: Macro monitor (default: EnhancedMacroMonitor() on the shared series cache)
+        artifact: Already-loaded model (skips model_file)
+
+    Returns:
+        dict: Summary with counts, stage timings, failures and per-issuer results
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    timing = {}
+    failures = []
+    started = time.perf_counter()
+
+    stage = time.perf_counter()
+    if artifact is None:
+        artifact = load_prediction_model(model_file)
+    timing['model_load_seconds'] = time.perf_counter() - stage
+
+    enrichers = []
+    for job in jobs:
+        try:
+            enrichers.append((job, Phase4DataEnricher(job['phase3'], job['ticker'], model_file,
+                                                      artifact=artifact)))
+        except Exception as e:
+            failures.append({'ticker': job['ticker'], 'phase3': job['phase3'], 'error': str(e)})
+
+    if not enrichers:
+        timing['wall_seconds'] = time.perf_counter() - started
+        return _summarize_portfolio(jobs, [], failures, timing)
+
+    fallback = enrichers[0][1]
+    collector = collector or AsyncMarketDataCollector(provider='tmx')
+    macro_monitor = macro_monitor or EnhancedMacroMonitor()
+
+    # Macro is identical for every issuer: one assessment, overlapped with market collection
+    stage = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        macro_future = executor.submit(macro_monitor.generate_assessment, macro_lookback_months)
+
+        tickers = list(dict.fromkeys(enricher.ticker for _, enricher in enrichers))
+        try:
+            assessments = collect_market_assessments(tickers, market_lookback_days, collector=collector)
+        except Exception as e:
+            print(f"⚠️  Market data collection error: {e}")
+            assessments = {}
+        timing['market_seconds'] = time.perf_counter() - stage
+
+        try:
+            macro_data = macro_future.result()
+        except Exception as e:
+            print(f"⚠️  Macro data collection error: {e}")
+            macro_data = fallback._generate_macro_fallback()
+    timing['market_and_macro_seconds'] = time.perf_counter() - stage
+
+    # Indexed like enrichers: several jobs (e.g. reporting periods) may share a ticker
+    market = []
+    for _, enricher in enrichers:
+        assessment = assessments.get(enricher.ticker)
+        if assessment is None or 'error' in assessment:
+            print(f"⚠️  Market data unavailable for {enricher.ticker}: "
+                  f"{(assessment or {}).get('error', 'not collected')}")
+            assessment = enricher._generate_market_fallback()
+        market.append(assessment)
+
+    # One batched predict_proba for the whole portfolio
+    stage = time.perf_counter()
+    predictions = [None] * len(enrichers)
+    try:
+        features = [enricher._prepare_features(market_data, macro_data)
+                    for (_, enricher), market_data in zip(enrichers, market)]
+        probabilities, classes = predict_cut_probabilities(artifact, features)
+        for i, ((_, enricher), feature_row, probability, y_pred) in enumerate(
+                zip(enrichers, features, probabilities, classes)):
+            predictions[i] = enricher._build_prediction_result(feature_row, probability, y_pred)
+    except Exception as e:
+        print(f"⚠️  Prediction model error: {e}")
+    timing['scoring_seconds'] = time.perf_counter() - stage
+
+    stage = time.perf_counter()
+    results = []
+    for (job, enricher), market_data, prediction_data in zip(enrichers, market, predictions):
+        try:
+            prediction_data = prediction_data or enricher._generate_prediction_fallback()
+            enriched = enricher.assemble(market_data, macro_data,
+                                         enricher.collect_distribution_history(), prediction_data)
+            enricher.save(enriched, job['output'])
+            results.append({
+                'ticker': enricher.ticker,
+                'phase3': job['phase3'],
+                'output': job['output'],
+                'market_data': 'error' not in market_data,
+                'cut_probability_pct': prediction_data.get('cut_probability_pct'),
+                'risk_level': prediction_data.get('risk_level'),
+            })
+        except Exception as e:
+            failures.append({'ticker': enricher.ticker, 'phase3': job['phase3'], 'error': str(e)})
+    timing['write_seconds'] = time.perf_counter() - stage
+    timing['wall_seconds'] = time.perf_counter() - started
+
+    return _summarize_portfolio(jobs, results, failures, timing)
+
+
+def _summarize_portfolio(jobs, results, failures, timing) -> Dict:
+    return {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'total': len(jobs),
+        'succeeded': len(results),
+        'failed': len(failures),
+        'timing': {name: round(seconds, 3) for name, seconds in timing.items()},
+        'failures': failures,
+        'results': results,
+    }
+
+
+def run_portfolio_mode(args) -> int:
+    """Execute --batch: discover jobs, enrich the portfolio, write summary. Returns exit code."""
+    print(f"{'='*60}")
+    print("PHASE 4 PORTFOLIO ENRICHMENT")
+    print(f"{'='*60}")
+
+    jobs, skipped = discover_enrichment_jobs(args.batch)
+    print(f"\n🔎 Batch source: {args.batch}")
+    print(f"✓ {len(jobs)} issuer(s) to enrich ({len(skipped)} skipped - ticker not in REIT universe)")
+    for path in skipped:
+        print(f"  - {path}")
+
+    if not jobs:
+        print("\n❌ Error: No issuers found for batch source")
+        return 1
+
+    collector = AsyncMarketDataCollector(provider='tmx', max_concurrency=args.concurrency)
+    summary = enrich_portfolio(jobs, args.model, args.market_lookback, args.macro_lookback,
+                               collector=collector)
+    summary['skipped'] = skipped
+
+    if args.summary:
+        summary_path = Path(args.summary)
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(summary_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+    print(f"\n{'='*60}")
+    print("PORTFOLIO SUMMARY")
+    print(f"{'='*60}")
+    for r in summary['results']:
+        print(f"  ✓ {r['ticker']}: {r['cut_probability_pct']}% ({r['risk_level']}) → {r['output']}")
+    for failure in summary['failures']:
+        print(f"  ✗ {failure['ticker']}: {failure['error']}")
+    print(f"Succeeded: {summary['succeeded']}/{summary['total']}")
+    print(f"Wall time: {summary['timing']['wall_seconds']:.2f}s "
+          f"(market+macro {summary['timing'].get('market_and_macro_seconds', 0):.2f}s, "
+          f"scoring {summary['timing'].get('scoring_seconds', 0):.3f}s)")
+    if args.summary:
+        print(f"Summary: {args.summary}")
+
+    return 0 if summary['failed'] == 0 else 1
+
+
 def main():
     """Command-line interface for Phase 4 data enrichment."""
     parser = argparse.ArgumentParser(
         description="Enrich Phase 3 metrics with market, macro, and predictive data"
     )
-    parser.add_argument('--phase3', '--phase3-file', dest='phase3', required=True,
+    parser.add_argument('--phase3', '--phase3-file', dest='phase3',
                        help='Path to Phase 3 calculated metrics JSON')
-    parser.add_argument('--ticker', required=True, help='REIT ticker symbol (e.g., REI-UN.TO)')
+    parser.add_argument('--ticker', help='REIT ticker symbol (e.g., REI-UN.TO)')
     parser.add_argument('--output', help='Output file for enriched data (default: same dir as phase3)')
-    parser.add_argument('--model', default='models/distribution_cut_logistic_regression_v2.2.pkl',
+    parser.add_argument('--batch', nargs='?', const=PORTFOLIO_DEFAULT_GLOB, metavar='MANIFEST_OR_GLOB',
+                       help=f'Enrich many issuers from a JSON manifest or glob (default: "{PORTFOLIO_DEFAULT_GLOB}")')
+    parser.add_argument('--concurrency', type=int, default=8,
+                       help='Concurrent market data requests in --batch mode (default: 8)')
+    parser.add_argument('--summary', help='Write a --batch JSON summary (timings, failures) to this path')
+    parser.add_argument('--model', default=DEFAULT_MODEL_FILE,
                        help='Path to trained model (default: v2.2 - sustainable AFCF methodology)')
     parser.add_argument('--market-lookback', type=int, default=365,
                        help='Market data lookback days (default: 365)')
     parser.add_argument('--macro-lookback', type=int, default=120,
                        help='Macro data lookback months (default: 120)')
+    parser.add_argument('--macro-cache-dir', type=Path,
+                       help='Shared BoC/FRED series cache directory (default: .cache/macro_series)')
+    parser.add_argument('--macro-ttl-hours', type=float, default=6,
+                       help='Refresh cached macro series older than this (default: 6; 0 = always refresh)')
 
     args = parser.parse_args()
 
+    set_default_cache(MacroSeriesCache(args.macro_cache_dir, ttl_seconds=args.macro_ttl_hours * 3600))
+
+    if args.batch:
+        return run_portfolio_mode(args)
+
+    if not args.phase3 or not args.ticker:
+        parser.error('--phase3 and --ticker are required (or use --batch)')
+
     # Default output path
     if not args.output:
         phase3_path = Path(args.phase3)
@@ -13,6 +13,7 @@ Configuration support: v1.1.0
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -45,6 +46,19 @@ def generate_template_from_schema(schema_path=None):
     with open(schema_path) as f:
         schema = json.load(f)
 
+    return template_from_schema(schema)
+
+
+def template_from_schema(schema):
+    """
+    Template for an already-loaded schema (or a fragment of it)
+
+    Args:
+        schema: JSON schema dict with 'properties'
+
+    Returns:
+        dict: Template with the schema's structure and zero/empty values
+    """
     def process_field(field_spec):
         """Recursively process a field specification to generate default value"""
         field_type = field_spec.get('type')
@@ -321,6 +335,82 @@ The previous extraction got some things right. Use this as reference but FIX THE
     return prompt
 
 
+def create_field_retry_prompt(output_path, issuer_name, previous_errors, plan, patch_path, attempt_number):
+    """
+    Create a retry prompt that asks only for the fields that failed validation
+
+    Args:
+        output_path: Path of the extraction JSON (left as is; the patch is merged into it)
+        issuer_name: Name of issuer
+        previous_errors: List of validation errors from previous attempt
+        plan: phase2_field_retry.plan_field_retry() result (paths, ranges, hints)
+        patch_path: Where the JSON patch should be saved
+        attempt_number: Which attempt this is (2 or 3)
+
+    Returns:
+        str: Targeted retry prompt
+    """
+    error_list = "\n".join(f"  • {e}" for e in previous_errors if e.startswith('❌'))
+    guidance = format_error_guidance(previous_errors)
+    field_list = "\n".join(f"- `{path}`" for path in plan['paths'])
+    range_list = "\n".join(
+        f"- `{r['file']}` lines {r['start_line']}-{r['end_line']} ({', '.join(r['sections'])}): "
+        + ", ".join(f"`{f}`" for f in r['fields'])
+        for r in plan['ranges']
+    )
+    hint_list = "\n".join(
+        f"- `{path}`: {hint['value']} from `{hint['source']}` line {hint['line']} "
+        f"(\"{hint['label']}\", {hint['column'] or 'first column'}; {hint['caption'] or 'table'})"
+        for path, hint in plan['hints'].items()
+    ) or "- (none)"
+    example = {path: 0 for path in plan['paths'][:3]}
+
+    prompt = f"""# Phase 2: TARGETED RETRY (Attempt {attempt_number}/3) - {issuer_name}
+
+⚠️ **PREVIOUS ATTEMPT FAILED VALIDATION** - only {len(plan['paths'])} field(s) need fixing.
+Everything else in `{output_path}` passed and is kept as is. Do NOT re-extract the whole document.
+
+## FIELDS TO FIX
+
+{field_list}
+
+**Validation errors:**
+{error_list}
+
+**Guidance:**
+{guidance}
+
+## WHERE TO LOOK
+
+Read ONLY these line ranges (Read tool with offset/limit):
+
+{range_list}
+
+**Candidate table rows** (found deterministically; confirm the period and statement before using):
+
+{hint_list}
+
+## OUTPUT
+
+Save a JSON object mapping each dotted field path above to its value to: `{patch_path}`
+
+```json
+{json.dumps(example, indent=2)}
+```
+
+**Rules:**
+1. **Only the fields listed above** - no other keys, no nested objects for these paths
+2. **Numbers:** No commas or $ signs; amounts in thousands as shown in statements
+3. **Rates:** Decimals (0.878 not 87.8)
+4. **Most recent period** (current quarter / period end)
+5. **Use 0 for values not disclosed** (NOT null)
+
+Do NOT edit `{output_path}` directly. Run the extraction script again afterwards: it merges the patch and re-validates.
+"""
+
+    return prompt
+
+
 def check_and_validate_existing_output(output_path):
     """
     Check if output JSON exists and validate it
@@ -390,7 +480,58 @@ def save_retry_metadata(output_path, attempt_number):
         json.dump(metadata, f, indent=2)
 
 
-def create_efficient_extraction_prompt(markdown_files, output_path, issuer_name):
+def replay_cached_extraction(prompt, input_files, output_path, issuer_name, model_id, cache_dir=None):
+    """
+    Write a cached extraction for this prompt to the output, or remember its key
+
+    On a miss the key is saved next to the output, and the next run stores
+    the extraction once it validates. A cached extraction that no longer
+    validates is dropped and counts as a miss.
+
+    Args:
+        prompt: Initial extraction prompt
+        input_files: Input files the prompt references
+        output_path: Path to output JSON file
+        issuer_name: Name of issuer
+        model_id: Model that runs the extraction
+        cache_dir: LLM response cache directory (default: .cache/llm_responses)
+
+    Returns:
+        bool: True if a valid cached extraction was written to output_path
+    """
+    from llm_response_cache import (ResponseCache, key_material, pending_key_path, prompt_digest,
+                                    response_key, save_pending_key)
+    from validate_extraction_schema import validate_schema
+
+    schema_path = Path(__file__).parent.parent / '.claude' / 'knowledge' / 'phase2_extraction_schema_v2.json'
+    material = key_material(input_files, schema_path, prompt_digest(prompt, input_files, output_path), model_id)
+    key = response_key(material)
+    cache = ResponseCache(cache_dir)
+
+    data = cache.get(key, stage='phase2', label=issuer_name)
+    if data is not None and not validate_schema(data)[0]:
+        print("   ⚠️  Cached extraction no longer validates - dropped")
+        cache.remove(key)
+        data = None
+    if data is None:
+        save_pending_key(output_path, key, material, label=issuer_name)
+        print(f"   Cache miss ({key[:12]}) - the validated extraction will be cached")
+        return False
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    pending_key_path(output_path).unlink(missing_ok=True)
+    print(f"\n♻️  Cache hit ({key[:12]}): replayed the extraction of identical inputs, schema, prompt and model")
+    print(f"   Output: {output_path}")
+    print(f"   Issuer: {data.get('issuer_name', 'Unknown')}")
+    print(f"   Reporting Date: {data.get('reporting_date', 'Unknown')}")
+    print("\n✅ This file is compatible with Phase 3 calculations")
+    return True
+
+
+def create_efficient_extraction_prompt(markdown_files, output_path, issuer_name, prefill=None):
     """
     Create EFFICIENT extraction prompt for Claude Code
 
@@ -401,6 +542,9 @@ def create_efficient_extraction_prompt(markdown_files, output_path, issuer_name)
         markdown_files: List of markdown file paths
         output_path: Path where JSON should be saved
         issuer_name: Name of issuer
+        prefill: Optional phase2_table_prefill.prefill_fields() result; its
+            values are filled into the template and the prompt asks only
+            for the remaining fields
 
     Returns:
         str: Compact prompt for Claude Code
@@ -414,6 +558,13 @@ def create_efficient_extraction_prompt(markdown_files, output_path, issuer_name)
     # Generate pre-filled template
     template = generate_template_from_schema(schema_path)
 
+    # Values already read deterministically from the tables
+    prefill_section = ""
+    if prefill and prefill.get('fields'):
+        from phase2_table_prefill import apply_prefill, format_prefill_section
+        template = apply_prefill(template, prefill)
+        prefill_section = format_prefill_section(prefill) + "\n"
+
     # Create file list with paths
     file_list = "\n".join([f"- `{f}`" for f in markdown_files])
 
@@ -433,7 +584,7 @@ def create_efficient_extraction_prompt(markdown_files, output_path, issuer_name)
 ### Step 1: Read Files
 Use the Read tool to access each markdown file listed above.
 
-### Step 2: Extract Required Data
+{prefill_section}### Step 2: Extract Required Data
 
 **IMPORTANT: Use this EXACT JSON structure** (fill in actual values from source documents, keep structure unchanged):
 
@@ -1061,6 +1212,37 @@ def main():
         action='store_true',
         help='Treat input as PDF files (direct PDF→JSON extraction)'
     )
+    parser.add_argument(
+        '--no-table-prefill',
+        action='store_true',
+        help='Skip the deterministic table pre-extraction (the LLM extracts every field)'
+    )
+    parser.add_argument(
+        '--full-retry',
+        action='store_true',
+        help='On validation errors, re-extract the whole document instead of only the failing fields'
+    )
+    parser.add_argument(
+        '--prefill-min-confidence',
+        type=float,
+        default=0.8,
+        help='Lowest confidence of a table value that is pre-filled (default: 0.8)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not replay or store validated extractions in the LLM response cache'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='LLM response cache directory (default: .cache/llm_responses in the repo root)'
+    )
+    parser.add_argument(
+        '--model-id',
+        default=os.environ.get('ANTHROPIC_MODEL', 'default'),
+        help='Model that runs the extraction, part of the cache key (default: $ANTHROPIC_MODEL or "default")'
+    )
 
     args = parser.parse_args()
 
@@ -1131,6 +1313,16 @@ def main():
     else:
         print(f"📊 Estimated tokens if embedded: ~{total_size//4:,}")
 
+    # Merge the answer to a targeted retry before validating
+    from phase2_field_retry import apply_retry_patch, plan_field_retry, retry_patch_path
+    try:
+        merged = apply_retry_patch(args.output)
+    except ValueError as e:
+        print(f"\n⚠️  Retry patch not merged: {e}")
+        merged = None
+    if merged:
+        print(f"\n🩹 Merged {len(merged)} retried field(s) into {args.output}")
+
     # Check if output exists and validate (for automatic retry)
     print(f"\n🔍 Checking for existing extraction...")
     exists, is_valid, errors, previous_data, attempt_number = check_and_validate_existing_output(args.output)
@@ -1144,6 +1336,14 @@ def main():
         print(f"   Issuer: {previous_data.get('issuer_name', 'Unknown')}")
         print(f"   Reporting Date: {previous_data.get('reporting_date', 'Unknown')}")
         print("\n✅ This file is compatible with Phase 3 calculations")
+
+        # Cache the extraction under the key of the prompt that produced it
+        if not args.no_cache:
+            from llm_response_cache import ResponseCache, store_pending_response
+            cache = ResponseCache(args.cache_dir)
+            if store_pending_response(args.output, previous_data, cache):
+                print(f"💾 Cached for replay: {cache.cache_dir}")
+
         print("\n💡 To re-extract, delete the output file and run again")
         sys.exit(0)
 
@@ -1179,15 +1379,33 @@ def main():
         # Update retry metadata
         save_retry_metadata(args.output, next_attempt)
 
-        # Generate retry prompt with errors
-        prompt = create_retry_prompt(
-            input_paths,
-            args.output,
-            args.issuer_name,
-            errors,
-            previous_data,
-            next_attempt
-        )
+        # Retry only the failing fields when each error names a field the section index can locate
+        retry_plan = None
+        if not (use_pdf_mode or args.full_retry or previous_data is None):
+            retry_plan = plan_field_retry(input_paths, errors)
+
+        if retry_plan:
+            patch_path = retry_patch_path(args.output)
+            print(f"   🎯 Targeted retry: {len(retry_plan['paths'])} field(s), "
+                  f"~{retry_plan['estimated_tokens']:,} tokens of source")
+            prompt = create_field_retry_prompt(
+                args.output,
+                args.issuer_name,
+                errors,
+                retry_plan,
+                patch_path,
+                next_attempt
+            )
+        else:
+            # Generate retry prompt with errors
+            prompt = create_retry_prompt(
+                input_paths,
+                args.output,
+                args.issuer_name,
+                errors,
+                previous_data,
+                next_attempt
+            )
 
         # Save retry prompt
         output_dir = Path(args.output).parent
@@ -1211,12 +1429,37 @@ def main():
             )
         else:
             print("   (References file paths instead of embedding content)")
+
+            # Deterministic fast path: fill what the statement tables answer directly
+            prefill = None
+            if not args.no_table_prefill:
+                try:
+                    from phase2_table_prefill import PREFILL_FILENAME, prefill_fields
+                    prefill = prefill_fields(input_paths, min_confidence=args.prefill_min_confidence)
+                    prefill_path = Path(args.output).parent / PREFILL_FILENAME
+                    prefill_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(prefill_path, 'w') as f:
+                        json.dump(prefill, f, indent=2)
+                    print(f"   ⚡ Pre-filled {len(prefill['fields'])} fields from tables "
+                          f"({len(prefill['gaps'])} table fields left for the LLM): {prefill_path}")
+                except Exception as e:
+                    print(f"   ⚠️  Table pre-extraction skipped ({e})")
+                    prefill = None
+
             prompt = create_efficient_extraction_prompt(
                 input_paths,
                 args.output,
-                args.issuer_name
+                args.issuer_name,
+                prefill=prefill
             )
 
+        # Replay an extraction of byte-identical inputs, schema, prompt and model
+        if not args.no_cache:
+            replayed = replay_cached_extraction(prompt, input_paths, args.output, args.issuer_name,
+                                                args.model_id, args.cache_dir)
+            if replayed:
+                sys.exit(0)
+
         # Save initial prompt
         output_dir = Path(args.output).parent
         prompt_path = output_dir / 'phase2_extraction_prompt.txt'
@@ -1245,22 +1488,32 @@ def main():
         next_attempt = attempt_number + 1
         print(f"\n🔄 RETRY EXTRACTION (Attempt {next_attempt}/{MAX_ATTEMPTS})")
         print(f"\n📋 Previous attempt had {len([e for e in errors if e.startswith('❌')])} validation errors")
-        print(f"   Retry prompt includes:")
-        print(f"   • Specific error guidance")
-        print(f"   • Corrected template structure")
-        print(f"   • Validation checklist")
-        print(f"\n📋 Claude Code will now:")
-        print(f"   1. Read the RETRY extraction prompt")
-        if use_pdf_mode:
-            print(f"   2. Use Read tool to access PDF files")
+        if retry_plan:
+            print(f"\n📋 Claude Code will now:")
+            print(f"   1. Read the targeted RETRY prompt")
+            print(f"   2. Read only the listed line ranges of the markdown files")
+            print(f"   3. Extract the {len(retry_plan['paths'])} failing field(s)")
+            print(f"   4. Save the fields to: {retry_patch_path(args.output)}")
+            print(f"\n⚠️  After extraction, run this script again to merge the patch and validate")
+            print(f"   If validation passes: ✅ Complete!")
+            print(f"   If validation fails: 🔄 Auto-retry (up to attempt {MAX_ATTEMPTS})")
         else:
-            print(f"   2. Use Read tool to access markdown files")
-        print(f"   3. Re-extract financial data FIXING previous errors")
-        print(f"   4. Self-validate before saving")
-        print(f"   5. Overwrite JSON: {args.output}")
-        print(f"\n⚠️  After extraction, run this script again to validate")
-        print(f"   If validation passes: ✅ Complete!")
-        print(f"   If validation fails: 🔄 Auto-retry (up to attempt {MAX_ATTEMPTS})")
+            print(f"   Retry prompt includes:")
+            print(f"   • Specific error guidance")
+            print(f"   • Corrected template structure")
+            print(f"   • Validation checklist")
+            print(f"\n📋 Claude Code will now:")
+            print(f"   1. Read the RETRY extraction prompt")
+            if use_pdf_mode:
+                print(f"   2. Use Read tool to access PDF files")
+            else:
+                print(f"   2. Use Read tool to access markdown files")
+            print(f"   3. Re-extract financial data FIXING previous errors")
+            print(f"   4. Self-validate before saving")
+            print(f"   5. Overwrite JSON: {args.output}")
+            print(f"\n⚠️  After extraction, run this script again to validate")
+            print(f"   If validation passes: ✅ Complete!")
+            print(f"   If validation fails: 🔄 Auto-retry (up to attempt {MAX_ATTEMPTS})")
     else:
         # Initial extraction instructions
         print(f"\n📋 Claude Code will now:")
@@ -14,6 +14,7 @@ IMPORTANT: Pure Python templating - NO LLM usage (0 tokens)
 import json
 import sys
 import re
+from functools import cache, lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -180,6 +181,73 @@ def load_template(template_name='credit_opinion_template.md'):
         return f.read()
 
 
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([A-Za-z0-9_]+)\}\}')
+_UNRESOLVED = object()
+
+
+@lru_cache(maxsize=16)
+def compile_template(template):
+    """
+    Parse a template into literal text and placeholder segments (cached)
+
+    The template is scanned once; repeated calls with the same template
+    string return the cached result, so regenerating many reports from one
+    template pays the parsing cost only once.
+
+    Args:
+        template: Template content with {{KEY}} placeholders
+
+    Returns:
+        tuple: (literals, keys) where literals has len(keys) + 1 entries and
+            the template equals literals[0] + {{keys[0]}} + literals[1] + ...
+    """
+    parts = PLACEHOLDER_PATTERN.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def render_template(template, replacements):
+    """
+    Render a template in a single pass
+
+    Placeholders are substituted from the compiled segment list and joined
+    once. Values are not re-scanned, so placeholder-like text inside a
+    Phase 4 section is emitted verbatim. Placeholders with no replacement
+    are left in the report as {{KEY}} and reported back to the caller.
+
+    A replacement value may be a zero-argument callable. It is resolved only
+    if the template references its key, at most once per render, so values
+    a slimmer template never uses are never computed.
+
+    Args:
+        template: Template content with {{KEY}} placeholders
+        replacements: Dict mapping placeholder key to a value (converted with
+            str()) or a callable returning the value
+
+    Returns:
+        tuple: (report, unresolved) where unresolved is a sorted list of
+            placeholder keys that had no replacement
+    """
+    literals, keys = compile_template(template)
+    pieces = [literals[0]]
+    resolved = {}
+    unresolved = set()
+
+    for key, literal in zip(keys, literals[1:]):
+        text = resolved.get(key)
+        if text is None:
+            value = replacements.get(key, _UNRESOLVED)
+            if value is _UNRESOLVED:
+                unresolved.add(key)
+                text = f"{{{{{key}}}}}"
+            else:
+                text = str(value() if callable(value) else value)
+            resolved[key] = text
+        pieces.append(text)
+        pieces.append(literal)
+
+    return ''.join(pieces), sorted(unresolved)
+
+
 def assess_leverage(debt_to_assets):
     """
     Assess leverage level based on Debt/Assets ratio
@@ -1454,53 +1522,69 @@ def generate_final_report(metrics, analysis_sections, template, phase2_data=None
     noi_growth_assessment = assess_noi_growth(noi_growth)
 
     # Generate reconciliation tables (v1.0.11+ comprehensive extraction)
+    # Tables are resolved lazily: built only if the template references them,
+    # and once per report even when several placeholders share a table
     # Use Phase 2 extraction data for reconciliations if available
     recon_data_source = phase2_data if phase2_data else metrics
 
-    try:
-        # FFO/AFFO Reconciliation Table
-        ffo_affo_recon_data = generate_ffo_affo_reconciliation(recon_data_source)
-        ffo_affo_table = format_reconciliation_table(ffo_affo_recon_data) if ffo_affo_recon_data else "Insufficient data - FFO/AFFO reconciliation not available. Enable comprehensive Phase 2 extraction for detailed reconciliations."
-    except Exception as e:
-        ffo_affo_table = f"Error generating FFO/AFFO reconciliation: {str(e)}"
-
-    try:
-        # ACFO Reconciliation Table
-        acfo_recon_data = generate_acfo_reconciliation(recon_data_source)
-        acfo_table = format_acfo_reconciliation_table(acfo_recon_data) if acfo_recon_data else "Insufficient data - ACFO reconciliation not available. Requires cash flow statement data in Phase 2 extraction."
-    except Exception as e:
-        acfo_table = f"Error generating ACFO reconciliation: {str(e)}"
+    @cache
+    def ffo_affo_table():
+        try:
+            # FFO/AFFO Reconciliation Table
+            ffo_affo_recon_data = generate_ffo_affo_reconciliation(recon_data_source)
+            return format_reconciliation_table(ffo_affo_recon_data) if ffo_affo_recon_data else "Insufficient data - FFO/AFFO reconciliation not available. Enable comprehensive Phase 2 extraction for detailed reconciliations."
+        except Exception as e:
+            return f"Error generating FFO/AFFO reconciliation: {str(e)}"
+
+    @cache
+    def acfo_table():
+        try:
+            # ACFO Reconciliation Table
+            acfo_recon_data = generate_acfo_reconciliation(recon_data_source)
+            return format_acfo_reconciliation_table(acfo_recon_data) if acfo_recon_data else "Insufficient data - ACFO reconciliation not available. Requires cash flow statement data in Phase 2 extraction."
+        except Exception as e:
+            return f"Error generating ACFO reconciliation: {str(e)}"
 
     # Generate issuer-reported reconciliation tables (v1.0.13+)
-    try:
-        # FFO/AFFO Reconciliation Table (ISSUER-REPORTED)
-        ffo_affo_recon_reported = generate_issuer_reported_ffo_affo_reconciliation(phase2_data) if phase2_data else None
-        ffo_affo_table_reported = format_issuer_reported_ffo_affo_reconciliation(ffo_affo_recon_reported)
-    except Exception as e:
-        ffo_affo_table_reported = f"Error generating issuer-reported FFO/AFFO reconciliation: {str(e)}"
-
-    try:
-        # ACFO Reconciliation Table (ISSUER-REPORTED)
-        acfo_recon_reported = generate_issuer_reported_acfo_reconciliation(phase2_data) if phase2_data else None
-        acfo_table_reported = format_issuer_reported_acfo_reconciliation(acfo_recon_reported)
-    except Exception as e:
-        acfo_table_reported = f"Error generating issuer-reported ACFO reconciliation: {str(e)}"
+    @cache
+    def ffo_affo_table_reported():
+        try:
+            # FFO/AFFO Reconciliation Table (ISSUER-REPORTED)
+            ffo_affo_recon_reported = generate_issuer_reported_ffo_affo_reconciliation(phase2_data) if phase2_data else None
+            return format_issuer_reported_ffo_affo_reconciliation(ffo_affo_recon_reported)
+        except Exception as e:
+            return f"Error generating issuer-reported FFO/AFFO reconciliation: {str(e)}"
+
+    @cache
+    def acfo_table_reported():
+        try:
+            # ACFO Reconciliation Table (ISSUER-REPORTED)
+            acfo_recon_reported = generate_issuer_reported_acfo_reconciliation(phase2_data) if phase2_data else None
+            return format_issuer_reported_acfo_reconciliation(acfo_recon_reported)
+        except Exception as e:
+            return f"Error generating issuer-reported ACFO reconciliation: {str(e)}"
 
     # AFFO Validation Summary
     affo_calculation_detail = reit_metrics.get('affo_calculation_detail', {})
     affo_validation_data = reit_metrics.get('validation', {})
-    affo_validation_summary = generate_affo_validation_summary(affo_calculation_detail, affo_validation_data)
+
+    def affo_validation_summary():
+        return generate_affo_validation_summary(affo_calculation_detail, affo_validation_data)
 
     # ACFO Validation Summary
-    acfo_validation_summary = generate_acfo_validation_summary(acfo_metrics)
+    def acfo_validation_summary():
+        return generate_acfo_validation_summary(acfo_metrics)
 
     # AFCF Tables
-    cfi_breakdown_table = format_cfi_breakdown_table(afcf_metrics.get('cfi_breakdown'), currency)
+    def cfi_breakdown_table():
+        return format_cfi_breakdown_table(afcf_metrics.get('cfi_breakdown'), currency)
 
     acfo_value = acfo_metrics.get('acfo', 0)
     afcf_value = afcf_metrics.get('afcf', 0)
     net_cfi_value = afcf_metrics.get('net_cfi', 0)
-    afcf_recon_table = format_afcf_reconciliation_table(acfo_value, afcf_value, net_cfi_value, currency)
+
+    def afcf_recon_table():
+        return format_afcf_reconciliation_table(acfo_value, afcf_value, net_cfi_value, currency)
 
     # Bridge Analysis (Section 2.6) - FFO → AFFO → ACFO
     # NOTE: ffo_calculated, affo_calculated, acfo_calculated already extracted from v2.0 schema
@@ -1756,23 +1840,32 @@ def generate_final_report(metrics, analysis_sections, template, phase2_data=None
 
     # Get full ESG section and parse into components (Issue #29)
     esg_section = get_section(analysis_sections, 'ESG Considerations', 'ESG', 'Environmental', 'Social', 'Governance')
-    parsed_esg = parse_esg_section(esg_section)
-    environmental_analysis = parsed_esg.get('ENVIRONMENTAL_ANALYSIS', 'Not available')
-    social_analysis = parsed_esg.get('SOCIAL_ANALYSIS', 'Not available')
-    governance_analysis = parsed_esg.get('GOVERNANCE_ANALYSIS', 'Not available')
+
+    @cache
+    def parsed_esg():
+        return parse_esg_section(esg_section)
 
     scenario_analysis = get_section(analysis_sections, 'Scenario Analysis and Stress Testing', 'SCENARIO ANALYSIS', 'Stress Testing')
 
     # Parse scenario analysis into individual components (Issue #28)
-    parsed_scenarios = parse_scenario_analysis(scenario_analysis)
+    @cache
+    def parsed_scenarios():
+        return parse_scenario_analysis(scenario_analysis)
 
     # Parse structural considerations from Phase 4 content (Issue #32)
     # Reconstruct full Phase 4 content for parsing
-    phase4_full_content = '\n\n'.join([f"## {k}\n{v}" for k, v in analysis_sections.items()])
+    @cache
+    def phase4_full_content():
+        return '\n\n'.join([f"## {k}\n{v}" for k, v in analysis_sections.items()])
+
+    def debt_structure():
+        return parse_debt_structure(phase4_full_content(), phase2_data, metrics)
 
-    debt_structure = parse_debt_structure(phase4_full_content, phase2_data, metrics)
-    collateral_analysis = parse_security_collateral(phase4_full_content, phase2_data, metrics)
-    perpetual_securities = check_perpetual_securities(phase4_full_content, phase2_data, metrics)
+    def collateral_analysis():
+        return parse_security_collateral(phase4_full_content(), phase2_data, metrics)
+
+    def perpetual_securities():
+        return check_perpetual_securities(phase4_full_content(), phase2_data, metrics)
 
     debt_reconciliation = get_section(analysis_sections, 'Moody\'s-Adjusted Debt Reconciliation', 'Debt Reconciliation', 'DEBT RECONCILIATION')
     ebitda_reconciliation = get_section(analysis_sections, 'Moody\'s-Adjusted EBITDA Reconciliation', 'EBITDA Reconciliation', 'EBITDA RECONCILIATION')
@@ -1872,8 +1965,20 @@ def generate_final_report(metrics, analysis_sections, template, phase2_data=None
     # Extract ACFO validation data (for legacy placeholder support)
     acfo_validation = acfo_metrics.get('acfo_validation', {}) if acfo_metrics else {}
 
+    # Distribution cut prediction drivers, resolved only when the template uses them
+    def driver_field(rank, field, spec=None):
+        def resolve():
+            top_drivers = distribution_prediction.get('top_drivers') if distribution_prediction else None
+            if not top_drivers or len(top_drivers) < rank:
+                return 'N/A'
+            if spec:
+                return format(top_drivers[rank - 1].get(field, 0), spec)
+            return top_drivers[rank - 1].get(field, 'N/A')
+        return resolve
 
     # Build replacements dictionary
+    # Expensive values (reconciliation tables, Phase 4 parsing, market/macro/prediction
+    # blocks) are callables resolved by render_template() only if the template uses them
     replacements = {
         'ISSUER_NAME': issuer_name,
         'REPORT_DATE': datetime.now().strftime('%B %d, %Y'),
@@ -2145,9 +2250,9 @@ def generate_final_report(metrics, analysis_sections, template, phase2_data=None
         'LEVERAGE_COVERAGE_DETAIL': leverage_coverage_detail,
         'GROWTH_STRATEGY': growth_strategy,
         'OPERATING_TRACK_RECORD': operating_track_record,
-        'ENVIRONMENTAL_ANALYSIS': environmental_analysis,
-        'SOCIAL_ANALYSIS': social_analysis,
-        'GOVERNANCE_ANALYSIS': governance_analysis,
+        'ENVIRONMENTAL_ANALYSIS': lambda: parsed_esg().get('ENVIRONMENTAL_ANALYSIS', 'Not available'),
+        'SOCIAL_ANALYSIS': lambda: parsed_esg().get('SOCIAL_ANALYSIS', 'Not available'),
+        'GOVERNANCE_ANALYSIS': lambda: parsed_esg().get('GOVERNANCE_ANALYSIS', 'Not available'),
         'SENSITIVITY_ANALYSIS': scenario_analysis,
         'DEBT_STRUCTURE': debt_structure,
         'COLLATERAL_ANALYSIS': collateral_analysis,
@@ -2184,23 +2289,23 @@ def generate_final_report(metrics, analysis_sections, template, phase2_data=None
         'ESG_OVERALL': 'ESG factors are assessed as having neutral-to-low credit impact.',
 
         # Scenario analysis placeholders (Issue #28 - parsed from Phase 4)
-        'BASE_ASSUMPTIONS': parsed_scenarios.get('BASE_ASSUMPTIONS', 'Not available'),
-        'BASE_METRICS': parsed_scenarios.get('BASE_METRICS', 'Not available'),
-        'BASE_RATING_IMPACT': parsed_scenarios.get('BASE_RATING_IMPACT', 'Not available'),
-        'BASE_LIKELIHOOD': parsed_scenarios.get('BASE_LIKELIHOOD', 'Not available'),
-        'UPSIDE_ASSUMPTIONS': parsed_scenarios.get('UPSIDE_ASSUMPTIONS', 'Not available'),
-        'UPSIDE_METRICS': parsed_scenarios.get('UPSIDE_METRICS', 'Not available'),
-        'UPSIDE_RATING_IMPACT': parsed_scenarios.get('UPSIDE_RATING_IMPACT', 'Not available'),
-        'UPSIDE_LIKELIHOOD': parsed_scenarios.get('UPSIDE_LIKELIHOOD', 'Not available'),
-        'DOWNSIDE_ASSUMPTIONS': parsed_scenarios.get('DOWNSIDE_ASSUMPTIONS', 'Not available'),
-        'DOWNSIDE_METRICS': parsed_scenarios.get('DOWNSIDE_METRICS', 'Not available'),
-        'DOWNSIDE_RATING_IMPACT': parsed_scenarios.get('DOWNSIDE_RATING_IMPACT', 'Not available'),
-        'DOWNSIDE_LIKELIHOOD': parsed_scenarios.get('DOWNSIDE_LIKELIHOOD', 'Not available'),
-        'STRESS_ASSUMPTIONS': parsed_scenarios.get('STRESS_ASSUMPTIONS', 'Not available'),
-        'STRESS_METRICS': parsed_scenarios.get('STRESS_METRICS', 'Not available'),
-        'STRESS_RATING_IMPACT': parsed_scenarios.get('STRESS_RATING_IMPACT', 'Not available'),
-        'STRESS_LIKELIHOOD': parsed_scenarios.get('STRESS_LIKELIHOOD', 'Not available'),
-        'DOWNGRADE_TRIGGERS': parsed_scenarios.get('DOWNGRADE_TRIGGERS', 'Not available'),
+        'BASE_ASSUMPTIONS': lambda: parsed_scenarios().get('BASE_ASSUMPTIONS', 'Not available'),
+        'BASE_METRICS': lambda: parsed_scenarios().get('BASE_METRICS', 'Not available'),
+        'BASE_RATING_IMPACT': lambda: parsed_scenarios().get('BASE_RATING_IMPACT', 'Not available'),
+        'BASE_LIKELIHOOD': lambda: parsed_scenarios().get('BASE_LIKELIHOOD', 'Not available'),
+        'UPSIDE_ASSUMPTIONS': lambda: parsed_scenarios().get('UPSIDE_ASSUMPTIONS', 'Not available'),
+        'UPSIDE_METRICS': lambda: parsed_scenarios().get('UPSIDE_METRICS', 'Not available'),
+        'UPSIDE_RATING_IMPACT': lambda: parsed_scenarios().get('UPSIDE_RATING_IMPACT', 'Not available'),
+        'UPSIDE_LIKELIHOOD': lambda: parsed_scenarios().get('UPSIDE_LIKELIHOOD', 'Not available'),
+        'DOWNSIDE_ASSUMPTIONS': lambda: parsed_scenarios().get('DOWNSIDE_ASSUMPTIONS', 'Not available'),
+        'DOWNSIDE_METRICS': lambda: parsed_scenarios().get('DOWNSIDE_METRICS', 'Not available'),
+        'DOWNSIDE_RATING_IMPACT': lambda: parsed_scenarios().get('DOWNSIDE_RATING_IMPACT', 'Not available'),
+        'DOWNSIDE_LIKELIHOOD': lambda: parsed_scenarios().get('DOWNSIDE_LIKELIHOOD', 'Not available'),
+        'STRESS_ASSUMPTIONS': lambda: parsed_scenarios().get('STRESS_ASSUMPTIONS', 'Not available'),
+        'STRESS_METRICS': lambda: parsed_scenarios().get('STRESS_METRICS', 'Not available'),
+        'STRESS_RATING_IMPACT': lambda: parsed_scenarios().get('STRESS_RATING_IMPACT', 'Not available'),
+        'STRESS_LIKELIHOOD': lambda: parsed_scenarios().get('STRESS_LIKELIHOOD', 'Not available'),
+        'DOWNGRADE_TRIGGERS': lambda: parsed_scenarios().get('DOWNGRADE_TRIGGERS', 'Not available'),
         'DELEVERAGING_SCENARIOS': 'Not available',
 
         # AFCF Metrics (v1.0.6) - Section 2.7
@@ -2470,106 +2575,475 @@ def generate_final_report(metrics, analysis_sections, template, phase2_data=None
 
         # ========== Issue #40: Market Risk Placeholders (26) ==========
         # Fixed: Corrected data paths to match enrich_phase4_data.py output structure
-        'MARKET_CURRENT_PRICE': f"{market_risk.get('price_stress', {}).get('current_price', 0):.2f}" if market_risk else 'N/A',
-        'MARKET_52W_HIGH': f"{market_risk.get('price_stress', {}).get('high_52w', 0):.2f}" if market_risk else 'N/A',
-        'MARKET_52W_LOW': f"{market_risk.get('price_stress', {}).get('low_52w', 0):.2f}" if market_risk else 'N/A',
-        'MARKET_DECLINE_FROM_PEAK': f"{market_risk.get('price_stress', {}).get('decline_from_peak_pct', 0):.1f}" if market_risk else 'N/A',  # Fixed: decline_from_peak_pct not decline_pct
-        'MARKET_DAYS_SINCE_PEAK': f"{market_risk.get('price_stress', {}).get('days_since_peak', 0):.0f}" if market_risk else 'N/A',
-        'MARKET_STRESS_LEVEL': market_risk.get('price_stress', {}).get('stress_level', 'N/A') if market_risk else 'N/A',
-        'MARKET_VOLATILITY_30D': f"{market_risk.get('volatility', {}).get('metrics', {}).get('30d', {}).get('volatility_annualized_pct', 0):.1f}" if market_risk else 'N/A',  # Fixed: 30d not 30_day, volatility_annualized_pct
-        'MARKET_VOLATILITY_90D': f"{market_risk.get('volatility', {}).get('metrics', {}).get('90d', {}).get('volatility_annualized_pct', 0):.1f}" if market_risk else 'N/A',  # Fixed: 90d not 90_day
-        'MARKET_VOLATILITY_252D': f"{market_risk.get('volatility', {}).get('metrics', {}).get('252d', {}).get('volatility_annualized_pct', 0):.1f}" if market_risk else 'N/A',  # Fixed: 252d not 252_day
-        'MARKET_VOL_30D_CLASS': market_risk.get('volatility', {}).get('metrics', {}).get('30d', {}).get('classification', 'N/A') if market_risk else 'N/A',  # Fixed: 30d
-        'MARKET_VOL_90D_CLASS': market_risk.get('volatility', {}).get('metrics', {}).get('90d', {}).get('classification', 'N/A') if market_risk else 'N/A',  # Fixed: 90d
-        'MARKET_VOL_252D_CLASS': market_risk.get('volatility', {}).get('metrics', {}).get('252d', {}).get('classification', 'N/A') if market_risk else 'N/A',  # Fixed: 252d
-        'MARKET_VOL_CLASSIFICATION': market_risk.get('volatility', {}).get('classification', 'N/A') if market_risk else 'N/A',  # Fixed: removed 'overall_classification' level
-        'MARKET_MOMENTUM_3M': f"{market_risk.get('momentum', {}).get('metrics', {}).get('3_month', {}).get('total_return_pct', 0):.1f}" if market_risk else 'N/A',
-        'MARKET_MOMENTUM_6M': f"{market_risk.get('momentum', {}).get('metrics', {}).get('6_month', {}).get('total_return_pct', 0):.1f}" if market_risk else 'N/A',
-        'MARKET_MOMENTUM_12M': f"{market_risk.get('momentum', {}).get('metrics', {}).get('12_month', {}).get('total_return_pct', 0):.1f}" if market_risk else 'N/A',
-        'MARKET_MOMENTUM_TREND': market_risk.get('momentum', {}).get('trend', 'N/A') if market_risk else 'N/A',
-        'MARKET_VOLUME_TREND': market_risk.get('volume', {}).get('trend', 'N/A') if market_risk else 'N/A',
-        'MARKET_PRICE_STRESS_SCORE': f"{market_risk.get('risk_score', {}).get('components', {}).get('stress_points', 0):.0f}" if market_risk else 'N/A',  # Fixed: risk_score.components.stress_points
-        'MARKET_VOLATILITY_SCORE': f"{market_risk.get('risk_score', {}).get('components', {}).get('volatility_points', 0):.0f}" if market_risk else 'N/A',  # Fixed: components.volatility_points
-        'MARKET_MOMENTUM_SCORE': f"{market_risk.get('risk_score', {}).get('components', {}).get('momentum_points', 0):.0f}" if market_risk else 'N/A',  # Fixed: components.momentum_points
-        'MARKET_VOLUME_SCORE': f"{market_risk.get('risk_score', {}).get('components', {}).get('volume_points', 0):.0f}" if market_risk else 'N/A',  # Fixed: components.volume_points
-        'MARKET_RISK_SCORE': f"{market_risk.get('risk_score', {}).get('total_score', 0):.0f}" if market_risk else 'N/A',
-        'MARKET_RISK_LEVEL': market_risk.get('risk_score', {}).get('risk_level', 'N/A') if market_risk else 'N/A',
-        'MARKET_RISK_NARRATIVE': market_risk.get('overall_assessment', 'Market risk assessment unavailable') if market_risk else 'Market risk assessment unavailable',
-        'MARKET_CREDIT_IMPLICATIONS': market_risk.get('credit_implications', 'Credit implications analysis unavailable') if market_risk else 'Credit implications analysis unavailable',
+        'MARKET_CURRENT_PRICE': lambda: f"{market_risk.get('price_stress', {}).get('current_price', 0):.2f}" if market_risk else 'N/A',
+        'MARKET_52W_HIGH': lambda: f"{market_risk.get('price_stress', {}).get('high_52w', 0):.2f}" if market_risk else 'N/A',
+        'MARKET_52W_LOW': lambda: f"{market_risk.get('price_stress', {}).get('low_52w', 0):.2f}" if market_risk else 'N/A',
+        'MARKET_DECLINE_FROM_PEAK': lambda: f"{market_risk.get('price_stress', {}).get('decline_from_peak_pct', 0):.1f}" if market_risk else 'N/A',  # Fixed: decline_from_peak_pct not decline_pct
+        'MARKET_DAYS_SINCE_PEAK': lambda: f"{market_risk.get('price_stress', {}).get('days_since_peak', 0):.0f}" if market_risk else 'N/A',
+        'MARKET_STRESS_LEVEL': lambda: market_risk.get('price_stress', {}).get('stress_level', 'N/A') if market_risk else 'N/A',
+        'MARKET_VOLATILITY_30D': lambda: f"{market_risk.get('volatility', {}).get('metrics', {}).get('30d', {}).get('volatility_annualized_pct', 0):.1f}" if market_risk else 'N/A',  # Fixed: 30d not 30_day, volatility_annualized_pct
+        'MARKET_VOLATILITY_90D': lambda: f"{market_risk.get('volatility', {}).get('metrics', {}).get('90d', {}).get('volatility_annualized_pct', 0):.1f}" if market_risk else 'N/A',  # Fixed: 90d not 90_day
+        'MARKET_VOLATILITY_252D': lambda: f"{market_risk.get('volatility', {}).get('metrics', {}).get('252d', {}).get('volatility_annualized_pct', 0):.1f}" if market_risk else 'N/A',  # Fixed: 252d not 252_day
+        'MARKET_VOL_30D_CLASS': lambda: market_risk.get('volatility', {}).get('metrics', {}).get('30d', {}).get('classification', 'N/A') if market_risk else 'N/A',  # Fixed: 30d
+        'MARKET_VOL_90D_CLASS': lambda: market_risk.get('volatility', {}).get('metrics', {}).get('90d', {}).get('classification', 'N/A') if market_risk else 'N/A',  # Fixed: 90d
+        'MARKET_VOL_252D_CLASS': lambda: market_risk.get('volatility', {}).get('metrics', {}).get('252d', {}).get('classification', 'N/A') if market_risk else 'N/A',  # Fixed: 252d
+        'MARKET_VOL_CLASSIFICATION': lambda: market_risk.get('volatility', {}).get('classification', 'N/A') if market_risk else 'N/A',  # Fixed: removed 'overall_classification' level
+        'MARKET_MOMENTUM_3M': lambda: f"{market_risk.get('momentum', {}).get('metrics', {}).get('3_month', {}).get('total_return_pct', 0):.1f}" if market_risk else 'N/A',
+        'MARKET_MOMENTUM_6M': lambda: f"{market_risk.get('momentum', {}).get('metrics', {}).get('6_month', {}).get('total_return_pct', 0):.1f}" if market_risk else 'N/A',
+        'MARKET_MOMENTUM_12M': lambda: f"{market_risk.get('momentum', {}).get('metrics', {}).get('12_month', {}).get('total_return_pct', 0):.1f}" if market_risk else 'N/A',
+        'MARKET_MOMENTUM_TREND': lambda: market_risk.get('momentum', {}).get('trend', 'N/A') if market_risk else 'N/A',
+        'MARKET_VOLUME_TREND': lambda: market_risk.get('volume', {}).get('trend', 'N/A') if market_risk else 'N/A',
+        'MARKET_PRICE_STRESS_SCORE': lambda: f"{market_risk.get('risk_score', {}).get('components', {}).get('stress_points', 0):.0f}" if market_risk else 'N/A',  # Fixed: risk_score.components.stress_points
+        'MARKET_VOLATILITY_SCORE': lambda: f"{market_risk.get('risk_score', {}).get('components', {}).get('volatility_points', 0):.0f}" if market_risk else 'N/A',  # Fixed: components.volatility_points
+        'MARKET_MOMENTUM_SCORE': lambda: f"{market_risk.get('risk_score', {}).get('components', {}).get('momentum_points', 0):.0f}" if market_risk else 'N/A',  # Fixed: components.momentum_points
+        'MARKET_VOLUME_SCORE': lambda: f"{market_risk.get('risk_score', {}).get('components', {}).get('volume_points', 0):.0f}" if market_risk else 'N/A',  # Fixed: components.volume_points
+        'MARKET_RISK_SCORE': lambda: f"{market_risk.get('risk_score', {}).get('total_score', 0):.0f}" if market_risk else 'N/A',
+        'MARKET_RISK_LEVEL': lambda: market_risk.get('risk_score', {}).get('risk_level', 'N/A') if market_risk else 'N/A',
+        'MARKET_RISK_NARRATIVE': lambda: market_risk.get('overall_assessment', 'Market risk assessment unavailable') if market_risk else 'Market risk assessment unavailable',
+        'MARKET_CREDIT_IMPLICATIONS': lambda: market_risk.get('credit_implications', 'Credit implications analysis unavailable') if market_risk else 'Credit implications analysis unavailable',
 
         # ========== Issue #40: Macro Environment Placeholders (13) ==========
         # Fixed: Added missing 'policy_rate' nesting level for Canada and US rates
-        'MACRO_CA_RATE': f"{macro_environment.get('canada', {}).get('policy_rate', {}).get('current_rate', 0):.2f}" if macro_environment else 'N/A',
-        'MACRO_CA_CHANGE_BPS': f"{macro_environment.get('canada', {}).get('policy_rate', {}).get('change_12m_bps', 0):.0f}" if macro_environment else 'N/A',
-        'MACRO_CA_CYCLE': macro_environment.get('canada', {}).get('policy_rate', {}).get('cycle', 'N/A') if macro_environment else 'N/A',
-        'MACRO_CA_PEAK_RATE': f"{macro_environment.get('canada', {}).get('policy_rate', {}).get('max_rate', 0):.2f}" if macro_environment else 'N/A',
-        'MACRO_CA_CREDIT_ENVIRONMENT': macro_environment.get('canada', {}).get('credit_environment', 'N/A') if macro_environment else 'N/A',  # Fixed: under canada not top level
-        'MACRO_CA_STRESS_SCORE': f"{macro_environment.get('canada', {}).get('credit_stress_score', 0):.0f}" if macro_environment else 'N/A',  # Fixed: under canada not top level
-        'MACRO_US_RATE': f"{macro_environment.get('united_states', {}).get('policy_rate', {}).get('current_rate', 0):.2f}" if macro_environment and macro_environment.get('united_states') else 'N/A',
-        'MACRO_US_CHANGE_BPS': f"{macro_environment.get('united_states', {}).get('policy_rate', {}).get('change_12m_bps', 0):.0f}" if macro_environment and macro_environment.get('united_states') else 'N/A',
-        'MACRO_US_CYCLE': macro_environment.get('united_states', {}).get('policy_rate', {}).get('cycle', 'N/A') if macro_environment and macro_environment.get('united_states') else 'N/A',
-        'MACRO_SPREAD_BPS': f"{macro_environment.get('rate_differential', {}).get('ca_minus_us_bps', 0):.0f}" if macro_environment and macro_environment.get('rate_differential') else 'N/A',  # Fixed: rate_differential.ca_minus_us_bps
+        'MACRO_CA_RATE': lambda: f"{macro_environment.get('canada', {}).get('policy_rate', {}).get('current_rate', 0):.2f}" if macro_environment else 'N/A',
+        'MACRO_CA_CHANGE_BPS': lambda: f"{macro_environment.get('canada', {}).get('policy_rate', {}).get('change_12m_bps', 0):.0f}" if macro_environment else 'N/A',
+        'MACRO_CA_CYCLE': lambda: macro_environment.get('canada', {}).get('policy_rate', {}).get('cycle', 'N/A') if macro_environment else 'N/A',
+        'MACRO_CA_PEAK_RATE': lambda: f"{macro_environment.get('canada', {}).get('policy_rate', {}).get('max_rate', 0):.2f}" if macro_environment else 'N/A',
+        'MACRO_CA_CREDIT_ENVIRONMENT': lambda: macro_environment.get('canada', {}).get('credit_environment', 'N/A') if macro_environment else 'N/A',  # Fixed: under canada not top level
+        'MACRO_CA_STRESS_SCORE': lambda: f"{macro_environment.get('canada', {}).get('credit_stress_score', 0):.0f}" if macro_environment else 'N/A',  # Fixed: under canada not top level
+        'MACRO_US_RATE': lambda: f"{macro_environment.get('united_states', {}).get('policy_rate', {}).get('current_rate', 0):.2f}" if macro_environment and macro_environment.get('united_states') else 'N/A',
+        'MACRO_US_CHANGE_BPS': lambda: f"{macro_environment.get('united_states', {}).get('policy_rate', {}).get('change_12m_bps', 0):.0f}" if macro_environment and macro_environment.get('united_states') else 'N/A',
+        'MACRO_US_CYCLE': lambda: macro_environment.get('united_states', {}).get('policy_rate', {}).get('cycle', 'N/A') if macro_environment and macro_environment.get('united_states') else 'N/A',
+        'MACRO_SPREAD_BPS': lambda: f"{macro_environment.get('rate_differential', {}).get('ca_minus_us_bps', 0):.0f}" if macro_environment and macro_environment.get('rate_differential') else 'N/A',  # Fixed: rate_differential.ca_minus_us_bps
         'MACRO_SPREAD_TREND': 'N/A',  # Note: spread_trend not in enriched data structure - would need to be added to enrich_phase4_data.py
-        'MACRO_RATE_NARRATIVE': macro_environment.get('overall_assessment', 'Macro environment assessment unavailable') if macro_environment else 'Macro environment assessment unavailable',
-        'MACRO_CREDIT_IMPLICATIONS': macro_environment.get('credit_implications', 'Credit implications analysis unavailable') if macro_environment else 'Credit implications analysis unavailable',
+        'MACRO_RATE_NARRATIVE': lambda: macro_environment.get('overall_assessment', 'Macro environment assessment unavailable') if macro_environment else 'Macro environment assessment unavailable',
+        'MACRO_CREDIT_IMPLICATIONS': lambda: macro_environment.get('credit_implications', 'Credit implications analysis unavailable') if macro_environment else 'Credit implications analysis unavailable',
 
         # ========== Issue #40: Distribution Cut Prediction Placeholders (32) ==========
-        'PRED_CUT_PROBABILITY': f"{distribution_prediction.get('cut_probability_pct', 0):.1f}" if distribution_prediction else 'N/A',
-        'PRED_RISK_LEVEL': distribution_prediction.get('risk_level', 'N/A') if distribution_prediction else 'N/A',
-        'PRED_RISK_BADGE': distribution_prediction.get('risk_badge', '❓') if distribution_prediction else '❓',
-        'PRED_CONFIDENCE': distribution_prediction.get('confidence', 'N/A') if distribution_prediction else 'N/A',
-        'PRED_DATE': distribution_prediction.get('prediction_date', 'N/A') if distribution_prediction else 'N/A',
+        'PRED_CUT_PROBABILITY': lambda: f"{distribution_prediction.get('cut_probability_pct', 0):.1f}" if distribution_prediction else 'N/A',
+        'PRED_RISK_LEVEL': lambda: distribution_prediction.get('risk_level', 'N/A') if distribution_prediction else 'N/A',
+        'PRED_RISK_BADGE': lambda: distribution_prediction.get('risk_badge', '❓') if distribution_prediction else '❓',
+        'PRED_CONFIDENCE': lambda: distribution_prediction.get('confidence', 'N/A') if distribution_prediction else 'N/A',
+        'PRED_DATE': lambda: distribution_prediction.get('prediction_date', 'N/A') if distribution_prediction else 'N/A',
         # Top 5 risk drivers
-        'PRED_DRIVER_1_NAME': distribution_prediction.get('top_drivers', [{}])[0].get('feature', 'N/A') if distribution_prediction and distribution_prediction.get('top_drivers') else 'N/A',
-        'PRED_DRIVER_1_VALUE': f"{distribution_prediction.get('top_drivers', [{}])[0].get('value', 0):.4f}" if distribution_prediction and distribution_prediction.get('top_drivers') else 'N/A',
-        'PRED_DRIVER_1_DIRECTION': distribution_prediction.get('top_drivers', [{}])[0].get('direction', 'N/A') if distribution_prediction and distribution_prediction.get('top_drivers') else 'N/A',
-        'PRED_DRIVER_1_COEF': f"{distribution_prediction.get('top_drivers', [{}])[0].get('coefficient', 0):.4f}" if distribution_prediction and distribution_prediction.get('top_drivers') else 'N/A',
-        'PRED_DRIVER_2_NAME': distribution_prediction.get('top_drivers', [{}, {}])[1].get('feature', 'N/A') if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 1 else 'N/A',
-        'PRED_DRIVER_2_VALUE': f"{distribution_prediction.get('top_drivers', [{}, {}])[1].get('value', 0):.4f}" if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 1 else 'N/A',
-        'PRED_DRIVER_2_DIRECTION': distribution_prediction.get('top_drivers', [{}, {}])[1].get('direction', 'N/A') if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 1 else 'N/A',
-        'PRED_DRIVER_2_COEF': f"{distribution_prediction.get('top_drivers', [{}, {}])[1].get('coefficient', 0):.4f}" if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 1 else 'N/A',
-        'PRED_DRIVER_3_NAME': distribution_prediction.get('top_drivers', [{}, {}, {}])[2].get('feature', 'N/A') if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 2 else 'N/A',
-        'PRED_DRIVER_3_VALUE': f"{distribution_prediction.get('top_drivers', [{}, {}, {}])[2].get('value', 0):.4f}" if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 2 else 'N/A',
-        'PRED_DRIVER_3_DIRECTION': distribution_prediction.get('top_drivers', [{}, {}, {}])[2].get('direction', 'N/A') if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 2 else 'N/A',
-        'PRED_DRIVER_3_COEF': f"{distribution_prediction.get('top_drivers', [{}, {}, {}])[2].get('coefficient', 0):.4f}" if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 2 else 'N/A',
-        'PRED_DRIVER_4_NAME': distribution_prediction.get('top_drivers', [{}, {}, {}, {}])[3].get('feature', 'N/A') if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 3 else 'N/A',
-        'PRED_DRIVER_4_VALUE': f"{distribution_prediction.get('top_drivers', [{}, {}, {}, {}])[3].get('value', 0):.4f}" if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 3 else 'N/A',
-        'PRED_DRIVER_4_DIRECTION': distribution_prediction.get('top_drivers', [{}, {}, {}, {}])[3].get('direction', 'N/A') if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 3 else 'N/A',
-        'PRED_DRIVER_4_COEF': f"{distribution_prediction.get('top_drivers', [{}, {}, {}, {}])[3].get('coefficient', 0):.4f}" if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 3 else 'N/A',
-        'PRED_DRIVER_5_NAME': distribution_prediction.get('top_drivers', [{}, {}, {}, {}, {}])[4].get('feature', 'N/A') if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 4 else 'N/A',
-        'PRED_DRIVER_5_VALUE': f"{distribution_prediction.get('top_drivers', [{}, {}, {}, {}, {}])[4].get('value', 0):.4f}" if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 4 else 'N/A',
-        'PRED_DRIVER_5_DIRECTION': distribution_prediction.get('top_drivers', [{}, {}, {}, {}, {}])[4].get('direction', 'N/A') if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 4 else 'N/A',
-        'PRED_DRIVER_5_COEF': f"{distribution_prediction.get('top_drivers', [{}, {}, {}, {}, {}])[4].get('coefficient', 0):.4f}" if distribution_prediction and len(distribution_prediction.get('top_drivers', [])) > 4 else 'N/A',
+        **{
+            f'PRED_DRIVER_{rank}_{suffix}': driver_field(rank, field, spec)
+            for rank in range(1, 6)
+            for suffix, field, spec in (('NAME', 'feature', None), ('VALUE', 'value', '.4f'), ('DIRECTION', 'direction', None), ('COEF', 'coefficient', '.4f'))
+        },
         # Model narrative and implications
-        'PRED_NARRATIVE': distribution_prediction.get('narrative', 'Prediction narrative unavailable') if distribution_prediction else 'Prediction narrative unavailable',
-        'PRED_CREDIT_IMPLICATIONS': distribution_prediction.get('credit_implications', 'Credit implications unavailable') if distribution_prediction else 'Credit implications unavailable',
+        'PRED_NARRATIVE': lambda: distribution_prediction.get('narrative', 'Prediction narrative unavailable') if distribution_prediction else 'Prediction narrative unavailable',
+        'PRED_CREDIT_IMPLICATIONS': lambda: distribution_prediction.get('credit_implications', 'Credit implications unavailable') if distribution_prediction else 'Credit implications unavailable',
 
         # ========== Issue #40: Distribution History Placeholders (12) ==========
-        'DIST_CURRENT_MONTHLY': f"{distribution_history.get('current_monthly', 0):.4f}" if distribution_history else 'N/A',
-        'DIST_CURRENT_ANNUAL': f"{distribution_history.get('current_annual', 0):.4f}" if distribution_history else 'N/A',
-        'DIST_CURRENT_YIELD': f"{distribution_history.get('current_yield', 0):.2f}" if distribution_history and distribution_history.get('current_yield') else 'N/A',
-        'DIST_CUT_COUNT': f"{distribution_history.get('cuts_detected', 0)}" if distribution_history else 'N/A',
-        'DIST_LATEST_CUT_DATE': distribution_history.get('latest_cut_date', 'N/A') if distribution_history and distribution_history.get('latest_cut_date') else 'N/A',
-        'DIST_LATEST_CUT_MAGNITUDE': f"{distribution_history.get('latest_cut_magnitude_pct', 0):.1f}" if distribution_history and distribution_history.get('latest_cut_magnitude_pct') else 'N/A',
-        'DIST_RECOVERY_STATUS': distribution_history.get('recovery_status', 'N/A') if distribution_history else 'N/A',
-        'DIST_RECOVERY_LEVEL': f"{distribution_history.get('recovery_level_pct', 0):.1f}" if distribution_history and distribution_history.get('recovery_level_pct') else 'N/A',
-        'DIST_RECOVERY_NARRATIVE': distribution_history.get('recovery_narrative', 'Recovery analysis unavailable') if distribution_history else 'Recovery analysis unavailable',
-        'DIST_STABILITY_ASSESSMENT': f"{'Stable' if distribution_history.get('cuts_detected', 0) == 0 else 'Cut history requires monitoring'}" if distribution_history else 'N/A',
-        'DIST_MGMT_ASSESSMENT': f"{'Consistent distribution policy' if distribution_history.get('cuts_detected', 0) == 0 else 'Distribution cut history indicates financial stress'}" if distribution_history else 'N/A',
-        'DIST_SUSTAINABILITY_OUTLOOK': f"{'Positive' if distribution_history.get('cuts_detected', 0) == 0 else 'Monitor closely'}" if distribution_history else 'N/A',
+        'DIST_CURRENT_MONTHLY': lambda: f"{distribution_history.get('current_monthly', 0):.4f}" if distribution_history else 'N/A',
+        'DIST_CURRENT_ANNUAL': lambda: f"{distribution_history.get('current_annual', 0):.4f}" if distribution_history else 'N/A',
+        'DIST_CURRENT_YIELD': lambda: f"{distribution_history.get('current_yield', 0):.2f}" if distribution_history and distribution_history.get('current_yield') else 'N/A',
+        'DIST_CUT_COUNT': lambda: f"{distribution_history.get('cuts_detected', 0)}" if distribution_history else 'N/A',
+        'DIST_LATEST_CUT_DATE': lambda: distribution_history.get('latest_cut_date', 'N/A') if distribution_history and distribution_history.get('latest_cut_date') else 'N/A',
+        'DIST_LATEST_CUT_MAGNITUDE': lambda: f"{distribution_history.get('latest_cut_magnitude_pct', 0):.1f}" if distribution_history and distribution_history.get('latest_cut_magnitude_pct') else 'N/A',
+        'DIST_RECOVERY_STATUS': lambda: distribution_history.get('recovery_status', 'N/A') if distribution_history else 'N/A',
+        'DIST_RECOVERY_LEVEL': lambda: f"{distribution_history.get('recovery_level_pct', 0):.1f}" if distribution_history and distribution_history.get('recovery_level_pct') else 'N/A',
+        'DIST_RECOVERY_NARRATIVE': lambda: distribution_history.get('recovery_narrative', 'Recovery analysis unavailable') if distribution_history else 'Recovery analysis unavailable',
+        'DIST_STABILITY_ASSESSMENT': lambda: f"{'Stable' if distribution_history.get('cuts_detected', 0) == 0 else 'Cut history requires monitoring'}" if distribution_history else 'N/A',
+        'DIST_MGMT_ASSESSMENT': lambda: f"{'Consistent distribution policy' if distribution_history.get('cuts_detected', 0) == 0 else 'Distribution cut history indicates financial stress'}" if distribution_history else 'N/A',
+        'DIST_SUSTAINABILITY_OUTLOOK': lambda: f"{'Positive' if distribution_history.get('cuts_detected', 0) == 0 else 'Monitor closely'}" if distribution_history else 'N/A',
 
         # Generation metadata
         'GENERATION_TIMESTAMP': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
 
-    # Replace all placeholders
-    report = template
-    for key, value in replacements.items():
-        report = report.replace(f"{{{{{key}}}}}", str(value))
+    # Replace all placeholders (single pass over the compiled template)
+    report, unresolved = render_template(template, replacements)
+    if unresolved:
+        print(f"⚠️  WARNING: {len(unresolved)} template placeholder(s) not resolved: {', '.join(unresolved)}")
 
     return report
 
 
+def load_phase2_data(metrics_path):
+    """
+    Auto-detect and load Phase 2 extraction data next to Phase 3 metrics
+
+    Looks for phase2_extracted_data.json in the same temp/ folder as the
+    metrics file (used for reconciliation tables).
+
+    Args:
+        metrics_path: Path to Phase 3 metrics JSON
+
+    Returns:
+        dict: Phase 2 extraction data, or None if not found or unreadable
+    """
+    metrics_path = Path(metrics_path).resolve()
+
+    if 'temp' not in metrics_path.parts:
+        return None
+
+    phase2_path = metrics_path.parent / 'phase2_extracted_data.json'
+    if not phase2_path.exists():
+        return None
+
+    try:
+        with open(phase2_path, 'r') as f:
+            phase2_data = json.load(f)
+        print(f"✓ Phase 2 extraction data loaded: {phase2_path}")
+        return phase2_data
+    except Exception as e:
+        print(f"⚠️  Phase 2 data found but couldn't load: {e}")
+        return None
+
+
+def default_report_path(metrics, metrics_path, timestamp, create=True):
+    """
+    Build the default report path in the issuer's reports/ folder
+
+    Args:
+        metrics: Phase 3 metrics dictionary (for issuer_name)
+        metrics_path: Path to Phase 3 metrics JSON (issuer folder is inferred from temp/)
+        timestamp: Eastern Time timestamp string for the filename
+        create: Create the reports folder if needed (False: only build the path)
+
+    Returns:
+        Path: {issuer_folder}/reports/{timestamp}_Credit_Opinion_{clean_name}.md
+    """
+    issuer_name = metrics.get('issuer_name', 'Unknown_Issuer')
+    # Clean issuer name for filename (remove spaces, special chars)
+    clean_name = issuer_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+    # Keep only alphanumeric, underscore, hyphen
+    clean_name = re.sub(r'[^a-zA-Z0-9_-]', '', clean_name)
+
+    # Infer issuer folder from metrics path (e.g., ./Issuer_Reports/{issuer}/temp/...)
+    metrics_path = Path(metrics_path).resolve()  # Convert to absolute path
+    # Navigate up from temp/ to issuer folder
+    if 'temp' in metrics_path.parts:
+        temp_index = metrics_path.parts.index('temp')
+        issuer_folder = Path(*metrics_path.parts[:temp_index])
+        reports_folder = issuer_folder / 'reports'
+    else:
+        # Fallback: create in Issuer_Reports/{clean_name}/reports/ (absolute path)
+        cwd = Path.cwd()
+        reports_folder = cwd / 'Issuer_Reports' / clean_name / 'reports'
+
+    # Create reports folder
+    if create:
+        reports_folder.mkdir(parents=True, exist_ok=True)
+
+    return reports_folder / f'{timestamp}_Credit_Opinion_{clean_name}.md'
+
+
+# ========================================
+# Batch mode (--batch)
+# ========================================
+
+BATCH_DEFAULT_GLOB = 'Issuer_Reports/*/temp/'
+# Most enriched first; phase3_enriched_data.json is the legacy name of the enriched metrics
+BATCH_METRICS_FILES = ('phase4_enriched_data.json', 'phase3_enriched_data.json', 'phase3_calculated_metrics.json')
+BATCH_ANALYSIS_FILE = 'phase4_credit_analysis.md'
+
+# Template shared by batch workers (set once per process by _init_batch_worker)
+_batch_template = None
+
+
+def _batch_job_from_temp_folder(temp_folder):
+    """Build a batch job from an issuer temp/ folder, or None if Phase 3 output is missing"""
+    temp_folder = Path(temp_folder)
+    for metrics_name in BATCH_METRICS_FILES:
+        metrics_path = temp_folder / metrics_name
+        if metrics_path.exists():
+            return {
+                'metrics': str(metrics_path),
+                'analysis': str(temp_folder / BATCH_ANALYSIS_FILE),
+            }
+    return None
+
+
+def discover_batch_jobs(source=BATCH_DEFAULT_GLOB):
+    """
+    Resolve a --batch source into report jobs
+
+    The source is either a JSON manifest or a glob over issuer temp/ folders.
+    A manifest is a list of entries, each a temp/ folder path or an object
+    with "metrics" and "analysis" paths and an optional "output" path.
+    Relative manifest paths are resolved against the manifest's directory.
+
+    For a temp/ folder, phase4_enriched_data.json (written by
+    enrich_phase4_data.py) is preferred, then the legacy
+    phase3_enriched_data.json, then phase3_calculated_metrics.json;
+    phase4_credit_analysis.md is used as the analysis. Folders without
+    Phase 3 output are skipped.
+
+    Args:
+        source: Manifest JSON path or glob pattern
+
+    Returns:
+        tuple: (jobs, skipped) where jobs is a list of dicts with 'metrics',
+            'analysis' and optional 'output' keys, and skipped is a list of
+            folders that had no Phase 3 metrics
+
+    Raises:
+        ValueError: If a manifest entry is malformed
+    """
+    import glob
+
+    jobs = []
+    skipped = []
+    source_path = Path(source)
+
+    if source_path.is_file() and source_path.suffix == '.json':
+        base = source_path.parent
+        with open(source_path, 'r') as f:
+            entries = json.load(f)
+
+        for entry in entries:
+            if isinstance(entry, str):
+                job = _batch_job_from_temp_folder(base / entry)
+                if job is None:
+                    skipped.append(str(base / entry))
+                else:
+                    jobs.append(job)
+            elif isinstance(entry, dict) and 'metrics' in entry and 'analysis' in entry:
+                job = {key: str(base / entry[key]) for key in ('metrics', 'analysis', 'output') if entry.get(key)}
+                jobs.append(job)
+            else:
+                raise ValueError(
+                    f"Invalid manifest entry in {source_path}: {entry!r}\n"
+                    f"Expected a temp/ folder path or an object with 'metrics' and 'analysis' keys"
+                )
+        return jobs, skipped
+
+    for match in sorted(glob.glob(source)):
+        match_path = Path(match)
+        if match_path.is_dir():
+            job = _batch_job_from_temp_folder(match_path)
+        elif match_path.suffix == '.json':
+            job = {'metrics': str(match_path), 'analysis': str(match_path.parent / BATCH_ANALYSIS_FILE)}
+        else:
+            job = None
+
+        if job is None:
+            skipped.append(str(match_path))
+        else:
+            jobs.append(job)
+
+    return jobs, skipped
+
+
+def _init_batch_worker(template):
+    """Process pool initializer: keep one copy of the template per worker"""
+    global _batch_template
+    _batch_template = template
+
+
+def generate_batch_report(job, timestamp):
+    """
+    Generate one report for a batch job (runs inside a batch worker)
+
+    Per-issuer console output is captured so batch output stays readable;
+    warnings are returned in the result instead.
+
+    Args:
+        job: Dict with 'metrics', 'analysis' and optional 'output' paths
+        timestamp: Eastern Time timestamp string for default filenames
+
+    Returns:
+        dict: Result with issuer, metrics, output, status ('success' or
+            'failed'), error, warnings and seconds
+    """
+    import io
+    import time
+    from contextlib import redirect_stdout
+
+    start = time.perf_counter()
+    result = {
+        'issuer': None,
+        'metrics': job['metrics'],
+        'output': None,
+        'status': 'failed',
+        'error': None,
+        'warnings': [],
+    }
+    log = io.StringIO()
+
+    try:
+        with redirect_stdout(log):
+            metrics = load_metrics(job['metrics'])
+            result['issuer'] = metrics.get('issuer_name')
+            phase2_data = load_phase2_data(job['metrics'])
+            analysis_sections = load_analysis(job['analysis'])
+
+            if job.get('output'):
+                output_path = Path(job['output'])
+            else:
+                output_path = default_report_path(metrics, job['metrics'], timestamp)
+
+            report = generate_final_report(metrics, analysis_sections, _batch_template, phase2_data)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w') as f:
+            f.write(report)
+
+        result['output'] = str(output_path)
+        result['status'] = 'success'
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    result['warnings'] = [line.strip() for line in log.getvalue().splitlines() if line.lstrip().startswith('⚠️')]
+    result['seconds'] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def assign_batch_outputs(jobs, timestamp):
+    """
+    Give every job without an 'output' its default report path
+
+    All jobs share one timestamp, so jobs whose default paths coincide (e.g.
+    two manifest entries for the same issuer) get their 1-based job number
+    appended to the filename instead of overwriting each other. Jobs whose
+    metrics cannot be loaded are left as they are; the worker reports the error.
+
+    Args:
+        jobs: List of jobs from discover_batch_jobs()
+        timestamp: Eastern Time timestamp string for default filenames
+
+    Returns:
+        list: Copies of the jobs, with 'output' set where a default was resolved
+    """
+    import io
+    from collections import Counter
+    from contextlib import redirect_stdout
+
+    jobs = [dict(job) for job in jobs]
+    defaults = {}
+    for index, job in enumerate(jobs):
+        if job.get('output'):
+            continue
+        try:
+            with redirect_stdout(io.StringIO()):
+                metrics = load_metrics(job['metrics'])
+        except Exception:
+            continue
+        defaults[index] = default_report_path(metrics, job['metrics'], timestamp, create=False)
+
+    counts = Counter(defaults.values())
+    for index, path in defaults.items():
+        if counts[path] > 1:
+            path = path.with_name(f'{path.stem}_{index + 1}{path.suffix}')
+        jobs[index]['output'] = str(path)
+    return jobs
+
+
+def run_batch(jobs, template, timestamp, workers=None):
+    """
+    Render reports for many issuers with one template load
+
+    Default output paths are resolved up front by assign_batch_outputs(), so
+    every job writes its own file.
+
+    Args:
+        jobs: List of jobs from discover_batch_jobs()
+        template: Template content (loaded once by the caller)
+        timestamp: Eastern Time timestamp string for default filenames
+        workers: Process pool size (default: CPU count); 1 renders in-process
+
+    Returns:
+        list: generate_batch_report() results in job order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = assign_batch_outputs(jobs, timestamp)
+    if workers == 1 or len(jobs) <= 1:
+        _init_batch_worker(template)
+        return [generate_batch_report(job, timestamp) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker, initargs=(template,)) as executor:
+        return list(executor.map(generate_batch_report, jobs, [timestamp] * len(jobs)))
+
+
+def summarize_batch(results, skipped, template_name, wall_seconds):
+    """
+    Build the batch summary (timings and failures)
+
+    Args:
+        results: List of generate_batch_report() results
+        skipped: Folders skipped during discovery
+        template_name: Template filename used for the run
+        wall_seconds: Elapsed wall-clock time for the whole batch
+
+    Returns:
+        dict: Summary with counts, timing statistics, failures and per-issuer results
+    """
+    succeeded = [r for r in results if r['status'] == 'success']
+    failed = [r for r in results if r['status'] != 'success']
+    timings = [r['seconds'] for r in results]
+
+    return {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'template': template_name,
+        'total': len(results),
+        'succeeded': len(succeeded),
+        'failed': len(failed),
+        'skipped': skipped,
+        'timing': {
+            'wall_seconds': round(wall_seconds, 3),
+            'total_report_seconds': round(sum(timings), 3),
+            'mean_report_seconds': round(sum(timings) / len(timings), 4) if timings else 0,
+            'max_report_seconds': max(timings) if timings else 0,
+        },
+        'failures': [{'metrics': r['metrics'], 'issuer': r['issuer'], 'error': r['error']} for r in failed],
+        'results': results,
+    }
+
+
+def run_batch_mode(args, timestamp):
+    """Execute --batch: discover jobs, render in a process pool, write summary. Returns exit code."""
+    import time
+
+    print("=" * 70)
+    print("PHASE 5: BATCH REPORT GENERATION")
+    print("=" * 70)
+
+    jobs, skipped = discover_batch_jobs(args.batch)
+    print(f"\n🔎 Batch source: {args.batch}")
+    print(f"✓ {len(jobs)} issuer(s) to render ({len(skipped)} folder(s) skipped - no Phase 3 metrics)")
+
+    if not jobs:
+        print("\n❌ Error: No issuers found for batch source")
+        return 1
+
+    print(f"\n📋 Loading template: {args.template}")
+    template = load_template(args.template)
+    compile_template(template)
+    print(f"✓ Template loaded ({len(template)} characters)")
+
+    print(f"\n⚙️  Rendering {len(jobs)} report(s) (workers: {args.workers or 'auto'})...")
+    start = time.perf_counter()
+    results = run_batch(jobs, template, timestamp, workers=args.workers)
+    wall_seconds = time.perf_counter() - start
+
+    for r in results:
+        if r['status'] == 'success':
+            print(f"  ✓ {r['issuer']} ({r['seconds']:.2f}s) → {r['output']}")
+        else:
+            print(f"  ✗ {r['issuer'] or r['metrics']}: {r['error']}")
+
+    summary = summarize_batch(results, skipped, args.template, wall_seconds)
+    summary_path = Path(args.summary) if args.summary else Path('Issuer_Reports') / f'{timestamp}_batch_report_summary.json'
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, 'w') as f:
+        json.dump(summary, f, indent=2)
+
+    print("\n" + "=" * 70)
+    print("BATCH SUMMARY")
+    print("=" * 70)
+    print(f"Succeeded: {summary['succeeded']}/{summary['total']}")
+    print(f"Failed: {summary['failed']}")
+    print(f"Wall time: {summary['timing']['wall_seconds']:.2f}s "
+          f"(mean {summary['timing']['mean_report_seconds']:.3f}s per report)")
+    print(f"Summary: {summary_path}")
+    print("=" * 70)
+
+    return 0 if summary['failed'] == 0 else 1
+
+
 def main():
     """Main execution - command-line interface"""
     import argparse
@@ -2577,15 +3051,19 @@ def main():
 
     parser = argparse.ArgumentParser(
         description='Phase 5: Generate final credit opinion report',
-        epilog='Example: python generate_final_report.py metrics.json analysis.md'
+        epilog='Example: python generate_final_report.py metrics.json analysis.md\n'
+               f'Batch:   python generate_final_report.py --batch "{BATCH_DEFAULT_GLOB}"',
+        formatter_class=argparse.RawDescriptionHelpFormatter
     )
     parser.add_argument(
         'metrics_json',
-        help='Path to Phase 3 calculated metrics JSON (REQUIRED)'
+        nargs='?',
+        help='Path to Phase 3 calculated metrics JSON (REQUIRED unless --batch)'
     )
     parser.add_argument(
         'analysis_md',
-        help='Path to Phase 4 credit analysis markdown (REQUIRED)'
+        nargs='?',
+        help='Path to Phase 4 credit analysis markdown (REQUIRED unless --batch)'
     )
     parser.add_argument(
         '--output',
@@ -2597,14 +3075,45 @@ def main():
         default='credit_opinion_template.md',
         help='Template filename (default: credit_opinion_template.md)'
     )
+    parser.add_argument(
+        '--batch',
+        nargs='?',
+        const=BATCH_DEFAULT_GLOB,
+        default=None,
+        metavar='MANIFEST_OR_GLOB',
+        help=f'Render many issuers in one run from a JSON manifest or a glob over issuer temp/ folders (default: {BATCH_DEFAULT_GLOB})'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Batch mode: number of worker processes (default: CPU count)'
+    )
+    parser.add_argument(
+        '--summary',
+        default=None,
+        help='Batch mode: summary JSON path (default: Issuer_Reports/{timestamp}_batch_report_summary.json)'
+    )
 
     args = parser.parse_args()
 
+    if args.batch is None and (args.metrics_json is None or args.analysis_md is None):
+        parser.error('the following arguments are required: metrics_json, analysis_md (or use --batch)')
+    if args.batch is not None and (args.metrics_json or args.output):
+        parser.error('--batch cannot be combined with metrics_json/analysis_md or --output')
+
     # Generate Eastern Time timestamp for default filename
     eastern = pytz.timezone('America/New_York')
     et_now = datetime.now(eastern)
     timestamp = et_now.strftime('%Y-%m-%d_%H%M%S')
 
+    if args.batch is not None:
+        try:
+            sys.exit(run_batch_mode(args, timestamp))
+        except (FileNotFoundError, ValueError, json.JSONDecodeError) as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
+
     use_auto_filename = args.output is None
 
     print("=" * 70)
@@ -2616,48 +3125,11 @@ def main():
         metrics = load_metrics(args.metrics_json)
 
         # Auto-detect and load Phase 2 extraction data (for reconciliation tables)
-        metrics_path = Path(args.metrics_json).resolve()
-        phase2_path = None
-        phase2_data = None
-
-        # Try to find phase2_extracted_data.json in the same temp/ folder
-        if 'temp' in metrics_path.parts:
-            temp_folder = metrics_path.parent
-            potential_phase2 = temp_folder / 'phase2_extracted_data.json'
-            if potential_phase2.exists():
-                phase2_path = potential_phase2
-                try:
-                    with open(phase2_path, 'r') as f:
-                        phase2_data = json.load(f)
-                    print(f"✓ Phase 2 extraction data loaded: {phase2_path}")
-                except Exception as e:
-                    print(f"⚠️  Phase 2 data found but couldn't load: {e}")
+        phase2_data = load_phase2_data(args.metrics_json)
 
         # If output path is auto-generated, create in issuer's reports/ folder
         if use_auto_filename:
-            issuer_name = metrics.get('issuer_name', 'Unknown_Issuer')
-            # Clean issuer name for filename (remove spaces, special chars)
-            import re
-            clean_name = issuer_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
-            # Keep only alphanumeric, underscore, hyphen
-            clean_name = re.sub(r'[^a-zA-Z0-9_-]', '', clean_name)
-
-            # Infer issuer folder from metrics path (e.g., ./Issuer_Reports/{issuer}/temp/...)
-            metrics_path = Path(args.metrics_json).resolve()  # Convert to absolute path
-            # Navigate up from temp/ to issuer folder
-            if 'temp' in metrics_path.parts:
-                temp_index = metrics_path.parts.index('temp')
-                issuer_folder = Path(*metrics_path.parts[:temp_index])
-                reports_folder = issuer_folder / 'reports'
-            else:
-                # Fallback: create in Issuer_Reports/{clean_name}/reports/ (absolute path)
-                cwd = Path.cwd()
-                reports_folder = cwd / 'Issuer_Reports' / clean_name / 'reports'
-
-            # Create reports folder
-            reports_folder.mkdir(parents=True, exist_ok=True)
-
-            args.output = str(reports_folder / f'{timestamp}_Credit_Opinion_{clean_name}.md')
+            args.output = str(default_report_path(metrics, args.metrics_json, timestamp))
 
         analysis_sections = load_analysis(args.analysis_md)
 
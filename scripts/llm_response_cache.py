@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+
+Phase 2 extraction (and the Phase 4 credit analysis) are the slowest and
+costliest stages, and they are re-run whenever an issuer is regenerated,
+even when the Phase 1 markdown and the prompt are byte-identical. This
+cache keeps validated responses so such a re-run replays them instantly.
+
+Entries are content-addressed. The key hashes:
+
+- the input files (SHA-256 of each markdown or PDF, in order), so moved or
+  renamed files still hit,
+- the schema version (SHA-256 of the schema file the output follows),
+- the prompt template (SHA-256 of the generated prompt with the input and
+  output paths replaced by placeholders), so any change to the template,
+  the issuer name or the table pre-extraction misses as it should, and
+- the model id.
+
+Each entry is one JSON file (<key>.json) holding the key material and the
+response. The cache directory is bounded by total size, and least-recently-
+used entries are evicted first. Recency is the entry mtime, which every hit
+refreshes. Every lookup is appended to lookups.jsonl, which the report
+command summarises as hits, misses and hit rate per stage and issuer.
+
+Usage:
+    python scripts/llm_response_cache.py report
+    python scripts/llm_response_cache.py report --json
+    python scripts/llm_response_cache.py list
+    python scripts/llm_response_cache.py prune --max-mb 50
+    python scripts/llm_response_cache.py prune --older-than-days 90
+    python scripts/llm_response_cache.py clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from pdf_conversion_cache import file_digest
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'llm_responses'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB (~5,000 Phase 2 extractions)
+DEFAULT_MODEL_ID = 'default'
+
+# Bump when the entry layout or the key material changes
+CACHE_FORMAT = 1
+
+LOOKUP_LOG = 'lookups.jsonl'
+MAX_LOG_LINES = 10000
+
+# Pending key of a missed lookup, stored next to the output until the response validates
+PENDING_SUFFIX = '_cache_key.json'
+
+
+def text_digest(text: str) -> str:
+    """SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def prompt_digest(prompt: str, input_files: List[str], output_path) -> str:
+    """
+    Hash of a prompt with run-specific paths replaced by placeholders
+
+    Args:
+        prompt: Generated prompt
+        input_files: Input file paths referenced in the prompt
+        output_path: Output path referenced in the prompt
+
+    Returns:
+        str: SHA-256 hex digest of the normalised prompt
+    """
+    normalised = prompt.replace(str(output_path), '{output_path}')
+    # Longest first, so a path that contains another is replaced whole
+    for index, path in sorted(enumerate(input_files), key=lambda item: -len(str(item[1]))):
+        normalised = normalised.replace(str(path), f'{{input_{index}}}')
+    return text_digest(normalised)
+
+
+def key_material(input_files: List[str], schema_path, prompt_sha256: str, model_id: str,
+                 stage: str = 'phase2') -> Dict:
+    """
+    Key material of one LLM call
+
+    Args:
+        input_files: Markdown or PDF files the prompt reads
+        schema_path: Schema the response follows (missing file: no schema version)
+        prompt_sha256: prompt_digest() of the prompt
+        model_id: Model that answers the prompt
+        stage: Pipeline stage (phase2, phase4, ...)
+
+    Returns:
+        dict: JSON-serializable key material
+    """
+    schema_path = Path(schema_path) if schema_path else None
+    return {
+        'format': CACHE_FORMAT,
+        'stage': stage,
+        'inputs': [file_digest(str(path)) for path in input_files],
+        'schema': file_digest(str(schema_path)) if schema_path and schema_path.exists() else None,
+        'prompt': prompt_sha256,
+        'model': model_id,
+    }
+
+
+def response_key(material: Dict) -> str:
+    """SHA-256 hex digest of the canonical key material."""
+    return text_digest(json.dumps(material, sort_keys=True, separators=(',', ':')))
+
+
+def pending_key_path(output_path) -> Path:
+    """phase2_extracted_data.json -> .phase2_extracted_data_cache_key.json (same directory)."""
+    output_path = Path(output_path)
+    return output_path.parent / f'.{output_path.stem}{PENDING_SUFFIX}'
+
+
+def save_pending_key(output_path, key: str, material: Dict, label: Optional[str] = None) -> Path:
+    """
+    Remember the key of a missed lookup until its response has been validated
+
+    Args:
+        output_path: File the response will be written to
+        key: Key from response_key()
+        material: key_material() the key was built from
+        label: Issuer (or other label)
+
+    Returns:
+        Path: The pending key file
+    """
+    path = pending_key_path(output_path)
+    _write_json_atomic(path, {'key': key, 'material': material, 'label': label})
+    return path
+
+
+def store_pending_response(output_path, response, cache: 'ResponseCache') -> Optional[str]:
+    """
+    Cache a validated response under the pending key of its output, if any
+
+    Args:
+        output_path: File holding the validated response
+        response: The validated response
+        cache: ResponseCache to store it in
+
+    Returns:
+        str: The key it was stored under, or None if no key was pending
+    """
+    path = pending_key_path(output_path)
+    try:
+        with open(path, 'r') as f:
+            pending = json.load(f)
+        key, material = pending['key'], pending['material']
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+        return None
+    cache.put(key, response, material, label=pending.get('label'))
+    path.unlink(missing_ok=True)
+    return key
+
+
+def _write_json_atomic(path: Path, payload) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+class ResponseCache:
+    """Size-bounded LRU store of LLM responses keyed by response_key()"""
+
+    def __init__(self, cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory for cache entries (default: <repo>/.cache/llm_responses)
+            max_bytes: Total size bound for the entries
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.json'
+
+    def _log(self, key: str, hit: bool, stage: str, label: Optional[str]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        record = {'time': datetime.now().isoformat(timespec='seconds'), 'key': key, 'hit': hit,
+                  'stage': stage, 'label': label}
+        with open(self.cache_dir / LOOKUP_LOG, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+    def get(self, key: str, stage: str = 'phase2', label: Optional[str] = None):
+        """
+        Look up a cached response and record the hit or miss
+
+        Args:
+            key: Key from response_key()
+            stage: Pipeline stage, for the report
+            label: Issuer (or other label), for the report
+
+        Returns:
+            The stored response, or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r') as f:
+                response = json.load(f)['response']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            response = None
+
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # Refresh recency for LRU eviction
+            try:
+                os.utime(entry_path)
+            except OSError:
+                pass
+        self._log(key, response is not None, stage, label)
+        return response
+
+    def put(self, key: str, response, material: Dict, label: Optional[str] = None) -> None:
+        """
+        Store a response and evict least-recently-used entries over the size bound
+
+        Args:
+            key: Key from response_key()
+            response: JSON-serializable response
+            material: key_material() the key was built from
+            label: Issuer (or other label)
+        """
+        entry = {'key': key, 'label': label, 'material': material, 'response': response,
+                 'created_at': datetime.now().isoformat(timespec='seconds')}
+        _write_json_atomic(self._entry_path(key), entry)
+        self.evict()
+
+    def entries(self) -> List[Dict]:
+        """
+        Describe every entry, least recently used first
+
+        Returns:
+            List of dicts with key, label, stage, model, size_bytes,
+            last_used (epoch seconds) and created_at
+        """
+        if not self.cache_dir.exists():
+            return []
+
+        entries = []
+        for entry_path in self.cache_dir.glob('*.json'):
+            if entry_path.name.startswith('.'):
+                continue
+            try:
+                stat = entry_path.stat()
+                with open(entry_path, 'r') as f:
+                    entry = json.load(f)
+                material = entry.get('material') or {}
+            except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+                continue
+            entries.append({
+                'key': entry_path.stem,
+                'label': entry.get('label'),
+                'stage': material.get('stage'),
+                'model': material.get('model'),
+                'size_bytes': stat.st_size,
+                'last_used': stat.st_mtime,
+                'created_at': entry.get('created_at'),
+            })
+        return sorted(entries, key=lambda e: e['last_used'])
+
+    def remove(self, key: str) -> None:
+        """Delete one entry."""
+        self._entry_path(key).unlink(missing_ok=True)
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Delete least-recently-used entries until the cache fits in max_bytes
+
+        Also trims the lookup log to its last MAX_LOG_LINES lookups.
+
+        Args:
+            max_bytes: Size bound (default: self.max_bytes)
+
+        Returns:
+            int: Number of entries removed
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(e['size_bytes'] for e in entries)
+        removed = 0
+        for entry in entries:
+            if total <= max_bytes:
+                break
+            self.remove(entry['key'])
+            total -= entry['size_bytes']
+            removed += 1
+
+        lookups = self.lookups()
+        if len(lookups) > MAX_LOG_LINES:
+            log_path = self.cache_dir / LOOKUP_LOG
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+            with os.fdopen(fd, 'w') as f:
+                f.writelines(json.dumps(record) + '\n' for record in lookups[-MAX_LOG_LINES:])
+            os.replace(tmp_path, log_path)
+        return removed
+
+    def prune(self, max_bytes: Optional[int] = None, older_than_days: Optional[float] = None) -> int:
+        """
+        Remove entries unused for older_than_days, then evict down to max_bytes
+
+        Args:
+            max_bytes: Size bound (default: self.max_bytes)
+            older_than_days: Remove entries last used before this many days ago
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        if older_than_days is not None:
+            cutoff = time.time() - older_than_days * 86400
+            for entry in self.entries():
+                if entry['last_used'] < cutoff:
+                    self.remove(entry['key'])
+                    removed += 1
+        return removed + self.evict(max_bytes)
+
+    def lookups(self) -> List[Dict]:
+        """Logged lookups, oldest first (unreadable lines are skipped)."""
+        try:
+            with open(self.cache_dir / LOOKUP_LOG, 'r') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records
+
+    def report(self) -> Dict:
+        """
+        Hit/miss report over the lookup log, plus entry count and size
+
+        Returns:
+            dict with cache_dir, entries, size_bytes, max_bytes, lookups,
+            hits, misses, hit_rate and by_stage / by_label breakdowns
+            ({name: {hits, misses}})
+        """
+        lookups = self.lookups()
+        entries = self.entries()
+        by_stage, by_label = {}, {}
+        for record in lookups:
+            outcome = 'hits' if record.get('hit') else 'misses'
+            for breakdown, name in ((by_stage, record.get('stage')), (by_label, record.get('label'))):
+                counts = breakdown.setdefault(name or '?', {'hits': 0, 'misses': 0})
+                counts[outcome] += 1
+        hits = sum(1 for record in lookups if record.get('hit'))
+        return {
+            'cache_dir': str(self.cache_dir),
+            'entries': len(entries),
+            'size_bytes': sum(e['size_bytes'] for e in entries),
+            'max_bytes': self.max_bytes,
+            'lookups': len(lookups),
+            'hits': hits,
+            'misses': len(lookups) - hits,
+            'hit_rate': hits / len(lookups) if lookups else None,
+            'by_stage': by_stage,
+            'by_label': by_label,
+        }
+
+    def clear(self) -> None:
+        """Remove all entries and the lookup log."""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.iterdir():
+                if path.is_file():
+                    path.unlink(missing_ok=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Report on, inspect or prune the LLM response cache."""
+    parser = argparse.ArgumentParser(description='Report on, inspect or prune the LLM response cache')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Cache directory (default: .cache/llm_responses in the repo root)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    report_parser = subparsers.add_parser('report', help='Hits, misses and hit rate per stage and issuer')
+    report_parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    list_parser = subparsers.add_parser('list', help='List entries, most recently used last')
+    list_parser.add_argument('--json', action='store_true', help='Print entries as JSON')
+    prune_parser = subparsers.add_parser('prune', help='Evict least-recently-used entries')
+    prune_parser.add_argument('--max-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                              help=f'Size bound in MB (default: {DEFAULT_MAX_BYTES // 1024 // 1024})')
+    prune_parser.add_argument('--older-than-days', type=float, default=None,
+                              help='Also remove entries not used for this many days')
+    subparsers.add_parser('clear', help='Remove every entry and the lookup log')
+
+    args = parser.parse_args(argv)
+    cache = ResponseCache(args.cache_dir)
+
+    if args.command == 'report':
+        report = cache.report()
+        if args.json:
+            print(json.dumps(report, indent=2))
+            return 0
+        print(f"Cache: {report['cache_dir']}")
+        print(f"Entries: {report['entries']} ({report['size_bytes'] / 1024 / 1024:.1f} MB "
+              f"of {report['max_bytes'] / 1024 / 1024:.0f} MB)")
+        rate = f"{report['hit_rate']:.0%}" if report['hit_rate'] is not None else 'n/a'
+        print(f"Lookups: {report['lookups']} ({report['hits']} hits, {report['misses']} misses, hit rate {rate})")
+        for title, breakdown in (('By stage', report['by_stage']), ('By issuer', report['by_label'])):
+            if breakdown:
+                print(f"\n{title}:")
+                for name, counts in sorted(breakdown.items()):
+                    print(f"  {name:40} {counts['hits']:5} hits {counts['misses']:5} misses")
+    elif args.command == 'list':
+        entries = cache.entries()
+        if args.json:
+            print(json.dumps(entries, indent=2))
+            return 0
+        for entry in entries:
+            last_used = datetime.fromtimestamp(entry['last_used']).isoformat(sep=' ', timespec='seconds')
+            print(f"{entry['key'][:12]}  {entry['size_bytes'] / 1024:8.1f} KB  {last_used}  "
+                  f"{entry['stage']}/{entry['model']}  {entry['label']}")
+        print(f"{len(entries)} entr{'y' if len(entries) == 1 else 'ies'}")
+    elif args.command == 'prune':
+        removed = cache.prune(int(args.max_mb * 1024 * 1024), args.older_than_days)
+        print(f"Removed {removed} entr{'y' if removed == 1 else 'ies'}")
+    elif args.command == 'clear':
+        cache.clear()
+        print(f"Cleared {cache.cache_dir}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Shared Macro Rate Series Cache
+
+Bank of Canada (Valet) and FRED policy-rate series are identical for every
+issuer on a given day, so they are fetched once and shared:
+
+- In-process: one MacroSeriesCache per process (get_default_cache()) serves
+  every EnhancedMacroMonitor, so a batch run makes one request per series.
+- On disk: series are stored as JSON under .cache/macro_series and reused
+  across runs until they are older than the TTL (default: 6 hours).
+- Incremental: a stale series is refreshed from its last observation date
+  (re-fetching that point picks up revisions) and appended.
+
+Backends:
+    HttpMacroBackend     Pooled requests.Session against the public Valet and
+                         FRED (fredgraph.csv) endpoints
+    FixtureMacroBackend  Local JSON fixtures for offline tests
+
+Usage:
+    from macro_series_cache import MacroSeriesCache, FixtureMacroBackend
+    cache = MacroSeriesCache(backend=FixtureMacroBackend('tests/fixtures/macro'))
+    df = cache.get_series('boc', 'V122530', start_date='2015-01-01')
+"""
+
+import io
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'macro_series'
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+
+BOC_VALET_URL = "https://www.bankofcanada.ca/valet/observations"
+FRED_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv"
+
+Observations = List[Tuple[str, float]]
+
+
+class HttpMacroBackend:
+    """Valet / FRED fetches over one pooled HTTP session."""
+
+    def __init__(self, session=None, timeout: int = 30, pool_size: int = 4):
+        """
+        Initialize backend.
+
+        Args:
+            session: requests.Session to reuse (default: new session with a
+                connection pool and retry on transient HTTP errors)
+            timeout: Request timeout in seconds
+            pool_size: Connections kept alive per host
+        """
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+        self.session = session
+        self.timeout = timeout
+
+    def fetch(self, source: str, code: str, start_date: str) -> Observations:
+        """
+        Fetch observations on or after start_date.
+
+        Args:
+            source: 'boc' or 'fred'
+            code: Series code (e.g. 'V122530', 'FEDFUNDS')
+            start_date: 'YYYY-MM-DD'
+
+        Returns:
+            List of (date 'YYYY-MM-DD', value) sorted by date
+
+        Raises:
+            ValueError: Unknown source
+            requests.RequestException: HTTP failure
+        """
+        if source == 'boc':
+            response = self.session.get(f"{BOC_VALET_URL}/{code}/json",
+                                        params={'start_date': start_date}, timeout=self.timeout)
+            response.raise_for_status()
+            observations = []
+            for obs in response.json().get('observations', []):
+                if obs.get('d') and obs.get(code, {}).get('v'):
+                    observations.append((obs['d'], float(obs[code]['v'])))
+            return sorted(observations)
+
+        if source == 'fred':
+            response = self.session.get(FRED_CSV_URL, params={'id': code, 'cosd': start_date},
+                                        timeout=self.timeout)
+            response.raise_for_status()
+            df = pd.read_csv(io.StringIO(response.text))
+            date_column = df.columns[0]  # 'observation_date' (older files: 'DATE')
+            values = pd.to_numeric(df[code], errors='coerce')  # '.' marks missing values
+            return [(str(d)[:10], float(v)) for d, v in zip(df[date_column], values) if pd.notna(v)]
+
+        raise ValueError(f"Unknown macro series source: {source}")
+
+
+class FixtureMacroBackend:
+    """
+    Offline backend serving <fixture_dir>/<source>_<code>.json.
+
+    Each fixture is a JSON list of [date, value] pairs. Requests are recorded
+    in self.calls so tests can assert how often the network would be hit.
+    """
+
+    def __init__(self, fixture_dir):
+        self.fixture_dir = Path(fixture_dir)
+        self.calls: List[Tuple[str, str, str]] = []
+
+    def fetch(self, source: str, code: str, start_date: str) -> Observations:
+        self.calls.append((source, code, start_date))
+        with open(self.fixture_dir / f'{source}_{code}.json', 'r') as f:
+            observations = json.load(f)
+        return [(d, float(v)) for d, v in observations if d >= start_date]
+
+
+class MacroSeriesCache:
+    """TTL'd on-disk + in-memory store of macro rate series."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        backend=None,
+        persist: bool = True
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for series files (default: <repo>/.cache/macro_series)
+            ttl_seconds: Age after which a series is refreshed (0: always refresh)
+            backend: Object with fetch(source, code, start_date) (default: HttpMacroBackend)
+            persist: False to keep series in memory only
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.backend = backend if backend is not None else HttpMacroBackend()
+        self.persist = persist
+        self._memory: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, source: str, code: str) -> Path:
+        return self.cache_dir / f'{source}_{code}.json'
+
+    def _read(self, source: str, code: str) -> Optional[Dict]:
+        key = f'{source}_{code}'
+        if key in self._memory:
+            return self._memory[key]
+        if not self.persist:
+            return None
+        try:
+            with open(self._path(source, code), 'r') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        self._memory[key] = entry
+        return entry
+
+    def _write(self, source: str, code: str, entry: Dict) -> None:
+        self._memory[f'{source}_{code}'] = entry
+        if not self.persist:
+            return
+
+        # Atomic write so concurrent batch workers never read a partial file
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(source, code))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _refresh(self, source: str, code: str, start_date: str, entry: Optional[Dict]) -> Dict:
+        now = datetime.now().isoformat(timespec='seconds')
+
+        if entry is None or start_date < entry['start_date'] or not entry['observations']:
+            observations = self.backend.fetch(source, code, start_date)
+            return {'start_date': start_date, 'fetched_at': now, 'observations': observations}
+
+        # Append: re-fetch from the last stored observation to pick up revisions
+        last_date = entry['observations'][-1][0]
+        tail = self.backend.fetch(source, code, last_date)
+        merged = dict((d, v) for d, v in entry['observations'])
+        merged.update((d, v) for d, v in tail)
+        return {
+            'start_date': entry['start_date'],
+            'fetched_at': now,
+            'observations': sorted(merged.items())
+        }
+
+    def get_series(self, source: str, code: str, start_date: str, refresh: bool = False) -> pd.DataFrame:
+        """
+        Series observations on or after start_date.
+
+        Args:
+            source: 'boc' or 'fred'
+            code: Series code (e.g. 'V122530', 'FEDFUNDS')
+            start_date: 'YYYY-MM-DD'
+            refresh: Force a refresh even if the cached series is within the TTL
+
+        Returns:
+            DataFrame with 'date' (datetime) and 'rate' columns, sorted by date
+
+        Raises:
+            Exception: Backend errors when there is no cached copy to fall back to
+        """
+        with self._lock:
+            entry = self._read(source, code)
+            fresh = (
+                entry is not None
+                and not refresh
+                and start_date >= entry['start_date']
+                and datetime.now() - datetime.fromisoformat(entry['fetched_at']) < self.ttl
+            )
+
+            if not fresh:
+                try:
+                    entry = self._refresh(source, code, start_date, entry)
+                    self._write(source, code, entry)
+                except Exception as e:
+                    if entry is None:
+                        raise
+                    print(f"WARNING: Could not refresh {source}:{code} ({e}); "
+                          f"using cached series from {entry['fetched_at']}")
+
+        records = [(d, v) for d, v in entry['observations'] if d >= start_date]
+        df = pd.DataFrame(records, columns=['date', 'rate'])
+        df['date'] = pd.to_datetime(df['date'])
+        return df.sort_values('date').reset_index(drop=True)
+
+    def clear(self) -> None:
+        """Drop in-memory and on-disk series."""
+        with self._lock:
+            self._memory.clear()
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob('*.json'):
+                    path.unlink(missing_ok=True)
+
+
+_default_cache: Optional[MacroSeriesCache] = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache() -> MacroSeriesCache:
+    """Process-wide cache shared by every EnhancedMacroMonitor."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = MacroSeriesCache()
+        return _default_cache
+
+
+def set_default_cache(cache: Optional[MacroSeriesCache]) -> None:
+    """Replace the process-wide cache (None: recreate with defaults on next use)."""
+    global _default_cache
+    with _default_lock:
+        _default_cache = cache
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Structured Table Store for Phase 1 Markdown
+
+A statements file converts to ~100+ pipe tables. Phase 2 tools used to
+re-parse them from raw text on every lookup (split on '|', regex over the
+first cell, clean each number). Phase 1 now parses every table once and
+writes a compact columnar store next to the markdown:
+
+    phase1_markdown/statements.md
+    phase1_markdown/statements.tables.json
+
+Each table keeps its caption (the heading or text line above it), its
+source line range and the line of every row, the column headers, the row
+labels and the numeric cells column by column (None where a cell is blank,
+a dash or text). Numbers are parsed once: thousands separators, '$',
+parentheses negatives ("(1,234)"), leading minus signs and percentages
+("12.5%" -> 0.125, as section_extractor.ExtractionUtilities.clean_number()).
+
+A label index maps each normalized row label ("total assets") to its
+(table, row) positions, so a lookup across a filing is a dictionary hit.
+Pattern lookups (find()) search the distinct labels rather than the file.
+
+Usage:
+    python scripts/markdown_table_store.py Issuer_Reports/Artis_REIT/temp/phase1_markdown/*.md
+    python scripts/markdown_table_store.py statements.md mda.md --lookup "total assets"
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+STORE_FORMAT = 2
+STORE_SUFFIX = '.tables.json'
+
+# Non-blank lines above a table searched for its caption (a heading is preferred)
+CAPTION_LOOKBACK = 3
+
+_SEPARATOR_RE = re.compile(r'^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$')
+_NUMBER_RE = re.compile(r'^(?P<open>\()?(?P<minus>[-−–])?(?P<digits>\d{1,3}(?:,\d{3})+|\d+)?'
+                        r'(?P<decimals>\.\d+)?(?P<pct>%)?(?P<close>\))?(?P<pct_after>%)?$')
+_NIL_CELLS = {'', '-', '–', '—', 'n/a', 'nil'}
+_FOOTNOTE_RE = re.compile(r'\s*(\(\d{1,2}\)|\[\d{1,2}\]|[¹²³⁰-⁹]+)\s*$')
+
+
+def parse_number(text: str) -> Optional[float]:
+    """
+    Parse a financial statement cell
+
+    Handles "1,234,567", "$ 1,234", "(1,234)" and "$(1,234)" (negative),
+    "-1,234", "12.5%" (-> 0.125) and "(2.5)%". Dashes, blanks and text
+    ("Q2 2025", "Note 4a") return None.
+
+    Args:
+        text: Cell text
+
+    Returns:
+        float, or None if the cell is not a number
+    """
+    cleaned = re.sub(r'[\s\u00a0\u202f$]', '', text)
+    if cleaned.lower() in _NIL_CELLS:
+        return None
+    match = _NUMBER_RE.match(cleaned)
+    if match is None or not (match.group('digits') or match.group('decimals')):
+        return None
+    if bool(match.group('open')) != bool(match.group('close')):
+        return None
+
+    value = float((match.group('digits') or '0').replace(',', '') + (match.group('decimals') or ''))
+    if match.group('open') or match.group('minus'):
+        value = -value
+    if match.group('pct') or match.group('pct_after'):
+        value = value / 100
+    return value
+
+
+def normalize_label(text: str) -> str:
+    """
+    Index key for a row label: lowercase words, no footnote markers or punctuation
+
+    "Unitholders' equity (1)" -> "unitholders equity"
+    """
+    text = _FOOTNOTE_RE.sub('', text.replace('**', ''))
+    return ' '.join(re.findall(r'[a-z0-9%]+', text.lower().replace("'", '').replace('’', '')))
+
+
+def _split_row(line: str) -> List[str]:
+    cells = line.strip()
+    if cells.startswith('|'):
+        cells = cells[1:]
+    if cells.endswith('|'):
+        cells = cells[:-1]
+    return [cell.strip() for cell in cells.split('|')]
+
+
+def _caption(lines: List[str], table_start: int) -> str:
+    """Nearest heading within CAPTION_LOOKBACK non-blank lines above a table, else the nearest text line."""
+    texts = []
+    for index in range(table_start - 1, -1, -1):
+        text = lines[index].strip()
+        if text.startswith('|') or len(texts) == CAPTION_LOOKBACK:
+            break
+        if text:
+            texts.append(text)
+    text = next((t for t in texts if t.startswith('#')), texts[0] if texts else '')
+    return text.lstrip('#').strip().strip('*_').strip()
+
+
+def parse_markdown_tables(text: str) -> List[Dict]:
+    """
+    Parse every pipe table in markdown
+
+    A table is a header row, a separator row (|---|---|) and the pipe rows
+    that follow. The first column holds the row labels; the remaining
+    columns are parsed with parse_number(), except 'Note' reference columns.
+
+    Args:
+        text: Markdown content
+
+    Returns:
+        List of dicts with caption, lines ([first, last], 1-based),
+        row_lines (1-based line of each row), columns (headers of the value
+        columns), labels and values (one list per column, aligned with labels)
+    """
+    lines = text.splitlines()
+    tables = []
+    index = 0
+    while index < len(lines) - 1:
+        line = lines[index]
+        if not line.lstrip().startswith('|') or not _SEPARATOR_RE.match(lines[index + 1]) \
+                or '|' not in lines[index + 1]:
+            index += 1
+            continue
+
+        header = _split_row(line)
+        rows = []
+        row_lines = []
+        end = index + 2
+        while end < len(lines) and lines[end].lstrip().startswith('|'):
+            if not _SEPARATOR_RE.match(lines[end]):
+                rows.append(_split_row(lines[end]))
+                row_lines.append(end + 1)
+            end += 1
+
+        width = max([len(header)] + [len(row) for row in rows])
+        columns = (header + [''] * width)[1:width]
+        values = [[None] * len(rows) for _ in columns]
+        numeric = [normalize_label(header) not in ('note', 'notes') for header in columns]
+        for row_index, row in enumerate(rows):
+            for column, cell in enumerate(row[1:]):
+                if numeric[column]:
+                    values[column][row_index] = parse_number(cell)
+
+        tables.append({
+            'caption': _caption(lines, index),
+            'lines': [index + 1, end],
+            'row_lines': row_lines,
+            'columns': columns,
+            'labels': [row[0] for row in rows],
+            'values': values,
+        })
+        index = end
+    return tables
+
+
+@dataclass
+class TableRow:
+    """One row of a stored table"""
+    table: int
+    row: int
+    label: str
+    caption: str
+    source: Optional[str]
+    columns: List[str]
+    values: List[Optional[float]]
+    line: Optional[int] = None
+
+    def value(self, column=-1) -> Optional[float]:
+        """
+        Numeric cell by column position or header
+
+        Args:
+            column: Index into the value columns (default: last), or a header
+                string (first case-insensitive substring match)
+
+        Returns:
+            float or None
+        """
+        if isinstance(column, str):
+            wanted = column.lower()
+            matches = [i for i, header in enumerate(self.columns) if wanted in header.lower()]
+            if not matches:
+                return None
+            column = matches[0]
+        if not -len(self.values) <= column < len(self.values):
+            return None
+        return self.values[column]
+
+    def last_value(self) -> Optional[float]:
+        """Rightmost numeric cell (usually the comparative period)."""
+        return next((v for v in reversed(self.values) if v is not None), None)
+
+    def first_value(self) -> Optional[float]:
+        """Leftmost numeric cell (usually the current period)."""
+        return next((v for v in self.values if v is not None), None)
+
+
+class TableStore:
+    """Parsed tables of one or more markdown files with a row-label index"""
+
+    def __init__(self, tables: List[Dict]):
+        """
+        Args:
+            tables: parse_markdown_tables() dicts, each optionally with a source
+        """
+        self.tables = tables
+        self.labels: Dict[str, List[Tuple[int, int]]] = {}
+        for table_index, table in enumerate(tables):
+            for row_index, label in enumerate(table['labels']):
+                key = normalize_label(label)
+                if key:
+                    self.labels.setdefault(key, []).append((table_index, row_index))
+
+    @classmethod
+    def from_markdown(cls, text: str, source: Optional[str] = None) -> 'TableStore':
+        """Parse the tables of markdown text (source: file name recorded on each table)."""
+        tables = parse_markdown_tables(text)
+        for table in tables:
+            table['source'] = source
+        return cls(tables)
+
+    @classmethod
+    def combine(cls, stores: List['TableStore']) -> 'TableStore':
+        """One store (and label index) across several files, e.g. statements and MD&A."""
+        return cls([table for store in stores for table in store.tables])
+
+    def row(self, table_index: int, row_index: int) -> TableRow:
+        """TableRow at a (table, row) position."""
+        table = self.tables[table_index]
+        return TableRow(
+            table=table_index,
+            row=row_index,
+            label=table['labels'][row_index],
+            caption=table['caption'],
+            source=table.get('source'),
+            columns=table['columns'],
+            values=[column[row_index] for column in table['values']],
+            line=table['row_lines'][row_index],
+        )
+
+    def group(self, table_index: int, row_index: int) -> str:
+        """
+        Label of the sub-heading a row sits under
+
+        The nearest row above it in the same table with no numeric cells,
+        e.g. "Current liabilities:" for a second "Mortgages and loans payable"
+        row. Empty if there is none.
+        """
+        table = self.tables[table_index]
+        for index in range(row_index - 1, -1, -1):
+            if all(column[index] is None for column in table['values']):
+                return table['labels'][index]
+        return ''
+
+    def lookup(self, label: str) -> List[TableRow]:
+        """
+        Every row whose normalized label equals label's
+
+        Args:
+            label: Row label, e.g. "Total assets"
+
+        Returns:
+            List of TableRow in document order (empty if none)
+        """
+        return [self.row(*position) for position in self.labels.get(normalize_label(label), [])]
+
+    def find(self, label_patterns: List[str], caption: Optional[str] = None) -> Optional[TableRow]:
+        """
+        First row whose label matches a pattern (patterns tried in order)
+
+        Same contract as section_extractor.ExtractionUtilities.find_row_by_label(),
+        but the patterns run over the distinct normalized labels, not the text.
+
+        Args:
+            label_patterns: Regexes matched against normalized labels
+            caption: Optional case-insensitive substring the table caption must contain
+
+        Returns:
+            TableRow or None
+        """
+        for pattern in label_patterns:
+            compiled = re.compile(pattern, re.IGNORECASE)
+            for key, positions in self.labels.items():
+                if not compiled.search(key):
+                    continue
+                for position in positions:
+                    if caption is None or caption.lower() in self.tables[position[0]]['caption'].lower():
+                        return self.row(*position)
+        return None
+
+    def value(self, label: str, column=-1) -> Optional[float]:
+        """Numeric cell of the first row labelled label (see TableRow.value())."""
+        rows = self.lookup(label)
+        return rows[0].value(column) if rows else None
+
+    def to_dict(self) -> Dict:
+        return {
+            'format': STORE_FORMAT,
+            'tables': self.tables,
+            'labels': {key: [list(position) for position in positions] for key, positions in self.labels.items()},
+        }
+
+    def save(self, path) -> None:
+        """Write the store as compact JSON (atomic replace)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.to_dict(), f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path) -> 'TableStore':
+        """
+        Read a saved store
+
+        Raises:
+            ValueError: If the file was written by an incompatible format version
+        """
+        with open(path, 'r') as f:
+            payload = json.load(f)
+        if payload.get('format') != STORE_FORMAT:
+            raise ValueError(f"{path}: table store format {payload.get('format')!r}, expected {STORE_FORMAT}")
+        store = cls.__new__(cls)
+        store.tables = payload['tables']
+        store.labels = {key: [tuple(position) for position in positions]
+                        for key, positions in payload['labels'].items()}
+        return store
+
+
+def table_store_path(markdown_path) -> Path:
+    """statements.md -> statements.tables.json (same directory)."""
+    markdown_path = Path(markdown_path)
+    return markdown_path.with_name(markdown_path.stem + STORE_SUFFIX)
+
+
+def build_table_store(markdown_path, output_path=None) -> TableStore:
+    """
+    Parse a markdown file's tables and save the store next to it
+
+    Args:
+        markdown_path: Phase 1 markdown file
+        output_path: Store path (default: table_store_path(markdown_path))
+
+    Returns:
+        TableStore
+    """
+    markdown_path = Path(markdown_path)
+    store = TableStore.from_markdown(markdown_path.read_text(encoding='utf-8'), source=markdown_path.name)
+    store.save(output_path or table_store_path(markdown_path))
+    return store
+
+
+def load_table_store(markdown_paths) -> TableStore:
+    """
+    Tables of a filing's markdown files as one store
+
+    Saved stores are used when they are at least as new as their markdown;
+    otherwise the markdown is parsed (and the store rewritten).
+
+    Args:
+        markdown_paths: Phase 1 markdown file(s)
+
+    Returns:
+        TableStore spanning every file
+    """
+    if isinstance(markdown_paths, (str, Path)):
+        markdown_paths = [markdown_paths]
+
+    stores = []
+    for markdown_path in map(Path, markdown_paths):
+        store_path = table_store_path(markdown_path)
+        store = None
+        try:
+            if store_path.stat().st_mtime_ns >= markdown_path.stat().st_mtime_ns:
+                store = TableStore.load(store_path)
+        except (FileNotFoundError, ValueError, json.JSONDecodeError):
+            pass
+        stores.append(store if store is not None else build_table_store(markdown_path))
+    return TableStore.combine(stores)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build table stores for markdown files, optionally looking up a row label."""
+    parser = argparse.ArgumentParser(description='Build structured table stores from Phase 1 markdown')
+    parser.add_argument('markdown_files', nargs='+', help='Phase 1 markdown files')
+    parser.add_argument('--lookup', action='append', default=[], metavar='LABEL',
+                        help='Print the rows with this label (repeatable)')
+    args = parser.parse_args(argv)
+
+    stores = []
+    for markdown_file in args.markdown_files:
+        store = build_table_store(markdown_file)
+        stores.append(store)
+        print(f"📊 {markdown_file}: {len(store.tables)} tables, {len(store.labels)} distinct row labels "
+              f"-> {table_store_path(markdown_file)}")
+
+    filing = TableStore.combine(stores)
+    for label in args.lookup:
+        rows = filing.lookup(label)
+        print(f"\n🔎 {label!r}: {len(rows)} row(s)")
+        for row in rows:
+            print(f"   {row.source} table {row.table} ({row.caption or 'no caption'}): {row.label} = {row.values}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
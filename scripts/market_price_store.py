@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Local OHLCV Price Store
+
+On-disk price history per provider and ticker, so market monitoring only
+downloads the dates it has not seen before:
+
+    <store>/<provider>/<TICKER>.parquet   OHLCV rows, one per trading day
+    <store>/<provider>/<TICKER>.json      Covered date range + bookkeeping
+
+The coverage record tracks the date ranges that were *requested* from the
+provider, so weekends and the days before a listing are never re-requested.
+It ends at the last bar that came back, though, and never includes today:
+a lagging provider's missing days and a bar fetched before the close are
+requested again on the next refresh.
+
+Files are Parquet when a Parquet engine (pyarrow or fastparquet) is
+installed, otherwise CSV. Both formats are read back regardless of which
+engine is available at write time.
+
+Usage:
+    from market_price_store import PriceStore
+    store = PriceStore()                                   # .cache/price_store
+    df = store.get_history('REI-UN.TO', 'tmx', start_date, end_date, fetcher)
+    df = PriceStore(offline=True).get_history(...)         # never touches the network
+
+Version: 1.0.0
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+DEFAULT_STORE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'price_store'
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    try:
+        import fastparquet  # noqa: F401
+        PARQUET_AVAILABLE = True
+    except ImportError:
+        PARQUET_AVAILABLE = False
+
+DATE_FORMAT = '%Y-%m-%d'
+
+
+def _to_date(value) -> pd.Timestamp:
+    return pd.Timestamp(value).normalize()
+
+
+def _today() -> pd.Timestamp:
+    return _to_date(datetime.now())
+
+
+def _has_business_days(start: pd.Timestamp, end: pd.Timestamp) -> bool:
+    """True if [start, end] contains at least one weekday."""
+    return start <= end and len(pd.bdate_range(start, end)) > 0
+
+
+class PriceStore:
+    """
+    Incrementally refreshed OHLCV history keyed by (provider, ticker).
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        offline: bool = False,
+        file_format: Optional[str] = None
+    ):
+        """
+        Initialize price store.
+
+        Args:
+            root: Store directory (default: <repo>/.cache/price_store)
+            offline: Serve stored data only; never call the fetcher
+            file_format: 'parquet' or 'csv' for new files (default: parquet if
+                a Parquet engine is installed, else csv)
+        """
+        self.root = Path(root) if root else DEFAULT_STORE_DIR
+        self.offline = offline
+        self.file_format = file_format or ('parquet' if PARQUET_AVAILABLE else 'csv')
+        if self.file_format not in ('parquet', 'csv'):
+            raise ValueError(f"file_format must be 'parquet' or 'csv', got {self.file_format!r}")
+
+    # ------------------------------------------------------------------
+    # Paths and metadata
+    # ------------------------------------------------------------------
+
+    def _base_path(self, ticker: str, provider: str) -> Path:
+        return self.root / provider / ticker
+
+    def _meta_path(self, ticker: str, provider: str) -> Path:
+        base = self._base_path(ticker, provider)
+        return base.with_name(base.name + '.json')
+
+    def _data_path(self, ticker: str, provider: str) -> Optional[Path]:
+        """Existing data file (either format), or None."""
+        base = self._base_path(ticker, provider)
+        for suffix in ('.parquet', '.csv'):
+            path = base.with_name(base.name + suffix)
+            if path.exists():
+                return path
+        return None
+
+    def coverage(self, ticker: str, provider: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Date range already requested from the provider.
+
+        Args:
+            ticker: Ticker symbol
+            provider: Data provider
+
+        Returns:
+            (covered_start, covered_end) timestamps, or None if nothing is stored
+        """
+        try:
+            with open(self._meta_path(ticker, provider), 'r') as f:
+                meta = json.load(f)
+            return _to_date(meta['covered_start']), _to_date(meta['covered_end'])
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    # ------------------------------------------------------------------
+    # Read / write
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        ticker: str,
+        provider: str,
+        start_date=None,
+        end_date=None
+    ) -> pd.DataFrame:
+        """
+        Stored rows for a ticker, optionally limited to [start_date, end_date].
+
+        Args:
+            ticker: Ticker symbol
+            provider: Data provider
+            start_date: First date to include (inclusive)
+            end_date: Last date to include (inclusive)
+
+        Returns:
+            DataFrame sorted by date (empty if nothing is stored)
+        """
+        path = self._data_path(ticker, provider)
+        if path is None:
+            return pd.DataFrame()
+
+        if path.suffix == '.parquet':
+            df = pd.read_parquet(path)
+        else:
+            df = pd.read_csv(path, parse_dates=['date'])
+
+        if start_date is not None:
+            df = df[df['date'] >= _to_date(start_date)]
+        if end_date is not None:
+            df = df[df['date'] < _to_date(end_date) + pd.Timedelta(days=1)]
+        return df.reset_index(drop=True)
+
+    def _write_atomic(self, path: Path, write: Callable[[str], None]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def merge(
+        self,
+        ticker: str,
+        provider: str,
+        new_rows: pd.DataFrame,
+        covered_start,
+        covered_end
+    ) -> pd.DataFrame:
+        """
+        Merge freshly fetched rows and extend the covered range.
+
+        Rows for dates already stored are replaced by the new values. The
+        covered range ends at the last new row, and at yesterday if that row
+        is today's (still-changing) bar.
+
+        Args:
+            ticker: Ticker symbol
+            provider: Data provider
+            new_rows: Normalized OHLCV rows (may be empty)
+            covered_start: Start of the range that was requested
+            covered_end: End of the range that was requested
+
+        Returns:
+            Full stored history after the merge
+        """
+        stored = self.load(ticker, provider)
+        frames = [df for df in (stored, new_rows) if df is not None and not df.empty]
+        merged = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        if not merged.empty:
+            merged['date'] = pd.to_datetime(merged['date'])
+            merged = (merged.drop_duplicates('date', keep='last')
+                            .sort_values('date')
+                            .reset_index(drop=True))
+
+        covered_start, covered_end = _to_date(covered_start), _to_date(covered_end)
+        if new_rows is not None and not new_rows.empty:
+            last_bar = _to_date(pd.to_datetime(new_rows['date']).max())
+        else:
+            last_bar = covered_start - pd.Timedelta(days=1)
+        covered_end = min(covered_end, last_bar, _today() - pd.Timedelta(days=1))
+        previous = self.coverage(ticker, provider)
+        if previous:
+            covered_start = min(covered_start, previous[0])
+            covered_end = max(covered_end, previous[1])
+
+        old_path = self._data_path(ticker, provider)
+        if not merged.empty:
+            base = self._base_path(ticker, provider)
+            path = base.with_name(f'{base.name}.{self.file_format}')
+            if self.file_format == 'parquet':
+                self._write_atomic(path, lambda tmp: merged.to_parquet(tmp, index=False))
+            else:
+                self._write_atomic(path, lambda tmp: merged.to_csv(tmp, index=False))
+            if old_path is not None and old_path != path:
+                old_path.unlink(missing_ok=True)
+
+        meta = {
+            'ticker': ticker,
+            'provider': provider,
+            'covered_start': covered_start.strftime(DATE_FORMAT),
+            'covered_end': covered_end.strftime(DATE_FORMAT),
+            'rows': len(merged),
+            'last_price_date': merged['date'].max().strftime(DATE_FORMAT) if not merged.empty else None,
+            'updated_at': datetime.now().isoformat(timespec='seconds')
+        }
+        self._write_atomic(
+            self._meta_path(ticker, provider),
+            lambda tmp: Path(tmp).write_text(json.dumps(meta, indent=2))
+        )
+        return merged
+
+    # ------------------------------------------------------------------
+    # Incremental refresh
+    # ------------------------------------------------------------------
+
+    def missing_ranges(
+        self,
+        ticker: str,
+        provider: str,
+        start_date,
+        end_date
+    ) -> List[Tuple[str, str]]:
+        """
+        Date ranges in [start_date, end_date] not yet requested from the provider.
+
+        Ranges always extend to the covered range, so coverage stays contiguous.
+        Only ranges containing at least one weekday are returned, so a weekend
+        refresh of Friday's data needs no network call.
+
+        Args:
+            ticker: Ticker symbol
+            provider: Data provider
+            start_date: Requested window start
+            end_date: Requested window end
+
+        Returns:
+            List of (start, end) 'YYYY-MM-DD' pairs: a backfilled head and/or the
+            missing tail since the last covered date
+        """
+        start, end = _to_date(start_date), _to_date(end_date)
+        covered = self.coverage(ticker, provider)
+        if covered is None:
+            return [(start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT))] if start <= end else []
+
+        covered_start, covered_end = covered
+        ranges = []
+        head_end = covered_start - pd.Timedelta(days=1)
+        if _has_business_days(start, head_end):
+            ranges.append((start.strftime(DATE_FORMAT), head_end.strftime(DATE_FORMAT)))
+
+        tail_start = covered_end + pd.Timedelta(days=1)
+        if _has_business_days(tail_start, end):
+            ranges.append((tail_start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)))
+        return ranges
+
+    def get_history(
+        self,
+        ticker: str,
+        provider: str,
+        start_date,
+        end_date,
+        fetcher: Optional[Callable] = None
+    ) -> pd.DataFrame:
+        """
+        Price history for [start_date, end_date], fetching only missing ranges.
+
+        Args:
+            ticker: Ticker symbol
+            provider: Data provider
+            start_date: Window start ('YYYY-MM-DD' or datetime)
+            end_date: Window end ('YYYY-MM-DD' or datetime)
+            fetcher: Callable (symbol, provider, start_date, end_date) -> DataFrame;
+                ignored when the store is offline
+
+        Returns:
+            DataFrame with a 'date' column, sorted ascending (empty if no data)
+
+        Raises:
+            Exception: Whatever the fetcher raises (already-stored data is kept)
+        """
+        if not self.offline and fetcher is not None:
+            for range_start, range_end in self.missing_ranges(ticker, provider, start_date, end_date):
+                fetched = normalize_price_frame(fetcher(ticker, provider, range_start, range_end))
+                self.merge(ticker, provider, fetched, range_start, range_end)
+
+        return self.load(ticker, provider, start_date, end_date)
+
+    def tickers(self, provider: str) -> List[str]:
+        """Tickers with stored coverage for a provider."""
+        provider_dir = self.root / provider
+        if not provider_dir.exists():
+            return []
+        return sorted(path.stem for path in provider_dir.glob('*.json'))
+
+    def summary(self, provider: str) -> Dict[str, Dict]:
+        """Coverage metadata for every stored ticker of a provider."""
+        result = {}
+        for ticker in self.tickers(provider):
+            with open(self._meta_path(ticker, provider), 'r') as f:
+                result[ticker] = json.load(f)
+        return result
+
+
+def normalize_price_frame(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Ensure a 'date' column (datetime) and ascending date order.
+
+    Args:
+        df: Provider DataFrame (date as column or index), or None
+
+    Returns:
+        Normalized copy (empty DataFrame if no rows)
+    """
+    if df is None or df.empty:
+        return pd.DataFrame()
+
+    # Ensure date column
+    if 'date' not in df.columns and df.index.name == 'date':
+        df = df.reset_index()
+    else:
+        df = df.copy()
+
+    df['date'] = pd.to_datetime(df['date'])
+    return df.sort_values('date', ascending=True)
+
+
+def lookback_window(lookback_days: int, now: Optional[datetime] = None) -> Tuple[str, str]:
+    """
+    (start_date, end_date) strings for a lookback ending today.
+
+    Args:
+        lookback_days: Number of calendar days
+        now: Reference time (default: datetime.now())
+
+    Returns:
+        Tuple of 'YYYY-MM-DD' strings
+    """
+    now = now or datetime.now()
+    return (now - timedelta(days=lookback_days)).strftime(DATE_FORMAT), now.strftime(DATE_FORMAT)
+
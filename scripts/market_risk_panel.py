@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Rolling Market-Risk Feature Panel
+
+Computes the MarketDataMonitor market-risk features for every ticker and
+every trading date in one vectorized pass, instead of re-running the
+single-ticker, single-as-of-date calculations per observation:
+
+    volatility_{30,90,252}d_pct     Annualized std of daily returns (rolling rows)
+    momentum_{3,6,12}_month_pct     Point-to-point return over 63/126/252 rows
+    high_52w / low_52w              Rolling 252-row high/low of close
+    decline_from_peak_pct           52-week drawdown
+    distance_from_low_pct           Distance above the 52-week low
+    volume_vs_30d_avg               Volume / 30-row average volume
+    risk_score / risk_level         MarketDataMonitor._calculate_risk_score() scale
+
+Windows are counted in trading rows per ticker, like the tail()/iloc[-n]
+logic in MarketDataMonitor. The panel is computed on one long frame sorted by
+(ticker, date); rows whose window would reach into the previous ticker are
+masked, so no per-ticker Python loop is needed.
+
+Point-in-time lookups use the last trading date on or before the as-of date
+(no look-ahead):
+
+    panel = build_market_risk_panel(prices)              # {ticker: OHLCV DataFrame}
+    features = features_as_of(panel, observations)       # columns: ticker, date
+
+Usage:
+    python scripts/market_risk_panel.py --store .cache/price_store --provider tmx \\
+        --output data/market_risk_panel.csv
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+VOLATILITY_WINDOWS = (30, 90, 252)
+MOMENTUM_PERIODS = {63: '3_month', 126: '6_month', 252: '12_month'}
+DRAWDOWN_WINDOW = 252
+VOLUME_WINDOW = 30
+
+# MarketDataMonitor._calculate_risk_score() point tables: (threshold, points),
+# checked in order
+STRESS_POINTS = [(50, 40), (40, 35), (30, 30), (20, 20), (10, 10)]
+VOLATILITY_POINTS = [(40, 30), (30, 25), (20, 15), (10, 5)]
+MOMENTUM_POINTS = [(-20, 30), (-10, 20), (-5, 10), (5, 5)]  # return <= threshold
+RISK_LEVELS = [(70, 'VERY HIGH'), (50, 'HIGH'), (30, 'MODERATE'), (15, 'LOW')]
+
+
+def _to_long_frame(prices: Union[Dict[str, pd.DataFrame], pd.DataFrame]) -> pd.DataFrame:
+    """Stack {ticker: OHLCV} (or a long frame with a ticker column) sorted by (ticker, date)."""
+    if isinstance(prices, dict):
+        frames = []
+        for ticker, df in prices.items():
+            if df is None or df.empty:
+                continue
+            df = df.reset_index() if 'date' not in df.columns else df
+            frames.append(df[[c for c in ('date', 'close', 'volume') if c in df.columns]]
+                          .assign(ticker=ticker))
+        long = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+            columns=['ticker', 'date', 'close', 'volume'])
+    else:
+        long = prices.copy()
+
+    if 'volume' not in long.columns:
+        long['volume'] = np.nan
+    long['date'] = pd.to_datetime(long['date'])
+    long = (long.drop_duplicates(['ticker', 'date'], keep='last')
+                .sort_values(['ticker', 'date'], kind='stable')
+                .reset_index(drop=True))
+    return long[['ticker', 'date', 'close', 'volume']]
+
+
+def _points(values: pd.Series, table, descending: bool = True) -> np.ndarray:
+    """Vectorized threshold table lookup (first matching threshold wins)."""
+    values = values.to_numpy(dtype=float)
+    if descending:
+        conditions = [values >= threshold for threshold, _ in table]
+    else:
+        conditions = [values <= threshold for threshold, _ in table]
+    return np.select(conditions, [points for _, points in table], default=0)
+
+
+def score_market_risk(panel: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add MarketDataMonitor risk score columns to a feature panel.
+
+    Inputs are rounded as in the single-ticker assessment (drawdown to 0.1%,
+    volatility and momentum to 0.01%) and missing features score as 0%,
+    so scores match MarketDataMonitor._calculate_risk_score().
+
+    Args:
+        panel: Frame with decline_from_peak_pct, volatility_90d_pct and
+            momentum_3_month_pct columns
+
+    Returns:
+        The panel with stress_points, volatility_points, momentum_points,
+        risk_score and risk_level columns
+    """
+    decline = panel['decline_from_peak_pct'].round(1).fillna(0)
+    vol_90d = panel['volatility_90d_pct'].round(2).fillna(0)
+    momentum_3m = panel['momentum_3_month_pct'].round(2).fillna(0)
+
+    panel['stress_points'] = _points(decline, STRESS_POINTS)
+    panel['volatility_points'] = _points(vol_90d, VOLATILITY_POINTS)
+    panel['momentum_points'] = _points(momentum_3m, MOMENTUM_POINTS, descending=False)
+    panel['risk_score'] = panel['stress_points'] + panel['volatility_points'] + panel['momentum_points']
+
+    score = panel['risk_score'].to_numpy()
+    panel['risk_level'] = np.select(
+        [score >= threshold for threshold, _ in RISK_LEVELS],
+        [level for _, level in RISK_LEVELS],
+        default='VERY LOW'
+    )
+    return panel
+
+
+def build_market_risk_panel(
+    prices: Union[Dict[str, pd.DataFrame], pd.DataFrame],
+    volatility_windows: Iterable[int] = VOLATILITY_WINDOWS,
+    momentum_periods: Optional[Dict[int, str]] = None,
+    drawdown_window: int = DRAWDOWN_WINDOW,
+    volume_window: int = VOLUME_WINDOW
+) -> pd.DataFrame:
+    """
+    Rolling market-risk features for all tickers and dates.
+
+    Args:
+        prices: {ticker: OHLCV DataFrame} (e.g. AsyncMarketDataCollector.collect_sync()
+            or PriceStore loads) or a long frame with ticker/date/close[/volume]
+        volatility_windows: Return windows in trading rows
+        momentum_periods: {rows: label} (default: 63/126/252 -> 3/6/12 month)
+        drawdown_window: Rows in the rolling high/low (default: 252, ~52 weeks)
+        volume_window: Rows in the average-volume denominator
+
+    Returns:
+        DataFrame with one row per (ticker, date), sorted by ticker then date.
+        Features are NaN until a ticker has enough history for the window;
+        the 52-week high/low use all history until the window fills.
+    """
+    momentum_periods = momentum_periods or MOMENTUM_PERIODS
+    long = _to_long_frame(prices)
+
+    close = long['close'].astype(float)
+    volume = long['volume'].astype(float)
+    # Row position within each ticker; windows reaching back past 0 are masked
+    position = long.groupby('ticker', sort=False).cumcount().to_numpy()
+
+    panel = long[['ticker', 'date', 'close']].copy()
+    panel['history_days'] = position + 1
+
+    # tail(window) of returns includes the undefined first return when a ticker
+    # has exactly `window` prices, hence min_periods=window - 1
+    returns = close.pct_change().mask(position == 0)
+    for window in volatility_windows:
+        rolling_std = returns.rolling(window, min_periods=window - 1).std()
+        panel[f'volatility_{window}d_pct'] = (rolling_std * np.sqrt(252) * 100).mask(position < window - 1)
+
+    # iloc[-period] is period - 1 rows back
+    for period, label in momentum_periods.items():
+        past_close = close.shift(period - 1)
+        panel[f'momentum_{label}_pct'] = ((close - past_close) / past_close * 100).mask(position < period - 1)
+
+    # Rolling high/low; expanding within the ticker until the window fills
+    full_window = position >= drawdown_window - 1
+    by_ticker = close.groupby(long['ticker'], sort=False)
+    high = close.rolling(drawdown_window, min_periods=1).max().where(full_window, by_ticker.cummax())
+    low = close.rolling(drawdown_window, min_periods=1).min().where(full_window, by_ticker.cummin())
+    panel['high_52w'] = high
+    panel['low_52w'] = low
+    panel['decline_from_peak_pct'] = (high - close) / high * 100
+    panel['distance_from_low_pct'] = (close - low) / low * 100
+
+    average_volume = volume.rolling(volume_window, min_periods=volume_window).mean()
+    panel['volume_vs_30d_avg'] = (volume / average_volume.where(average_volume > 0)).mask(
+        position < volume_window - 1)
+
+    return score_market_risk(panel)
+
+
+def features_as_of(
+    panel: pd.DataFrame,
+    observations: pd.DataFrame,
+    ticker_column: str = 'ticker',
+    date_column: str = 'date',
+    max_staleness_days: Optional[int] = 7
+) -> pd.DataFrame:
+    """
+    Point-in-time feature lookup for many (ticker, date) observations.
+
+    Each observation gets the panel row for the last trading date on or before
+    its date, so features never use prices after the observation date.
+
+    Args:
+        panel: Output of build_market_risk_panel()
+        observations: Frame with ticker and date columns (other columns are kept)
+        ticker_column: Observation ticker column name
+        date_column: Observation date column name
+        max_staleness_days: Ignore panel rows older than this many days before
+            the observation (None: no limit)
+
+    Returns:
+        observations (in original order) with the panel feature columns joined;
+        'panel_date' holds the trading date the features are as of
+    """
+    left = observations.copy()
+    left['_row'] = np.arange(len(left))
+    left['_as_of'] = pd.to_datetime(left[date_column])
+
+    right = panel.rename(columns={'date': 'panel_date', 'ticker': ticker_column})
+    right = right.drop(columns=[c for c in right.columns
+                                if c in left.columns and c != ticker_column])
+
+    tolerance = pd.Timedelta(days=max_staleness_days) if max_staleness_days is not None else None
+    merged = pd.merge_asof(
+        left.sort_values('_as_of'),
+        right.sort_values('panel_date'),
+        left_on='_as_of',
+        right_on='panel_date',
+        by=ticker_column,
+        direction='backward',
+        tolerance=tolerance
+    )
+    return (merged.sort_values('_row')
+                  .drop(columns=['_row', '_as_of'])
+                  .reset_index(drop=True))
+
+
+def lookup_market_risk(panel: pd.DataFrame, ticker: str, as_of) -> Optional[Dict]:
+    """
+    Features for one ticker as of a date.
+
+    Args:
+        panel: Output of build_market_risk_panel()
+        ticker: Ticker symbol
+        as_of: Observation date
+
+    Returns:
+        Dict of panel columns for the last trading date on or before as_of,
+        or None if the ticker has no prices by then
+    """
+    rows = panel[(panel['ticker'] == ticker) & (panel['date'] <= pd.Timestamp(as_of))]
+    if rows.empty:
+        return None
+    return rows.iloc[-1].to_dict()
+
+
+def main():
+    """Build a market-risk panel from the local price store."""
+    from market_price_store import PriceStore
+
+    parser = argparse.ArgumentParser(
+        description='Build rolling market-risk features for all stored tickers and dates'
+    )
+    parser.add_argument('--store', type=Path, help='Price store directory (default: .cache/price_store)')
+    parser.add_argument('--provider', default='tmx', help='Data provider (default: tmx)')
+    parser.add_argument('--tickers', nargs='+', help='Tickers to include (default: all stored)')
+    parser.add_argument('--output', type=Path, default=Path('data/market_risk_panel.csv'),
+                        help='Output CSV (default: data/market_risk_panel.csv)')
+    args = parser.parse_args()
+
+    store = PriceStore(args.store, offline=True)
+    tickers = args.tickers or store.tickers(args.provider)
+    if not tickers:
+        print(f"ERROR: No stored prices for provider '{args.provider}' in {store.root}")
+        sys.exit(1)
+
+    prices = {ticker: store.load(ticker, args.provider) for ticker in tickers}
+    panel = build_market_risk_panel(prices)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    panel.to_csv(args.output, index=False)
+    print(f"✓ Market risk panel: {panel['ticker'].nunique()} tickers, {len(panel)} rows → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+Self-Describing Model Artifacts
+
+A model artifact is the estimator pickle plus a JSON metadata sidecar
+(<model>.model.json) that describes everything a predictor needs before the
+estimator is unpickled:
+
+    features          Ordered input feature schema
+    encodings         Categorical encodings (e.g. sector, dilution_materiality)
+    selector          Feature selection mask and selected feature names
+    scaler            StandardScaler mean/scale for the selected features
+    target_classes    Class labels in estimator order
+    metrics           Training metrics reported with predictions
+    estimator         Pickle file, key (for dict bundles) and SHA-256
+    fused_scorer      Binary logistic regression only: selection, scaling and
+                      coefficients folded into one weight vector (FusedLinearScorer)
+
+Loaders read only the sidecar; the estimator is unpickled on first use and
+checked against the schema, so feature-order mismatches surface up front
+instead of as silently wrong predictions. Models with a fused scorer are
+scored with NumPy alone (no pickle, sklearn or pandas at scoring time).
+
+Legacy v2.x pickles (a dict bundle with model/scaler/selector entries) still
+load without a sidecar via load_model_artifact(); generate one with:
+
+    python scripts/model_artifact.py models/distribution_cut_logistic_regression_v2.2.pkl
+
+LightGBM pickles store only the estimator, so pass the feature order:
+
+    python scripts/model_artifact.py models/lightgbm_model_X.pkl \\
+        --feature-names-from data/training_dataset_v2.csv
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+ARTIFACT_FORMAT = "issuer-credit-model"
+ARTIFACT_FORMAT_VERSION = 1
+METADATA_SUFFIX = ".model.json"
+
+# Encodings Phase4DataEnricher._prepare_features() has applied since model v2.0
+PHASE3_ENCODINGS = {
+    'dilution_materiality': {
+        'mapping': {'minimal': 0, 'low': 1, 'moderate': 2, 'high': 3},
+        'default': 1
+    },
+    'sector': {
+        'mapping': {
+            'Retail': 0, 'Office': 1, 'Industrial': 2, 'Residential': 3,
+            'Diversified': 4, 'Healthcare': 5, 'Storage': 6, 'Other': 7
+        },
+        'default': 7
+    },
+}
+
+# Non-feature columns of training_dataset_v2.csv (LightGBM experiments)
+TRAINING_CSV_EXCLUDE = [
+    'ticker', 'cut_date', 'sector', 'target_cut_occurred',
+    'ttm_distribution_pre_cut', 'avg_monthly_distribution',
+    'dividend_payment_count_ttm', 'current_price', 'current_yield',
+    'data_quality', 'notes', 'cash_runway_months', 'self_funding_ratio',
+    'risk_level'
+]
+
+
+class ModelSchemaError(ValueError):
+    """Model metadata, estimator or input features do not match the schema."""
+
+
+def metadata_path_for(model_path) -> Path:
+    """Sidecar path for an estimator pickle (model.pkl -> model.model.json)."""
+    model_path = Path(model_path)
+    if model_path.name.endswith(METADATA_SUFFIX):
+        return model_path
+    return model_path.with_name(model_path.stem + METADATA_SUFFIX)
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _estimator_feature_names(estimator) -> Optional[List[str]]:
+    names = getattr(estimator, 'feature_names_in_', None)
+    if names is None:
+        names = getattr(estimator, 'feature_name_', None)  # LightGBM sklearn API
+    return [str(name) for name in names] if names is not None else None
+
+
+class FusedLinearScorer:
+    """
+    Binary logistic regression with feature selection and standardization folded in.
+
+    For selected features, z = (x - mean) / scale and logit = coef . z + intercept,
+    so logit = weights . x + bias with weights = coef / scale (0 for unselected
+    features) and bias = intercept - weights . center. Scoring a batch is one
+    matrix-vector product over the full (unselected) feature matrix.
+    """
+
+    def __init__(self, weights, center, intercept: float, coefficients):
+        """
+        Initialize scorer.
+
+        Args:
+            weights: Per-feature weights in artifact feature order
+            center: Per-feature centering (training mean; 0 for unselected features)
+            intercept: Model intercept (on standardized features)
+            coefficients: Standardized-feature coefficients, in selected-feature order
+        """
+        self.weights = np.asarray(weights, dtype=float)
+        self.center = np.asarray(center, dtype=float)
+        self.intercept = float(intercept)
+        self.bias = self.intercept - float(self.weights @ self.center)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+
+    @classmethod
+    def from_pipeline(cls, selector_mask, scaler_mean, scaler_scale, coef, intercept) -> 'FusedLinearScorer':
+        """Fold a selector mask, StandardScaler parameters and logistic coefficients."""
+        mask = np.asarray(selector_mask, dtype=bool)
+        coef = np.asarray(coef, dtype=float).ravel()
+        weights = np.zeros(len(mask))
+        center = np.zeros(len(mask))
+        weights[mask] = coef / np.asarray(scaler_scale, dtype=float)
+        center[mask] = np.asarray(scaler_mean, dtype=float)
+        return cls(weights, center, float(np.ravel(intercept)[0]), coef)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FusedLinearScorer':
+        return cls(data['weights'], data['center'], data['intercept'], data['coefficients'])
+
+    def to_dict(self) -> Dict:
+        return {
+            'weights': [float(v) for v in self.weights],
+            'center': [float(v) for v in self.center],
+            'intercept': self.intercept,
+            'coefficients': [float(v) for v in self.coefficients],
+        }
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        """Log-odds of a cut for each row of the full feature matrix."""
+        return np.asarray(X, dtype=float) @ self.weights + self.bias
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Cut probability (positive class) for each row."""
+        return 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Encoded class (1 = positive) for each row."""
+        return (self.decision_function(X) > 0).astype(int)
+
+    def contributions(self, X: np.ndarray) -> np.ndarray:
+        """
+        Per-feature log-odds contributions relative to the training mean.
+
+        Each row sums to decision_function(X) - intercept; unselected features
+        contribute 0.
+        """
+        return (np.asarray(X, dtype=float) - self.center) * self.weights
+
+
+class ModelArtifact:
+    """Model metadata with a lazily loaded estimator."""
+
+    def __init__(self, metadata: Dict, base_dir: Path, estimator=None, verify_checksum: bool = True):
+        """
+        Initialize artifact.
+
+        Args:
+            metadata: Parsed sidecar metadata
+            base_dir: Directory the estimator file is relative to
+            estimator: Already-loaded estimator (legacy bundles)
+            verify_checksum: Check the estimator file's SHA-256 when loading it
+
+        Raises:
+            ModelSchemaError: If the metadata is not a supported artifact
+        """
+        if metadata.get('format') != ARTIFACT_FORMAT:
+            raise ModelSchemaError(f"Not a model artifact (format: {metadata.get('format')!r})")
+        if metadata.get('format_version', 0) > ARTIFACT_FORMAT_VERSION:
+            raise ModelSchemaError(
+                f"Model artifact format v{metadata['format_version']} is newer than supported "
+                f"v{ARTIFACT_FORMAT_VERSION}; update scripts/model_artifact.py"
+            )
+
+        self.metadata = metadata
+        self.base_dir = Path(base_dir)
+        self.verify_checksum = verify_checksum
+        self._estimator = estimator
+
+        self.feature_names: List[str] = list(metadata['features'])
+        selector = metadata.get('selector')
+        if selector:
+            self.selector_mask = np.asarray(selector['mask'], dtype=bool)
+            self.selected_features: List[str] = list(selector['selected_features'])
+        else:
+            self.selector_mask = None
+            self.selected_features = list(self.feature_names)
+
+        scaler = metadata.get('scaler')
+        self.scaler_mean = np.asarray(scaler['mean'], dtype=float) if scaler else None
+        self.scaler_scale = np.asarray(scaler['scale'], dtype=float) if scaler else None
+
+        fused = metadata.get('fused_scorer')
+        self.fused_scorer: Optional[FusedLinearScorer] = FusedLinearScorer.from_dict(fused) if fused else None
+
+        self._validate_metadata()
+
+    def _validate_metadata(self) -> None:
+        if len(set(self.feature_names)) != len(self.feature_names):
+            raise ModelSchemaError("Duplicate feature names in model schema")
+        if self.selector_mask is not None:
+            if len(self.selector_mask) != len(self.feature_names):
+                raise ModelSchemaError(
+                    f"Selector mask has {len(self.selector_mask)} entries for {len(self.feature_names)} features"
+                )
+            masked = [name for name, keep in zip(self.feature_names, self.selector_mask) if keep]
+            if masked != self.selected_features:
+                raise ModelSchemaError("Selector mask does not match selected_features")
+        if self.scaler_mean is not None and len(self.scaler_mean) != len(self.selected_features):
+            raise ModelSchemaError(
+                f"Scaler has {len(self.scaler_mean)} parameters for {len(self.selected_features)} selected features"
+            )
+        if self.fused_scorer is not None and (
+            len(self.fused_scorer.weights) != len(self.feature_names)
+            or len(self.fused_scorer.coefficients) != len(self.selected_features)
+        ):
+            raise ModelSchemaError("Fused scorer does not match the feature schema")
+
+    @classmethod
+    def load(cls, path, verify_checksum: bool = True) -> 'ModelArtifact':
+        """
+        Read an artifact's metadata (the estimator is not unpickled).
+
+        Args:
+            path: Sidecar (.model.json) or estimator pickle with a sidecar next to it
+            verify_checksum: Check the estimator file's SHA-256 when it is loaded
+
+        Returns:
+            ModelArtifact
+
+        Raises:
+            FileNotFoundError: If there is no sidecar
+            ModelSchemaError: If the metadata is invalid
+        """
+        metadata_path = metadata_path_for(path)
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+        return cls(metadata, metadata_path.parent, verify_checksum=verify_checksum)
+
+    @classmethod
+    def from_bundle(cls, bundle: Dict, model_path, encodings: Optional[Dict] = None) -> 'ModelArtifact':
+        """Artifact for an already-unpickled v2.x dict bundle (no sidecar)."""
+        model_path = Path(model_path)
+        metadata = describe_model_bundle(bundle, model_path, encodings, checksum=False)
+        return cls(metadata, model_path.parent, estimator=bundle['model'], verify_checksum=False)
+
+    # Metadata accessors
+
+    @property
+    def version(self) -> str:
+        return self.metadata.get('version', 'unknown')
+
+    @property
+    def model_type(self) -> str:
+        return self.metadata.get('model_type', 'unknown')
+
+    @property
+    def metrics(self) -> Dict:
+        return self.metadata.get('metrics', {})
+
+    @property
+    def target_classes(self) -> List:
+        return self.metadata.get('target_classes', [0, 1])
+
+    @property
+    def estimator_path(self) -> Path:
+        return self.base_dir / self.metadata['estimator']['file']
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._estimator is not None
+
+    def decode_target(self, label) -> str:
+        """Class label for an encoded estimator prediction."""
+        return self.target_classes[int(label)]
+
+    def encode(self, feature: str, value):
+        """
+        Encode a categorical feature value.
+
+        Args:
+            feature: Encoded feature name (e.g. 'sector')
+            value: Raw category
+
+        Returns:
+            Integer code (the encoding's default for unknown categories)
+        """
+        encoding = self.metadata.get('encodings', {})[feature]
+        return encoding['mapping'].get(value, encoding['default'])
+
+    # Estimator
+
+    @property
+    def estimator(self):
+        """The fitted estimator, unpickled and schema-checked on first use."""
+        if self._estimator is None:
+            info = self.metadata['estimator']
+            path = self.estimator_path
+            if self.verify_checksum and info.get('sha256') and _sha256(path) != info['sha256']:
+                raise ModelSchemaError(f"Estimator file {path} does not match the artifact checksum")
+
+            with open(path, 'rb') as f:
+                if info.get('loader') == 'joblib':
+                    import joblib
+                    loaded = joblib.load(f)
+                else:
+                    loaded = pickle.load(f)
+            estimator = loaded[info['key']] if info.get('key') else loaded
+            self.check_estimator(estimator)
+            self._estimator = estimator
+        return self._estimator
+
+    def check_estimator(self, estimator) -> None:
+        """
+        Verify an estimator expects the selected features in schema order.
+
+        Raises:
+            ModelSchemaError: On a feature count or order mismatch
+        """
+        n_features = getattr(estimator, 'n_features_in_', None)
+        if n_features is not None and n_features != len(self.selected_features):
+            raise ModelSchemaError(
+                f"Estimator expects {n_features} features; artifact schema selects {len(self.selected_features)}"
+            )
+        names = _estimator_feature_names(estimator)
+        if names is not None and names != self.selected_features:
+            raise ModelSchemaError(
+                f"Estimator feature order {names} does not match artifact schema {self.selected_features}"
+            )
+
+    # Inputs
+
+    def check_columns(self, columns: Iterable[str]) -> None:
+        """
+        Verify input columns cover the feature schema.
+
+        Raises:
+            ModelSchemaError: Listing missing features
+        """
+        missing = [name for name in self.feature_names if name not in set(columns)]
+        if missing:
+            raise ModelSchemaError(f"Input is missing model features: {', '.join(missing)}")
+
+    def feature_matrix(self, rows: Iterable[Dict]) -> np.ndarray:
+        """
+        Stack feature dicts into a matrix in schema order.
+
+        Args:
+            rows: Feature dicts with exactly the schema's features
+
+        Returns:
+            Array of shape (rows, features)
+
+        Raises:
+            ModelSchemaError: If a row has missing or unexpected features
+        """
+        expected = set(self.feature_names)
+        matrix = []
+        for row in rows:
+            if row.keys() != expected:
+                missing = sorted(expected - row.keys())
+                extra = sorted(row.keys() - expected)
+                raise ModelSchemaError(f"Feature mismatch - missing: {missing}, unexpected: {extra}")
+            matrix.append([row[name] for name in self.feature_names])
+        return np.asarray(matrix, dtype=float).reshape(len(matrix), len(self.feature_names))
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Apply feature selection and scaling (same arithmetic as SelectKBest + StandardScaler)."""
+        X = np.asarray(X, dtype=float)
+        if self.selector_mask is not None:
+            X = X[:, self.selector_mask]
+        if self.scaler_mean is not None:
+            X = (X - self.scaler_mean) / self.scaler_scale
+        return X
+
+    def save(self, path=None) -> Path:
+        """Write the metadata sidecar atomically (default: next to the estimator)."""
+        return write_metadata(self.metadata, path or metadata_path_for(self.estimator_path))
+
+
+def describe_model_bundle(bundle: Dict, model_path, encodings: Optional[Dict] = None,
+                          checksum: bool = True) -> Dict:
+    """
+    Sidecar metadata for a v2.x dict bundle (model, scaler, selector, ...).
+
+    Args:
+        bundle: Unpickled bundle
+        model_path: Path of the bundle pickle
+        encodings: Categorical encodings (default: PHASE3_ENCODINGS for encoded features)
+        checksum: Record the pickle's SHA-256
+
+    Returns:
+        Metadata dict
+    """
+    model_path = Path(model_path)
+    features = list(bundle['feature_names'])
+    selector = bundle.get('selector')
+    scaler = bundle.get('scaler')
+    if encodings is None:
+        encodings = {name: enc for name, enc in PHASE3_ENCODINGS.items() if name in features}
+
+    model = bundle['model']
+    fused = None
+    if (hasattr(model, 'coef_') and getattr(model, 'predict_proba', None) is not None
+            and len(getattr(model, 'classes_', [])) == 2 and scaler is not None):
+        mask = selector.get_support() if selector is not None else np.ones(len(features), dtype=bool)
+        fused = FusedLinearScorer.from_pipeline(mask, scaler.mean_, scaler.scale_,
+                                                model.coef_[0], model.intercept_).to_dict()
+
+    metadata = {
+        'format': ARTIFACT_FORMAT,
+        'format_version': ARTIFACT_FORMAT_VERSION,
+        'model_type': bundle.get('model_type', 'unknown'),
+        'version': bundle.get('version', 'unknown'),
+        'training_date': bundle.get('training_date'),
+        'estimator': {
+            'file': model_path.name,
+            'key': 'model',
+            'loader': 'pickle',
+            'class': f"{type(bundle['model']).__module__}.{type(bundle['model']).__name__}",
+            'sha256': _sha256(model_path) if checksum else None,
+        },
+        'features': features,
+        'encodings': encodings,
+        'selector': {
+            'mask': [bool(keep) for keep in selector.get_support()],
+            'selected_features': list(bundle['selected_features']),
+        } if selector is not None else None,
+        'scaler': {
+            'mean': [float(v) for v in scaler.mean_],
+            'scale': [float(v) for v in scaler.scale_],
+        } if scaler is not None else None,
+        'target_classes': [str(c) for c in bundle['target_encoder'].classes_]
+        if bundle.get('target_encoder') is not None else [0, 1],
+        'metrics': {k: float(v) for k, v in bundle.get('metrics', {}).items()},
+        'fused_scorer': fused,
+    }
+    return metadata
+
+
+def describe_estimator(model_path, feature_names: List[str], model_type: str = 'lightgbm',
+                       version: str = 'unknown', loader: str = 'joblib') -> Dict:
+    """
+    Sidecar metadata for a bare estimator pickle (no selector or scaler).
+
+    Args:
+        model_path: Path of the estimator pickle
+        feature_names: Ordered input features
+        model_type: Model family label
+        version: Model version label
+        loader: 'joblib' or 'pickle'
+
+    Returns:
+        Metadata dict
+    """
+    model_path = Path(model_path)
+    return {
+        'format': ARTIFACT_FORMAT,
+        'format_version': ARTIFACT_FORMAT_VERSION,
+        'model_type': model_type,
+        'version': version,
+        'training_date': None,
+        'estimator': {'file': model_path.name, 'key': None, 'loader': loader,
+                      'sha256': _sha256(model_path)},
+        'features': list(feature_names),
+        'encodings': {},
+        'selector': None,
+        'scaler': None,
+        'target_classes': [0, 1],
+        'metrics': {},
+    }
+
+
+def write_metadata(metadata: Dict, path) -> Path:
+    """Write sidecar JSON atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(metadata, f, indent=2)
+            f.write('\n')
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def load_model_artifact(model_path, verify_checksum: bool = True) -> ModelArtifact:
+    """
+    Load a model by path, preferring its metadata sidecar.
+
+    Without a sidecar, a v2.x dict bundle is unpickled eagerly and described
+    in memory (legacy models keep working).
+
+    Args:
+        model_path: Estimator pickle or sidecar path
+        verify_checksum: Check the estimator file's SHA-256 when it is loaded
+
+    Returns:
+        ModelArtifact
+
+    Raises:
+        FileNotFoundError: If neither the sidecar nor the pickle exists
+        ModelSchemaError: If the pickle is not a described bundle
+    """
+    model_path = Path(model_path)
+    if metadata_path_for(model_path).exists():
+        return ModelArtifact.load(model_path, verify_checksum=verify_checksum)
+    if not model_path.exists():
+        raise FileNotFoundError(f"Model file not found: {model_path}")
+
+    with open(model_path, 'rb') as f:
+        bundle = pickle.load(f)
+    if not isinstance(bundle, dict) or 'feature_names' not in bundle:
+        raise ModelSchemaError(
+            f"{model_path} has no metadata sidecar; create one with: "
+            f"python scripts/model_artifact.py {model_path} --feature-names-from <training CSV>"
+        )
+    return ModelArtifact.from_bundle(bundle, model_path)
+
+
+def feature_names_from_csv(csv_path, exclude: Iterable[str] = TRAINING_CSV_EXCLUDE) -> List[str]:
+    """Feature columns of a training CSV (header only)."""
+    import csv
+
+    with open(csv_path, 'r', newline='') as f:
+        header = next(csv.reader(f))
+    excluded = set(exclude)
+    return [column for column in header if column not in excluded]
+
+
+def main():
+    """Write (or check) the metadata sidecar for a model pickle."""
+    parser = argparse.ArgumentParser(description='Create a self-describing model artifact sidecar')
+    parser.add_argument('model', type=Path, help='Model pickle')
+    parser.add_argument('--feature-names-from', type=Path,
+                        help='Training CSV giving the feature order (bare estimator pickles)')
+    parser.add_argument('--model-type', default='lightgbm', help='Model type for bare estimators')
+    parser.add_argument('--version', default='unknown', help='Model version for bare estimators')
+    parser.add_argument('--check', action='store_true',
+                        help='Load the existing sidecar and estimator and verify the schema')
+    args = parser.parse_args()
+
+    if args.check:
+        artifact = ModelArtifact.load(args.model)
+        artifact.estimator
+        print(f"✓ {metadata_path_for(args.model)}: {len(artifact.feature_names)} features, "
+              f"{len(artifact.selected_features)} selected, estimator matches schema")
+        return 0
+
+    if args.feature_names_from:
+        metadata = describe_estimator(args.model, feature_names_from_csv(args.feature_names_from),
+                                      model_type=args.model_type, version=args.version)
+    else:
+        with open(args.model, 'rb') as f:
+            bundle = pickle.load(f)
+        if not isinstance(bundle, dict) or 'feature_names' not in bundle:
+            print("ERROR: Not a v2.x model bundle; pass --feature-names-from <training CSV>")
+            return 1
+        metadata = describe_model_bundle(bundle, args.model)
+        ModelArtifact(metadata, args.model.parent, estimator=bundle['model']).check_estimator(bundle['model'])
+
+    path = write_metadata(metadata, metadata_path_for(args.model))
+    print(f"✓ Wrote {path} ({len(metadata['features'])} features)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
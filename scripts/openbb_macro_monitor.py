@@ -7,57 +7,43 @@ to provide comprehensive North American interest rate context.
 
 Usage:
     python scripts/openbb_macro_monitor_enhanced.py --output data/macro_enhanced.json
+    python scripts/openbb_macro_monitor.py --ttl-hours 0      # force a refresh
+
+Rate series are read through the shared macro series cache
+(macro_series_cache.py), so every issuer in a batch run reuses one fetch.
 """
 
-import requests
 import pandas as pd
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from openbb import obb
+
+from macro_series_cache import MacroSeriesCache, get_default_cache
+
+BOC_POLICY_RATE = ('boc', 'V122530')
+FED_FUNDS_RATE = ('fred', 'FEDFUNDS')
 
 class EnhancedMacroMonitor:
     """Monitor both Canadian and US interest rates."""
     
-    def __init__(self):
-        self.boc_url = "https://www.bankofcanada.ca/valet/observations"
+    def __init__(self, series_cache: MacroSeriesCache = None):
+        """
+        Args:
+            series_cache: Macro series cache (default: the process-wide shared cache)
+        """
+        self.series_cache = series_cache or get_default_cache()
     
     def get_boc_rate(self, months=120):
         """Get Bank of Canada overnight rate."""
         start = (datetime.now() - timedelta(days=months*30)).strftime('%Y-%m-%d')
-        url = f"{self.boc_url}/V122530/json?start_date={start}"
-        data = requests.get(url, timeout=30).json()
-        
-        records = []
-        for obs in data.get('observations', []):
-            if obs.get('d') and obs.get('V122530', {}).get('v'):
-                records.append({
-                    'date': pd.to_datetime(obs['d']),
-                    'rate': float(obs['V122530']['v'])
-                })
-        return pd.DataFrame(records).sort_values('date')
+        return self.series_cache.get_series(*BOC_POLICY_RATE, start_date=start)
     
     def get_us_fed_rate(self, months=120):
         """Get US Federal Funds Rate from FRED."""
         start_date = (datetime.now() - timedelta(days=months*30)).strftime('%Y-%m-%d')
         
         try:
-            result = obb.economy.fred_series(
-                symbol='FEDFUNDS',
-                start_date=start_date,
-                provider='fred'
-            )
-            
-            df = result.to_df()
-            if df.empty:
-                return pd.DataFrame()
-            
-            # Reset index to get date column
-            df = df.reset_index()
-            df = df.rename(columns={'FEDFUNDS': 'rate'})
-            df['date'] = pd.to_datetime(df['date'])
-            
-            return df.sort_values('date')
+            return self.series_cache.get_series(*FED_FUNDS_RATE, start_date=start_date)
             
         except Exception as e:
             print(f"WARNING: Could not retrieve US Fed data: {e}")
@@ -279,9 +265,11 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Enhanced macro monitor (Canada + US rates)")
     parser.add_argument('--output', type=Path, default=Path('data/macro_enhanced.json'))
     parser.add_argument('--lookback', type=int, default=120)
+    parser.add_argument('--cache-dir', type=Path, help='Macro series cache directory (default: .cache/macro_series)')
+    parser.add_argument('--ttl-hours', type=float, default=6, help='Refresh cached series older than this (default: 6)')
     args = parser.parse_args()
     
-    monitor = EnhancedMacroMonitor()
+    monitor = EnhancedMacroMonitor(MacroSeriesCache(args.cache_dir, ttl_seconds=args.ttl_hours * 3600))
     assessment = monitor.generate_assessment(args.lookback)
     
     # Export
@@ -8,6 +8,9 @@ and momentum indicators for credit risk assessment.
 Usage:
     python scripts/openbb_market_monitor.py --ticker REI-UN.TO --output data/riocan_market.json
     python scripts/openbb_market_monitor.py --ticker AX-UN.TO --lookback 365
+    python scripts/openbb_market_monitor.py --universe config/canadian_reits.yaml --concurrency 8
+    python scripts/openbb_market_monitor.py --universe config/canadian_reits.yaml --store
+    python scripts/openbb_market_monitor.py --ticker REI-UN.TO --store --offline
 
 Features:
     - Price stress detection (>30% decline from 52-week high)
@@ -16,6 +19,10 @@ Features:
     - 52-week high/low tracking
     - Trading volume analysis
     - Price trend classification
+    - Concurrent multi-ticker collection (asyncio, per-provider rate limiting,
+      retry with exponential backoff)
+    - Local price store (--store): only the missing tail since the last stored
+      date is downloaded; --offline analyzes stored history without network I/O
 
 Author: Claude Code
 Version: 1.0.0
@@ -23,14 +30,18 @@ Date: 2025-10-22
 """
 
 import argparse
+import asyncio
+import functools
+import inspect
 import json
+import random
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
-    from openbb import obb
     import pandas as pd
     import numpy as np
 except ImportError as e:
@@ -38,6 +49,31 @@ except ImportError as e:
     print("Install with: pip install openbb openbb-tmx pandas numpy")
     sys.exit(1)
 
+from market_price_store import PriceStore, lookback_window, normalize_price_frame
+
+# OpenBB is only needed to download prices; the analysis methods work on any
+# OHLCV DataFrame (e.g. from a stub provider or a local price store)
+try:
+    from openbb import obb
+except ImportError:
+    obb = None
+
+OPENBB_INSTALL_HINT = "Install with: pip install openbb openbb-tmx pandas numpy"
+
+
+def _fetch_openbb_history(symbol: str, provider: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Default price fetcher: blocking OpenBB equity.price.historical call."""
+    if obb is None:
+        raise ImportError(f"openbb is not installed. {OPENBB_INSTALL_HINT}")
+
+    result = obb.equity.price.historical(
+        symbol=symbol,
+        provider=provider,
+        start_date=start_date,
+        end_date=end_date
+    )
+    return result.to_df()
+
 
 class MarketDataMonitor:
     """
@@ -45,16 +81,24 @@ class MarketDataMonitor:
     volatility, and momentum shifts that may indicate credit risk.
     """
 
-    def __init__(self, ticker: str, provider: str = "tmx"):
+    def __init__(
+        self,
+        ticker: str,
+        provider: str = "tmx",
+        price_store: Optional[PriceStore] = None
+    ):
         """
         Initialize market monitor for a specific REIT.
 
         Args:
             ticker: REIT ticker symbol (e.g., 'REI-UN.TO', 'AX-UN.TO')
             provider: Data provider ('tmx' or 'yfinance')
+            price_store: Local price store; when set, only dates missing from the
+                store are downloaded and the analysis runs on stored history
         """
         self.ticker = ticker
         self.provider = provider
+        self.price_store = price_store
         self.reit_name = self._extract_reit_name(ticker)
 
     @staticmethod
@@ -76,33 +120,31 @@ class MarketDataMonitor:
         Returns:
             DataFrame with OHLCV data
         """
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
-        end_date = datetime.now().strftime('%Y-%m-%d')
+        start_date, end_date = lookback_window(lookback_days)
 
         try:
-            result = obb.equity.price.historical(
-                symbol=self.ticker,
-                provider=self.provider,
-                start_date=start_date,
-                end_date=end_date
-            )
-            df = result.to_df()
+            if self.price_store is not None:
+                df = self.price_store.get_history(
+                    self.ticker, self.provider, start_date, end_date,
+                    fetcher=_fetch_openbb_history
+                )
+            else:
+                df = _fetch_openbb_history(self.ticker, self.provider, start_date, end_date)
 
             if df.empty:
                 print(f"WARNING: No price data retrieved for {self.ticker}")
                 return pd.DataFrame()
 
-            # Ensure date column
-            if 'date' not in df.columns and df.index.name == 'date':
-                df = df.reset_index()
-
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date', ascending=True)
-
-            return df
+            return normalize_price_frame(df)
 
         except Exception as e:
             print(f"ERROR retrieving price history for {self.ticker}: {e}")
+            if self.price_store is not None:
+                stored = self.price_store.load(self.ticker, self.provider, start_date, end_date)
+                if not stored.empty:
+                    print(f"WARNING: Using stored price history for {self.ticker} "
+                          f"(through {stored['date'].max():%Y-%m-%d})")
+                    return stored
             return pd.DataFrame()
 
     def detect_price_stress(
@@ -406,13 +448,16 @@ class MarketDataMonitor:
 
     def generate_market_assessment(
         self,
-        lookback_days: int = 365
+        lookback_days: int = 365,
+        price_df: Optional[pd.DataFrame] = None
     ) -> Dict:
         """
         Generate comprehensive market data assessment.
 
         Args:
             lookback_days: Lookback period in days
+            price_df: Pre-fetched OHLCV DataFrame (e.g. from
+                AsyncMarketDataCollector); fetched with get_price_history() if None
 
         Returns:
             Complete market assessment dict
@@ -420,7 +465,8 @@ class MarketDataMonitor:
         print(f"Analyzing market data for {self.ticker}...")
 
         # Get price history
-        price_df = self.get_price_history(lookback_days)
+        if price_df is None:
+            price_df = self.get_price_history(lookback_days)
         if price_df.empty:
             return {'error': 'No price data available'}
 
@@ -607,16 +653,320 @@ class MarketDataMonitor:
         print(f"✓ Exported market assessment to {output_path}")
 
 
+# Requests per second per provider. TMX throttles aggressively; yfinance
+# tolerates bursts. Unknown providers are not throttled.
+DEFAULT_RATE_LIMITS = {
+    'tmx': 4.0,
+    'yfinance': 8.0,
+}
+
+
+class _RateLimiter:
+    """Spaces request start times at least 1/rate seconds apart."""
+
+    def __init__(self, rate_per_second: Optional[float]):
+        self.interval = 1.0 / rate_per_second if rate_per_second else 0.0
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncMarketDataCollector:
+    """
+    Concurrent price history collection for many tickers.
+
+    Each ticker is one fetch (the same OpenBB call as
+    MarketDataMonitor.get_price_history). Fetches run concurrently, bounded by
+    a semaphore, throttled per provider and retried with exponential backoff.
+    Blocking fetchers run in worker threads; async fetchers are awaited directly.
+
+    Example:
+        collector = AsyncMarketDataCollector(provider='tmx', max_concurrency=8)
+        prices = collector.collect_sync(['REI-UN.TO', 'AX-UN.TO'])
+        assessments = collect_market_assessments(prices.keys(), prices=prices)
+    """
+
+    def __init__(
+        self,
+        provider: str = "tmx",
+        fetcher: Optional[Callable] = None,
+        max_concurrency: int = 8,
+        rate_limits: Optional[Dict[str, float]] = None,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        price_store: Optional[PriceStore] = None
+    ):
+        """
+        Initialize collector.
+
+        Args:
+            provider: Data provider ('tmx' or 'yfinance')
+            fetcher: Callable (symbol, provider, start_date, end_date) -> DataFrame,
+                sync or async (default: OpenBB equity.price.historical)
+            max_concurrency: Maximum fetches in flight
+            rate_limits: Requests per second by provider (default: DEFAULT_RATE_LIMITS)
+            max_retries: Retries per ticker after the first failed attempt
+            backoff_seconds: Base delay; attempt n waits backoff_seconds * 2**n (+ jitter)
+            price_store: Local price store; only ranges missing from the store are
+                fetched and results are served from stored history
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        self.provider = provider
+        self.fetcher = fetcher or _fetch_openbb_history
+        self.max_concurrency = max_concurrency
+        self.rate_limits = DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.price_store = price_store
+        self.errors: Dict[str, str] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def _call_fetcher(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        if inspect.iscoroutinefunction(self.fetcher):
+            return await self.fetcher(ticker, self.provider, start_date, end_date)
+        call = functools.partial(self.fetcher, ticker, self.provider, start_date, end_date)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def _fetch_range(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        semaphore: asyncio.Semaphore,
+        limiter: _RateLimiter
+    ) -> pd.DataFrame:
+        """One provider request with retry; raises the last error when retries run out."""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                delay = self.backoff_seconds * (2 ** (attempt - 1))
+                await asyncio.sleep(delay + random.uniform(0, delay / 2))
+
+            async with semaphore:
+                await limiter.wait()
+                try:
+                    return normalize_price_frame(
+                        await self._call_fetcher(ticker, start_date, end_date)
+                    )
+                except ImportError:
+                    # Missing openbb will not fix itself on retry
+                    raise
+                except Exception:
+                    if attempt == self.max_retries:
+                        raise
+
+    async def _fetch_one(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        semaphore: asyncio.Semaphore,
+        limiter: _RateLimiter
+    ) -> pd.DataFrame:
+        store = self.price_store
+        try:
+            if store is None:
+                df = await self._fetch_range(ticker, start_date, end_date, semaphore, limiter)
+            else:
+                if not store.offline:
+                    for range_start, range_end in store.missing_ranges(
+                            ticker, self.provider, start_date, end_date):
+                        fetched = await self._fetch_range(
+                            ticker, range_start, range_end, semaphore, limiter
+                        )
+                        store.merge(ticker, self.provider, fetched, range_start, range_end)
+                df = store.load(ticker, self.provider, start_date, end_date)
+        except Exception as e:
+            self.errors[ticker] = f"{type(e).__name__}: {e}"
+            if store is None:
+                return pd.DataFrame()
+            # Serve whatever history is already stored
+            df = store.load(ticker, self.provider, start_date, end_date)
+
+        if df.empty:
+            self.errors.setdefault(ticker, "No price data retrieved")
+        return df
+
+    async def collect(
+        self,
+        tickers: Iterable[str],
+        lookback_days: int = 365
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch price history for all tickers concurrently.
+
+        Args:
+            tickers: Ticker symbols (duplicates are fetched once)
+            lookback_days: Lookback period in days
+
+        Returns:
+            Dict of ticker -> OHLCV DataFrame, in input order. Failed tickers map to
+            an empty DataFrame; the reason is recorded in self.errors.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        start_date, end_date = lookback_window(lookback_days)
+
+        self.errors = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limiter = _RateLimiter(self.rate_limits.get(self.provider))
+
+        # Own pool sized to the concurrency bound (the loop's default pool is
+        # capped by CPU count, which would silently lower concurrency)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                thread_name_prefix='market-data') as executor:
+            self._executor = executor
+            try:
+                frames = await asyncio.gather(*(
+                    self._fetch_one(ticker, start_date, end_date, semaphore, limiter)
+                    for ticker in tickers
+                ))
+            finally:
+                self._executor = None
+        return dict(zip(tickers, frames))
+
+    def collect_sync(
+        self,
+        tickers: Iterable[str],
+        lookback_days: int = 365
+    ) -> Dict[str, pd.DataFrame]:
+        """Blocking wrapper around collect() for scripts without an event loop."""
+        return asyncio.run(self.collect(tickers, lookback_days))
+
+
+def load_ticker_universe(config_path: Path) -> Dict[str, str]:
+    """
+    Load REIT name -> ticker mapping (e.g. config/canadian_reits.yaml).
+
+    Args:
+        config_path: YAML file with a top-level 'reits' mapping
+
+    Returns:
+        Dict of REIT name -> ticker symbol
+    """
+    import yaml
+
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f) or {}
+    return dict(config.get('reits') or {})
+
+
+def collect_market_assessments(
+    tickers: Iterable[str],
+    lookback_days: int = 365,
+    provider: str = "tmx",
+    collector: Optional[AsyncMarketDataCollector] = None,
+    prices: Optional[Dict[str, pd.DataFrame]] = None
+) -> Dict[str, Dict]:
+    """
+    Market assessments for many tickers with concurrent price collection.
+
+    Args:
+        tickers: Ticker symbols
+        lookback_days: Lookback period in days
+        provider: Data provider ('tmx' or 'yfinance')
+        collector: Configured collector (default: AsyncMarketDataCollector(provider))
+        prices: Already-collected price histories; tickers missing here are fetched
+
+    Returns:
+        Dict of ticker -> assessment from MarketDataMonitor.generate_market_assessment()
+        (an {'error': ...} dict for tickers without data)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    prices = dict(prices or {})
+    collector = collector or AsyncMarketDataCollector(provider=provider)
+
+    missing = [ticker for ticker in tickers if ticker not in prices]
+    if missing:
+        prices.update(collector.collect_sync(missing, lookback_days))
+
+    assessments = {}
+    for ticker in tickers:
+        monitor = MarketDataMonitor(ticker, collector.provider, collector.price_store)
+        assessment = monitor.generate_market_assessment(lookback_days, price_df=prices[ticker])
+        if 'error' in assessment and ticker in collector.errors:
+            assessment['error'] = f"{assessment['error']} ({collector.errors[ticker]})"
+        assessments[ticker] = assessment
+    return assessments
+
+
+def _default_output_path(ticker: str) -> Path:
+    ticker_clean = ticker.replace('.TO', '').replace('-UN', '').replace('-', '')
+    return Path(f'data/{ticker_clean.lower()}_market.json')
+
+
+def _run_universe(args, tickers: List[str], price_store: Optional[PriceStore]) -> None:
+    """Collect and export assessments for many tickers (--universe / --tickers)."""
+    import time
+
+    collector = AsyncMarketDataCollector(
+        provider=args.provider,
+        max_concurrency=args.concurrency,
+        price_store=price_store
+    )
+
+    started = time.perf_counter()
+    assessments = collect_market_assessments(
+        tickers, args.lookback, args.provider, collector=collector
+    )
+    elapsed = time.perf_counter() - started
+
+    output_dir = args.output_dir
+    failed = 0
+    print(f"\n{'='*60}")
+    print(f"MARKET ASSESSMENTS: {len(tickers)} tickers in {elapsed:.1f}s")
+    print(f"{'='*60}")
+    for ticker, assessment in assessments.items():
+        if 'error' in assessment:
+            failed += 1
+            print(f"  {ticker:<12} ERROR: {assessment['error']}")
+            continue
+
+        output_path = _default_output_path(ticker)
+        if output_dir:
+            output_path = output_dir / output_path.name
+        MarketDataMonitor(ticker, args.provider).export_assessment(output_path, assessment)
+
+        risk = assessment.get('risk_score', {})
+        print(f"  {ticker:<12} {risk.get('risk_level', 'N/A'):<10} "
+              f"score {risk.get('total_score', 0):>3}/100")
+
+    if failed == len(tickers):
+        sys.exit(1)
+
+
 def main():
     """Command-line interface for market data monitor."""
     parser = argparse.ArgumentParser(
         description="Monitor market data for Canadian REITs (price stress, volatility, momentum)"
     )
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
         '--ticker',
-        required=True,
         help='REIT ticker symbol (e.g., REI-UN.TO, AX-UN.TO)'
     )
+    target.add_argument(
+        '--tickers',
+        nargs='+',
+        help='Several ticker symbols, collected concurrently'
+    )
+    target.add_argument(
+        '--universe',
+        type=Path,
+        help='YAML ticker mapping to collect concurrently (e.g., config/canadian_reits.yaml)'
+    )
     parser.add_argument(
         '--output',
         type=Path,
@@ -634,16 +984,55 @@ def main():
         choices=['tmx', 'yfinance'],
         help='Data provider (default: tmx)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Maximum concurrent fetches with --tickers/--universe (default: 8)'
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=Path,
+        help='Output directory with --tickers/--universe (default: data/)'
+    )
+    parser.add_argument(
+        '--store',
+        nargs='?',
+        const=True,
+        type=Path,
+        metavar='DIR',
+        help='Keep price history in a local store and download only missing dates '
+             '(default DIR: .cache/price_store)'
+    )
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Analyze stored price history only (implies --store; no network I/O)'
+    )
 
     args = parser.parse_args()
 
+    price_store = None
+    if args.store or args.offline:
+        store_dir = args.store if isinstance(args.store, Path) else None
+        price_store = PriceStore(store_dir, offline=args.offline)
+
+    if obb is None and not args.offline:
+        print("ERROR: Missing required package: openbb")
+        print(OPENBB_INSTALL_HINT)
+        sys.exit(1)
+
+    if args.tickers or args.universe:
+        tickers = args.tickers or list(load_ticker_universe(args.universe).values())
+        _run_universe(args, tickers, price_store)
+        return
+
     # Initialize monitor
-    monitor = MarketDataMonitor(args.ticker, args.provider)
+    monitor = MarketDataMonitor(args.ticker, args.provider, price_store)
 
     # Set default output path
     if not args.output:
-        ticker_clean = args.ticker.replace('.TO', '').replace('-UN', '').replace('-', '')
-        args.output = Path(f'data/{ticker_clean.lower()}_market.json')
+        args.output = _default_output_path(args.ticker)
 
     # Generate assessment
     assessment = monitor.generate_market_assessment(args.lookback)
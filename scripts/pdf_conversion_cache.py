@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Phase 1 Conversion Cache
+
+Docling converts a filing in minutes, and an unchanged PDF converts to the
+same markdown every time. Re-running an issuer, changing Phase 2 settings or
+rebuilding the Phase 1B dataset should not convert it again.
+
+Entries are content-addressed. The key hashes:
+
+- the PDF bytes (SHA-256), so a renamed or moved file still hits,
+- the converter (name, version, TableFormer mode), and
+- the conversion options: OCR mode and the planned page ranges with their
+  OCR flags. The ranges already reflect page selection and per-page OCR
+  routing, so a different locator or classification misses as it should.
+
+Each entry is a directory holding the stitched markdown (document.md), the
+markdown of every converted page range (pages/0001-0008.md) and entry.json
+(key material plus the conversion stats). The cache directory is bounded by
+total size, and least-recently-used entries are evicted first. Recency is
+the entry.json mtime, which every hit refreshes.
+
+Usage:
+    python scripts/pdf_conversion_cache.py list
+    python scripts/pdf_conversion_cache.py stats
+    python scripts/pdf_conversion_cache.py prune --max-mb 200
+    python scripts/pdf_conversion_cache.py prune --older-than-days 90
+    python scripts/pdf_conversion_cache.py clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'phase1_markdown'
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB (~2,000 converted filings)
+
+# Bump when the entry layout or the stitched markdown format changes
+CACHE_FORMAT = 1
+
+ENTRY_FILE = 'entry.json'
+DOCUMENT_FILE = 'document.md'
+PAGES_DIR = 'pages'
+
+
+def file_digest(path: str, block_size: int = 1024 * 1024) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def conversion_key(pdf_sha256: str, converter: Dict, options: Dict) -> str:
+    """
+    Content-addressed key for one PDF conversion
+
+    Args:
+        pdf_sha256: file_digest() of the PDF
+        converter: Converter description (name, version, table mode)
+        options: Conversion options (OCR mode, planned page ranges)
+
+    Returns:
+        str: SHA-256 hex digest of the canonical key material
+    """
+    material = {'format': CACHE_FORMAT, 'pdf_sha256': pdf_sha256, 'converter': converter, 'options': options}
+    canonical = json.dumps(material, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _range_file(page_range: Tuple[int, int]) -> str:
+    return f'{page_range[0]:04d}-{page_range[1]:04d}.md'
+
+
+def _dir_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob('*') if p.is_file())
+
+
+class ConversionCache:
+    """Size-bounded LRU store of Phase 1 markdown keyed by conversion_key()"""
+
+    def __init__(self, cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory for cache entries (default: <repo>/.cache/phase1_markdown)
+            max_bytes: Total size bound for the cache directory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached conversion
+
+        Args:
+            key: Key from conversion_key()
+
+        Returns:
+            dict with markdown, chunks ({(first, last): markdown}) and the
+            stored entry metadata, or None on a miss (or incomplete entry)
+        """
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(entry_dir / ENTRY_FILE, 'r') as f:
+                entry = json.load(f)
+            markdown = (entry_dir / DOCUMENT_FILE).read_text(encoding='utf-8')
+            chunks = {tuple(page_range): (entry_dir / PAGES_DIR / _range_file(page_range)).read_text(encoding='utf-8')
+                      for page_range in entry['ranges']}
+        except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError, KeyError):
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(entry_dir / ENTRY_FILE)
+        except OSError:
+            pass
+        return dict(entry, markdown=markdown, chunks=chunks)
+
+    def put(self, key: str, markdown: str, chunks: Dict[Tuple[int, int], str], metadata: Dict) -> None:
+        """
+        Store a conversion and evict least-recently-used entries over the size bound
+
+        Args:
+            key: Key from conversion_key()
+            markdown: Stitched markdown for the whole PDF
+            chunks: Markdown per converted page range
+            metadata: JSON-serializable key material and stats kept in entry.json
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Build the entry in a temporary directory and rename it into place,
+        # so concurrent runs never read a partial entry
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix='.tmp-'))
+        try:
+            (tmp_dir / PAGES_DIR).mkdir()
+            for page_range, chunk in chunks.items():
+                (tmp_dir / PAGES_DIR / _range_file(page_range)).write_text(chunk, encoding='utf-8')
+            (tmp_dir / DOCUMENT_FILE).write_text(markdown, encoding='utf-8')
+            entry = dict(metadata, key=key, ranges=[list(r) for r in sorted(chunks)],
+                         created_at=datetime.now().isoformat(timespec='seconds'))
+            with open(tmp_dir / ENTRY_FILE, 'w') as f:
+                json.dump(entry, f, indent=2)
+
+            entry_dir = self._entry_dir(key)
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            try:
+                os.rename(tmp_dir, entry_dir)
+            except OSError:
+                # Another run stored the same content-addressed entry first
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        self.evict()
+
+    def entries(self) -> List[Dict]:
+        """
+        Describe every complete entry, least recently used first
+
+        Returns:
+            List of dicts with key, pdf, converter, options, size_bytes,
+            last_used (epoch seconds) and created_at
+        """
+        if not self.cache_dir.exists():
+            return []
+
+        entries = []
+        for entry_dir in self.cache_dir.iterdir():
+            if entry_dir.name.startswith('.') or not entry_dir.is_dir():
+                continue
+            try:
+                last_used = (entry_dir / ENTRY_FILE).stat().st_mtime
+                with open(entry_dir / ENTRY_FILE, 'r') as f:
+                    entry = json.load(f)
+                size = _dir_size(entry_dir)
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+            entries.append({
+                'key': entry_dir.name,
+                'pdf': entry.get('pdf'),
+                'converter': entry.get('converter'),
+                'options': entry.get('options'),
+                'size_bytes': size,
+                'last_used': last_used,
+                'created_at': entry.get('created_at'),
+            })
+        return sorted(entries, key=lambda e: e['last_used'])
+
+    def remove(self, key: str) -> None:
+        """Delete one entry."""
+        shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Delete least-recently-used entries until the cache fits in max_bytes
+
+        Args:
+            max_bytes: Size bound (default: self.max_bytes)
+
+        Returns:
+            int: Number of entries removed
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(e['size_bytes'] for e in entries)
+        removed = 0
+        for entry in entries:
+            if total <= max_bytes:
+                break
+            self.remove(entry['key'])
+            total -= entry['size_bytes']
+            removed += 1
+        return removed
+
+    def prune(self, max_bytes: Optional[int] = None, older_than_days: Optional[float] = None) -> int:
+        """
+        Remove entries unused for older_than_days, then evict down to max_bytes
+
+        Args:
+            max_bytes: Size bound (default: self.max_bytes)
+            older_than_days: Remove entries last used before this many days ago
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        if older_than_days is not None:
+            cutoff = time.time() - older_than_days * 86400
+            for entry in self.entries():
+                if entry['last_used'] < cutoff:
+                    self.remove(entry['key'])
+                    removed += 1
+        return removed + self.evict(max_bytes)
+
+    def stats(self) -> Dict:
+        """Entry count, total size and size bound."""
+        entries = self.entries()
+        return {
+            'cache_dir': str(self.cache_dir),
+            'entries': len(entries),
+            'size_bytes': sum(e['size_bytes'] for e in entries),
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """Remove all cache entries (and leftover temporary directories)."""
+        if self.cache_dir.exists():
+            for entry_dir in self.cache_dir.iterdir():
+                if entry_dir.is_dir():
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Inspect or prune the Phase 1 conversion cache."""
+    parser = argparse.ArgumentParser(description='Inspect or prune the Phase 1 PDF conversion cache')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Cache directory (default: .cache/phase1_markdown in the repo root)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help='List entries, most recently used last')
+    list_parser.add_argument('--json', action='store_true', help='Print entries as JSON')
+    subparsers.add_parser('stats', help='Entry count and total size')
+    prune_parser = subparsers.add_parser('prune', help='Evict least-recently-used entries')
+    prune_parser.add_argument('--max-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                              help=f'Size bound in MB (default: {DEFAULT_MAX_BYTES // 1024 // 1024})')
+    prune_parser.add_argument('--older-than-days', type=float, default=None,
+                              help='Also remove entries not used for this many days')
+    subparsers.add_parser('clear', help='Remove every entry')
+
+    args = parser.parse_args(argv)
+    cache = ConversionCache(args.cache_dir)
+
+    if args.command == 'list':
+        entries = cache.entries()
+        if args.json:
+            print(json.dumps(entries, indent=2))
+            return 0
+        for entry in entries:
+            last_used = datetime.fromtimestamp(entry['last_used']).isoformat(sep=' ', timespec='seconds')
+            converter = (entry['converter'] or {}).get('name', '?')
+            ocr = (entry['options'] or {}).get('ocr', '?')
+            print(f"{entry['key'][:12]}  {entry['size_bytes'] / 1024:8.1f} KB  {last_used}  "
+                  f"{converter}/ocr={ocr}  {entry['pdf']}")
+        print(f"{len(entries)} entr{'y' if len(entries) == 1 else 'ies'}")
+    elif args.command == 'stats':
+        stats = cache.stats()
+        print(f"Cache: {stats['cache_dir']}")
+        print(f"Entries: {stats['entries']}")
+        print(f"Size: {stats['size_bytes'] / 1024 / 1024:.1f} MB of {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+    elif args.command == 'prune':
+        removed = cache.prune(int(args.max_mb * 1024 * 1024), args.older_than_days)
+        print(f"Removed {removed} entr{'y' if removed == 1 else 'ies'}")
+    elif args.command == 'clear':
+        cache.clear()
+        print(f"Cleared {cache.cache_dir}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Financial-Statement Page Locator
+
+Phase 2 reads only the balance sheet, income statement, cash flow statement,
+FFO/AFFO/ACFO reconciliations, portfolio, dilution, liquidity and debt
+sections of a filing. This module finds the PDF pages that hold them so
+Phase 1 can convert those pages (plus their neighbours) instead of the
+whole 30-50 page statement PDF or 20-40 page MD&A.
+
+The scan reads the PDF text layer with pypdfium2 (no rendering, no OCR) and
+scores every page against the SECTION_MARKERS vocabulary of the Phase 2
+section indexer (scripts/archive/experimental/extraction_indexer.py), plus
+ACFO markers. Pages scoring at least --min-score, and pages carrying a
+primary statement title (balance sheet, income or cash flow statement), are
+selected together with --neighbours pages on either side (statements and
+notes often continue on the next page).
+
+Usage:
+    python scripts/pdf_page_locator.py statements.pdf mda.pdf
+    python scripts/pdf_page_locator.py statements.pdf --neighbours 2 --min-score 1 --json
+
+Image-only pages have no text layer and score 0; run Phase 1 with
+--full-document for scanned filings.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent / 'archive' / 'experimental'))
+from extraction_indexer import ExtractionIndexer
+
+
+# Phase 2 section vocabulary: the indexer's markers plus ACFO (REALPAC ACFO reconciliation)
+SECTION_MARKERS = {
+    **ExtractionIndexer.SECTION_MARKERS,
+    'acfo': [
+        'Adjusted Cash Flow from Operations',
+        r'\bACFO\b',
+    ],
+}
+
+# A title match on its own selects the page: a statement page may carry only its title
+STATEMENT_SECTIONS = ('balance_sheet', 'income_statement', 'cash_flow')
+
+DEFAULT_MIN_SCORE = 2
+DEFAULT_NEIGHBOURS = 1
+
+
+def compile_section_markers(markers: Dict[str, List[str]] = SECTION_MARKERS) -> Dict[str, List[re.Pattern]]:
+    """Compile marker regexes (case-insensitive, as the grep-based indexer matches)."""
+    return {section: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for section, patterns in markers.items()}
+
+
+COMPILED_SECTION_MARKERS = compile_section_markers()
+
+
+def score_page(text: str, compiled_markers: Dict[str, List[re.Pattern]] = COMPILED_SECTION_MARKERS) -> Dict[str, int]:
+    """
+    Count marker matches on one page.
+
+    Args:
+        text: Page text
+        compiled_markers: Output of compile_section_markers()
+
+    Returns:
+        dict of section -> match count (sections without matches omitted)
+    """
+    scores = {}
+    for section, patterns in compiled_markers.items():
+        hits = sum(len(pattern.findall(text)) for pattern in patterns)
+        if hits:
+            scores[section] = hits
+    return scores
+
+
+def locate_pages(
+    page_texts: List[str],
+    min_score: int = DEFAULT_MIN_SCORE,
+    neighbours: int = DEFAULT_NEIGHBOURS,
+    compiled_markers: Dict[str, List[re.Pattern]] = COMPILED_SECTION_MARKERS
+) -> Dict:
+    """
+    Select the pages Phase 2 needs from per-page text.
+
+    Args:
+        page_texts: Text of each page, in page order
+        min_score: Total marker matches for a page to be selected (any
+            STATEMENT_SECTIONS match selects the page regardless)
+        neighbours: Pages to add on each side of a selected page
+        compiled_markers: Output of compile_section_markers()
+
+    Returns:
+        dict with total_pages, pages (selected, 1-based, sorted), matched_pages
+        (pages selected before neighbours are added) and sections
+        (section -> matched pages)
+    """
+    page_count = len(page_texts)
+    matched = []
+    sections = {}
+    for page, text in enumerate(page_texts, 1):
+        scores = score_page(text, compiled_markers)
+        if sum(scores.values()) >= min_score or any(section in scores for section in STATEMENT_SECTIONS):
+            matched.append(page)
+            for section in scores:
+                sections.setdefault(section, []).append(page)
+
+    selected = set()
+    for page in matched:
+        selected.update(range(max(1, page - neighbours), min(page_count, page + neighbours) + 1))
+
+    return {
+        'total_pages': page_count,
+        'pages': sorted(selected),
+        'matched_pages': matched,
+        'sections': {section: sections[section] for section in compiled_markers if section in sections},
+    }
+
+
+def read_page_texts(pdf_path: str) -> List[str]:
+    """
+    Read each page's text layer with pypdfium2 (installed with docling).
+
+    Raises:
+        ImportError: If pypdfium2 is not installed
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError as e:
+        raise ImportError("pypdfium2 not installed. Run: pip install docling (or pip install pypdfium2)") from e
+
+    texts = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            try:
+                textpage = page.get_textpage()
+                texts.append(textpage.get_text_range())
+                textpage.close()
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return texts
+
+
+def locate_pdf_pages(pdf_path: str, min_score: int = DEFAULT_MIN_SCORE, neighbours: int = DEFAULT_NEIGHBOURS,
+                     text_reader=read_page_texts) -> Dict:
+    """
+    Locate the Phase 2 pages of a PDF (see locate_pages()).
+
+    Args:
+        pdf_path: Path to PDF file
+        min_score: Total marker matches for a page to be selected (any
+            STATEMENT_SECTIONS match selects the page regardless)
+        neighbours: Pages to add on each side of a selected page
+        text_reader: Callable returning per-page text (default: pypdfium2 text layer)
+
+    Returns:
+        locate_pages() result with the pdf path added
+    """
+    return dict(locate_pages(text_reader(pdf_path), min_score, neighbours), pdf=str(pdf_path))
+
+
+def format_page_list(pages: List[int]) -> str:
+    """Compact page list, e.g. [1, 2, 3, 7, 9, 10] -> '1-3, 7, 9-10'."""
+    spans = []
+    for page in pages:
+        if spans and page == spans[-1][1] + 1:
+            spans[-1][1] = page
+        else:
+            spans.append([page, page])
+    return ', '.join(f"{a}-{b}" if a != b else f"{a}" for a, b in spans)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print the pages Phase 1 would convert for each PDF."""
+    parser = argparse.ArgumentParser(description='Locate financial-statement pages in filing PDFs')
+    parser.add_argument('pdf_files', nargs='+', help='PDF files to scan')
+    parser.add_argument('--min-score', type=int, default=DEFAULT_MIN_SCORE,
+                        help=f'Marker matches for a page to be selected (default: {DEFAULT_MIN_SCORE})')
+    parser.add_argument('--neighbours', type=int, default=DEFAULT_NEIGHBOURS,
+                        help=f'Pages kept on each side of a match (default: {DEFAULT_NEIGHBOURS})')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args(argv)
+
+    results = [locate_pdf_pages(pdf, args.min_score, args.neighbours) for pdf in args.pdf_files]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    for result in results:
+        print(f"\n📄 {result['pdf']}: {len(result['pages'])}/{result['total_pages']} pages "
+              f"({format_page_list(result['pages']) or 'none'})")
+        for section, pages in result['sections'].items():
+            print(f"   {section:18s} {format_page_list(pages)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
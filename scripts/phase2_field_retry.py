@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Phase 2 Field-Level Retry
+
+When an extraction fails validation, the retry prompt used to ask for the
+whole extraction again, with every markdown file attached: the same
+latency and tokens as the first attempt, to fix two or three fields.
+
+A targeted retry instead:
+
+1. turns the validate_schema() errors into the exact failing JSON paths
+   (validate_extraction_schema.error_paths()),
+2. locates the markdown sections those fields live in with the section
+   index (archive/experimental/extraction_indexer.py), plus the candidate
+   table rows the Phase 2 table pre-extraction finds for them, and
+3. asks for those fields only, written as a small JSON patch
+   (phase2_retry_patch.json, {"dotted.path": value}) that the next run of
+   extract_key_metrics_efficient.py merges into phase2_extracted_data.json
+   before validating again.
+
+Usage:
+    python scripts/phase2_field_retry.py --output Issuer_Reports/X/temp/phase2_extracted_data.json FS.md MDA.md
+    python scripts/phase2_field_retry.py --output Issuer_Reports/X/temp/phase2_extracted_data.json --merge
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / 'archive' / 'experimental'))
+from extraction_indexer import ExtractionIndexer
+
+RETRY_PATCH_FILENAME = 'phase2_retry_patch.json'
+
+# Schema section -> section index entries that hold its source data, most likely first
+SCHEMA_SECTIONS = {
+    'balance_sheet': ['balance_sheet'],
+    'income_statement': ['income_statement'],
+    'ffo_affo': ['ffo_affo'],
+    'ffo_affo_components': ['ffo_affo', 'income_statement'],
+    'acfo_components': ['cash_flow', 'ffo_affo'],
+    'cash_flow_investing': ['cash_flow'],
+    'cash_flow_financing': ['cash_flow'],
+    'liquidity': ['liquidity', 'balance_sheet'],
+    'portfolio': ['portfolio'],
+    'dilution_detail': ['dilution'],
+    'debt': ['debt_schedule', 'balance_sheet'],
+}
+
+# Top-level fields (issuer_name, reporting_date, currency) come from the document header
+HEADER_LINES = 40
+
+# Characters per line and per token, as the section index estimates tokens
+_CHARS_PER_LINE = 100
+_CHARS_PER_TOKEN = 2.5
+
+
+def retry_patch_path(output_path) -> Path:
+    """phase2_extracted_data.json -> phase2_retry_patch.json (same directory)."""
+    return Path(output_path).parent / RETRY_PATCH_FILENAME
+
+
+def locate_fields(markdown_files, paths: List[str],
+                  indexer: Optional[ExtractionIndexer] = None) -> Tuple[List[Dict], List[str]]:
+    """
+    Markdown line ranges that hold the source data of failing fields
+
+    Args:
+        markdown_files: Phase 1 markdown files
+        paths: Failing dotted paths (from error_paths())
+        indexer: ExtractionIndexer over markdown_files (default: a new one)
+
+    Returns:
+        Tuple of (ranges, unlocated): ranges are dicts with file, start_line,
+        end_line, sections and fields, merged per file where they overlap;
+        unlocated lists the paths whose sections are not in the index
+    """
+    markdown_files = [Path(f) for f in markdown_files]
+    indexer = indexer or ExtractionIndexer(markdown_files)
+
+    spans = {}      # (file, start_line, end_line) -> (sections, fields)
+    unlocated = []
+    for path in paths:
+        if '.' not in path:
+            spans_found = [(markdown_files[0], 1, HEADER_LINES, 'header')] if markdown_files else []
+        else:
+            locations = [indexer.locate(name) for name in SCHEMA_SECTIONS.get(path.split('.')[0], [])]
+            spans_found = [(loc.file, loc.start_line, loc.end_line, loc.section_name)
+                           for loc in locations if loc is not None]
+        if not spans_found:
+            unlocated.append(path)
+        for md_file, start, end, section in spans_found:
+            sections, fields = spans.setdefault((md_file, start, end), ([], []))
+            if section not in sections:
+                sections.append(section)
+            fields.append(path)
+
+    # Clip to the file and merge overlapping ranges of the same file
+    order = {md_file: index for index, md_file in enumerate(markdown_files)}
+    ranges = []
+    for (md_file, start, end), (sections, fields) in sorted(spans.items(),
+                                                            key=lambda item: (order[item[0][0]], item[0][1])):
+        end = min(end, indexer.scan_file(md_file)['lines'])
+        previous = ranges[-1] if ranges else None
+        if previous and previous['file'] == str(md_file) and start <= previous['end_line'] + 1:
+            previous['end_line'] = max(previous['end_line'], end)
+            previous['sections'] += [s for s in sections if s not in previous['sections']]
+            previous['fields'] += [f for f in fields if f not in previous['fields']]
+        else:
+            ranges.append({'file': str(md_file), 'start_line': start, 'end_line': end,
+                           'sections': list(sections), 'fields': list(dict.fromkeys(fields))})
+    return ranges, unlocated
+
+
+def estimate_tokens(ranges: List[Dict]) -> int:
+    """Rough token count of reading the given line ranges."""
+    lines = sum(r['end_line'] - r['start_line'] + 1 for r in ranges)
+    return int(lines * _CHARS_PER_LINE / _CHARS_PER_TOKEN)
+
+
+def field_hints(markdown_files, paths: List[str]) -> Dict[str, Dict]:
+    """
+    Candidate table rows for failing fields, from the table pre-extraction rules
+
+    Candidates are returned whatever their confidence: the retry prompt
+    shows them as pointers to check, not as answers.
+
+    Args:
+        markdown_files: Phase 1 markdown files
+        paths: Failing dotted paths
+
+    Returns:
+        dict: {path: extract_field() result} for paths a rule covers and finds
+    """
+    from markdown_table_store import load_table_store
+    from phase2_table_prefill import FIELD_RULES, extract_field
+
+    rules = [rule for rule in FIELD_RULES if rule.path in paths]
+    if not rules:
+        return {}
+    store = load_table_store(markdown_files)
+    hints = {}
+    for rule in rules:
+        result = extract_field(store, rule)
+        if result is not None:
+            hints[rule.path] = result
+    return hints
+
+
+def merge_patch(data: Dict, patch: Dict) -> List[str]:
+    """
+    Set dotted-path values from a retry patch (in place)
+
+    Missing or non-object parents are replaced by objects, which also
+    repairs "is not a dictionary" errors.
+
+    Args:
+        data: Extraction JSON
+        patch: {"dotted.path": value}
+
+    Returns:
+        list: Paths that were set
+    """
+    applied = []
+    for path, value in patch.items():
+        *parents, name = path.split('.')
+        target = data
+        for key in parents:
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            target = target[key]
+        target[name] = value
+        applied.append(path)
+    return applied
+
+
+def _write_json_atomic(path: Path, payload: Dict) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def apply_retry_patch(output_path, patch_path=None) -> Optional[List[str]]:
+    """
+    Merge a pending retry patch into the extraction and remove the patch
+
+    Args:
+        output_path: phase2_extracted_data.json
+        patch_path: Patch file (default: retry_patch_path(output_path))
+
+    Returns:
+        list of merged paths, or None if there is no patch (or no
+        extraction to merge it into)
+
+    Raises:
+        ValueError: If the patch is not a JSON object of dotted paths
+    """
+    output_path = Path(output_path)
+    patch_path = Path(patch_path) if patch_path else retry_patch_path(output_path)
+    if not patch_path.exists() or not output_path.exists():
+        return None
+
+    with open(patch_path, 'r') as f:
+        try:
+            patch = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{patch_path}: invalid JSON: {e}")
+    if not isinstance(patch, dict):
+        raise ValueError(f"{patch_path}: expected an object of dotted paths, got {type(patch).__name__}")
+
+    with open(output_path, 'r') as f:
+        data = json.load(f)
+    applied = merge_patch(data, patch)
+    _write_json_atomic(output_path, data)
+    patch_path.unlink()
+    return applied
+
+
+def plan_field_retry(markdown_files, errors: List[str]) -> Optional[Dict]:
+    """
+    Work out a targeted retry for a failed extraction
+
+    Args:
+        markdown_files: Phase 1 markdown files
+        errors: validate_schema() errors of the failed extraction
+
+    Returns:
+        dict with paths, ranges, hints and estimated_tokens, or None when
+        the errors cannot be fixed field by field (an error names no field,
+        or a field's source section is not in the index)
+    """
+    from validate_extraction_schema import error_paths
+
+    paths, unmapped = error_paths(errors)
+    if unmapped or not paths:
+        return None
+    ranges, unlocated = locate_fields(markdown_files, paths)
+    if unlocated:
+        return None
+    return {
+        'paths': paths,
+        'ranges': ranges,
+        'hints': field_hints(markdown_files, paths),
+        'estimated_tokens': estimate_tokens(ranges),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Show the targeted retry plan for a failed extraction, or merge a pending patch."""
+    parser = argparse.ArgumentParser(description='Plan or merge a Phase 2 field-level retry')
+    parser.add_argument('markdown_files', nargs='*', help='Phase 1 markdown files')
+    parser.add_argument('--output', required=True, help='phase2_extracted_data.json')
+    parser.add_argument('--merge', action='store_true', help=f'Merge a pending {RETRY_PATCH_FILENAME} and exit')
+    args = parser.parse_args(argv)
+
+    if args.merge:
+        applied = apply_retry_patch(args.output)
+        if applied is None:
+            print(f"No pending retry patch for {args.output}")
+            return 1
+        print(f"🩹 Merged {len(applied)} field(s) into {args.output}: {', '.join(applied)}")
+        return 0
+
+    from validate_extraction_schema import validate_schema
+
+    with open(args.output, 'r') as f:
+        is_valid, errors = validate_schema(json.load(f))
+    if is_valid:
+        print(f"✅ {args.output} is valid - nothing to retry")
+        return 0
+
+    plan = plan_field_retry(args.markdown_files, errors)
+    if plan is None:
+        print("⚠️  Errors cannot be fixed field by field - a full re-extraction is needed")
+        return 1
+    print(f"🎯 {len(plan['paths'])} failing field(s): {', '.join(plan['paths'])}")
+    for r in plan['ranges']:
+        print(f"   {r['file']} lines {r['start_line']}-{r['end_line']} ({', '.join(r['sections'])})")
+    for path, hint in plan['hints'].items():
+        print(f"   💡 {path}: {hint['value']} at {hint['source']}:{hint['line']} \"{hint['label']}\"")
+    print(f"   ~{plan['estimated_tokens']:,} tokens of source")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
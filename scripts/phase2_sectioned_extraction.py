@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Phase 2 Sectioned Extraction (concurrent section jobs)
+
+The single Phase 2 extraction covers balance sheet, income statement,
+FFO/AFFO and their components, ACFO components, investing and financing
+cash flows, liquidity, portfolio and dilution in one pass: its latency is
+the sum of all of them, and one bad section means redoing everything.
+
+This module splits the extraction into independent section jobs. Each job
+gets its own fragment of phase2_extraction_schema_v2.json (its top-level
+properties), its template, the markdown line ranges of its sections (from
+the section index) and any values the table pre-extraction already found.
+Jobs run concurrently on a backend:
+
+- stub: local and deterministic, no network. Returns the job's template
+  with the table pre-extraction values (for tests and dry runs only).
+- command: runs a command per job (e.g. "claude -p --output-format json"),
+  the prompt on stdin and the section JSON on stdout.
+
+There is no default backend: --backend must be given.
+
+Each finished section is saved to phase2_sections/<job>.json next to the
+output, with a key over the markdown contents, the section prompt, its
+schema fragment and the backend/model. A re-run reuses a saved section only
+when its key matches (--force runs every section again), so only failed,
+missing or outdated sections run. When every section is in, the sections
+are merged into phase2_extracted_data.json and validated against the full
+schema.
+
+Usage:
+    python scripts/phase2_sectioned_extraction.py --issuer-name "Artis REIT" --backend stub FS.md MDA.md
+    python scripts/phase2_sectioned_extraction.py --issuer-name "Artis REIT" --workers 6 \\
+        --backend command --backend-command "claude -p --output-format json" FS.md MDA.md
+"""
+
+import argparse
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from extract_key_metrics_efficient import template_from_schema
+from llm_response_cache import prompt_digest, response_key, text_digest
+from pdf_conversion_cache import file_digest
+from phase2_field_retry import locate_fields
+from phase2_table_prefill import apply_prefill, prefill_fields
+from validate_extraction_schema import validate_schema
+
+DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent / '.claude' / 'knowledge' / 'phase2_extraction_schema_v2.json'
+SECTIONS_DIRNAME = 'phase2_sections'
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 900
+SECTION_KEY_FORMAT = 1
+
+# Section jobs and the top-level schema properties each one extracts.
+# Scalar properties no job claims go to the header job; object properties
+# no job claims get a job of their own.
+SECTION_JOBS = {
+    'balance_sheet': ['balance_sheet'],
+    'income_statement': ['income_statement'],
+    'ffo_affo': ['ffo_affo', 'ffo_affo_components'],
+    'acfo': ['acfo_components'],
+    'cash_flow': ['cash_flow_investing', 'cash_flow_financing'],
+    'liquidity': ['liquidity'],
+    'portfolio': ['portfolio'],
+    'dilution': ['dilution_detail'],
+}
+HEADER_JOB = 'header'
+
+
+@dataclass
+class SectionJob:
+    """One independent extraction job"""
+    name: str
+    properties: List[str]       # Top-level schema properties it returns
+    schema: Dict                # Schema fragment (those properties only)
+    template: Dict = field(default_factory=dict)
+    prompt: str = ''
+    key: str = ''               # section_key(): a saved section is reused only under the same key
+
+
+def plan_section_jobs(schema: Dict, sections: Optional[List[str]] = None) -> List[SectionJob]:
+    """
+    Split the full schema into section jobs
+
+    Args:
+        schema: Phase 2 extraction schema
+        sections: Only these job names (default: all)
+
+    Returns:
+        List of SectionJob (header first, then SECTION_JOBS order)
+    """
+    properties = schema['properties']
+    required = set(schema.get('required', []))
+    claimed = {prop for props in SECTION_JOBS.values() for prop in props}
+
+    groups = {HEADER_JOB: [p for p, spec in properties.items()
+                           if p not in claimed and spec.get('type') != 'object']}
+    for name, props in SECTION_JOBS.items():
+        groups[name] = [p for p in props if p in properties]
+    for prop, spec in properties.items():
+        if prop not in claimed and spec.get('type') == 'object':
+            groups[prop] = [prop]
+
+    jobs = []
+    for name, props in groups.items():
+        if not props or (sections and name not in sections):
+            continue
+        fragment = {
+            'type': 'object',
+            'properties': {p: properties[p] for p in props},
+            'required': [p for p in props if p in required],
+        }
+        jobs.append(SectionJob(name=name, properties=props, schema=fragment, template=template_from_schema(fragment)))
+    return jobs
+
+
+def create_section_prompt(job: SectionJob, markdown_files: List[str], issuer_name: str,
+                          prefill: Optional[Dict] = None) -> str:
+    """
+    Prompt for one section job
+
+    Args:
+        job: SectionJob
+        markdown_files: Phase 1 markdown files
+        issuer_name: Name of issuer
+        prefill: Optional phase2_table_prefill.prefill_fields() result
+
+    Returns:
+        str: Prompt asking for the job's properties only, as one JSON object
+    """
+    ranges, unlocated = locate_fields(markdown_files, [f'{p}.*' if job.name != HEADER_JOB else p
+                                                       for p in job.properties])
+    where = [f"- `{r['file']}` lines {r['start_line']}-{r['end_line']} ({', '.join(r['sections'])})"
+             for r in ranges]
+    if unlocated or not where:
+        where += [f"- `{f}` (search the whole file)" for f in markdown_files]
+
+    prefilled = {}
+    if prefill:
+        prefilled = {path: f for path, f in prefill['fields'].items() if path.split('.')[0] in job.properties}
+    template = job.template
+    if prefilled:
+        template = apply_prefill(template, {'fields': prefilled})
+    prefill_note = ''
+    if prefilled:
+        prefill_note = ("\n**Already filled from the statement tables (keep unless clearly wrong):** "
+                        + ", ".join(f"`{path}` (line {f['line']} of {f['source']})" for path, f in prefilled.items())
+                        + "\n")
+
+    return f"""# Phase 2 Section Extraction: {job.name} - {issuer_name}
+
+Extract ONLY these top-level fields: {', '.join(f'`{p}`' for p in job.properties)}
+
+**Where to look** (Read tool with offset/limit):
+{chr(10).join(where)}
+{prefill_note}
+**Template** (fill in values, keep names and structure):
+
+```json
+{json.dumps(template, indent=2)}
+```
+
+**Schema fragment:**
+
+```json
+{json.dumps(job.schema, indent=2)}
+```
+
+**Rules:** numbers without commas or $ signs, amounts in thousands as shown, rates as decimals (0.878 not 87.8),
+most recent period, 0 for values not disclosed (NOT null).
+
+**Output:** reply with the JSON object only - its keys are exactly {', '.join(f'`{p}`' for p in job.properties)}.
+"""
+
+
+class StubBackend:
+    """Local backend: the job template plus table pre-extraction values (no network)"""
+
+    backend_id = 'stub'
+
+    def __init__(self, prefill: Optional[Dict] = None, issuer_name: Optional[str] = None):
+        self.prefill = prefill
+        self.issuer_name = issuer_name
+
+    def __call__(self, job: SectionJob) -> Dict:
+        data = json.loads(json.dumps(job.template))
+        if self.prefill:
+            fields = {path: f for path, f in self.prefill['fields'].items() if path.split('.')[0] in job.properties}
+            data = apply_prefill(data, {'fields': fields})
+        if self.issuer_name and 'issuer_name' in job.properties:
+            data['issuer_name'] = self.issuer_name
+        return data
+
+
+def parse_section_output(text: str) -> Dict:
+    """
+    Section JSON from a backend's output
+
+    Accepts a bare JSON object, one wrapped in ```json fences or surrounding
+    prose, and the {"result": "..."} envelope of `claude -p --output-format json`.
+
+    Raises:
+        ValueError: If no JSON object can be parsed
+    """
+    start, end = text.find('{'), text.rfind('}')
+    if start == -1 or end < start:
+        raise ValueError("no JSON object in backend output")
+    try:
+        data = json.loads(text[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON in backend output: {e}")
+    if isinstance(data.get('result'), str) and '{' in data['result']:
+        return parse_section_output(data['result'])
+    return data
+
+
+class CommandBackend:
+    """Runs a command per job: prompt on stdin, section JSON on stdout"""
+
+    def __init__(self, command: str, timeout: float = DEFAULT_TIMEOUT, model_id: Optional[str] = None):
+        self.command = shlex.split(command)
+        self.timeout = timeout
+        self.backend_id = f"command:{shlex.join(self.command)}" + (f" model:{model_id}" if model_id else '')
+
+    def __call__(self, job: SectionJob) -> Dict:
+        completed = subprocess.run(self.command, input=job.prompt, capture_output=True, text=True,
+                                   timeout=self.timeout)
+        if completed.returncode != 0:
+            raise RuntimeError(f"backend exited with {completed.returncode}: {completed.stderr.strip()[:500]}")
+        return parse_section_output(completed.stdout)
+
+
+def backend_id(backend: Callable[[SectionJob], Dict]) -> str:
+    """Backend identity for section keys (its backend_id, else its name)."""
+    return getattr(backend, 'backend_id', None) or getattr(backend, '__qualname__', type(backend).__name__)
+
+
+def section_key(job: SectionJob, markdown_files: List[str], output_path, backend: str,
+                input_digests: Optional[List[str]] = None) -> str:
+    """
+    Reuse key of one section job
+
+    Args:
+        job: SectionJob with its prompt built
+        markdown_files: Phase 1 markdown files the prompt reads
+        output_path: Extraction output path (normalised out of the prompt like the input paths)
+        backend: backend_id() of the backend that answers the job
+        input_digests: file_digest() of each markdown file (computed if omitted)
+
+    Returns:
+        str: SHA-256 hex digest over input contents, prompt, schema fragment and backend
+    """
+    if input_digests is None:
+        input_digests = [file_digest(str(path)) for path in markdown_files]
+    return response_key({
+        'format': SECTION_KEY_FORMAT,
+        'section': job.name,
+        'inputs': input_digests,
+        'prompt': prompt_digest(job.prompt, markdown_files, output_path),
+        'schema': text_digest(json.dumps(job.schema, sort_keys=True)),
+        'backend': backend,
+    })
+
+
+def _write_json_atomic(path: Path, payload: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _load_saved_section(path: Path, job: SectionJob) -> Optional[Dict]:
+    """Saved section data, if it was saved under the job's key."""
+    try:
+        with open(path, 'r') as f:
+            saved = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not job.key or not isinstance(saved, dict) or saved.get('key') != job.key:
+        return None
+    data = saved.get('data')
+    return data if isinstance(data, dict) and all(p in data for p in job.properties) else None
+
+
+def run_section_jobs(jobs: List[SectionJob], backend: Callable[[SectionJob], Dict], sections_dir,
+                     workers: int = DEFAULT_WORKERS, reuse: bool = True) -> Dict[str, Dict]:
+    """
+    Run section jobs concurrently, saving each finished section
+
+    Args:
+        jobs: SectionJob list (prompts and keys already built)
+        backend: Callable returning a job's section JSON
+        sections_dir: Directory for <job>.json results ({"key": ..., "data": ...})
+        workers: Concurrent jobs
+        reuse: Keep sections an earlier run saved under the same key
+            (only failed, missing or outdated jobs run)
+
+    Returns:
+        dict: {job name: {status ('ok', 'cached' or 'failed'), seconds, error, data}}
+    """
+    sections_dir = Path(sections_dir)
+
+    def run(job: SectionJob) -> Dict:
+        path = sections_dir / f'{job.name}.json'
+        if reuse:
+            saved = _load_saved_section(path, job)
+            if saved is not None:
+                return {'status': 'cached', 'seconds': 0.0, 'error': None, 'data': saved}
+        start = time.perf_counter()
+        try:
+            data = backend(job)
+            missing = [p for p in job.properties if p not in data]
+            if missing:
+                raise ValueError(f"output is missing {', '.join(missing)}")
+            data = {p: data[p] for p in job.properties}
+            _write_json_atomic(path, {'key': job.key, 'data': data})
+            return {'status': 'ok', 'seconds': time.perf_counter() - start, 'error': None, 'data': data}
+        except Exception as e:
+            return {'status': 'failed', 'seconds': time.perf_counter() - start, 'error': str(e), 'data': None}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='phase2-section') as executor:
+        results = list(executor.map(run, jobs))
+    return {job.name: result for job, result in zip(jobs, results)}
+
+
+def merge_sections(jobs: List[SectionJob], results: Dict[str, Dict]) -> Dict:
+    """Merge section outputs in job order (each job contributes only its own properties)."""
+    merged = {}
+    for job in jobs:
+        data = results.get(job.name, {}).get('data')
+        if data:
+            merged.update({p: data[p] for p in job.properties if p in data})
+    return merged
+
+
+def validate_merged(data: Dict, schema: Dict) -> List[str]:
+    """validate_schema() errors plus required top-level schema properties that are missing."""
+    _, errors = validate_schema(data)
+    errors += [f"❌ Missing required field: {p}" for p in schema.get('required', [])
+               if p not in data and f"❌ Missing required field: {p}" not in errors]
+    return errors
+
+
+def extract_sectioned(markdown_files: List[str], issuer_name: str, output_path, schema: Dict,
+                      backend: Callable[[SectionJob], Dict], workers: int = DEFAULT_WORKERS,
+                      sections: Optional[List[str]] = None, reuse: bool = True,
+                      prefill: Optional[Dict] = None) -> Dict:
+    """
+    Plan, run, merge and validate a sectioned extraction
+
+    Args:
+        markdown_files: Phase 1 markdown files
+        issuer_name: Name of issuer
+        output_path: phase2_extracted_data.json (written when every section succeeded)
+        schema: Full Phase 2 extraction schema
+        backend: Section backend (StubBackend, CommandBackend or any callable)
+        workers: Concurrent jobs
+        sections: Only run these jobs (the merge still uses every saved section
+            whose key matches)
+        reuse: Keep sections an earlier run saved under the same key
+        prefill: Optional phase2_table_prefill.prefill_fields() result
+
+    Returns:
+        dict with results (per job), failed (job names), wall_seconds,
+        written (bool), is_valid and errors
+    """
+    output_path = Path(output_path)
+    sections_dir = output_path.parent / SECTIONS_DIRNAME
+    jobs = plan_section_jobs(schema)
+    selected = [job for job in jobs if not sections or job.name in sections]
+    # Every job gets its key: sections not run this time are merged only if saved under it
+    input_digests = [file_digest(str(path)) for path in markdown_files]
+    for job in jobs:
+        job.prompt = create_section_prompt(job, markdown_files, issuer_name, prefill)
+        job.key = section_key(job, markdown_files, output_path, backend_id(backend), input_digests)
+    for job in selected:
+        _write_text(sections_dir / f'{job.name}_prompt.txt', job.prompt)
+
+    start = time.perf_counter()
+    results = run_section_jobs(selected, backend, sections_dir, workers=workers, reuse=reuse)
+    wall_seconds = time.perf_counter() - start
+
+    # Sections not run this time come from earlier runs
+    for job in jobs:
+        if job.name not in results:
+            saved = _load_saved_section(sections_dir / f'{job.name}.json', job)
+            results[job.name] = ({'status': 'cached', 'seconds': 0.0, 'error': None, 'data': saved} if saved
+                                 else {'status': 'failed', 'seconds': 0.0, 'error': 'not run', 'data': None})
+
+    failed = [job.name for job in jobs if results[job.name]['status'] == 'failed']
+    summary = {'results': results, 'failed': failed, 'wall_seconds': wall_seconds, 'written': False,
+               'is_valid': None, 'errors': []}
+    if failed:
+        return summary
+
+    merged = merge_sections(jobs, results)
+    errors = validate_merged(merged, schema)
+    _write_json_atomic(output_path, merged)
+    summary.update(written=True, errors=errors, is_valid=not any(e.startswith('❌') for e in errors))
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a sectioned Phase 2 extraction."""
+    parser = argparse.ArgumentParser(description='Phase 2 extraction as concurrent section jobs')
+    parser.add_argument('markdown_files', nargs='+', help='Phase 1 markdown files')
+    parser.add_argument('--issuer-name', required=True, help='Issuer name')
+    parser.add_argument('--output', default=None, help='Output JSON path (default: auto-generated)')
+    parser.add_argument('--schema', default=str(DEFAULT_SCHEMA_PATH), help='Phase 2 extraction schema')
+    parser.add_argument('--backend', choices=['stub', 'command'], required=True,
+                        help='command: run --backend-command per section; '
+                             'stub: local template + table values (dry runs only)')
+    parser.add_argument('--backend-command', default=None,
+                        help='Command for the command backend (prompt on stdin, JSON on stdout)')
+    parser.add_argument('--model-id', default=os.environ.get('ANTHROPIC_MODEL', 'default'),
+                        help='Model the backend command runs, part of the section key '
+                             '(default: $ANTHROPIC_MODEL or "default")')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Concurrent section jobs (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Seconds per section for the command backend (default: {DEFAULT_TIMEOUT})')
+    parser.add_argument('--sections', nargs='+', default=None, metavar='JOB',
+                        help=f"Only run these section jobs ({', '.join([HEADER_JOB] + list(SECTION_JOBS))})")
+    parser.add_argument('--force', '--no-reuse', dest='force', action='store_true',
+                        help='Run every section again, even those saved under a matching key')
+    parser.add_argument('--no-table-prefill', action='store_true', help='Skip the table pre-extraction')
+    args = parser.parse_args(argv)
+
+    if args.backend == 'command' and not args.backend_command:
+        parser.error('--backend command requires --backend-command')
+
+    if args.output is None:
+        safe_name = re.sub(r'[^a-zA-Z0-9_-]', '', args.issuer_name.replace(' ', '_').replace('/', '_'))
+        args.output = str(Path.cwd() / 'Issuer_Reports' / safe_name / 'temp' / 'phase2_extracted_data.json')
+
+    with open(args.schema, 'r') as f:
+        schema = json.load(f)
+
+    prefill = None
+    if not args.no_table_prefill:
+        prefill = prefill_fields(args.markdown_files)
+
+    if args.backend == 'command':
+        backend = CommandBackend(args.backend_command, timeout=args.timeout, model_id=args.model_id)
+    else:
+        backend = StubBackend(prefill=prefill, issuer_name=args.issuer_name)
+
+    summary = extract_sectioned(args.markdown_files, args.issuer_name, args.output, schema, backend,
+                                workers=args.workers, sections=args.sections, reuse=not args.force,
+                                prefill=prefill)
+
+    print(f"PHASE 2 SECTIONED EXTRACTION ({args.backend} backend, {args.workers} workers)")
+    for name, result in summary['results'].items():
+        mark = {'ok': '✓', 'cached': '↺', 'failed': '❌'}[result['status']]
+        detail = f" - {result['error']}" if result['error'] else ''
+        print(f"  {mark} {name:18} {result['status']:7} {result['seconds']:7.2f}s{detail}")
+    busy = sum(r['seconds'] for r in summary['results'].values())
+    print(f"\n⏱️  Wall clock {summary['wall_seconds']:.2f}s (section time {busy:.2f}s)")
+
+    if summary['failed']:
+        print(f"\n❌ {len(summary['failed'])} section(s) failed: {', '.join(summary['failed'])}")
+        print("   Re-run to retry only those sections")
+        return 1
+
+    print(f"\n💾 Merged: {args.output}")
+    if summary['is_valid']:
+        print("✅ Schema validation PASSED")
+        return 0
+    print("❌ Schema validation FAILED")
+    for error in summary['errors']:
+        print(f"  {error}")
+    print("\n💡 Run extract_key_metrics_efficient.py on the same output for a targeted field retry")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Phase 2 Table Pre-Extraction (deterministic fast path)
+
+Most Phase 2 required fields sit on a labelled row of a statement table:
+"Total assets" on the balance sheet, "Net operating income" in the results
+table, "FFO per unit - diluted" in the MD&A reconciliation. Reading them
+does not need an LLM. Before the extraction prompt is written, this module
+reads the Phase 1 table stores (markdown_table_store.py) and fills every
+field it can with a rule:
+
+- row-label patterns, tried in order as section_extractor.find_row_by_label()
+  does (the balance sheet patterns are section_extractor.BALANCE_SHEET_LABELS),
+  matched against the label alone and against the label qualified by its
+  sub-heading ("Mortgages and loans payable" under "Current liabilities:"),
+- the statement the row is expected in (a caption regex), and
+- a sanity check on the value (positive amounts, per-unit amounts below
+  $10, rates between 0 and 1; expenses are stored positive).
+
+The value is read from the table's current-period column (the first value
+column, as extract_value_from_row() reads a row's cells). When several rows
+match, they vote on the value, and rows under the expected statement caption
+count double. Each value carries its provenance (file, line, caption, row
+label, column header) and a confidence:
+
+    1.0 - 0.1 per fallback pattern
+        - 0.15 if no row with the value sits under the expected caption
+        - 0.3 x the share of votes against the value
+
+Values at or above --min-confidence (default 0.8) are pre-filled. The
+extraction prompt lists them with their provenance and asks the LLM only
+for the remaining fields.
+
+Usage:
+    python scripts/phase2_table_prefill.py statements.md mda.md
+    python scripts/phase2_table_prefill.py statements.md mda.md --output phase2_table_prefill.json
+"""
+
+import argparse
+import copy
+import json
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / 'archive' / 'experimental'))
+from markdown_table_store import TableStore, load_table_store, normalize_label
+from section_extractor import BALANCE_SHEET_LABELS
+
+PREFILL_FORMAT = 1
+PREFILL_FILENAME = 'phase2_table_prefill.json'
+DEFAULT_MIN_CONFIDENCE = 0.8
+
+# Expected statement captions
+BALANCE_SHEET_CAPTION = r'balance sheet|financial position'
+OPERATIONS_CAPTION = r'operations|income|earnings|results'
+FFO_CAPTION = r'\bffo\b|\baffo\b|funds from operations'
+PORTFOLIO_CAPTION = r'portfolio|occupan|leasing'
+
+
+@dataclass
+class FieldRule:
+    """How to read one schema field from the table store"""
+    path: str                       # Dotted schema path, e.g. 'balance_sheet.total_assets'
+    labels: List[str]               # Row-label regexes, most specific first
+    caption: Optional[str] = None   # Regex the expected statement's caption matches
+    exclude: Optional[str] = None   # Regex of (qualified) row labels that never match
+    kind: str = 'positive'          # positive | amount | expense | per_unit | rate
+
+
+FIELD_RULES: List[FieldRule] = [
+    # Balance sheet
+    FieldRule('balance_sheet.total_assets', BALANCE_SHEET_LABELS['total_assets'], BALANCE_SHEET_CAPTION,
+              exclude=r'current|per unit'),
+    FieldRule('balance_sheet.investment_properties', [r'^investment properties$', r'^investment propert'],
+              BALANCE_SHEET_CAPTION, exclude=r'held for sale|fair value|additions|acquisition|disposition'),
+    FieldRule('balance_sheet.cash', BALANCE_SHEET_LABELS['cash'], BALANCE_SHEET_CAPTION,
+              exclude=r'beginning|end of|increase|decrease|provided|used'),
+    FieldRule('balance_sheet.mortgages_noncurrent', BALANCE_SHEET_LABELS['mortgages_noncurrent'],
+              BALANCE_SHEET_CAPTION, exclude=r'repayment|proceeds|interest'),
+    FieldRule('balance_sheet.mortgages_current', BALANCE_SHEET_LABELS['mortgages_current'], BALANCE_SHEET_CAPTION,
+              exclude=r'\bnon\b|noncurrent|repayment|proceeds|interest'),
+    FieldRule('balance_sheet.credit_facilities', BALANCE_SHEET_LABELS['credit_facilities'], BALANCE_SHEET_CAPTION,
+              exclude=r'undrawn|available|unused|capacity|limit|repayment|proceeds|advances|interest'),
+    FieldRule('balance_sheet.total_liabilities', [r'^total liabilities$'] + BALANCE_SHEET_LABELS['total_liabilities'],
+              BALANCE_SHEET_CAPTION, exclude=r'equity|current'),
+
+    # Income statement
+    FieldRule('income_statement.revenue', [r'^total revenues?$', r'^revenues?$', r'^(rental|property) revenues?$'],
+              OPERATIONS_CAPTION, exclude=r'same|growth|%'),
+    FieldRule('income_statement.property_operating_expenses',
+              [r'^property operating (expenses|costs)$', r'^property operating'], OPERATIONS_CAPTION,
+              kind='expense'),
+    FieldRule('income_statement.noi', [r'^net operating income$', r'^noi$', r'net operating income'],
+              OPERATIONS_CAPTION, exclude=r'same|margin|%|growth|proportionate|change'),
+    FieldRule('income_statement.interest_expense', [r'^interest expense$', r'interest expense', r'^finance costs$'],
+              OPERATIONS_CAPTION, exclude=r'income|capitali[sz]ed|preferred|treated as|coverage|paid',
+              kind='expense'),
+    FieldRule('income_statement.net_income', [r'^net income loss$', r'^net loss income$', r'^net income$',
+                                              r'^net loss$'], OPERATIONS_CAPTION,
+              exclude=r'per unit|attributable|comprehensive', kind='amount'),
+
+    # FFO / AFFO
+    FieldRule('ffo_affo.ffo', [r'^ffo$', r'^funds from operations( ffo)?$'], FFO_CAPTION, kind='amount'),
+    FieldRule('ffo_affo.affo', [r'^affo$', r'^adjusted funds from operations( affo)?$'], FFO_CAPTION,
+              kind='amount'),
+    FieldRule('ffo_affo.ffo_per_unit', [r'^ffo per unit diluted$', r'^diluted ffo per unit$',
+                                        r'^ffo per unit.*diluted', r'^ffo per unit$'],
+              FFO_CAPTION, kind='per_unit'),
+    FieldRule('ffo_affo.affo_per_unit', [r'^affo per unit diluted$', r'^diluted affo per unit$',
+                                         r'^affo per unit.*diluted', r'^affo per unit$'],
+              FFO_CAPTION, kind='per_unit'),
+    FieldRule('ffo_affo.distributions_per_unit', [r'distributions per (common )?unit', r'distributions declared per'],
+              FFO_CAPTION, exclude=r'payout|preferred|special', kind='per_unit'),
+
+    # Portfolio
+    FieldRule('portfolio.occupancy_rate', [r'^(total )?occupancy( rate)?$', r'^occupancy', r'^(total )?occupied'],
+              PORTFOLIO_CAPTION, exclude=r'commit|including|same|change|cost', kind='rate'),
+]
+
+
+def _passes(value: float, kind: str) -> bool:
+    if kind == 'rate':
+        return 0 < value <= 1
+    if kind == 'per_unit':
+        return 0 < abs(value) < 10
+    if kind == 'positive':
+        return value > 0
+    return value != 0
+
+
+def _current_column(table: Dict) -> Optional[int]:
+    """First value column holding any number (the current period in filings)."""
+    return next((i for i, column in enumerate(table['values']) if any(v is not None for v in column)), None)
+
+
+def _candidates(store: TableStore, rule: FieldRule):
+    """Rows matching the first label pattern that yields any usable value, with that pattern's rank."""
+    exclude = re.compile(rule.exclude, re.IGNORECASE) if rule.exclude else None
+    for rank, pattern in enumerate(rule.labels):
+        compiled = re.compile(pattern, re.IGNORECASE)
+        found = []
+        for table_index, table in enumerate(store.tables):
+            column = _current_column(table)
+            if column is None:
+                continue
+            for row_index, label in enumerate(table['labels']):
+                value = table['values'][column][row_index]
+                if value is None:
+                    continue
+                # Match the label, else the label qualified by its sub-heading
+                key = normalize_label(label)
+                if not compiled.search(key):
+                    group = normalize_label(store.group(table_index, row_index))
+                    key = f'{key} {group}'
+                    if not group or not compiled.search(key):
+                        continue
+                if exclude and exclude.search(key):
+                    continue
+                if rule.kind == 'expense':
+                    value = abs(value)
+                if _passes(value, rule.kind):
+                    found.append((table_index, row_index, column, value))
+        if found:
+            return rank, found
+    return None, []
+
+
+def extract_field(store: TableStore, rule: FieldRule) -> Optional[Dict]:
+    """
+    Read one field from the table store
+
+    Args:
+        store: Tables of the issuer's Phase 1 markdown
+        rule: FieldRule for the field
+
+    Returns:
+        dict with value, confidence and provenance (source, line, caption,
+        label, column, matches), or None if no row matches
+    """
+    rank, found = _candidates(store, rule)
+    if not found:
+        return None
+
+    # Rows under the expected statement caption count double
+    caption = re.compile(rule.caption, re.IGNORECASE) if rule.caption else None
+    weights = [2 if caption is None or caption.search(store.tables[c[0]]['caption']) else 1 for c in found]
+    scores = Counter()
+    for candidate, weight in zip(found, weights):
+        scores[candidate[3]] += weight
+    top = max(scores.values())
+    chosen = next(i for i, c in enumerate(found) if scores[c[3]] == top)
+    table_index, row_index, column, value = found[chosen]
+    in_caption = any(w == 2 for c, w in zip(found, weights) if c[3] == value)
+
+    confidence = 1.0 - 0.1 * rank - (0 if in_caption else 0.15) - 0.3 * (1 - top / sum(weights))
+    row = store.row(table_index, row_index)
+    return {
+        'value': int(value) if float(value).is_integer() and rule.kind != 'rate' else value,
+        'confidence': round(max(confidence, 0.0), 2),
+        'source': row.source,
+        'line': row.line,
+        'caption': row.caption,
+        'label': row.label,
+        'column': row.columns[column],
+        'matches': len(found),
+    }
+
+
+def prefill_fields(markdown_files, rules: List[FieldRule] = FIELD_RULES,
+                   min_confidence: float = DEFAULT_MIN_CONFIDENCE, store: Optional[TableStore] = None) -> Dict:
+    """
+    Pre-extract Phase 2 fields from a filing's tables
+
+    Args:
+        markdown_files: Phase 1 markdown files (their table stores are reused when fresh)
+        rules: Field rules to apply
+        min_confidence: Lowest confidence that is pre-filled
+        store: Already-loaded TableStore (skips loading markdown_files)
+
+    Returns:
+        dict with fields ({path: value and provenance} at or above
+        min_confidence), low_confidence (the same for values below it) and
+        gaps (rule paths left for the LLM)
+    """
+    if store is None:
+        store = load_table_store(markdown_files)
+
+    fields, low_confidence = {}, {}
+    for rule in rules:
+        result = extract_field(store, rule)
+        if result is None:
+            continue
+        (fields if result['confidence'] >= min_confidence else low_confidence)[rule.path] = result
+
+    return {
+        'format': PREFILL_FORMAT,
+        'sources': [str(f) for f in markdown_files],
+        'min_confidence': min_confidence,
+        'fields': fields,
+        'low_confidence': low_confidence,
+        'gaps': [rule.path for rule in rules if rule.path not in fields],
+    }
+
+
+def apply_prefill(template: Dict, prefill: Dict) -> Dict:
+    """
+    Copy of an extraction template with the pre-filled values set
+
+    Args:
+        template: generate_template_from_schema() output
+        prefill: prefill_fields() output
+
+    Returns:
+        dict: New template (the input is not modified)
+    """
+    filled = copy.deepcopy(template)
+    for path, field in prefill['fields'].items():
+        target = filled
+        *parents, name = path.split('.')
+        for key in parents:
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            target = target[key]
+        target[name] = field['value']
+    return filled
+
+
+def format_prefill_section(prefill: Dict) -> str:
+    """
+    Prompt section listing pre-filled values and the fields still to extract
+
+    Args:
+        prefill: prefill_fields() output
+
+    Returns:
+        str: Markdown section (empty if nothing was pre-filled)
+    """
+    if not prefill['fields']:
+        return ''
+
+    rows = []
+    for path, field in prefill['fields'].items():
+        source = f"{field['source']}:{field['line']}" if field.get('line') else field['source']
+        rows.append(f"| `{path}` | {field['value']} | {field['confidence']:.2f} | "
+                    f"{source} - {field['caption'] or 'table'} / \"{field['label']}\" ({field['column']}) |")
+    gaps = ', '.join(f'`{path}`' for path in prefill['gaps']) or 'none of the table fields'
+
+    return f"""### Pre-extracted Values (deterministic table read)
+
+These {len(prefill['fields'])} fields were read from the statement tables and are ALREADY FILLED in the template below.
+**Do not re-extract them.** Keep each value unless the cited row is clearly the wrong period or statement.
+
+| Field | Value | Confidence | Source (file:line - table / row (column)) |
+|-------|-------|------------|--------------------------------------------|
+{chr(10).join(rows)}
+
+**Still to extract:** {gaps}, plus every other template field not listed above.
+"""
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Pre-extract Phase 2 fields from Phase 1 markdown tables."""
+    parser = argparse.ArgumentParser(description='Deterministic Phase 2 pre-extraction from Phase 1 markdown tables')
+    parser.add_argument('markdown_files', nargs='+', help='Phase 1 markdown files')
+    parser.add_argument('--output', default=None, help=f'Write the pre-extraction as JSON (e.g. {PREFILL_FILENAME})')
+    parser.add_argument('--min-confidence', type=float, default=DEFAULT_MIN_CONFIDENCE,
+                        help=f'Lowest confidence that is pre-filled (default: {DEFAULT_MIN_CONFIDENCE})')
+    args = parser.parse_args(argv)
+
+    prefill = prefill_fields(args.markdown_files, min_confidence=args.min_confidence)
+
+    for label, fields in (('✓', prefill['fields']), ('?', prefill['low_confidence'])):
+        for path, field in fields.items():
+            print(f"{label} {path:40} {field['value']!s:>14}  {field['confidence']:.2f}  "
+                  f"{field['source']}:{field['line']} \"{field['label']}\"")
+    print(f"\n⚡ Pre-filled {len(prefill['fields'])}/{len(FIELD_RULES)} fields "
+          f"({len(prefill['gaps'])} left for extraction)")
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(prefill, f, indent=2)
+        print(f"💾 Saved: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
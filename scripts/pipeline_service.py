@@ -0,0 +1,876 @@
+#!/usr/bin/env python3
+"""
+Warm Pipeline Service
+
+Every pipeline phase normally runs as its own CLI process, paying for the
+pandas/NumPy/sklearn imports, the model load and the template read on each
+run. This service keeps those resources resident in one long-running local
+process and accepts Phase 3, prediction, Phase 4 enrichment and Phase 5
+report jobs over localhost HTTP or a Unix socket:
+
+- Model: the v2.2 artifact is loaded once (fused NumPy scorer, no unpickling)
+- Templates: read once and reloaded only when the file changes
+- Caches: one Phase 3 MetricsCache and the shared macro series cache
+- Market: one AsyncMarketDataCollector reused across enrichment jobs
+
+Jobs run on a thread pool. GET /stats reports queue depth, in-flight jobs and
+per-job-type latency (mean, p50, p95, max).
+
+Endpoints:
+    GET  /health            Liveness and model version
+    GET  /stats             Queue depth and latency statistics
+    POST /jobs/<type>       Run a job (phase3, predict, enrich, report); the
+                            response waits for the result unless ?wait=0,
+                            which returns 202 with a job id
+    GET  /jobs/<id>         Status and result of a submitted job
+
+Usage:
+    # Start (localhost HTTP or Unix socket)
+    python scripts/pipeline_service.py serve --port 8765
+    python scripts/pipeline_service.py serve --socket /tmp/issuer-credit.sock
+
+    # Submit jobs (JSON payload inline or @file)
+    python scripts/pipeline_service.py submit predict \
+        '{"phase3": "Issuer_Reports/RioCan_REIT/temp/phase3_calculated_metrics.json", "ticker": "REI-UN.TO"}'
+    python scripts/pipeline_service.py submit report \
+        '{"metrics": "Issuer_Reports/RioCan_REIT/temp/phase3_calculated_metrics.json",
+          "analysis": "Issuer_Reports/RioCan_REIT/temp/phase4_credit_analysis.md"}'
+    python scripts/pipeline_service.py stats
+
+Relative paths in job payloads resolve against the service's working directory.
+Requests must carry a localhost Host header (blocks DNS rebinding) and POSTs an
+application/json body. Every file a job writes - explicit "output" paths and
+the defaults next to its inputs - must lie under Issuer_Reports/ (--output-root),
+and templates must resolve inside the template directory.
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from calculate_credit_metrics import MetricsCache, calculate_all_metrics, calculate_all_metrics_cached
+from enrich_phase4_data import (
+    DEFAULT_MODEL_FILE,
+    PHASE4_OUTPUT_FILE,
+    Phase4DataEnricher,
+    discover_enrichment_jobs,
+    enrich_portfolio,
+    load_prediction_model,
+    predict_cut_probabilities,
+)
+from generate_final_report import (
+    default_report_path,
+    generate_final_report,
+    load_analysis,
+    load_metrics,
+    load_phase2_data,
+)
+from model_artifact import ModelArtifact
+from openbb_macro_monitor import EnhancedMacroMonitor
+from openbb_market_monitor import AsyncMarketDataCollector
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 4
+DEFAULT_TEMPLATE = 'credit_opinion_template.md'
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / 'templates'
+PHASE3_OUTPUT_FILE = 'phase3_calculated_metrics.json'
+DEFAULT_OUTPUT_ROOT = 'Issuer_Reports'
+ALLOWED_HOSTS = ('localhost', '127.0.0.1')
+
+# Latency samples kept per job type, and finished jobs kept for GET /jobs/<id>
+LATENCY_WINDOW = 1000
+MAX_FINISHED_JOBS = 1000
+
+
+class JobError(ValueError):
+    """Invalid job request (unknown type, missing or malformed payload)."""
+
+
+class PathNotAllowedError(JobError):
+    """Job output outside the output root, or template outside the template directory."""
+
+
+def _json_default(obj):
+    """JSON encoder hook for NumPy scalars/arrays and paths in job results."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[max(0, math.ceil(q / 100 * len(sorted_values)) - 1)]
+
+
+def _require(payload: Dict, *keys):
+    """Raise JobError unless the payload has one of the given keys."""
+    if not any(payload.get(key) is not None for key in keys):
+        raise JobError(f"payload requires {' or '.join(repr(k) for k in keys)}")
+
+
+class PipelineService:
+    """
+    Resident pipeline resources plus a thread-pool job queue.
+
+    Job handlers share one model artifact, template cache, Phase 3 result
+    cache, market collector and macro monitor. The service is usable
+    in-process (submit/wait/run) as well as behind PipelineHTTPServer or
+    PipelineUnixServer.
+    """
+
+    JOB_TYPES = ('phase3', 'predict', 'enrich', 'report')
+
+    def __init__(
+        self,
+        model_file: str = DEFAULT_MODEL_FILE,
+        artifact: Optional[ModelArtifact] = None,
+        workers: int = DEFAULT_WORKERS,
+        metrics_cache: Optional[MetricsCache] = None,
+        collector: Optional[AsyncMarketDataCollector] = None,
+        macro_monitor: Optional[EnhancedMacroMonitor] = None,
+        template_dir: Path = TEMPLATE_DIR,
+        output_root=DEFAULT_OUTPUT_ROOT
+    ):
+        """
+        Initialize service (resources load on warm() or first use).
+
+        Args:
+            model_file: Path to trained prediction model pickle file
+            artifact: Already-loaded model (skips model_file)
+            workers: Job worker threads
+            metrics_cache: Phase 3 result cache (default: MetricsCache() in the default directory)
+            collector: Market collector for enrichment (default: AsyncMarketDataCollector('tmx'))
+            macro_monitor: Macro monitor (default: EnhancedMacroMonitor() on the shared series cache)
+            template_dir: Directory holding Phase 5 templates
+            output_root: Directory every job output must lie under
+                (default: Issuer_Reports in the working directory)
+        """
+        self.model_file = model_file
+        self.workers = workers
+        self.template_dir = Path(template_dir)
+        self.output_root = Path(output_root).resolve()
+        self.metrics_cache = metrics_cache if metrics_cache is not None else MetricsCache()
+        self.collector = collector
+        self.macro_monitor = macro_monitor
+
+        self._artifact = artifact
+        self._templates = {}
+        self._resource_lock = threading.Lock()
+        # The market collector keeps per-run state; enrichment jobs take turns
+        self._enrich_lock = threading.Lock()
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pipeline-job')
+        self._jobs = OrderedDict()
+        self._finished = {}
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._latency = {job_type: deque(maxlen=LATENCY_WINDOW) for job_type in self.JOB_TYPES}
+        self._counts = {job_type: {'completed': 0, 'failed': 0} for job_type in self.JOB_TYPES}
+        self.started_at = time.time()
+
+    # ---------- resident resources ----------
+
+    @property
+    def artifact(self) -> ModelArtifact:
+        """Prediction model, loaded on first use and kept for the service lifetime."""
+        if self._artifact is None:
+            with self._resource_lock:
+                if self._artifact is None:
+                    self._artifact = load_prediction_model(self.model_file)
+        return self._artifact
+
+    def template(self, name: str = DEFAULT_TEMPLATE) -> str:
+        """
+        Phase 5 template content, re-read only when the file changes.
+
+        Args:
+            name: Template filename in template_dir
+
+        Returns:
+            str: Template content
+
+        Raises:
+            PathNotAllowedError: If the name resolves outside template_dir
+            FileNotFoundError: If the template does not exist
+        """
+        path = self._template_path(name)
+        if not path.exists():
+            raise FileNotFoundError(f"Template not found: {path}")
+        mtime = path.stat().st_mtime_ns
+
+        cached = self._templates.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with self._resource_lock:
+            cached = self._templates.get(name)
+            if cached is None or cached[0] != mtime:
+                with open(path, 'r') as f:
+                    self._templates[name] = cached = (mtime, f.read())
+        return cached[1]
+
+    def _template_path(self, name: str) -> Path:
+        """template_dir / name, rejecting names that resolve outside template_dir."""
+        path = (self.template_dir / name).resolve()
+        if not path.is_relative_to(self.template_dir.resolve()):
+            raise PathNotAllowedError(f"template must be inside {self.template_dir}: {name}")
+        return path
+
+    def _check_output(self, path) -> Path:
+        """Resolved output path, rejecting paths outside output_root."""
+        resolved = Path(path).resolve()
+        if not resolved.is_relative_to(self.output_root):
+            raise PathNotAllowedError(f"output must be under {self.output_root}: {path}")
+        return resolved
+
+    def _resolve_paths(self, job_type: str, payload: Dict) -> Dict:
+        """
+        Fill in default outputs (and expand enrich manifests), then check every path.
+
+        Report jobs without an output are checked in _run_report, once the
+        issuer's default report path is known.
+
+        Returns:
+            dict: Copy of the payload with final 'output' (phase3) or 'jobs' (enrich)
+
+        Raises:
+            PathNotAllowedError: If an output or the template is outside its directory
+            JobError: If an enrich manifest or glob cannot be read
+        """
+        payload = dict(payload)
+        if job_type == 'phase3' and payload.get('data') is None and payload.get('phase2'):
+            payload['output'] = payload.get('output') or str(Path(payload['phase2']).parent / PHASE3_OUTPUT_FILE)
+        elif job_type == 'enrich':
+            if payload.get('batch'):
+                try:
+                    jobs, payload['skipped'] = discover_enrichment_jobs(payload.pop('batch'))
+                except (OSError, ValueError) as e:
+                    raise JobError(f"cannot read batch source {payload['batch']!r}: {e}")
+            elif payload.get('jobs') is not None:
+                if not isinstance(payload['jobs'], list) or not all(isinstance(j, dict) for j in payload['jobs']):
+                    raise JobError("'jobs' must be a list of objects")
+                jobs = [dict(job) for job in payload['jobs']]
+            else:
+                _require(payload, 'phase3')
+                _require(payload, 'ticker')
+                jobs = [{'phase3': payload['phase3'], 'ticker': payload['ticker'], 'output': payload.get('output')}]
+            for job in jobs:
+                _require(job, 'phase3')
+                if not job.get('output'):
+                    job['output'] = str(Path(job['phase3']).parent / PHASE4_OUTPUT_FILE)
+            payload['jobs'] = jobs
+        elif job_type == 'report':
+            self._template_path(payload.get('template') or DEFAULT_TEMPLATE)
+
+        outputs = [job['output'] for job in payload['jobs']] if job_type == 'enrich' else [payload.get('output')]
+        for output in outputs:
+            if output:
+                self._check_output(output)
+        return payload
+
+    def warm(self):
+        """Load the model and default template now instead of on the first job."""
+        self.artifact
+        self.template()
+        if self.collector is None:
+            self.collector = AsyncMarketDataCollector(provider='tmx')
+        if self.macro_monitor is None:
+            self.macro_monitor = EnhancedMacroMonitor()
+        return self
+
+    # ---------- job queue ----------
+
+    def submit(self, job_type: str, payload: Optional[Dict] = None) -> str:
+        """
+        Queue a job.
+
+        Args:
+            job_type: One of JOB_TYPES
+            payload: Job parameters (see the _run_<type> handlers)
+
+        Returns:
+            str: Job id for wait() / job()
+
+        Raises:
+            JobError: If the job type is unknown or the payload is not an object
+            PathNotAllowedError: If the job would write outside output_root
+                or read a template outside template_dir
+        """
+        if job_type not in self.JOB_TYPES:
+            raise JobError(f"unknown job type '{job_type}' (expected one of: {', '.join(self.JOB_TYPES)})")
+        payload = payload if payload is not None else {}
+        if not isinstance(payload, dict):
+            raise JobError('job payload must be a JSON object')
+        payload = self._resolve_paths(job_type, payload)
+
+        job_id = uuid.uuid4().hex[:12]
+        record = {
+            'id': job_id,
+            'type': job_type,
+            'status': 'queued',
+            'submitted_at': datetime.now().isoformat(timespec='milliseconds'),
+            'queue_ms': None,
+            'run_ms': None,
+            'result': None,
+            'error': None,
+        }
+        with self._stats_lock:
+            self._jobs[job_id] = record
+            self._finished[job_id] = threading.Event()
+            self._queued += 1
+            self._trim_finished()
+        self._executor.submit(self._execute, record, payload, time.perf_counter())
+        return job_id
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Dict:
+        """
+        Block until a job finishes and return its record.
+
+        Raises:
+            KeyError: If the job id is unknown (or already evicted)
+            TimeoutError: If the job is still running after timeout seconds
+        """
+        with self._stats_lock:
+            finished = self._finished[job_id]
+        if not finished.wait(timeout):
+            raise TimeoutError(f"job {job_id} still running after {timeout}s")
+        return self.job(job_id)
+
+    def run(self, job_type: str, payload: Optional[Dict] = None, timeout: Optional[float] = None) -> Dict:
+        """Submit a job and wait for its record."""
+        return self.wait(self.submit(job_type, payload), timeout)
+
+    def job(self, job_id: str) -> Dict:
+        """Return a copy of a job record (KeyError if unknown)."""
+        with self._stats_lock:
+            return dict(self._jobs[job_id])
+
+    def _execute(self, record: Dict, payload: Dict, submitted: float):
+        started = time.perf_counter()
+        with self._stats_lock:
+            self._queued -= 1
+            self._running += 1
+            record['status'] = 'running'
+            record['queue_ms'] = round((started - submitted) * 1000, 3)
+
+        try:
+            result = getattr(self, f"_run_{record['type']}")(payload)
+            status, error = 'done', None
+        except Exception as e:
+            result, status, error = None, 'failed', f"{type(e).__name__}: {e}"
+
+        run_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self._running -= 1
+            record.update(status=status, result=result, error=error, run_ms=round(run_ms, 3))
+            self._counts[record['type']]['completed' if status == 'done' else 'failed'] += 1
+            self._latency[record['type']].append(run_ms)
+            self._finished[record['id']].set()
+
+    def _trim_finished(self):
+        """Drop the oldest finished job records beyond MAX_FINISHED_JOBS (lock held)."""
+        finished = [job_id for job_id, r in self._jobs.items() if r['status'] in ('done', 'failed')]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+            del self._finished[job_id]
+
+    def stats(self) -> Dict:
+        """
+        Queue depth and per-job-type latency statistics.
+
+        Returns:
+            dict: uptime, worker count, queue_depth (waiting), in_flight
+                (running), resident resources and, per job type, completed /
+                failed counts with latency_ms (mean, p50, p95, max, last) over
+                the last LATENCY_WINDOW jobs
+        """
+        with self._stats_lock:
+            jobs = {}
+            for job_type in self.JOB_TYPES:
+                samples = list(self._latency[job_type])
+                latency = None
+                if samples:
+                    ordered = sorted(samples)
+                    latency = {
+                        'mean': round(sum(samples) / len(samples), 3),
+                        'p50': round(_percentile(ordered, 50), 3),
+                        'p95': round(_percentile(ordered, 95), 3),
+                        'max': round(ordered[-1], 3),
+                        'last': round(samples[-1], 3),
+                    }
+                jobs[job_type] = dict(self._counts[job_type], latency_ms=latency)
+
+            return {
+                'uptime_seconds': round(time.time() - self.started_at, 1),
+                'workers': self.workers,
+                'queue_depth': self._queued,
+                'in_flight': self._running,
+                'resident': {
+                    'model_version': self._artifact.version if self._artifact is not None else None,
+                    'templates': sorted(self._templates),
+                },
+                'jobs': jobs,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs and (optionally) wait for queued ones."""
+        self._executor.shutdown(wait=wait)
+
+    # ---------- job handlers ----------
+
+    def _run_phase3(self, payload: Dict) -> Dict:
+        """
+        Phase 3 metrics from a Phase 2 extraction.
+
+        Payload:
+            phase2: Path to Phase 2 extracted data JSON, or
+            data: Phase 2 extraction dictionary
+            output: Where to write the metrics (default: phase3_calculated_metrics.json
+                next to the phase2 file; not written for inline data)
+            use_cache: False to recompute (default: True)
+
+        Returns:
+            dict: metrics, cache_hit and output path (or None)
+        """
+        _require(payload, 'phase2', 'data')
+        if payload.get('data') is not None:
+            financial_data = payload['data']
+            output = payload.get('output')
+        else:
+            phase2_path = Path(payload['phase2'])
+            with open(phase2_path, 'r') as f:
+                financial_data = json.load(f)
+            output = payload.get('output') or str(phase2_path.parent / PHASE3_OUTPUT_FILE)
+        if output:
+            self._check_output(output)
+
+        if 'issuer_name' not in financial_data:
+            raise JobError('Phase 2 data is missing issuer_name')
+
+        metrics, cache_hit = calculate_all_metrics_cached(
+            financial_data,
+            cache=self.metrics_cache,
+            use_cache=payload.get('use_cache', True),
+            calculate=calculate_all_metrics
+        )
+
+        if output:
+            output_path = Path(output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w') as f:
+                json.dump(metrics, f, indent=2)
+
+        return {'metrics': metrics, 'cache_hit': cache_hit, 'output': output}
+
+    def _run_predict(self, payload: Dict) -> Dict:
+        """
+        Distribution cut prediction for one issuer or a batch (one scoring pass).
+
+        Payload:
+            phase3: Path to Phase 3 metrics JSON, or phase3_data: metrics dictionary
+            ticker: REIT ticker (optional, echoed in the result)
+            issuers: List of {phase3 | phase3_data, ticker} for a batch instead
+
+        Returns:
+            dict: predictions (one run_prediction_model()-style dict per issuer)
+        """
+        issuers = payload.get('issuers')
+        if issuers is None:
+            issuers = [payload]
+        if not isinstance(issuers, list) or not issuers:
+            raise JobError("'issuers' must be a non-empty list")
+
+        enrichers = []
+        for issuer in issuers:
+            _require(issuer, 'phase3', 'phase3_data')
+            enrichers.append(Phase4DataEnricher(
+                issuer.get('phase3') or '<inline>',
+                issuer.get('ticker') or 'UNKNOWN',
+                artifact=self.artifact,
+                phase3_data=issuer.get('phase3_data')
+            ))
+
+        features = [enricher._prepare_features({}, {}) for enricher in enrichers]
+        probabilities, classes = predict_cut_probabilities(self.artifact, features)
+
+        predictions = []
+        for enricher, feature_row, probability, y_pred in zip(enrichers, features, probabilities, classes):
+            prediction = enricher._build_prediction_result(feature_row, probability, y_pred)
+            predictions.append(dict(prediction, ticker=enricher.ticker))
+        return {'predictions': predictions}
+
+    def _run_enrich(self, payload: Dict) -> Dict:
+        """
+        Phase 4 enrichment through enrich_portfolio() with the resident resources.
+
+        Payload:
+            phase3, ticker, output: One issuer (output defaults to
+                phase4_enriched_data.json next to phase3), or
+            jobs: List of {phase3, ticker, output}, or
+            batch: Manifest path or glob (as enrich_phase4_data.py --batch)
+            market_lookback_days, macro_lookback_months: Lookback windows
+
+        Returns:
+            dict: enrich_portfolio() summary
+        """
+        payload = self._resolve_paths('enrich', payload)  # no-op after submit(); checks the outputs
+        jobs, skipped = payload['jobs'], payload.get('skipped', [])
+
+        if self.collector is None:
+            self.collector = AsyncMarketDataCollector(provider='tmx')
+        if self.macro_monitor is None:
+            self.macro_monitor = EnhancedMacroMonitor()
+
+        with self._enrich_lock:
+            summary = enrich_portfolio(
+                jobs,
+                market_lookback_days=payload.get('market_lookback_days', 365),
+                macro_lookback_months=payload.get('macro_lookback_months', 120),
+                collector=self.collector,
+                macro_monitor=self.macro_monitor,
+                artifact=self.artifact
+            )
+        summary['skipped'] = skipped
+        return summary
+
+    def _run_report(self, payload: Dict) -> Dict:
+        """
+        Phase 5 report from Phase 3 metrics and a Phase 4 analysis.
+
+        Payload:
+            metrics: Path to Phase 3 metrics (or Phase 4 enriched) JSON
+            analysis: Path to Phase 4 credit analysis markdown
+            output: Report path (default: issuer reports/ folder with ET timestamp)
+            template: Template filename (default: credit_opinion_template.md)
+            include_report: True to return the report text as well
+
+        Returns:
+            dict: issuer, output path and report size (plus report text if requested)
+        """
+        _require(payload, 'metrics')
+        _require(payload, 'analysis')
+
+        template = self.template(payload.get('template') or DEFAULT_TEMPLATE)
+        metrics = load_metrics(payload['metrics'])
+        phase2_data = load_phase2_data(payload['metrics'])
+        analysis_sections = load_analysis(payload['analysis'])
+
+        if payload.get('output'):
+            output_path = Path(payload['output'])
+        else:
+            import pytz
+            timestamp = datetime.now(pytz.timezone('America/New_York')).strftime('%Y-%m-%d_%H%M%S')
+            output_path = default_report_path(metrics, payload['metrics'], timestamp, create=False)
+        self._check_output(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        report = generate_final_report(metrics, analysis_sections, template, phase2_data)
+        with open(output_path, 'w') as f:
+            f.write(report)
+
+        result = {'issuer': metrics.get('issuer_name'), 'output': str(output_path), 'characters': len(report)}
+        if payload.get('include_report'):
+            result['report'] = report
+        return result
+
+
+# ========================================
+# HTTP front end (localhost TCP or Unix socket)
+# ========================================
+
+class PipelineRequestHandler(BaseHTTPRequestHandler):
+    """JSON request handler; the service is taken from self.server.service."""
+
+    server_version = 'IssuerCreditPipeline/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        path = urlsplit(self.path).path.rstrip('/')
+        service = self.server.service
+
+        if not self._host_allowed():
+            return
+
+        if path == '/health':
+            self._send_json(200, {'status': 'ok', 'model_version': service.stats()['resident']['model_version']})
+        elif path == '/stats':
+            self._send_json(200, service.stats())
+        elif path.startswith('/jobs/'):
+            try:
+                self._send_json(200, service.job(path[len('/jobs/'):]))
+            except KeyError:
+                self._send_json(404, {'error': 'unknown job id'})
+        else:
+            self._send_json(404, {'error': f'no such endpoint: {path}'})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip('/')
+        service = self.server.service
+
+        if not self._host_allowed():
+            return
+        if not path.startswith('/jobs/'):
+            self._send_json(404, {'error': f'no such endpoint: {path}'})
+            return
+        if self.headers.get_content_type() != 'application/json':
+            self.close_connection = True  # the unread body must not be parsed as a request
+            self._send_json(415, {'error': 'Content-Type must be application/json'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {'error': f'invalid JSON body: {e}'})
+            return
+
+        job_type = path[len('/jobs/'):]
+        try:
+            job_id = service.submit(job_type, payload)
+        except PathNotAllowedError as e:
+            self._send_json(403, {'error': str(e)})
+            return
+        except JobError as e:
+            self._send_json(404 if job_type not in service.JOB_TYPES else 400, {'error': str(e)})
+            return
+
+        if parse_qs(url.query).get('wait', ['1'])[0] in ('0', 'false', 'no'):
+            self._send_json(202, service.job(job_id))
+            return
+
+        record = service.wait(job_id)
+        self._send_json(200 if record['status'] == 'done' else 422, record)
+
+    def _host_allowed(self) -> bool:
+        """Reject (403) requests whose Host is not localhost, e.g. from a rebound DNS name."""
+        host = urlsplit('//' + (self.headers.get('Host') or '')).hostname
+        if host in ALLOWED_HOSTS:
+            return True
+        self.close_connection = True
+        self._send_json(403, {'error': f'host not allowed: {self.headers.get("Host")}'})
+        return False
+
+    def _send_json(self, status: int, body: Dict):
+        data = json.dumps(body, default=_json_default).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if not getattr(self.server, 'quiet', False):
+            super().log_message(format, *args)
+
+
+class PipelineHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to a PipelineService."""
+
+    daemon_threads = True
+
+    def __init__(self, address, service: PipelineService, quiet: bool = False):
+        self.service = service
+        self.quiet = quiet
+        super().__init__(address, PipelineRequestHandler)
+
+
+class PipelineUnixServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded HTTP-over-Unix-socket server bound to a PipelineService."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, service: PipelineService, quiet: bool = False):
+        self.service = service
+        self.quiet = quiet
+        self.socket_path = str(socket_path)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # stale socket from a previous run
+        super().__init__(self.socket_path, PipelineRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def make_server(service: PipelineService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                socket_path: Optional[str] = None, quiet: bool = False):
+    """
+    Create a server for the service (not yet serving).
+
+    Args:
+        service: PipelineService handling the jobs
+        host, port: Localhost TCP address (port 0 picks a free port)
+        socket_path: Unix socket path; takes precedence over host/port
+        quiet: Suppress per-request access logging
+
+    Returns:
+        PipelineHTTPServer or PipelineUnixServer
+    """
+    if socket_path:
+        return PipelineUnixServer(socket_path, service, quiet=quiet)
+    return PipelineHTTPServer((host, port), service, quiet=quiet)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class PipelineClient:
+    """Minimal JSON client for a running pipeline service."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 socket_path: Optional[str] = None, timeout: float = 600):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def request(self, method: str, path: str, payload: Optional[Dict] = None):
+        """
+        Send one request.
+
+        Returns:
+            tuple: (HTTP status, decoded JSON body)
+        """
+        if self.socket_path:
+            conn = _UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            body = json.dumps(payload, default=_json_default) if payload is not None else None
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, json.loads(response.read() or b'{}')
+        finally:
+            conn.close()
+
+    def submit(self, job_type: str, payload: Optional[Dict] = None, wait: bool = True):
+        """POST /jobs/<type>; returns (status, job record)."""
+        return self.request('POST', f"/jobs/{job_type}{'' if wait else '?wait=0'}", payload or {})
+
+    def job(self, job_id: str):
+        return self.request('GET', f'/jobs/{job_id}')
+
+    def stats(self):
+        return self.request('GET', '/stats')
+
+    def health(self):
+        return self.request('GET', '/health')
+
+
+def _add_address_arguments(parser):
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Listen/connect host (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Listen/connect port (default: {DEFAULT_PORT})')
+    parser.add_argument('--socket', dest='socket_path', help='Unix socket path (instead of --host/--port)')
+
+
+def main():
+    """Command-line interface: serve, submit, stats."""
+    parser = argparse.ArgumentParser(description='Warm pipeline service for Phase 3-5 jobs')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help='Start the service')
+    _add_address_arguments(serve)
+    serve.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                       help=f'Job worker threads (default: {DEFAULT_WORKERS})')
+    serve.add_argument('--model', default=DEFAULT_MODEL_FILE, help='Prediction model file')
+    serve.add_argument('--cache-dir', default=None,
+                       help='Phase 3 result cache directory (default: .cache/phase3_metrics in the repo root)')
+    serve.add_argument('--output-root', default=DEFAULT_OUTPUT_ROOT,
+                       help=f'Directory job output paths must lie under (default: {DEFAULT_OUTPUT_ROOT})')
+    serve.add_argument('--quiet', action='store_true', help='No per-request access log')
+
+    submit = commands.add_parser('submit', help='Submit a job to a running service')
+    submit.add_argument('job_type', choices=PipelineService.JOB_TYPES)
+    submit.add_argument('payload', nargs='?', default='{}', help='JSON payload, or @file.json')
+    submit.add_argument('--no-wait', action='store_true', help='Return the job id without waiting')
+    _add_address_arguments(submit)
+
+    stats = commands.add_parser('stats', help='Show queue depth and latency statistics')
+    _add_address_arguments(stats)
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        service = PipelineService(model_file=args.model, workers=args.workers,
+                                  metrics_cache=MetricsCache(args.cache_dir), output_root=args.output_root)
+        started = time.perf_counter()
+        service.warm()
+        server = make_server(service, args.host, args.port, args.socket_path, quiet=args.quiet)
+        where = args.socket_path or f"http://{args.host}:{server.server_address[1]}"
+        print(f"✓ Resources loaded in {time.perf_counter() - started:.2f}s "
+              f"(model {service.artifact.version}, {args.workers} workers)")
+        print(f"🚀 Pipeline service listening on {where}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down...")
+        finally:
+            server.server_close()
+            service.shutdown(wait=False)
+        return 0
+
+    client = PipelineClient(args.host, args.port, args.socket_path)
+    try:
+        if args.command == 'stats':
+            status, body = client.stats()
+        else:
+            raw = args.payload
+            if raw.startswith('@'):
+                with open(raw[1:], 'r') as f:
+                    raw = f.read()
+            status, body = client.submit(args.job_type, json.loads(raw), wait=not args.no_wait)
+    except (ConnectionError, FileNotFoundError) as e:
+        print(f"❌ Error: cannot reach pipeline service: {e}")
+        return 1
+
+    print(json.dumps(body, indent=2))
+    return 0 if status < 400 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,6 +20,10 @@ Usage:
 
     # Using latest trained model
     python scripts/predict_distribution_cut.py --model models/lightgbm_model_*.pkl --csv data/new_reits.csv
+
+Batch prediction scores the whole CSV as one feature matrix: one predict_proba
+call, and SHAP contributions for all rows in one pass (LightGBM's native
+pred_contrib output, or a TreeExplainer created once per predictor).
 """
 
 import argparse
@@ -31,7 +35,16 @@ from typing import Dict, List, Tuple
 import pandas as pd
 import numpy as np
 import joblib
-import shap
+
+from model_artifact import ModelArtifact, ModelSchemaError, feature_names_from_csv, metadata_path_for
+
+try:
+    import shap
+except ImportError:
+    shap = None  # Only needed for models without native SHAP contributions
+
+SHAP_INSTALL_HINT = "Install with: pip install shap"
+TOP_DRIVER_COUNT = 5
 
 # Suppress warnings
 import warnings
@@ -41,13 +54,18 @@ warnings.filterwarnings('ignore')
 class DistributionCutPredictor:
     """Predicts REIT distribution cut probability."""
 
-    def __init__(self, model_path: str = None):
+    def __init__(self, model_path: str = None, feature_names: List[str] = None):
         """
         Initialize predictor with trained model.
 
         Args:
             model_path: Path to trained LightGBM model (.pkl).
                        If None, uses most recent model in models/ directory.
+            feature_names: Model feature order (default: the model's .model.json
+                       sidecar, else training_dataset_v2.csv columns)
+
+        Raises:
+            ModelSchemaError: If the estimator's feature count does not match the schema
         """
         if model_path is None:
             # Find most recent LightGBM baseline model
@@ -57,27 +75,40 @@ class DistributionCutPredictor:
             model_path = model_files[-1]
 
         print(f"📊 Loading model from {model_path}")
-        self.model = joblib.load(model_path)
         self.model_path = model_path
+        self._explainer = None
+
+        if feature_names is None and metadata_path_for(model_path).exists():
+            # Self-describing artifact: schema from the sidecar, estimator unpickled on first prediction
+            self.artifact = ModelArtifact.load(model_path)
+            self.feature_names = self.artifact.feature_names
+            self._model = None
+        else:
+            self.artifact = None
+            self._model = joblib.load(model_path)
+            self.feature_names = list(feature_names) if feature_names is not None else self._load_feature_names()
+
+            n_features = getattr(self._model, 'n_features_in_', None)
+            if n_features is not None and n_features != len(self.feature_names):
+                raise ModelSchemaError(
+                    f"Model expects {n_features} features but {len(self.feature_names)} feature names were given"
+                )
 
-        # Load feature names from training dataset
-        self.feature_names = self._load_feature_names()
         print(f"✅ Model loaded ({len(self.feature_names)} features)")
 
+    @property
+    def model(self):
+        """The fitted estimator (loaded from the artifact on first use)."""
+        if self._model is None:
+            self._model = self.artifact.estimator
+        return self._model
+
     def _load_feature_names(self, dataset_path="data/training_dataset_v2.csv") -> List[str]:
-        """Load feature names from training dataset."""
-        df = pd.read_csv(dataset_path)
+        """Load feature names from the training dataset header (models without a sidecar)."""
+        print(f"⚠️  No {metadata_path_for(self.model_path).name} sidecar; reading feature names from {dataset_path}")
 
         # Exclude non-feature columns (same as training)
-        exclude_cols = [
-            'ticker', 'cut_date', 'sector', 'target_cut_occurred',
-            'ttm_distribution_pre_cut', 'avg_monthly_distribution',
-            'dividend_payment_count_ttm', 'current_price', 'current_yield',
-            'data_quality', 'notes', 'cash_runway_months', 'self_funding_ratio',
-            'risk_level'
-        ]
-
-        return [col for col in df.columns if col not in exclude_cols]
+        return feature_names_from_csv(dataset_path)
 
     def predict_single(self,
                       ticker: str,
@@ -114,105 +145,137 @@ class DistributionCutPredictor:
             **kwargs
         }
 
-        # Create DataFrame with all required features (fill missing with 0)
-        feature_values = []
-        for feat in self.feature_names:
-            feature_values.append(features.get(feat, 0))
-
-        X = np.array([feature_values])
-
-        # Make prediction
-        prediction = self.model.predict(X)[0]
-        probability = self.model.predict_proba(X)[0, 1]
-
-        # Get SHAP explanation
-        explainer = shap.TreeExplainer(self.model)
-        shap_values = explainer.shap_values(X)
-
-        if isinstance(shap_values, list):
-            shap_values = shap_values[1]  # Positive class
+        # Feature vector in model order (fill missing with 0)
+        X = np.array([[features.get(feat, 0) for feat in self.feature_names]], dtype=float)
 
-        # Get top contributing features
-        contributions = list(zip(self.feature_names, shap_values[0]))
-        contributions.sort(key=lambda x: abs(x[1]), reverse=True)
+        labels, probabilities, contributions = self._score(X)
 
-        # Format result
-        result = {
-            'ticker': ticker,
-            'prediction': 'CUT' if prediction == 1 else 'NO CUT',
-            'cut_probability': float(probability),
-            'risk_level': self._assess_risk_level(probability),
-            'top_drivers': [
-                {
-                    'feature': feat,
-                    'shap_value': float(shap_val),
-                    'direction': 'increases' if shap_val > 0 else 'decreases',
-                    'magnitude': 'high' if abs(shap_val) > 0.5 else 'moderate' if abs(shap_val) > 0.1 else 'low'
-                }
-                for feat, shap_val in contributions[:5]
-            ],
-            'input_features': {
-                'affo_payout_ratio': affo_payout,
-                'interest_coverage': interest_coverage,
-                'debt_to_assets': debt_to_assets,
-                'debt_to_ebitda': debt_to_ebitda,
-                'occupancy_rate': occupancy,
-                'sector': sector
-            }
+        input_features = {
+            'affo_payout_ratio': affo_payout,
+            'interest_coverage': interest_coverage,
+            'debt_to_assets': debt_to_assets,
+            'debt_to_ebitda': debt_to_ebitda,
+            'occupancy_rate': occupancy,
+            'sector': sector
         }
 
-        return result
+        return self._format_result(ticker, labels[0], probabilities[0], contributions[0], input_features)
 
-    def predict_batch(self, csv_path: str) -> List[Dict]:
+    def predict_batch(self, csv_path) -> List[Dict]:
         """
         Predict distribution cuts for multiple REITs from CSV file.
 
         CSV should have columns: ticker, affo_payout_ratio, interest_coverage, debt_to_assets, etc.
-        (same format as training_dataset_v2.csv)
+        (same format as training_dataset_v2.csv). All rows are scored as one
+        feature matrix; results match predict_single() row by row.
 
         Args:
-            csv_path: Path to CSV file with REIT data
+            csv_path: Path to CSV file with REIT data (or an already-loaded DataFrame)
 
         Returns:
             List of prediction results for each REIT
         """
-        print(f"📊 Loading data from {csv_path}")
-        df = pd.read_csv(csv_path)
+        if isinstance(csv_path, pd.DataFrame):
+            df = csv_path
+        else:
+            print(f"📊 Loading data from {csv_path}")
+            df = pd.read_csv(csv_path)
+
+        # Columns the model does not know are ignored; missing columns and NaN are 0
+        features = df.reindex(columns=self.feature_names).astype(float).fillna(0)
+        X = features.to_numpy()
+
+        labels, probabilities, contributions = self._score(X)
+
+        tickers = df['ticker'].tolist() if 'ticker' in df.columns else [f'REIT_{idx}' for idx in df.index]
+        sectors = df['sector'].tolist() if 'sector' in df.columns else [None] * len(df)
+        inputs = {
+            name: (features[name].tolist() if name in df.columns and name in features.columns
+                   else [0] * len(df))
+            for name in ('affo_payout_ratio', 'interest_coverage', 'debt_to_assets',
+                         'debt_to_ebitda', 'occupancy_rate')
+        }
 
         results = []
-        for idx, row in df.iterrows():
-            ticker = row.get('ticker', f'REIT_{idx}')
-
-            # Extract features
-            feature_dict = {}
-            for feat in self.feature_names:
-                if feat in row:
-                    val = row[feat]
-                    feature_dict[feat] = float(val) if pd.notna(val) else 0
-
-            # Extract explicit parameters and remove from feature_dict to avoid duplicates
-            affo_payout = feature_dict.pop('affo_payout_ratio', 0)
-            interest_coverage = feature_dict.pop('interest_coverage', 0)
-            debt_to_assets = feature_dict.pop('debt_to_assets', 0)
-            debt_to_ebitda = feature_dict.pop('debt_to_ebitda', 0)
-            occupancy = feature_dict.pop('occupancy_rate', 0)
-
-            # Make prediction
-            result = self.predict_single(
-                ticker=ticker,
-                affo_payout=affo_payout,
-                interest_coverage=interest_coverage,
-                debt_to_assets=debt_to_assets,
-                debt_to_ebitda=debt_to_ebitda,
-                occupancy=occupancy,
-                sector=row.get('sector', None),
-                **feature_dict
-            )
-
-            results.append(result)
+        for i in range(len(df)):
+            input_features = {name: values[i] for name, values in inputs.items()}
+            input_features['sector'] = sectors[i]
+            results.append(self._format_result(tickers[i], labels[i], probabilities[i],
+                                               contributions[i], input_features))
 
         return results
 
+    def _score(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score a feature matrix.
+
+        Args:
+            X: Feature matrix (rows x self.feature_names)
+
+        Returns:
+            tuple: (predicted labels, cut probabilities, SHAP contributions per feature)
+        """
+        proba = self.model.predict_proba(X)
+        classes = getattr(self.model, 'classes_', np.arange(proba.shape[1]))
+        labels = np.asarray(classes)[proba.argmax(axis=1)]
+
+        return labels, proba[:, 1], self._shap_contributions(X)
+
+    def _shap_contributions(self, X: np.ndarray) -> np.ndarray:
+        """
+        Per-feature SHAP contributions (log-odds) for all rows in one pass.
+
+        LightGBM models return them natively (pred_contrib); other tree models
+        use a TreeExplainer that is created once and reused.
+
+        Args:
+            X: Feature matrix
+
+        Returns:
+            Array of shape (rows, features)
+        """
+        if hasattr(self.model, 'booster_'):
+            # Last column is the expected value (bias), not a feature
+            return np.asarray(self.model.predict(X, pred_contrib=True))[:, :len(self.feature_names)]
+
+        if self._explainer is None:
+            if shap is None:
+                raise ImportError(f"shap is required to explain {type(self.model).__name__} models. "
+                                  f"{SHAP_INSTALL_HINT}")
+            self._explainer = shap.TreeExplainer(self.model)
+
+        shap_values = self._explainer.shap_values(X)
+        if isinstance(shap_values, list):
+            shap_values = shap_values[1]  # Positive class
+        shap_values = np.asarray(shap_values)
+        if shap_values.ndim == 3:
+            shap_values = shap_values[:, :, 1]  # (rows, features, classes)
+        return shap_values
+
+    def _format_result(self, ticker, label, probability: float, contributions: np.ndarray,
+                       input_features: Dict) -> Dict:
+        """Build the prediction result for one row."""
+        # Stable sort keeps feature order among equal contributions
+        top = np.argsort(-np.abs(contributions), kind='stable')[:TOP_DRIVER_COUNT]
+
+        return {
+            'ticker': ticker,
+            'prediction': 'CUT' if label == 1 else 'NO CUT',
+            'cut_probability': float(probability),
+            'risk_level': self._assess_risk_level(probability),
+            'top_drivers': [
+                {
+                    'feature': self.feature_names[i],
+                    'shap_value': float(contributions[i]),
+                    'direction': 'increases' if contributions[i] > 0 else 'decreases',
+                    'magnitude': ('high' if abs(contributions[i]) > 0.5
+                                  else 'moderate' if abs(contributions[i]) > 0.1 else 'low')
+                }
+                for i in top
+            ],
+            'input_features': input_features
+        }
+
     @staticmethod
     def _assess_risk_level(probability: float) -> str:
         """Assess risk level based on cut probability."""
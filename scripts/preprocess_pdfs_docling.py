@@ -7,80 +7,381 @@ Alternative to preprocess_pdfs_enhanced.py that uses Docling instead of PyMuPDF4
 Key differences:
 - Uses Docling with TableFormerMode.FAST for table extraction
 - Produces cleaner, more compact markdown (4 columns vs 14)
-- Slower (~9.6 minutes per 48-page PDF vs 15 seconds)
+- Slower (~9.6 minutes per 48-page PDF vs 15 seconds serially)
 - No cleanup/enhancement needed (Docling produces clean output)
+- Writes a structured table store next to each markdown file
+  (<name>.tables.json, see markdown_table_store.py) for Phase 2 lookups
+
+Selective OCR (--ocr auto, the default):
+- A text-layer pre-pass classifies every page as text-native, scanned or mixed
+  (non-whitespace characters in the text layer vs. area covered by images)
+- Only scanned and mixed pages are converted with OCR; born-digital pages
+  use the text layer directly. Per-page decisions and the estimated time
+  saved are reported in each PDF's stats (stats['ocr'])
+
+Financial-statement pages only (default; --full-document converts everything):
+- pdf_page_locator scores each page's text layer against the Phase 2 section
+  vocabulary; only matching pages and their neighbours are converted
+
+Conversion cache (default; --no-cache converts anyway):
+- Markdown is cached under .cache/phase1_markdown keyed on the PDF's SHA-256,
+  the converter and the planned page ranges; an unchanged filing re-run
+  with the same options is written from the cache without conversion.
+  Inspect or prune with scripts/pdf_conversion_cache.py
+
+Page-parallel conversion:
+- Each worker process builds one DocumentConverter (TableFormer + OCR models
+  load once per worker, not once per PDF)
+- Every PDF is split into page ranges (--chunk-pages); the ranges of all PDFs
+  (statements and MD&A together) share one process pool
+- Each PDF's ranges are stitched back in page order into a single markdown file
 
 Usage:
     python scripts/preprocess_pdfs_docling.py --issuer-name "Artis REIT" file1.pdf file2.pdf
 
+    # Serial, one converter for all files
+    python scripts/preprocess_pdfs_docling.py --issuer-name "Artis REIT" --workers 1 file1.pdf file2.pdf
+
+    # OCR every page (previous behaviour)
+    python scripts/preprocess_pdfs_docling.py --issuer-name "Artis REIT" --ocr all file1.pdf file2.pdf
+
 Author: Claude Code Pipeline v1.0.12
 Date: 2025-10-21
 """
 
 import argparse
+import functools
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+from markdown_table_store import TableStore, table_store_path
+from pdf_conversion_cache import ConversionCache, conversion_key, file_digest
+from pdf_page_locator import DEFAULT_NEIGHBOURS, locate_pdf_pages
+
+DOCLING_INSTALL_HINT = "Docling not installed. Run: pip install docling"
+
+# Pages per conversion task; small enough to spread a 40-page PDF over several
+# workers, large enough that per-task overhead stays negligible
+DEFAULT_CHUNK_PAGES = 8
+
+# Page classification thresholds for selective OCR
+MIN_TEXT_CHARS = 200            # non-whitespace characters for a usable text layer
+SCANNED_IMAGE_COVERAGE = 0.5    # image share of the page typical of a scan
+MIXED_IMAGE_COVERAGE = 0.25     # text layer plus images large enough to hold text
+PAGE_TEXT, PAGE_SCANNED, PAGE_MIXED = 'text', 'scanned', 'mixed'
+OCR_PAGE_CLASSES = (PAGE_SCANNED, PAGE_MIXED)
+OCR_MODES = ('auto', 'all', 'none')
+
+# Time saved is estimated from measured per-page cost when a run converts both
+# OCR and text-layer pages; otherwise from this typical CPU OCR cost per page
+DEFAULT_OCR_SECONDS_PER_PAGE = 4.0
+
+# Converters owned by this process, keyed by (converter_factory, do_ocr) (serial mode, or per pool worker)
+_docling_converters = {}
+
 
 def sanitize_issuer_name(name: str) -> str:
     """Convert issuer name to safe folder name."""
     return name.replace(" ", "_").replace("/", "_").replace("\\", "_")
 
-def convert_pdf_docling(pdf_path: str, output_path: str, issuer_name: str) -> dict:
+
+def build_docling_converter(do_ocr: bool = True):
     """
-    Convert a single PDF to markdown using Docling.
+    Build a Docling converter configured for fast table extraction.
 
     Args:
-        pdf_path: Path to PDF file
-        output_path: Output directory for markdown
-        issuer_name: Name of issuer (for reporting)
+        do_ocr: Run OCR on bitmap content (False: use the PDF text layer only)
 
     Returns:
-        dict with conversion stats
+        docling DocumentConverter (TableFormer FAST, cell matching)
+
+    Raises:
+        ImportError: If docling is not installed
     """
     try:
         from docling.document_converter import DocumentConverter, PdfFormatOption
         from docling.datamodel.base_models import InputFormat
         from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
-    except ImportError:
-        print("ERROR: Docling not installed. Run: pip install docling")
-        sys.exit(1)
-
-    print(f"\n{'='*70}")
-    print(f"Converting: {os.path.basename(pdf_path)}")
-    print(f"Issuer: {issuer_name}")
-    print(f"Method: Docling (FAST mode)")
-    print(f"{'='*70}")
-
-    start_time = time.time()
+    except ImportError as e:
+        raise ImportError(DOCLING_INSTALL_HINT) from e
 
-    # Configure Docling for fast table extraction
     pipeline_options = PdfPipelineOptions()
     pipeline_options.do_table_structure = True
     pipeline_options.table_structure_options.mode = TableFormerMode.FAST
     pipeline_options.table_structure_options.do_cell_matching = True
-    pipeline_options.do_ocr = True  # Enable OCR for scanned sections
+    pipeline_options.do_ocr = do_ocr  # OCR only where the page needs it
 
-    converter = DocumentConverter(
+    return DocumentConverter(
         format_options={
             InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
         }
     )
 
-    # Convert PDF
-    print(f"[1/2] Converting PDF to structured document...")
-    result = converter.convert(pdf_path)
 
-    # Export to markdown
-    print(f"[2/2] Exporting to markdown...")
-    markdown_content = result.document.export_to_markdown()
+def describe_converter(converter_factory: Callable = build_docling_converter) -> dict:
+    """
+    Identify the converter a factory builds, for conversion cache keys.
+
+    Args:
+        converter_factory: Callable (do_ocr=...) returning a converter
+
+    Returns:
+        dict with the converter name, and for Docling its installed version
+        and TableFormer mode
+    """
+    if converter_factory is build_docling_converter:
+        try:
+            from importlib.metadata import PackageNotFoundError, version
+            docling_version = version('docling')
+        except PackageNotFoundError:
+            docling_version = None
+        return {'name': 'docling', 'version': docling_version, 'table_mode': 'FAST'}
+
+    func = getattr(converter_factory, 'func', converter_factory)  # unwrap functools.partial
+    return {'name': f"{func.__module__}.{func.__qualname__}"}
+
+
+def get_docling_converter(converter_factory: Callable = build_docling_converter, do_ocr: bool = True):
+    """Return this process's converter for a factory and OCR setting, building it on first use."""
+    key = (converter_factory, do_ocr)
+    if key not in _docling_converters:
+        # Converters hold the loaded models: keep only the current factory's
+        for stale in [k for k in _docling_converters if k[0] != converter_factory]:
+            del _docling_converters[stale]
+        _docling_converters[key] = converter_factory(do_ocr=do_ocr)
+    return _docling_converters[key]
+
+
+def count_pdf_pages(pdf_path: str) -> int:
+    """
+    Count pages with pypdfium2 (installed with docling).
+
+    Raises:
+        ImportError: If pypdfium2 is not installed
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError as e:
+        raise ImportError(DOCLING_INSTALL_HINT) from e
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def classify_page(text_chars: int, image_coverage: float) -> str:
+    """
+    Classify a page for OCR from its text layer and image coverage.
+
+    Args:
+        text_chars: Non-whitespace characters in the page's text layer
+        image_coverage: Fraction of the page area covered by images (0-1)
+
+    Returns:
+        'scanned' (image page without a usable text layer), 'mixed' (text layer
+        plus large images) or 'text' (text-native; blank pages included)
+    """
+    if image_coverage >= SCANNED_IMAGE_COVERAGE and text_chars < MIN_TEXT_CHARS:
+        return PAGE_SCANNED
+    if image_coverage >= MIXED_IMAGE_COVERAGE:
+        return PAGE_MIXED
+    return PAGE_TEXT
+
+
+def classify_pdf_pages(pdf_path: str) -> List[str]:
+    """
+    Classify every page of a PDF for selective OCR (text-layer pre-pass).
+
+    Reads only the text layer and image object positions with pypdfium2;
+    nothing is rendered, so the pass takes milliseconds per page.
+
+    Returns:
+        List of page classes ('text', 'scanned' or 'mixed'), one per page
+
+    Raises:
+        ImportError: If pypdfium2 is not installed
+    """
+    try:
+        import pypdfium2 as pdfium
+        import pypdfium2.raw as pdfium_c
+    except ImportError as e:
+        raise ImportError(DOCLING_INSTALL_HINT) from e
+
+    classes = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            try:
+                width, height = page.get_size()
+                textpage = page.get_textpage()
+                text_chars = sum(not c.isspace() for c in textpage.get_text_range())
+                textpage.close()
+
+                image_area = 0.0
+                for obj in page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,), max_depth=2):
+                    left, bottom, right, top = obj.get_pos()
+                    image_area += max(0.0, min(right, width) - max(left, 0.0)) * \
+                        max(0.0, min(top, height) - max(bottom, 0.0))
+                coverage = min(1.0, image_area / (width * height)) if width and height else 0.0
+
+                classes.append(classify_page(text_chars, coverage))
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return classes
+
+
+def _split_page_runs(pages, chunk_pages: int, needs_ocr=None) -> List[Tuple[Tuple[int, int], bool]]:
+    """Group ascending pages into runs of consecutive pages with the same OCR need."""
+    if chunk_pages < 1:
+        raise ValueError(f"chunk_pages must be >= 1, got {chunk_pages}")
+
+    runs = []
+    for page in pages:
+        do_ocr = needs_ocr(page) if needs_ocr is not None else False
+        if runs:
+            (first, last), run_ocr = runs[-1]
+            if page == last + 1 and do_ocr == run_ocr and page - first < chunk_pages:
+                runs[-1] = ((first, page), run_ocr)
+                continue
+        runs.append(((page, page), do_ocr))
+    return runs
+
+
+def plan_page_ranges(page_count: int, chunk_pages: int = DEFAULT_CHUNK_PAGES,
+                     pages: Optional[List[int]] = None) -> List[Tuple[int, int]]:
+    """
+    Split a document into page ranges.
+
+    Args:
+        page_count: Number of pages in the PDF
+        chunk_pages: Maximum pages per range
+        pages: Only these pages (1-based), e.g. from the page locator (default: all)
+
+    Returns:
+        List of (first_page, last_page) tuples, 1-based and inclusive, in page order;
+        ranges never span a page outside `pages`
+    """
+    pages = range(1, page_count + 1) if pages is None else sorted(p for p in set(pages) if 1 <= p <= page_count)
+    return [page_range for page_range, _ in _split_page_runs(pages, chunk_pages)]
+
+
+def plan_ocr_ranges(page_classes: List[str], chunk_pages: int = DEFAULT_CHUNK_PAGES,
+                    pages: Optional[List[int]] = None) -> List[Tuple[Tuple[int, int], bool]]:
+    """
+    Split a document into page ranges that either all need OCR or all do not.
+
+    Args:
+        page_classes: Page classes from classify_pdf_pages()
+        chunk_pages: Maximum pages per range
+        pages: Only these pages (1-based), e.g. from the page locator (default: all)
+
+    Returns:
+        List of ((first_page, last_page), do_ocr) in page order
+    """
+    page_count = len(page_classes)
+    pages = range(1, page_count + 1) if pages is None else sorted(p for p in set(pages) if 1 <= p <= page_count)
+    return _split_page_runs(pages, chunk_pages, lambda page: page_classes[page - 1] in OCR_PAGE_CLASSES)
+
+
+def summarize_ocr(mode: str, page_classes: List[str], ocr_ranges, range_seconds: Dict) -> dict:
+    """
+    Per-page OCR decisions and estimated time saved for one PDF.
+
+    Args:
+        mode: OCR mode ('auto', 'all' or 'none')
+        page_classes: Page classes of the whole PDF ('auto' mode) or None; only
+            converted pages are reported
+        ocr_ranges: ((first_page, last_page), do_ocr) tasks that were run
+        range_seconds: Conversion seconds per page range
+
+    Returns:
+        dict with mode, page class counts, the pages OCR'd, pages that skipped
+        OCR and estimated_seconds_saved (estimate_basis 'measured' when the
+        run converted both kinds of pages, otherwise 'default')
+    """
+    ocr_pages = [page for (first, last), do_ocr in ocr_ranges if do_ocr for page in range(first, last + 1)]
+    page_count = sum(last - first + 1 for (first, last), _ in ocr_ranges)
+    skipped = page_count - len(ocr_pages) if mode == 'auto' else 0
+
+    def seconds_per_page(do_ocr):
+        pages = sum(last - first + 1 for (first, last), flag in ocr_ranges if flag == do_ocr)
+        seconds = sum(range_seconds.get(r, 0.0) for r, flag in ocr_ranges if flag == do_ocr)
+        return seconds / pages if pages else None
+
+    ocr_cost, text_cost = seconds_per_page(True), seconds_per_page(False)
+    if ocr_cost is not None and text_cost is not None:
+        saved_per_page, basis = max(0.0, ocr_cost - text_cost), 'measured'
+    else:
+        saved_per_page, basis = DEFAULT_OCR_SECONDS_PER_PAGE, 'default'
+
+    summary = {
+        'mode': mode,
+        'ocr_pages': ocr_pages,
+        'ocr_skipped_pages': skipped,
+        'estimated_seconds_saved': round(skipped * saved_per_page, 1),
+        'estimate_basis': basis,
+    }
+    if page_classes is not None:
+        converted = [page for (first, last), _ in ocr_ranges for page in range(first, last + 1)]
+        summary['page_classes'] = {page: page_classes[page - 1] for page in converted}
+        classes = list(summary['page_classes'].values())
+        summary['pages_by_class'] = {cls: classes.count(cls) for cls in (PAGE_TEXT, PAGE_SCANNED, PAGE_MIXED)}
+    return summary
+
+
+def stitch_markdown(chunks: Dict[Tuple[int, int], str]) -> str:
+    """Join per-range markdown in page order."""
+    return "\n\n".join(chunks[page_range].strip("\n") for page_range in sorted(chunks)) + "\n"
 
-    # Save markdown
+
+def convert_page_range(pdf_path: str, page_range: Tuple[int, int], converter=None, do_ocr: bool = True) -> str:
+    """
+    Convert one page range to markdown.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_range: (first_page, last_page), 1-based and inclusive
+        converter: Docling converter (default: this process's converter for do_ocr)
+        do_ocr: OCR setting used to pick this process's converter
+
+    Returns:
+        Markdown for the pages in the range
+    """
+    converter = converter if converter is not None else get_docling_converter(do_ocr=do_ocr)
+    result = converter.convert(pdf_path, page_range=page_range)
+    return result.document.export_to_markdown()
+
+
+_worker_converter_factory = build_docling_converter
+
+
+def _init_docling_worker(converter_factory: Callable):
+    """Process pool initializer: converters are built once per worker and OCR setting."""
+    global _worker_converter_factory
+    _worker_converter_factory = converter_factory
+
+
+def _convert_page_range_task(pdf_path: str, page_range: Tuple[int, int], do_ocr: bool = True):
+    start = time.time()
+    converter = get_docling_converter(_worker_converter_factory, do_ocr)
+    markdown = convert_page_range(pdf_path, page_range, converter)
+    return pdf_path, page_range, markdown, time.time() - start
+
+
+def _write_markdown(pdf_path: str, output_path: str, markdown_content: str, elapsed_time: float) -> dict:
+    """Save one PDF's markdown and its table store, and return its conversion stats."""
     os.makedirs(output_path, exist_ok=True)
     output_file = os.path.join(
         output_path,
@@ -90,20 +391,25 @@ def convert_pdf_docling(pdf_path: str, output_path: str, issuer_name: str) -> di
     with open(output_file, "w", encoding="utf-8") as f:
         f.write(markdown_content)
 
-    elapsed_time = time.time() - start_time
+    # Parse tables once for Phase 2 (written after the markdown, so it is never older)
+    table_store = TableStore.from_markdown(markdown_content, source=os.path.basename(output_file))
+    table_store_file = str(table_store_path(output_file))
+    table_store.save(table_store_file)
+
     file_size = os.path.getsize(output_file)
 
     # Count lines and tables
-    with open(output_file, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-        line_count = len(lines)
-        table_count = sum(1 for line in lines if line.strip().startswith("|") and "---" in line)
+    lines = markdown_content.splitlines()
+    line_count = len(lines)
+    table_count = sum(1 for line in lines if line.strip().startswith("|") and "---" in line)
 
     print(f"\n✓ Conversion complete!")
     print(f"  Output: {output_file}")
     print(f"  Size: {file_size / 1024:.1f} KB")
     print(f"  Lines: {line_count:,}")
     print(f"  Tables detected: {table_count}")
+    print(f"  Table store: {table_store_file} ({len(table_store.tables)} tables, "
+          f"{len(table_store.labels)} row labels)")
     print(f"  Time: {elapsed_time:.1f} seconds ({elapsed_time/60:.1f} minutes)")
 
     return {
@@ -112,10 +418,230 @@ def convert_pdf_docling(pdf_path: str, output_path: str, issuer_name: str) -> di
         "size_kb": file_size / 1024,
         "lines": line_count,
         "tables": table_count,
+        "table_store": table_store_file,
         "time_seconds": elapsed_time,
         "success": True
     }
 
+
+def convert_pdf_docling(pdf_path: str, output_path: str, issuer_name: str, converter=None) -> dict:
+    """
+    Convert a single PDF to markdown using Docling.
+
+    Args:
+        pdf_path: Path to PDF file
+        output_path: Output directory for markdown
+        issuer_name: Name of issuer (for reporting)
+        converter: Docling converter to reuse (default: this process's shared converter)
+
+    Returns:
+        dict with conversion stats
+    """
+    print(f"\n{'='*70}")
+    print(f"Converting: {os.path.basename(pdf_path)}")
+    print(f"Issuer: {issuer_name}")
+    print(f"Method: Docling (FAST mode)")
+    print(f"{'='*70}")
+
+    start_time = time.time()
+
+    if converter is None:
+        try:
+            converter = get_docling_converter()
+        except ImportError:
+            print(f"ERROR: {DOCLING_INSTALL_HINT}")
+            sys.exit(1)
+
+    # Convert PDF
+    print(f"[1/2] Converting PDF to structured document...")
+    result = converter.convert(pdf_path)
+
+    # Export to markdown
+    print(f"[2/2] Exporting to markdown...")
+    markdown_content = result.document.export_to_markdown()
+
+    return _write_markdown(pdf_path, output_path, markdown_content, time.time() - start_time)
+
+
+def convert_pdfs_parallel(
+    pdf_paths: List[str],
+    output_path: str,
+    issuer_name: str,
+    workers: Optional[int] = None,
+    chunk_pages: int = DEFAULT_CHUNK_PAGES,
+    ocr: str = 'auto',
+    converter_factory: Callable = build_docling_converter,
+    page_counter: Callable = count_pdf_pages,
+    page_classifier: Callable = classify_pdf_pages,
+    page_locator: Optional[Callable] = None,
+    cache: Optional[ConversionCache] = None
+) -> List[dict]:
+    """
+    Convert several PDFs with page ranges spread over a process pool.
+
+    All PDFs are split into page ranges up front and submitted to one pool,
+    so the statements and the MD&A convert at the same time. Each worker
+    builds its converter once per OCR setting; each PDF's ranges are stitched
+    in page order and written as soon as its last range finishes.
+
+    Args:
+        pdf_paths: PDF files to convert
+        output_path: Output directory for markdown
+        issuer_name: Name of issuer (for reporting)
+        workers: Worker processes (default: CPU count, capped at the number of ranges)
+        chunk_pages: Maximum pages per conversion task
+        ocr: 'auto' (OCR only scanned/mixed pages), 'all' or 'none'
+        converter_factory: Picklable callable (do_ocr=...) returning a converter
+        page_counter: Callable returning a PDF's page count ('all'/'none' modes)
+        page_classifier: Callable returning a PDF's page classes ('auto' mode)
+        page_locator: Callable returning pdf_page_locator.locate_pdf_pages()-style
+            results; only its pages are converted (default: None, whole document).
+            A PDF where no page matches is converted in full.
+        cache: ConversionCache for markdown keyed on the PDF contents, the
+            converter and the planned ranges (default: None, always convert).
+            Hits skip conversion; the page selection and OCR pre-pass still run.
+
+    Returns:
+        List of conversion stats dicts (input order), with pages (PDF page
+        count), converted_pages, chunks, page_seconds (summed worker time),
+        ocr (see summarize_ocr()), page_selection (when a locator is used) and
+        cache_hit added; failed PDFs have success=False
+    """
+    if ocr not in OCR_MODES:
+        raise ValueError(f"ocr must be one of {OCR_MODES}, got {ocr!r}")
+
+    start_time = time.time()
+
+    plans = {}
+    cache_keys = {}
+    cache_metadata = {}
+    page_counts = {}
+    page_classes = {}
+    selections = {}
+    results = {}
+    for pdf_path in pdf_paths:
+        try:
+            pages = None
+            if page_locator is not None:
+                selections[pdf_path] = page_locator(pdf_path)
+                if selections[pdf_path]['pages']:
+                    pages = selections[pdf_path]['pages']
+                else:
+                    print(f"⚠️  {os.path.basename(pdf_path)}: no financial-statement pages located "
+                          f"(no text layer?) - converting the full document")
+
+            if ocr == 'auto':
+                page_classes[pdf_path] = page_classifier(pdf_path)
+                page_counts[pdf_path] = len(page_classes[pdf_path])
+                plans[pdf_path] = plan_ocr_ranges(page_classes[pdf_path], chunk_pages, pages)
+            else:
+                page_counts[pdf_path] = page_counter(pdf_path)
+                plans[pdf_path] = [(page_range, ocr == 'all')
+                                   for page_range in plan_page_ranges(page_counts[pdf_path], chunk_pages, pages)]
+
+            if cache is not None and plans[pdf_path]:
+                pdf_sha256 = file_digest(pdf_path)
+                converter = describe_converter(converter_factory)
+                options = {'ocr': ocr, 'ranges': [[first, last, do_ocr] for (first, last), do_ocr in plans[pdf_path]]}
+                cache_keys[pdf_path] = conversion_key(pdf_sha256, converter, options)
+                cache_metadata[pdf_path] = {'pdf': os.path.basename(pdf_path), 'pdf_sha256': pdf_sha256,
+                                            'converter': converter, 'options': options}
+                cached = cache.get(cache_keys[pdf_path])
+                if cached is not None:
+                    print(f"\n♻️  {os.path.basename(pdf_path)}: unchanged PDF and options - using cached markdown")
+                    stats = _write_markdown(pdf_path, output_path, cached['markdown'], time.time() - start_time)
+                    stats.update(cached['stats'], page_seconds=0.0, cache_hit=True)
+                    if 'page_classes' in stats['ocr']:  # JSON object keys come back as strings
+                        stats['ocr']['page_classes'] = {int(page): cls for page, cls in stats['ocr']['page_classes'].items()}
+                    results[pdf_path] = stats
+                    del plans[pdf_path]
+        except Exception as e:
+            results[pdf_path] = {"pdf": pdf_path, "success": False, "error": f"{type(e).__name__}: {e}"}
+            plans.pop(pdf_path, None)
+
+    tasks = [(pdf_path, page_range, do_ocr) for pdf_path, ranges in plans.items() for page_range, do_ocr in ranges]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    ocr_ranges = sum(do_ocr for _, _, do_ocr in tasks)
+
+    print(f"\n{'='*70}")
+    print(f"Converting {len(plans)} PDF(s): {len(tasks)} page range(s) across {workers} worker(s)")
+    print(f"Issuer: {issuer_name}")
+    print(f"Method: Docling (FAST mode), {chunk_pages} pages per range")
+    print(f"OCR: {ocr} ({ocr_ranges} of {len(tasks)} range(s) with OCR)")
+    print(f"{'='*70}")
+
+    chunks = {pdf_path: {} for pdf_path in plans}
+    range_seconds = {pdf_path: {} for pdf_path in plans}
+
+    def finish(pdf_path, page_range, markdown, seconds):
+        chunks[pdf_path][page_range] = markdown
+        range_seconds[pdf_path][page_range] = seconds
+        if len(chunks[pdf_path]) == len(plans[pdf_path]) and pdf_path not in results:
+            print(f"\n[{os.path.basename(pdf_path)}] {len(plans[pdf_path])} range(s) done, stitching...")
+            markdown = stitch_markdown(chunks[pdf_path])
+            stats = _write_markdown(pdf_path, output_path, markdown, time.time() - start_time)
+            ocr_stats = summarize_ocr(ocr, page_classes.get(pdf_path), plans[pdf_path], range_seconds[pdf_path])
+            converted_pages = sum(last - first + 1 for (first, last), _ in plans[pdf_path])
+            stats.update(pages=page_counts[pdf_path],
+                         converted_pages=converted_pages,
+                         chunks=len(plans[pdf_path]),
+                         page_seconds=round(sum(range_seconds[pdf_path].values()), 3),
+                         ocr=ocr_stats,
+                         cache_hit=False)
+            if pdf_path in selections:
+                selection = selections[pdf_path]
+                stats['page_selection'] = {
+                    'pages': [page for (first, last), _ in plans[pdf_path] for page in range(first, last + 1)],
+                    'matched_pages': selection.get('matched_pages', []),
+                    'sections': selection.get('sections', {}),
+                    'full_document': not selection['pages'],
+                }
+                print(f"  Pages: {converted_pages} of {page_counts[pdf_path]} converted (financial-statement pages)")
+            if ocr == 'auto':
+                print(f"  OCR: {len(ocr_stats['ocr_pages'])} page(s), skipped {ocr_stats['ocr_skipped_pages']} "
+                      f"(~{ocr_stats['estimated_seconds_saved']:.0f}s saved)")
+            if pdf_path in cache_keys:
+                cached_stats = {k: stats[k] for k in ('pages', 'converted_pages', 'chunks', 'ocr', 'page_selection')
+                                if k in stats}
+                cache.put(cache_keys[pdf_path], markdown, chunks[pdf_path],
+                          dict(cache_metadata[pdf_path], stats=cached_stats))
+            results[pdf_path] = stats
+
+    def fail(pdf_path, page_range, error):
+        print(f"⚠️  {os.path.basename(pdf_path)} pages {page_range[0]}-{page_range[1]} failed: {error}")
+        results[pdf_path] = {"pdf": pdf_path, "success": False,
+                             "error": f"pages {page_range[0]}-{page_range[1]}: {error}"}
+
+    if workers == 1:
+        _init_docling_worker(converter_factory)
+        for pdf_path, page_range, do_ocr in tasks:
+            if pdf_path in results:
+                continue
+            try:
+                finish(*_convert_page_range_task(pdf_path, page_range, do_ocr))
+            except Exception as e:
+                fail(pdf_path, page_range, f"{type(e).__name__}: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_docling_worker,
+                                 initargs=(converter_factory,)) as executor:
+            futures = {executor.submit(_convert_page_range_task, pdf_path, page_range, do_ocr): (pdf_path, page_range)
+                       for pdf_path, page_range, do_ocr in tasks}
+            for future in as_completed(futures):
+                pdf_path, page_range = futures[future]
+                if pdf_path in results:
+                    continue
+                try:
+                    finish(*future.result())
+                except Exception as e:
+                    fail(pdf_path, page_range, f"{type(e).__name__}: {e}")
+
+    for pdf_path in plans:
+        if not plans[pdf_path] and pdf_path not in results:
+            results[pdf_path] = {"pdf": pdf_path, "success": False, "error": "PDF has no pages"}
+
+    return [results[pdf_path] for pdf_path in pdf_paths]
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -136,6 +662,46 @@ def main():
         default="Issuer_Reports",
         help="Base output directory (default: Issuer_Reports)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes, each holding one converter (default: CPU count; 1 = serial)"
+    )
+    parser.add_argument(
+        "--ocr",
+        choices=OCR_MODES,
+        default="auto",
+        help="auto: OCR only scanned/mixed pages (default); all: OCR every page; none: text layer only"
+    )
+    parser.add_argument(
+        "--full-document",
+        action="store_true",
+        help="Convert every page (default: only pages located as financial statements, "
+             "reconciliations, liquidity and debt notes, plus neighbours)"
+    )
+    parser.add_argument(
+        "--neighbours",
+        type=int,
+        default=DEFAULT_NEIGHBOURS,
+        help=f"Pages kept on each side of a located page (default: {DEFAULT_NEIGHBOURS})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Convert even if an unchanged PDF was already converted with the same options"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Conversion cache directory (default: .cache/phase1_markdown in the repo root)"
+    )
+    parser.add_argument(
+        "--chunk-pages",
+        type=int,
+        default=DEFAULT_CHUNK_PAGES,
+        help=f"Pages per conversion task (default: {DEFAULT_CHUNK_PAGES})"
+    )
 
     args = parser.parse_args()
 
@@ -160,15 +726,21 @@ def main():
             print(f"  - {f}")
         sys.exit(1)
 
-    # Convert each PDF
-    results = []
-    total_start = time.time()
-
-    for i, pdf_file in enumerate(args.pdf_files, 1):
-        print(f"\nProcessing file {i}/{len(args.pdf_files)}")
-        result = convert_pdf_docling(pdf_file, markdown_output, args.issuer_name)
-        results.append(result)
+    try:
+        import docling  # noqa: F401
+    except ImportError:
+        print(f"ERROR: {DOCLING_INSTALL_HINT}")
+        sys.exit(1)
 
+    # Convert all PDFs: page ranges of every file share one worker pool
+    total_start = time.time()
+    page_locator = None
+    if not args.full_document:
+        page_locator = functools.partial(locate_pdf_pages, neighbours=args.neighbours)
+    results = convert_pdfs_parallel(args.pdf_files, markdown_output, args.issuer_name,
+                                    workers=args.workers, chunk_pages=args.chunk_pages, ocr=args.ocr,
+                                    page_locator=page_locator,
+                                    cache=None if args.no_cache else ConversionCache(args.cache_dir))
     total_time = time.time() - total_start
 
     # Summary
@@ -178,9 +750,29 @@ def main():
     print(f"Files processed: {len(results)}")
     print(f"Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
     print(f"Average time per PDF: {total_time/len(results):.1f} seconds")
+    converted = [r for r in results if r["success"]]
+    if converted:
+        page_seconds = sum(r["page_seconds"] for r in converted)
+        converted_pages = sum(r["converted_pages"] for r in converted)
+        total_pages = sum(r["pages"] for r in converted)
+        print(f"Pages converted: {converted_pages} of {total_pages}")
+        cache_hits = sum(r["cache_hit"] for r in converted)
+        if cache_hits:
+            print(f"Conversion cache: {cache_hits} of {len(converted)} PDF(s) reused unchanged markdown")
+        print(f"Conversion work: {page_seconds:.1f} seconds across workers "
+              f"({page_seconds / max(total_time, 1e-9):.1f}x parallel speedup)")
+        if args.ocr == 'auto':
+            skipped = sum(r["ocr"]["ocr_skipped_pages"] for r in converted)
+            saved = sum(r["ocr"]["estimated_seconds_saved"] for r in converted)
+            print(f"Selective OCR: skipped OCR on {skipped} of {converted_pages} page(s) "
+                  f"(~{saved:.0f} seconds saved)")
     print(f"\nOutput location: {markdown_output}/")
 
-    successful = sum(1 for r in results if r["success"])
+    for r in results:
+        if not r["success"]:
+            print(f"  ✗ {r['pdf']}: {r['error']}")
+
+    successful = len(converted)
     if successful == len(results):
         print(f"\n✓ All files converted successfully!")
         print(f"\nNext step: Run Phase 2 extraction")
@@ -5,18 +5,49 @@ Schema Validator for Phase 2 Extraction Output
 Validates that Phase 2 extracted JSON conforms to the required schema
 for Phase 3 calculations.
 
+compile_validator() compiles the same rules (and optionally the required
+fields and types of phase2_extraction_schema_v2.json) into closures once,
+for validating many files. Given directories or glob patterns, the script
+validates every extraction in a process pool and writes a JSON report.
+
 Usage:
     python scripts/validate_extraction_schema.py <path_to_extracted_json>
+    python scripts/validate_extraction_schema.py <directory|glob>... [--schema [PATH]] [--workers N] [--report PATH]
 
 Example:
     python scripts/validate_extraction_schema.py Issuer_Reports/Artis_REIT/temp/phase2_extracted_data.json
+    python scripts/validate_extraction_schema.py Issuer_Reports/ --schema --report qa_report.json
 """
 
 import json
+import os
+import re
 import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
+# Required fields Phase 3 reads, checked by validate_schema() and compile_validator()
+REQUIRED_TOP_LEVEL_FIELDS = [
+    ('issuer_name', str),
+    ('reporting_date', str),
+    ('currency', str),
+]
+REQUIRED_NUMERIC_FIELDS = [
+    'balance_sheet.total_assets',
+    'balance_sheet.mortgages_noncurrent',
+    'balance_sheet.mortgages_current',
+    'balance_sheet.credit_facilities',
+    'balance_sheet.cash',
+    'income_statement.noi',
+    'income_statement.interest_expense',
+    'income_statement.revenue',
+    'ffo_affo.ffo',
+    'ffo_affo.affo',
+    'ffo_affo.ffo_per_unit',
+    'ffo_affo.affo_per_unit',
+    'ffo_affo.distributions_per_unit',
+]
+
 
 def validate_required_field(data: Dict, field_path: str) -> Tuple[bool, str]:
     """
@@ -88,13 +119,7 @@ def validate_schema(data: Dict) -> Tuple[bool, List[str]]:
     errors = []
 
     # Required top-level fields
-    required_top_level = [
-        ('issuer_name', str),
-        ('reporting_date', str),
-        ('currency', str)
-    ]
-
-    for field, expected_type in required_top_level:
+    for field, expected_type in REQUIRED_TOP_LEVEL_FIELDS:
         valid, error = validate_required_field(data, field)
         if not valid:
             errors.append(f"❌ {error}")
@@ -103,16 +128,8 @@ def validate_schema(data: Dict) -> Tuple[bool, List[str]]:
             if not valid:
                 errors.append(f"❌ {error}")
 
-    # Balance sheet required fields
-    balance_sheet_fields = [
-        ('balance_sheet.total_assets', (int, float)),
-        ('balance_sheet.mortgages_noncurrent', (int, float)),
-        ('balance_sheet.mortgages_current', (int, float)),
-        ('balance_sheet.credit_facilities', (int, float)),
-        ('balance_sheet.cash', (int, float))
-    ]
-
-    for field, expected_type in balance_sheet_fields:
+    # Balance sheet, income statement and FFO/AFFO required fields
+    for field in REQUIRED_NUMERIC_FIELDS:
         valid, error = validate_required_field(data, field)
         if not valid:
             errors.append(f"❌ {error}")
@@ -125,46 +142,6 @@ def validate_schema(data: Dict) -> Tuple[bool, List[str]]:
             if not isinstance(value, (int, float)):
                 errors.append(f"❌ Field '{field}' must be numeric, got {type(value).__name__}")
 
-    # Income statement required fields
-    income_fields = [
-        ('income_statement.noi', (int, float)),
-        ('income_statement.interest_expense', (int, float)),
-        ('income_statement.revenue', (int, float))
-    ]
-
-    for field, expected_type in income_fields:
-        valid, error = validate_required_field(data, field)
-        if not valid:
-            errors.append(f"❌ {error}")
-        else:
-            keys = field.split('.')
-            value = data
-            for key in keys:
-                value = value[key]
-            if not isinstance(value, (int, float)):
-                errors.append(f"❌ Field '{field}' must be numeric, got {type(value).__name__}")
-
-    # FFO/AFFO required fields
-    ffo_fields = [
-        ('ffo_affo.ffo', (int, float)),
-        ('ffo_affo.affo', (int, float)),
-        ('ffo_affo.ffo_per_unit', (int, float)),
-        ('ffo_affo.affo_per_unit', (int, float)),
-        ('ffo_affo.distributions_per_unit', (int, float))
-    ]
-
-    for field, expected_type in ffo_fields:
-        valid, error = validate_required_field(data, field)
-        if not valid:
-            errors.append(f"❌ {error}")
-        else:
-            keys = field.split('.')
-            value = data
-            for key in keys:
-                value = value[key]
-            if not isinstance(value, (int, float)):
-                errors.append(f"❌ Field '{field}' must be numeric, got {type(value).__name__}")
-
     # Portfolio fields (optional, but must be correct type if present)
     if 'portfolio' in data:
         portfolio = data['portfolio']
@@ -199,14 +176,462 @@ def validate_schema(data: Dict) -> Tuple[bool, List[str]]:
     return is_valid, errors
 
 
+DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent / '.claude' / 'knowledge' / 'phase2_extraction_schema_v2.json'
+
+# JSON schema type -> Python types (numbers accept bool, as the checks above do)
+_JSON_TYPES = {
+    'string': str,
+    'number': (int, float),
+    'integer': int,
+    'boolean': bool,
+    'object': dict,
+    'array': list,
+    'null': type(None),
+}
+
+_MISSING = object()
+
+
+def _required_accessor(field_path: str):
+    """
+    Closure returning (value, error) for a required dotted path
+
+    The keys are split and the error messages formatted once, at compile time.
+    """
+    keys = tuple(field_path.split('.'))
+    missing = f"❌ Missing required field: {field_path}"
+    not_dict = tuple(f"❌ Field '{'.'.join(keys[:i])}' is not a dictionary, cannot access '{key}'"
+                     for i, key in enumerate(keys))
+
+    if len(keys) == 1:
+        key = keys[0]
+
+        def access(data):
+            value = data.get(key, _MISSING)
+            return (value, None) if value is not _MISSING else (_MISSING, missing)
+        return access
+
+    if len(keys) == 2:
+        first, second = keys
+
+        def access(data):
+            parent = data.get(first, _MISSING)
+            if parent is _MISSING:
+                return _MISSING, missing
+            if not isinstance(parent, dict):
+                return _MISSING, not_dict[1]
+            value = parent.get(second, _MISSING)
+            return (value, None) if value is not _MISSING else (_MISSING, missing)
+        return access
+
+    def access(data):
+        current = data
+        for i, key in enumerate(keys):
+            if not isinstance(current, dict):
+                return _MISSING, not_dict[i]
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return _MISSING, missing
+        return current, None
+    return access
+
+
+def _optional_accessor(parent_path: Tuple[str, ...]):
+    """Closure returning the object at parent_path, or None if it is missing or not an object."""
+    def access(data):
+        current = data
+        for key in parent_path:
+            current = current.get(key) if isinstance(current, dict) else None
+        return current if isinstance(current, dict) else None
+    return access
+
+
+def _compile_required_field(field_path: str, expected_type):
+    access = _required_accessor(field_path)
+    if expected_type is str:
+        template = f"❌ Field '{field_path}' has type {{}}, expected str"
+    else:
+        template = f"❌ Field '{field_path}' must be numeric, got {{}}"
+
+    def check(data, errors):
+        value, error = access(data)
+        if error:
+            errors.append(error)
+        elif not isinstance(value, expected_type):
+            errors.append(template.format(type(value).__name__))
+    return check
+
+
+def _check_portfolio(data, errors):
+    portfolio = data.get('portfolio')
+    if portfolio is None:
+        return
+    occupancy = portfolio.get('occupancy_rate', _MISSING)
+    if occupancy is not _MISSING:
+        if not isinstance(occupancy, (int, float)):
+            errors.append("❌ Field 'portfolio.occupancy_rate' must be numeric")
+        elif occupancy > 1.0:
+            errors.append(f"⚠️  Warning: portfolio.occupancy_rate is {occupancy}, should be decimal (e.g., 0.878 for 87.8%)")
+    if 'total_gla_sf' in portfolio and portfolio['total_gla_sf'] is None:
+        errors.append("⚠️  Warning: portfolio.total_gla_sf is null, should be 0 if unknown")
+    if 'occupancy_including_commitments' in portfolio:
+        errors.append("⚠️  Warning: Use 'occupancy_with_commitments' instead of 'occupancy_including_commitments'")
+    if 'same_property_noi_growth' in portfolio and 'same_property_noi_growth_6m' not in portfolio:
+        errors.append("⚠️  Warning: Use 'same_property_noi_growth_6m' instead of 'same_property_noi_growth'")
+
+
+def _check_validation_block(data, errors):
+    validation = data.get('validation')
+    if validation is not None and validation.get('balance_sheet_balanced', True) is False:
+        errors.append("⚠️  Warning: Balance sheet does not balance (assets != liabilities + equity)")
+
+
+def _compile_schema_rules(schema: Dict, covered: set) -> List:
+    """
+    Required-field and type checks for every property of a JSON schema
+
+    A property is checked only when its parent object is present; paths
+    the business rules already check are skipped. Array items are not
+    descended into.
+    """
+    checks = []
+
+    def walk(spec: Dict, parent: Tuple[str, ...]):
+        access_parent = _optional_accessor(parent)
+        required = set(spec.get('required', []))
+        for name, prop in spec.get('properties', {}).items():
+            path = '.'.join(parent + (name,))
+            if path not in covered:
+                types = prop.get('type')
+                types = [types] if isinstance(types, str) else list(types or [])
+                python_types = []
+                for json_type in types:
+                    mapped = _JSON_TYPES.get(json_type, object)
+                    python_types.extend(mapped if isinstance(mapped, tuple) else [mapped])
+                checks.append(_schema_check(access_parent, name, path, name in required, tuple(python_types),
+                                            '|'.join(types)))
+            if prop.get('type') == 'object' or 'properties' in prop:
+                walk(prop, parent + (name,))
+
+    walk(schema, ())
+    return checks
+
+
+def _schema_check(access_parent, name: str, path: str, required: bool, python_types: Tuple, type_label: str):
+    missing = f"❌ Missing required field: {path}"
+    template = f"❌ Field '{path}' has type {{}}, expected {type_label}"
+
+    def check(data, errors):
+        parent = access_parent(data)
+        if parent is None:
+            return
+        value = parent.get(name, _MISSING)
+        if value is _MISSING:
+            if required:
+                errors.append(missing)
+        elif python_types and not isinstance(value, python_types):
+            errors.append(template.format(type(value).__name__))
+    return check
+
+
+class CompiledValidator:
+    """
+    validate_schema() rules (plus optional JSON schema rules) compiled to closures
+
+    Calling it returns the same (is_valid, errors) as validate_schema(), in
+    the same order, with schema rule errors after the business rule errors.
+    Documents whose shape the closures do not cover (not an object, or a
+    portfolio/validation block that is not an object) go through
+    validate_schema() itself.
+    """
+
+    def __init__(self, checks: List, schema_rules: int = 0):
+        self.checks = checks
+        self.schema_rules = schema_rules
+
+    def __call__(self, data) -> Tuple[bool, List[str]]:
+        if (not isinstance(data, dict)
+                or not isinstance(data.get('portfolio', {}), dict)
+                or not isinstance(data.get('validation', {}), dict)):
+            return validate_schema(data)
+        errors = []
+        for check in self.checks:
+            check(data, errors)
+        return not any(error.startswith('❌') for error in errors), errors
+
+
+def compile_validator(schema: Dict = None) -> CompiledValidator:
+    """
+    Compile the Phase 2 validation rules once
+
+    Args:
+        schema: Optional JSON schema (e.g. phase2_extraction_schema_v2.json);
+            its required fields and property types are checked as well
+
+    Returns:
+        CompiledValidator: Callable data -> (is_valid, errors)
+    """
+    checks = [_compile_required_field(field, expected_type) for field, expected_type in REQUIRED_TOP_LEVEL_FIELDS]
+    checks += [_compile_required_field(field, (int, float)) for field in REQUIRED_NUMERIC_FIELDS]
+    checks += [_check_portfolio, _check_validation_block]
+
+    schema_checks = []
+    if schema:
+        covered = {field for field, _ in REQUIRED_TOP_LEVEL_FIELDS} | set(REQUIRED_NUMERIC_FIELDS)
+        covered.add('portfolio.occupancy_rate')
+        schema_checks = _compile_schema_rules(schema, covered)
+    return CompiledValidator(checks + schema_checks, schema_rules=len(schema_checks))
+
+
+# Error messages that name a field, and how to recover its dotted path
+_ERROR_PATH_PATTERNS = [
+    re.compile(r"Missing required field: (?P<path>[\w.]+)"),
+    re.compile(r"Field '(?P<path>[\w.]+)' is not a dictionary, cannot access '(?P<key>\w+)'"),
+    re.compile(r"Field '(?P<path>[\w.]+)' (?:has type|must be)"),
+]
+
+
+def error_paths(errors: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Dotted paths of the fields behind validate_schema() errors
+
+    Only blocking (❌) errors are considered; warnings never fail validation.
+
+    Args:
+        errors: Error list from validate_schema()
+
+    Returns:
+        Tuple of (paths in error order without duplicates, blocking errors
+        that name no field, e.g. "Invalid JSON")
+    """
+    paths, unmapped = [], []
+    for error in errors:
+        if not error.startswith('❌') and not error.startswith('Invalid JSON'):
+            continue
+        for pattern in _ERROR_PATH_PATTERNS:
+            match = pattern.search(error)
+            if match:
+                path = match.group('path')
+                if 'key' in pattern.groupindex:
+                    path = f"{path}.{match.group('key')}"
+                if path not in paths:
+                    paths.append(path)
+                break
+        else:
+            unmapped.append(error)
+    return paths, unmapped
+
+
+EXTRACTION_FILENAME = 'phase2_extracted_data.json'
+MAX_LISTED_FAILURES = 20
+
+_bulk_validator = None
+
+
+def discover_extractions(sources: List[str]) -> List[str]:
+    """
+    Extraction files for bulk validation
+
+    Args:
+        sources: Files, directories (searched recursively for
+            phase2_extracted_data.json) or glob patterns
+
+    Returns:
+        list: Sorted file paths without duplicates
+    """
+    import glob
+
+    paths = set()
+    for source in sources:
+        source_path = Path(source)
+        if source_path.is_dir():
+            paths.update(str(p) for p in source_path.rglob(EXTRACTION_FILENAME))
+        elif source_path.is_file():
+            paths.add(str(source_path))
+        else:
+            paths.update(p for p in glob.glob(source, recursive=True) if Path(p).is_file())
+    return sorted(paths)
+
+
+def _init_bulk_worker(schema):
+    """Process pool initializer: compile the rules once per worker"""
+    global _bulk_validator
+    _bulk_validator = compile_validator(schema)
+
+
+def validate_file(path: str) -> Dict:
+    """
+    Validate one extraction file with the worker's compiled validator
+
+    Returns:
+        dict: path, issuer, status ('valid', 'invalid' or 'unreadable'),
+            errors (blocking), warnings and micros (validation time)
+    """
+    import time
+
+    result = {'path': path, 'issuer': None, 'status': 'unreadable', 'errors': [], 'warnings': [], 'micros': None}
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        result['errors'] = [f"Invalid JSON: {e}" if isinstance(e, json.JSONDecodeError) else f"Unreadable: {e}"]
+        return result
+
+    start = time.perf_counter()
+    try:
+        is_valid, errors = _bulk_validator(data)
+    except Exception as e:
+        result['errors'] = [f"❌ Validator error: {type(e).__name__}: {e}"]
+        result['status'] = 'invalid'
+        return result
+    result['micros'] = round((time.perf_counter() - start) * 1e6, 1)
+
+    if isinstance(data, dict) and isinstance(data.get('issuer_name'), str):
+        result['issuer'] = data['issuer_name']
+    result['status'] = 'valid' if is_valid else 'invalid'
+    result['errors'] = [e for e in errors if e.startswith('❌')]
+    result['warnings'] = [e for e in errors if not e.startswith('❌')]
+    return result
+
+
+def validate_many(paths: List[str], schema: Dict = None, workers: int = None) -> List[Dict]:
+    """
+    Validate many extraction files, compiling the rules once per process
+
+    Args:
+        paths: Extraction files
+        schema: Optional JSON schema compiled into the rules
+        workers: Process pool size (default: CPU count); 1 validates in-process
+
+    Returns:
+        list: validate_file() results in path order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if workers == 1 or len(paths) <= 1:
+        _init_bulk_worker(schema)
+        return [validate_file(path) for path in paths]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_bulk_worker, initargs=(schema,)) as executor:
+        return list(executor.map(validate_file, paths, chunksize=chunksize))
+
+
+def summarize_validation(results: List[Dict], wall_seconds: float, schema_path: str = None) -> Dict:
+    """
+    Machine-readable bulk validation report
+
+    Args:
+        results: validate_many() results
+        wall_seconds: Elapsed wall-clock time
+        schema_path: Schema compiled into the rules (None: business rules only)
+
+    Returns:
+        dict: counts, timing, failing field paths by frequency, failures
+            and per-file results
+    """
+    from collections import Counter
+    from datetime import datetime
+
+    field_counts = Counter()
+    for result in results:
+        paths, _ = error_paths(result['errors'])
+        field_counts.update(paths)
+    micros = [r['micros'] for r in results if r['micros'] is not None]
+
+    return {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'schema': schema_path,
+        'total': len(results),
+        'valid': sum(1 for r in results if r['status'] == 'valid'),
+        'invalid': sum(1 for r in results if r['status'] == 'invalid'),
+        'unreadable': sum(1 for r in results if r['status'] == 'unreadable'),
+        'timing': {
+            'wall_seconds': round(wall_seconds, 3),
+            'mean_validate_micros': round(sum(micros) / len(micros), 1) if micros else 0,
+            'max_validate_micros': max(micros) if micros else 0,
+        },
+        'failing_fields': dict(field_counts.most_common()),
+        'failures': [{'path': r['path'], 'issuer': r['issuer'], 'errors': r['errors']}
+                     for r in results if r['status'] != 'valid'],
+        'results': results,
+    }
+
+
+def run_bulk(sources: List[str], schema_path: str = None, workers: int = None, report_path: str = None) -> int:
+    """Validate every extraction under the sources and write the report. Returns exit code."""
+    import time
+
+    paths = discover_extractions(sources)
+    print(f"📋 Validating {len(paths)} extraction(s) (workers: {workers or 'auto'})")
+    if not paths:
+        print(f"❌ Error: No extraction files found for: {' '.join(sources)}")
+        return 1
+
+    schema = None
+    if schema_path:
+        if not Path(schema_path).exists():
+            print(f"❌ Error: Schema not found: {schema_path}")
+            return 1
+        with open(schema_path, 'r') as f:
+            schema = json.load(f)
+        print(f"   Schema rules: {schema_path}")
+
+    start = time.perf_counter()
+    results = validate_many(paths, schema, workers)
+    summary = summarize_validation(results, time.perf_counter() - start, schema_path)
+
+    if report_path == '-':
+        print(json.dumps(summary, indent=2))
+    elif report_path:
+        Path(report_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+    for failure in summary['failures'][:MAX_LISTED_FAILURES]:
+        print(f"  ✗ {failure['path']}: {len(failure['errors'])} error(s) - {failure['errors'][0]}")
+    if len(summary['failures']) > MAX_LISTED_FAILURES:
+        print(f"  ... and {len(summary['failures']) - MAX_LISTED_FAILURES} more (see --report)")
+    print("\n" + "=" * 70)
+    print(f"Valid: {summary['valid']}/{summary['total']}   Invalid: {summary['invalid']}   "
+          f"Unreadable: {summary['unreadable']}")
+    print(f"⏱️  {summary['timing']['wall_seconds']:.2f}s wall clock, "
+          f"{summary['timing']['mean_validate_micros']:.0f} µs mean per file")
+    if summary['failing_fields']:
+        top = list(summary['failing_fields'].items())[:10]
+        print("Most frequent failing fields: " + ", ".join(f"{path} ({count})" for path, count in top))
+    if report_path and report_path != '-':
+        print(f"💾 Report: {report_path}")
+    return 0 if summary['valid'] == summary['total'] else 1
+
+
 def main():
+    import argparse
+
     if len(sys.argv) < 2:
         print("Usage: python validate_extraction_schema.py <path_to_json>")
+        print("       python validate_extraction_schema.py <directory|glob>... [--workers N] [--report PATH]")
         print("\nExample:")
         print("  python scripts/validate_extraction_schema.py Issuer_Reports/Artis_REIT/temp/phase2_extracted_data.json")
+        print("  python scripts/validate_extraction_schema.py Issuer_Reports/ --report qa_report.json")
         sys.exit(1)
 
-    input_path = Path(sys.argv[1])
+    parser = argparse.ArgumentParser(description='Validate Phase 2 extraction output (one file, or in bulk)')
+    parser.add_argument('sources', nargs='+',
+                        help='Extraction JSON file, or directories / glob patterns for bulk validation')
+    parser.add_argument('--workers', type=int, default=None, help='Bulk: process pool size (default: CPU count)')
+    parser.add_argument('--report', default=None, help='Bulk: write the JSON report here ("-" for stdout)')
+    parser.add_argument('--schema', nargs='?', const=str(DEFAULT_SCHEMA_PATH), default=None,
+                        help='Bulk: also check the JSON schema\'s required fields and types '
+                             '(default path: .claude/knowledge/phase2_extraction_schema_v2.json)')
+    args = parser.parse_args()
+
+    source = args.sources[0]
+    if len(args.sources) > 1 or Path(source).is_dir() or any(c in source for c in '*?[') or args.report or args.schema:
+        sys.exit(run_bulk(args.sources, args.schema, args.workers, args.report))
+
+    input_path = Path(args.sources[0])
 
     if not input_path.exists():
         print(f"❌ Error: File not found: {input_path}")
@@ -222,7 +647,7 @@ def main():
         print(f"❌ Error: Invalid JSON: {e}")
         sys.exit(1)
 
-    is_valid, errors = validate_schema(data)
+    is_valid, errors = compile_validator()(data)
 
     if is_valid:
         print("\n✅ Schema validation PASSED")
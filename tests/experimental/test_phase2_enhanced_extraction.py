@@ -14,10 +14,10 @@ import json
 import tempfile
 from pathlib import Path
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+# Add experimental scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts' / 'archive' / 'experimental'))
 
-from extraction_indexer import ExtractionIndexer, SectionLocation
+from extraction_indexer import SCAN_SUFFIX, ExtractionIndexer, SectionLocation, scan_markdown
 from section_extractor import SectionValidator, SectionExtractor, ExtractionResult
 
 
@@ -186,6 +186,109 @@ class TestExtractionIndexer:
             assert checkpoint_dir.exists()
 
 
+@pytest.fixture
+def synthetic_markdown_files(tmp_path):
+    """Statements and MD&A markdown with known marker lines and boundaries"""
+    statements = ["# Interim Financial Statements", ""]
+    statements += [f"Note {n}: accounting policies" for n in range(1, 11)]          # lines 3-12
+    statements += ["## Consolidated Balance Sheets", ""]                             # line 13
+    statements += [f"| Asset line {n} | {n * 1000} |" for n in range(1, 31)]       # lines 15-44
+    statements += ["## Consolidated Statements of Operations and Comprehensive Income"]  # line 45
+    statements += [f"| Income line {n} | {n * 10} |" for n in range(1, 40)]
+    statements += ["<!-- Page 9 -->", "Consolidated Statement of Cash Flows"]
+    statements += [f"Cash flow line {n}" for n in range(1, 200)]
+
+    mda = ["# MD&A", "Liquidity is discussed in section 7"]
+    mda += [f"Commentary {n}" for n in range(1, 30)]
+    mda += ["## FFO and AFFO", "Funds from Operations (FFO) reconciliation"]
+    mda += [f"FFO line {n}" for n in range(1, 25)]
+    mda += ["---", "Weighted-average units outstanding, diluted"]
+
+    paths = []
+    for name, lines in (('statements.md', statements), ('mda.md', mda)):
+        path = tmp_path / name
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+class TestSectionScanner:
+    """Single-pass, memory-mapped section scan (no grep subprocesses)"""
+
+    def test_scan_matches_grep_first_line_per_marker(self, synthetic_markdown_files):
+        """First matching line per marker, case-insensitive, with byte offsets"""
+        statements = synthetic_markdown_files[0]
+        scan = scan_markdown(statements, ExtractionIndexer.SECTION_MARKERS)
+        data = statements.read_bytes()
+
+        lines = statements.read_text().splitlines()
+        assert scan['lines'] == len(lines)
+        balance_sheet = scan['matches']['balance_sheet']
+        assert balance_sheet['0'][0] == 13 and '2' in balance_sheet   # 'Balance Sheet' on the same line
+        assert scan['matches']['income_statement']['0'][0] == 45
+        assert scan['matches']['cash_flow']['1'][0] == lines.index('Consolidated Statement of Cash Flows') + 1
+        for matches in scan['matches'].values():
+            for line, offset in matches.values():
+                assert data[offset:].split(b'\n', 1)[0].decode() == lines[line - 1]
+
+    def test_index_does_not_spawn_processes(self, synthetic_markdown_files, monkeypatch):
+        """Indexing never calls subprocess"""
+        import subprocess
+
+        def forbidden(*args, **kwargs):
+            raise AssertionError('subprocess called')
+
+        monkeypatch.setattr(subprocess, 'run', forbidden)
+        monkeypatch.setattr(subprocess, 'Popen', forbidden)
+        index = ExtractionIndexer(synthetic_markdown_files).create_index()
+
+        assert index['balance_sheet'].start_line == 13
+        assert index['balance_sheet'].end_line == 43       # two lines before the next '##' header
+        assert index['cash_flow'].end_line == index['cash_flow'].start_line + 150
+        assert index['ffo_affo'].file == synthetic_markdown_files[1]
+        assert index['liquidity'].start_line == 2
+        assert 'portfolio' not in index
+
+    def test_read_section_serves_byte_ranges(self, synthetic_markdown_files):
+        """Byte-range reads equal the line slices the previous reader returned"""
+        indexer = ExtractionIndexer(synthetic_markdown_files)
+        indexer.create_index()
+
+        for location in indexer.index.values():
+            lines = location.file.read_text(encoding='utf-8').splitlines(keepends=True)
+            for expand_by in (0, 5, 500):
+                expected = ''.join(lines[location.start_line - 1:location.end_line + expand_by])
+                assert indexer.read_section(location, expand_by) == expected
+            # Locations without offsets (older saved indexes) are read by line number
+            legacy = SectionLocation(location.file, location.start_line, location.end_line,
+                                     location.section_name, location.estimated_tokens)
+            assert indexer.read_section(legacy) == indexer.read_section(location)
+
+    def test_scan_persisted_next_to_markdown(self, synthetic_markdown_files):
+        """A second indexer reuses the stored scan; edits invalidate it"""
+        statements = synthetic_markdown_files[0]
+        ExtractionIndexer(synthetic_markdown_files).create_index()
+        sidecar = statements.with_name(statements.name + SCAN_SUFFIX)
+        assert sidecar.exists()
+
+        stored = json.loads(sidecar.read_text())
+        stored['matches']['balance_sheet']['0'] = [14, stored['matches']['balance_sheet']['0'][1]]
+        sidecar.write_text(json.dumps(stored))
+        assert ExtractionIndexer(synthetic_markdown_files).create_index()['balance_sheet'].start_line == 14
+
+        statements.write_text("Preface\n" + statements.read_text())
+        assert ExtractionIndexer(synthetic_markdown_files).create_index()['balance_sheet'].start_line == 14
+        assert json.loads(sidecar.read_text())['matches']['balance_sheet']['0'][0] == 14
+
+    def test_saved_index_keeps_offsets(self, synthetic_markdown_files, tmp_path):
+        indexer = ExtractionIndexer(synthetic_markdown_files)
+        indexer.create_index(save_to=tmp_path / 'index.json')
+        loaded = ExtractionIndexer.load_index(tmp_path / 'index.json', synthetic_markdown_files)
+
+        assert loaded.index['ffo_affo'].start_offset == indexer.index['ffo_affo'].start_offset
+        assert loaded.read_section(loaded.index['ffo_affo']) == indexer.read_section(indexer.index['ffo_affo'])
+
+
 # ============================================================================
 # SECTION VALIDATOR TESTS
 # ============================================================================
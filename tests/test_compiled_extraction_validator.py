@@ -0,0 +1,164 @@
+"""
+Tests for the compiled Phase 2 validator and bulk validation
+(compile_validator() and run_bulk() in scripts/validate_extraction_schema.py)
+"""
+
+import copy
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from validate_extraction_schema import (
+    compile_validator,
+    discover_extractions,
+    summarize_validation,
+    validate_many,
+    validate_schema,
+)
+from test_phase2_field_retry import valid_extraction
+
+SCRIPT = Path(__file__).parent.parent / 'scripts' / 'validate_extraction_schema.py'
+
+SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'issuer_name': {'type': 'string'},
+        'balance_sheet': {
+            'type': 'object',
+            'properties': {'total_assets': {'type': 'number'}, 'investment_properties': {'type': 'number'}},
+            'required': ['total_assets', 'investment_properties'],
+        },
+        'portfolio': {
+            'type': 'object',
+            'properties': {'property_count': {'type': 'integer'}, 'occupancy_rate': {'type': 'number'}},
+        },
+        'notes': {'type': ['string', 'null']},
+    },
+    'required': ['issuer_name', 'balance_sheet'],
+}
+
+
+def _mutations(count, seed=7):
+    """Extractions with sections and fields removed, retyped or replaced"""
+    rnd = random.Random(seed)
+    values = [None, 'x', 1, 2.5, True, False, [1], {}, {'a': 1}, 0.9, 87.8]
+    sections = ['issuer_name', 'reporting_date', 'currency', 'balance_sheet', 'income_statement', 'ffo_affo',
+                'portfolio', 'validation']
+    extra_keys = ['occupancy_rate', 'total_gla_sf', 'occupancy_including_commitments', 'same_property_noi_growth',
+                  'same_property_noi_growth_6m', 'balance_sheet_balanced']
+    for _ in range(count):
+        data = copy.deepcopy(valid_extraction())
+        for _ in range(rnd.randint(1, 4)):
+            section = rnd.choice(sections)
+            roll = rnd.random()
+            if roll < 0.2:
+                data.pop(section, None)
+            elif roll < 0.35:
+                data[section] = rnd.choice(values)
+            else:
+                target = data.setdefault(section, {}) if section in ('portfolio', 'validation') else data.get(section)
+                if isinstance(target, dict):
+                    key = rnd.choice(list(target) + extra_keys)
+                    if rnd.random() < 0.3:
+                        target.pop(key, None)
+                    else:
+                        target[key] = rnd.choice(values)
+        yield data
+
+
+def _outcome(validate, data):
+    try:
+        return validate(data)
+    except Exception as e:
+        return type(e)
+
+
+def test_compiled_rules_match_validate_schema():
+    """Same validity, errors and error order as validate_schema() on valid and damaged extractions"""
+    validator = compile_validator()
+    for data in [valid_extraction(), [], 'text'] + list(_mutations(3000)):
+        assert _outcome(validator, data) == _outcome(validate_schema, data), data
+
+
+def test_schema_rules_check_required_fields_and_types():
+    validator = compile_validator(SCHEMA)
+    assert validator.schema_rules == 5  # the business rules already cover the other paths
+
+    data = valid_extraction()
+    data['portfolio'] = {'property_count': 12.5}
+    data['notes'] = None
+    is_valid, errors = validator(data)
+
+    assert not is_valid
+    assert errors == ["❌ Missing required field: balance_sheet.investment_properties",
+                      "❌ Field 'portfolio.property_count' has type float, expected integer"]
+    assert validate_schema(data) == (True, [])
+
+    data['balance_sheet']['investment_properties'] = 2400000
+    data['portfolio']['property_count'] = 12
+    data['notes'] = 7
+    assert validator(data) == (False, ["❌ Field 'notes' has type int, expected string|null"])
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Three issuers' temp folders: valid, invalid and unreadable extractions"""
+    broken = valid_extraction()
+    del broken['balance_sheet']['cash']
+    broken['ffo_affo']['ffo'] = '16,956'
+    for name, content in [('Valid_REIT', json.dumps(valid_extraction())), ('Broken_REIT', json.dumps(broken)),
+                          ('Truncated_REIT', '{"issuer_name": ')]:
+        folder = tmp_path / 'Issuer_Reports' / name / 'temp'
+        folder.mkdir(parents=True)
+        (folder / 'phase2_extracted_data.json').write_text(content)
+        (folder / 'phase3_calculated_metrics.json').write_text('{}')
+    return tmp_path / 'Issuer_Reports'
+
+
+def test_discover_extractions(corpus):
+    assert [Path(p).parent.parent.name for p in discover_extractions([str(corpus)])] == \
+        ['Broken_REIT', 'Truncated_REIT', 'Valid_REIT']
+    assert len(discover_extractions([str(corpus / '*' / 'temp' / '*.json')])) == 6
+    temp = corpus / 'Valid_REIT' / 'temp'
+    assert discover_extractions([str(corpus / 'Valid_REIT'), str(temp / '*')]) == \
+        [str(temp / 'phase2_extracted_data.json'), str(temp / 'phase3_calculated_metrics.json')]
+
+
+def test_bulk_validation_report(corpus):
+    paths = discover_extractions([str(corpus)])
+    results = validate_many(paths, workers=2)
+
+    assert [r['status'] for r in results] == ['invalid', 'unreadable', 'valid']
+    assert results[0]['errors'] == ["❌ Missing required field: balance_sheet.cash",
+                                    "❌ Field 'ffo_affo.ffo' must be numeric, got str"]
+    assert results[1]['errors'][0].startswith('Invalid JSON')
+    in_process = validate_many(paths, workers=1)
+    assert [dict(r, micros=None) for r in results] == [dict(r, micros=None) for r in in_process]
+
+    report = summarize_validation(results, 0.5)
+    assert (report['total'], report['valid'], report['invalid'], report['unreadable']) == (3, 1, 1, 1)
+    assert report['failing_fields'] == {'balance_sheet.cash': 1, 'ffo_affo.ffo': 1}
+    assert [f['issuer'] for f in report['failures']] == ['Test REIT', None]
+
+
+def test_cli_bulk_mode_writes_report(corpus, tmp_path):
+    report_path = tmp_path / 'qa' / 'report.json'
+    result = subprocess.run([sys.executable, str(SCRIPT), str(corpus), '--workers', '2', '--report', str(report_path)],
+                            capture_output=True, text=True)
+
+    assert result.returncode == 1
+    assert 'Valid: 1/3' in result.stdout
+    report = json.loads(report_path.read_text())
+    assert report['invalid'] == 1 and report['schema'] is None
+
+    valid = corpus / 'Valid_REIT' / 'temp' / 'phase2_extracted_data.json'
+    result = subprocess.run([sys.executable, str(SCRIPT), str(valid)], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert 'Schema validation PASSED' in result.stdout
@@ -0,0 +1,207 @@
+"""
+Tests for batched DistributionCutPredictor inference
+
+predict_batch() scores all rows as one matrix; each result must equal what
+predict_single() returns for the same row. A linear model exposing LightGBM's
+sklearn interface (predict_proba + predict(pred_contrib=True)) keeps the
+contributions exact without training a booster; the real LightGBM and SHAP
+paths run when those packages are installed.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+joblib = pytest.importorskip('joblib')
+
+import predict_distribution_cut
+from predict_distribution_cut import DistributionCutPredictor
+
+
+FEATURES = ['affo_payout_ratio', 'interest_coverage', 'debt_to_assets', 'debt_to_ebitda',
+            'occupancy_rate', 'ffo_payout_ratio', 'market_risk_score', 'macro_policy_rate']
+
+
+class LinearContribModel:
+    """Logistic model with LightGBM-style native contributions (last column: bias)"""
+
+    classes_ = np.array([0, 1])
+    booster_ = None
+
+    def __init__(self, weights, bias):
+        self.weights = np.asarray(weights, dtype=float)
+        self.bias = bias
+        self.proba_calls = 0
+
+    def predict_proba(self, X):
+        self.proba_calls += 1
+        p = 1 / (1 + np.exp(-(np.asarray(X) @ self.weights + self.bias)))
+        return np.column_stack([1 - p, p])
+
+    def predict(self, X, pred_contrib=False):
+        if pred_contrib:
+            X = np.asarray(X, dtype=float)
+            return np.column_stack([X * self.weights, np.full(len(X), self.bias)])
+        return self.predict_proba(X).argmax(axis=1)
+
+
+def issuer_quarters(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'ticker': [f'R{i:03d}-UN.TO' for i in range(rows)],
+        'sector': rng.choice(['office', 'retail', 'industrial', 'residential'], rows),
+        'affo_payout_ratio': rng.uniform(60, 140, rows),
+        'interest_coverage': rng.uniform(0.8, 4, rows),
+        'debt_to_assets': rng.uniform(30, 65, rows),
+        'debt_to_ebitda': rng.uniform(6, 14, rows),
+        'occupancy_rate': rng.uniform(0.8, 1, rows),
+        'ffo_payout_ratio': rng.uniform(50, 120, rows),
+        'macro_policy_rate': rng.uniform(0.25, 5, rows),
+        'notes': 'ignored',
+    })
+    # Sparse inputs: missing values score as 0, as in predict_single()
+    df.loc[df.index % 7 == 0, 'debt_to_ebitda'] = np.nan
+    return df
+
+
+@pytest.fixture
+def predictor(tmp_path):
+    model_path = tmp_path / 'lightgbm_model_test.pkl'
+    joblib.dump(LinearContribModel([0.04, -0.9, 0.05, 0.12, -2.0, 0.01, 0.03, 0.3], -6.5), model_path)
+    return DistributionCutPredictor(str(model_path), feature_names=FEATURES)
+
+
+def _single(predictor, row):
+    features = {feat: (0 if pd.isna(row[feat]) else float(row[feat]))
+                for feat in FEATURES if feat in row}
+    return predictor.predict_single(
+        ticker=row['ticker'],
+        affo_payout=features.pop('affo_payout_ratio', 0),
+        interest_coverage=features.pop('interest_coverage', 0),
+        debt_to_assets=features.pop('debt_to_assets', 0),
+        debt_to_ebitda=features.pop('debt_to_ebitda', 0),
+        occupancy=features.pop('occupancy_rate', 0),
+        sector=row['sector'],
+        **features
+    )
+
+
+def test_batch_matches_per_row_predictions(predictor, tmp_path):
+    """Every batch result equals predict_single() on the same row"""
+    csv_path = tmp_path / 'reits.csv'
+    issuer_quarters(40).to_csv(csv_path, index=False)
+    df = pd.read_csv(csv_path)
+
+    batch = predictor.predict_batch(str(csv_path))
+
+    assert len(batch) == len(df)
+    for result, (_, row) in zip(batch, df.iterrows()):
+        single = _single(predictor, row)
+        assert result['cut_probability'] == pytest.approx(single['cut_probability'], abs=1e-12)
+        assert [d['feature'] for d in result['top_drivers']] == [d['feature'] for d in single['top_drivers']]
+        assert [d['shap_value'] for d in result['top_drivers']] == pytest.approx(
+            [d['shap_value'] for d in single['top_drivers']])
+        for key in ('ticker', 'prediction', 'risk_level', 'input_features'):
+            assert result[key] == single[key]
+
+
+def test_batch_scores_with_one_model_call(predictor):
+    """One predict_proba for the whole frame; DataFrames are accepted directly"""
+    results = predictor.predict_batch(issuer_quarters(300))
+
+    assert predictor.model.proba_calls == 1
+    assert len(results) == 300
+    assert {r['prediction'] for r in results} <= {'CUT', 'NO CUT'}
+    assert all(len(r['top_drivers']) == 5 for r in results)
+
+
+def test_missing_columns_score_as_zero(predictor):
+    """Feature columns absent from the input (market_risk_score) contribute nothing"""
+    results = predictor.predict_batch(issuer_quarters(5))
+
+    for result in results:
+        drivers = {d['feature']: d['shap_value'] for d in result['top_drivers']}
+        assert drivers.get('market_risk_score', 0) == 0
+
+
+def test_batch_is_fast_for_hundreds_of_rows(predictor):
+    """A few hundred issuer-quarters score in well under a second"""
+    df = issuer_quarters(500)
+
+    start = time.perf_counter()
+    predictor.predict_batch(df)
+
+    assert time.perf_counter() - start < 1.0
+
+
+def test_explainer_is_created_once(tmp_path, monkeypatch):
+    """Models without native contributions reuse one TreeExplainer across calls"""
+    shap = pytest.importorskip('shap')
+    from sklearn.ensemble import GradientBoostingClassifier
+
+    df = issuer_quarters(60)
+    X = df.reindex(columns=FEATURES).fillna(0)
+    model = GradientBoostingClassifier(n_estimators=20, random_state=0).fit(X, (df['affo_payout_ratio'] > 100))
+    model_path = tmp_path / 'gbm.pkl'
+    joblib.dump(model, model_path)
+
+    created = []
+    real_explainer = shap.TreeExplainer
+    monkeypatch.setattr(predict_distribution_cut.shap, 'TreeExplainer',
+                        lambda m: created.append(m) or real_explainer(m))
+    predictor = DistributionCutPredictor(str(model_path), feature_names=FEATURES)
+
+    batch = predictor.predict_batch(df)
+    single = _single(predictor, df.iloc[3])
+
+    assert len(created) == 1
+    assert batch[3]['top_drivers'] == single['top_drivers']
+
+
+def test_lightgbm_native_contributions_match_shap(tmp_path):
+    """pred_contrib output equals TreeExplainer values for a trained booster"""
+    lightgbm = pytest.importorskip('lightgbm')
+    shap = pytest.importorskip('shap')
+
+    df = issuer_quarters(200)
+    X = df.reindex(columns=FEATURES).fillna(0)
+    model = lightgbm.LGBMClassifier(n_estimators=30, verbose=-1).fit(X, (df['affo_payout_ratio'] > 100).astype(int))
+    model_path = tmp_path / 'lightgbm_model_test.pkl'
+    joblib.dump(model, model_path)
+    predictor = DistributionCutPredictor(str(model_path), feature_names=FEATURES)
+
+    expected = shap.TreeExplainer(model).shap_values(X.to_numpy())
+    if isinstance(expected, list):
+        expected = expected[1]
+
+    np.testing.assert_allclose(predictor._shap_contributions(X.to_numpy()), expected, atol=1e-6)
+
+
+def test_artifact_sidecar_avoids_training_csv(tmp_path, monkeypatch):
+    """With a .model.json sidecar the predictor reads no CSV and loads the model lazily"""
+    from model_artifact import describe_estimator, metadata_path_for, write_metadata
+
+    model_path = tmp_path / 'lightgbm_model_test.pkl'
+    joblib.dump(LinearContribModel([0.04, -0.9, 0.05, 0.12, -2.0, 0.01, 0.03, 0.3], -6.5), model_path)
+    write_metadata(describe_estimator(model_path, FEATURES), metadata_path_for(model_path))
+
+    def no_csv(*args, **kwargs):
+        raise AssertionError('training CSV read at startup')
+
+    monkeypatch.setattr(pd, 'read_csv', no_csv)
+    predictor = DistributionCutPredictor(str(model_path))
+
+    assert predictor.feature_names == FEATURES
+    assert not predictor.artifact.is_loaded
+
+    results = predictor.predict_batch(issuer_quarters(10))
+
+    assert predictor.artifact.is_loaded
+    assert len(results) == 10
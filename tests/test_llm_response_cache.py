@@ -0,0 +1,152 @@
+"""
+Tests for the LLM response cache (scripts/llm_response_cache.py)
+
+The end-to-end test drives extract_key_metrics_efficient.main() through a
+miss, the validated extraction being cached, and a replay for the same
+inputs written to a different output directory.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from llm_response_cache import (
+    LOOKUP_LOG,
+    ResponseCache,
+    key_material,
+    main,
+    pending_key_path,
+    prompt_digest,
+    response_key,
+)
+from test_phase2_field_retry import STATEMENTS, valid_extraction
+
+
+@pytest.fixture
+def statements(tmp_path):
+    path = tmp_path / 'statements.md'
+    path.write_text(STATEMENTS)
+    return path
+
+
+def test_key_covers_inputs_schema_prompt_and_model(statements, tmp_path):
+    """Paths do not matter; content, schema, prompt and model do"""
+    schema = tmp_path / 'schema.json'
+    schema.write_text('{"version": 2}')
+    prompt = f"Read {statements} and write {tmp_path / 'out.json'}"
+    base = key_material([statements], schema, prompt_digest(prompt, [statements], tmp_path / 'out.json'), 'model-a')
+
+    moved = tmp_path / 'moved' / 'statements.md'
+    moved.parent.mkdir()
+    moved.write_text(STATEMENTS)
+    moved_prompt = f"Read {moved} and write {tmp_path / 'elsewhere.json'}"
+    assert response_key(key_material([moved], schema, prompt_digest(moved_prompt, [moved], tmp_path / 'elsewhere.json'),
+                                     'model-a')) == response_key(base)
+
+    assert response_key(dict(base, model='model-b')) != response_key(base)
+    assert response_key(dict(base, prompt=prompt_digest(prompt + '!', [statements], tmp_path / 'out.json'))) != \
+        response_key(base)
+    moved.write_text(STATEMENTS + '\nrestated')
+    assert key_material([moved], schema, base['prompt'], 'model-a')['inputs'] != base['inputs']
+    schema.write_text('{"version": 3}')
+    assert key_material([statements], schema, base['prompt'], 'model-a')['schema'] != base['schema']
+
+
+def test_get_put_and_hit_miss_report(tmp_path):
+    cache = ResponseCache(tmp_path / 'cache')
+    material = {'stage': 'phase2', 'model': 'model-a'}
+
+    assert cache.get('k1', label='Test REIT') is None
+    cache.put('k1', {'issuer_name': 'Test REIT'}, material, label='Test REIT')
+    assert cache.get('k1', label='Test REIT') == {'issuer_name': 'Test REIT'}
+    assert cache.get('k2', stage='phase4', label='Other REIT') is None
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    report = cache.report()
+    assert (report['lookups'], report['hits'], report['misses'], report['entries']) == (3, 1, 2, 1)
+    assert report['hit_rate'] == pytest.approx(1 / 3)
+    assert report['by_stage'] == {'phase2': {'hits': 1, 'misses': 1}, 'phase4': {'hits': 0, 'misses': 1}}
+    assert report['by_label']['Test REIT'] == {'hits': 1, 'misses': 1}
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    cache = ResponseCache(tmp_path / 'cache')
+    for n, key in enumerate(['old', 'used', 'new']):
+        cache.put(key, {'payload': 'x' * 1000}, {'stage': 'phase2'})
+        os.utime(cache.cache_dir / f'{key}.json', (time.time() - 100 + n, time.time() - 100 + n))
+    assert cache.get('used') is not None  # refreshes recency
+
+    total = sum(e['size_bytes'] for e in cache.entries())
+    assert cache.evict(max_bytes=total - 1) == 1
+    assert [e['key'] for e in cache.entries()] == ['new', 'used']
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(tmp_path / 'cache')
+    cache.cache_dir.mkdir()
+    (cache.cache_dir / 'k1.json').write_text('{"response":')
+    assert cache.get('k1') is None
+
+
+def _run_phase2(monkeypatch, args):
+    import extract_key_metrics_efficient
+
+    monkeypatch.setattr(sys, 'argv', ['extract_key_metrics_efficient.py'] + args)
+    with pytest.raises(SystemExit) as exit_info:
+        extract_key_metrics_efficient.main()
+    return exit_info.value.code
+
+
+def test_phase2_replays_validated_extraction(statements, tmp_path, monkeypatch, capsys):
+    """Miss -> validated extraction cached -> identical re-run replays it without a prompt"""
+    schema = Path(__file__).parent.parent / '.claude' / 'knowledge' / 'phase2_extraction_schema_v2.json'
+    if not schema.exists():
+        pytest.skip('Phase 2 schema not available')
+    cache_dir = tmp_path / 'cache'
+    first, second, third = (tmp_path / name / 'phase2_extracted_data.json' for name in ('first', 'second', 'third'))
+    for output in (first, second, third):
+        output.parent.mkdir()
+    args = [str(statements), '--issuer-name', 'Test REIT', '--cache-dir', str(cache_dir), '--model-id', 'model-a']
+
+    assert _run_phase2(monkeypatch, args + ['--output', str(first)]) == 0
+    assert (first.parent / 'phase2_extraction_prompt.txt').exists()
+    assert pending_key_path(first).exists()
+
+    first.write_text(json.dumps(valid_extraction()))  # the agent's extraction
+    assert _run_phase2(monkeypatch, args + ['--output', str(first)]) == 0
+    assert not pending_key_path(first).exists()
+    assert len(ResponseCache(cache_dir).entries()) == 1
+
+    capsys.readouterr()
+    assert _run_phase2(monkeypatch, args + ['--output', str(second)]) == 0
+    assert 'Cache hit' in capsys.readouterr().out
+    assert json.loads(second.read_text()) == valid_extraction()
+    assert not (second.parent / 'phase2_extraction_prompt.txt').exists()
+
+    assert _run_phase2(monkeypatch, args[:-1] + ['model-b', '--output', str(third)]) == 0
+    assert not third.exists()
+
+    report = ResponseCache(cache_dir).report()
+    assert (report['hits'], report['misses']) == (1, 2)
+
+
+def test_cli_report_and_prune(tmp_path, capsys):
+    cache = ResponseCache(tmp_path / 'cache')
+    cache.put('k1', {'a': 1}, {'stage': 'phase2', 'model': 'model-a'}, label='Test REIT')
+    cache.get('k1', label='Test REIT')
+
+    assert main(['--cache-dir', str(cache.cache_dir), 'report', '--json']) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert (report['hits'], report['entries']) == (1, 1)
+
+    assert main(['--cache-dir', str(cache.cache_dir), 'prune', '--older-than-days', '0']) == 0
+    assert cache.entries() == []
+    assert main(['--cache-dir', str(cache.cache_dir), 'clear']) == 0
+    assert not (cache.cache_dir / LOOKUP_LOG).exists()
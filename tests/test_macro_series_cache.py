@@ -0,0 +1,192 @@
+"""
+Tests for the shared Bank of Canada / FRED macro series cache
+
+All tests run offline against the fixture backend (tests/fixtures/macro) or a
+fake HTTP session; they assert how many provider requests a workload makes.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pd = pytest.importorskip('pandas')
+
+from macro_series_cache import (
+    FixtureMacroBackend,
+    HttpMacroBackend,
+    MacroSeriesCache,
+    set_default_cache,
+)
+from openbb_macro_monitor import EnhancedMacroMonitor
+
+
+MACRO_FIXTURES = Path(__file__).parent / 'fixtures' / 'macro'
+
+
+@pytest.fixture
+def backend():
+    return FixtureMacroBackend(MACRO_FIXTURES)
+
+
+@pytest.fixture
+def cache(tmp_path, backend):
+    return MacroSeriesCache(tmp_path / 'macro', backend=backend)
+
+
+def _age_entry(cache, source, code, hours):
+    """Backdate a cached series so it falls outside the TTL"""
+    path = cache._path(source, code)
+    entry = json.loads(path.read_text())
+    entry['fetched_at'] = (datetime.now() - timedelta(hours=hours)).isoformat(timespec='seconds')
+    path.write_text(json.dumps(entry))
+    cache._memory.clear()
+
+
+def test_series_fetched_once_within_ttl(cache, backend):
+    """Repeat reads (same or later start date) are served from memory"""
+    first = cache.get_series('boc', 'V122530', '2016-01-01')
+    cache.get_series('boc', 'V122530', '2016-01-01')
+    later = cache.get_series('boc', 'V122530', '2020-01-01')
+
+    assert backend.calls == [('boc', 'V122530', '2016-01-01')]
+    assert list(first.columns) == ['date', 'rate']
+    assert first['date'].is_monotonic_increasing
+    assert later['date'].min() >= pd.Timestamp('2020-01-01')
+
+
+def test_disk_cache_shared_across_instances(cache, backend, tmp_path):
+    """A second process (new cache instance, same directory) makes no request"""
+    cache.get_series('fred', 'FEDFUNDS', '2016-01-01')
+
+    other_backend = FixtureMacroBackend(MACRO_FIXTURES)
+    other = MacroSeriesCache(tmp_path / 'macro', backend=other_backend)
+    df = other.get_series('fred', 'FEDFUNDS', '2016-01-01')
+
+    assert other_backend.calls == []
+    assert df['rate'].iloc[-1] == 4.22
+
+
+def test_stale_series_appends_from_last_observation(tmp_path):
+    """After the TTL only the tail from the last stored observation is requested"""
+    fixture_dir = tmp_path / 'fixtures'
+    fixture_dir.mkdir()
+    fixture = fixture_dir / 'boc_V122530.json'
+    fixture.write_text(json.dumps([['2025-07-30', 2.75], ['2025-08-28', 2.75]]))
+
+    backend = FixtureMacroBackend(fixture_dir)
+    cache = MacroSeriesCache(tmp_path / 'macro', backend=backend)
+    cache.get_series('boc', 'V122530', '2025-01-01')
+
+    fixture.write_text(json.dumps([['2025-07-30', 2.75], ['2025-08-28', 2.70], ['2025-09-17', 2.5]]))
+    _age_entry(cache, 'boc', 'V122530', hours=7)
+    df = cache.get_series('boc', 'V122530', '2025-01-01')
+
+    assert backend.calls[-1] == ('boc', 'V122530', '2025-08-28')
+    assert df['rate'].tolist() == [2.75, 2.70, 2.5]  # revised last point + appended point
+
+
+def test_earlier_start_refetches(cache, backend):
+    """A longer lookback than cached triggers a fetch from the new start"""
+    cache.get_series('boc', 'V122530', '2020-01-01')
+    df = cache.get_series('boc', 'V122530', '2016-01-01')
+
+    assert backend.calls[-1] == ('boc', 'V122530', '2016-01-01')
+    assert df['date'].min() < pd.Timestamp('2016-02-01')
+
+
+def test_ttl_zero_always_refreshes(tmp_path, backend):
+    """ttl_seconds=0 (e.g. --ttl-hours 0) refreshes on every read"""
+    cache = MacroSeriesCache(tmp_path / 'macro', ttl_seconds=0, backend=backend)
+    cache.get_series('boc', 'V122530', '2016-01-01')
+    cache.get_series('boc', 'V122530', '2016-01-01')
+
+    assert len(backend.calls) == 2
+
+
+def test_backend_failure_falls_back_to_stale_copy(cache, backend, capsys):
+    """An outage serves the stale series with a warning; without a copy it raises"""
+    cache.get_series('boc', 'V122530', '2016-01-01')
+    _age_entry(cache, 'boc', 'V122530', hours=48)
+
+    def failing_fetch(source, code, start_date):
+        raise ConnectionError('valet down')
+
+    backend.fetch = failing_fetch
+    df = cache.get_series('boc', 'V122530', '2016-01-01')
+
+    assert not df.empty
+    assert 'using cached series' in capsys.readouterr().out
+    with pytest.raises(ConnectionError):
+        cache.get_series('fred', 'FEDFUNDS', '2016-01-01')
+
+
+def test_batch_of_monitors_shares_one_fetch_per_series(cache, backend):
+    """25 issuers' macro assessments cost one BoC and one FRED request"""
+    assessments = [EnhancedMacroMonitor(cache).generate_assessment(120) for _ in range(25)]
+
+    assert sorted(source for source, _, _ in backend.calls) == ['boc', 'fred']
+    assert all(a['canada'] == assessments[0]['canada'] for a in assessments)
+    assert assessments[0]['canada']['policy_rate']['current_rate'] == 2.5
+    assert assessments[0]['united_states']['policy_rate']['current_rate'] == 4.22
+
+
+def test_default_cache_is_shared(tmp_path, backend):
+    """Monitors created without a cache use the process-wide shared instance"""
+    shared = MacroSeriesCache(tmp_path / 'macro', backend=backend)
+    set_default_cache(shared)
+    try:
+        assert EnhancedMacroMonitor().series_cache is shared
+        assert EnhancedMacroMonitor().series_cache is EnhancedMacroMonitor().series_cache
+    finally:
+        set_default_cache(None)
+
+
+class FakeResponse:
+    def __init__(self, payload=None, text=''):
+        self._payload = payload
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Records requests made through the pooled session"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append((url, params))
+        if 'valet' in url:
+            return FakeResponse({'observations': [
+                {'d': '2025-09-17', 'V122530': {'v': '2.50'}},
+                {'d': '2025-09-16', 'V122530': {'v': '2.75'}},
+                {'d': '2025-09-18', 'V122530': {}},
+            ]})
+        return FakeResponse(text='observation_date,FEDFUNDS\n2025-08-01,4.33\n2025-09-01,.\n')
+
+
+def test_http_backend_parses_valet_and_fred_on_one_session():
+    """Both sources go through the injected session; missing values are skipped"""
+    session = FakeSession()
+    backend = HttpMacroBackend(session=session)
+
+    boc = backend.fetch('boc', 'V122530', '2025-09-01')
+    fred = backend.fetch('fred', 'FEDFUNDS', '2025-08-01')
+
+    assert boc == [('2025-09-16', 2.75), ('2025-09-17', 2.5)]
+    assert fred == [('2025-08-01', 4.33)]
+    assert session.requests[0][1] == {'start_date': '2025-09-01'}
+    assert session.requests[1][1] == {'id': 'FEDFUNDS', 'cosd': '2025-08-01'}
+    with pytest.raises(ValueError):
+        backend.fetch('ecb', 'X', '2025-01-01')
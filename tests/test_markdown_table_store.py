@@ -0,0 +1,149 @@
+"""
+Tests for the Phase 1 structured table store (scripts/markdown_table_store.py)
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from markdown_table_store import (
+    TableStore,
+    build_table_store,
+    load_table_store,
+    main,
+    normalize_label,
+    parse_markdown_tables,
+    parse_number,
+    table_store_path,
+)
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+DOCLING_STATEMENTS = """\
+## Interim Condensed Consolidated Balance Sheets
+
+(In thousands of Canadian dollars)
+
+|                                 | Note   | June 30, 2025   | December 31, 2024   |
+|---------------------------------|--------|-----------------|---------------------|
+| **Assets**                      |        |                 |                     |
+| Investment properties           | 4      | $ 2,402,193     | $ 2,512,448         |
+| Cash                            |        | 16,639          | 15,480              |
+| Total assets                    |        | $ 2,611,435     | $ 2,734,077         |
+| Mortgages and loans payable (1) | 7      | 1,183,297       | 1,233,441           |
+| Unitholders' equity             |        | 995,257         | 1,045,893           |
+
+## Interim Condensed Consolidated Statements of Operations
+
+|                              | Three months ended June 30, 2025   | Three months ended June 30, 2024   |
+|------------------------------|------------------------------------|------------------------------------|
+| Revenue                      | 59,082                             | 61,306                             |
+| Fair value loss              | (27,510)                           | (8,012)                            |
+| Net income (loss)            | (12,345)                           | 4,567                              |
+| Occupancy                    | 87.8%                              | 90.1%                              |
+| Total assets                 | —                                  | —                                  |
+"""
+
+
+def test_parse_number_formats():
+    """Thousands separators, $, parentheses negatives, percentages; text and dashes are None"""
+    assert parse_number('1,234,567') == 1234567
+    assert parse_number('$ 2,611,435') == 2611435
+    assert parse_number('(27,510)') == -27510
+    assert parse_number('$(1,234.5)') == -1234.5
+    assert parse_number('-3') == -3
+    assert parse_number('87.8%') == pytest.approx(0.878)
+    assert parse_number('(2.5)%') == pytest.approx(-0.025)
+    for text in ('—', '-', '', 'n/a', 'Q2 2025', 'Note 4a', '(12', '1,23'):
+        assert parse_number(text) is None
+
+
+def test_normalize_label():
+    assert normalize_label("Unitholders' equity") == 'unitholders equity'
+    assert normalize_label('Mortgages and loans payable (1)') == 'mortgages and loans payable'
+    assert normalize_label('**Total Assets**') == 'total assets'
+
+
+def test_tables_are_columnar_with_captions():
+    """Captions come from the heading above; note columns are not parsed as values"""
+    balance_sheet, operations = parse_markdown_tables(DOCLING_STATEMENTS)
+
+    assert balance_sheet['caption'] == 'Interim Condensed Consolidated Balance Sheets'
+    assert balance_sheet['columns'] == ['Note', 'June 30, 2025', 'December 31, 2024']
+    assert balance_sheet['labels'][0] == '**Assets**'
+    assert balance_sheet['values'][0] == [None] * 6
+    assert balance_sheet['values'][1] == [None, 2402193, 16639, 2611435, 1183297, 995257]
+    assert balance_sheet['lines'] == [5, 12]
+    assert operations['values'][0][1:3] == [-27510, -12345]
+
+
+def test_label_index_lookups():
+    """Lookups are index hits across tables; find() mirrors find_row_by_label()"""
+    store = TableStore.from_markdown(DOCLING_STATEMENTS, source='statements.md')
+
+    rows = store.lookup('TOTAL ASSETS')
+    assert [(row.table, row.row) for row in rows] == [(0, 3), (1, 4)]
+    assert rows[0].first_value() == 2611435 and rows[0].last_value() == 2734077
+    assert rows[0].value('december') == 2734077
+    assert rows[1].first_value() is None
+    assert store.value('Mortgages and loans payable', column=1) == 1183297
+    assert store.value('missing label') is None
+
+    assert store.find([r'^net income']).value(0) == -12345
+    assert store.find([r'total.*assets'], caption='operations').table == 1
+    assert store.find([r'^goodwill']) is None
+
+
+def test_store_round_trip_and_combine(tmp_path):
+    """Saved stores load identically; a filing store spans statements and MD&A"""
+    statements = tmp_path / 'statements.md'
+    statements.write_text(DOCLING_STATEMENTS)
+    mda = tmp_path / 'mda.md'
+    mda.write_text((FIXTURES / 'sample_financial_statement.md').read_text())
+
+    store = build_table_store(statements)
+    loaded = TableStore.load(table_store_path(statements))
+    assert loaded.tables == json.loads(json.dumps(store.tables))
+    assert loaded.lookup('cash')[0].values == store.lookup('cash')[0].values
+
+    filing = load_table_store([statements, mda])
+    assert filing.lookup('total assets')[-1].source == 'mda.md'
+    assert filing.value('Funds From Operations (FFO)') == 15000
+    assert table_store_path(mda).exists()
+
+
+def test_stale_store_is_rebuilt(tmp_path):
+    statements = tmp_path / 'statements.md'
+    statements.write_text(DOCLING_STATEMENTS)
+    build_table_store(statements)
+
+    statements.write_text(DOCLING_STATEMENTS.replace('16,639', '17,000'))
+    store_mtime = table_store_path(statements).stat().st_mtime_ns
+    os.utime(statements, ns=(store_mtime + 10**9, store_mtime + 10**9))
+
+    assert load_table_store(statements).value('cash', 1) == 17000
+
+
+def test_phase1_writes_table_store(tmp_path):
+    """Docling conversion writes <name>.tables.json next to the markdown"""
+    from preprocess_pdfs_docling import _write_markdown
+
+    stats = _write_markdown(str(tmp_path / 'statements.pdf'), str(tmp_path / 'md'), DOCLING_STATEMENTS, 1.0)
+
+    assert stats['table_store'] == str(tmp_path / 'md' / 'statements.tables.json')
+    assert TableStore.load(stats['table_store']).value('revenue', 0) == 59082
+
+
+def test_cli_lookup(tmp_path, capsys):
+    statements = tmp_path / 'statements.md'
+    statements.write_text(DOCLING_STATEMENTS)
+
+    assert main([str(statements), '--lookup', 'revenue']) == 0
+    out = capsys.readouterr().out
+    assert '2 tables' in out and "'revenue': 1 row(s)" in out and '59082.0' in out
@@ -0,0 +1,184 @@
+"""
+Tests for concurrent market data collection (AsyncMarketDataCollector)
+
+A local stub provider stands in for OpenBB so the tests run offline. The
+collector must bound concurrency, throttle per provider, retry transient
+failures and feed the unchanged MarketDataMonitor assessment logic.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+
+from openbb_market_monitor import (
+    AsyncMarketDataCollector,
+    MarketDataMonitor,
+    collect_market_assessments,
+    load_ticker_universe,
+)
+
+
+CONFIG = Path(__file__).parent.parent / 'config' / 'canadian_reits.yaml'
+
+
+def synthetic_prices(ticker, days=300):
+    """Deterministic OHLCV frame per ticker, newest row first like some providers"""
+    rng = np.random.default_rng(sum(map(ord, ticker)))
+    close = 20 * np.exp(np.cumsum(rng.normal(0, 0.015, days)))
+    dates = pd.bdate_range(end='2025-10-17', periods=days)
+    df = pd.DataFrame({
+        'date': dates,
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': rng.integers(50_000, 150_000, days),
+    })
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+class StubProvider:
+    """Blocking fetcher that records peak concurrency and can fail N times per ticker"""
+
+    def __init__(self, latency=0.05, failures=None):
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, symbol, provider, start_date, end_date):
+        with self._lock:
+            self.calls.append((symbol, time.monotonic()))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if self.failures.get(symbol, 0) > 0:
+                self.failures[symbol] -= 1
+                raise ConnectionError(f"stub outage for {symbol}")
+            if symbol == 'EMPTY-UN.TO':
+                return pd.DataFrame()
+            return synthetic_prices(symbol)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def make_collector(stub, **kwargs):
+    kwargs.setdefault('rate_limits', {})
+    kwargs.setdefault('backoff_seconds', 0.01)
+    return AsyncMarketDataCollector(provider='stub', fetcher=stub, **kwargs)
+
+
+def test_collect_returns_normalized_frames_in_input_order():
+    """One ascending-date DataFrame per ticker, keyed in input order, duplicates fetched once"""
+    stub = StubProvider(latency=0)
+    tickers = ['REI-UN.TO', 'AX-UN.TO', 'DIR-UN.TO', 'AX-UN.TO']
+
+    prices = make_collector(stub).collect_sync(tickers)
+
+    assert list(prices) == ['REI-UN.TO', 'AX-UN.TO', 'DIR-UN.TO']
+    assert len(stub.calls) == 3
+    for df in prices.values():
+        assert df['date'].is_monotonic_increasing
+        assert pd.api.types.is_datetime64_any_dtype(df['date'])
+
+
+def test_concurrency_is_bounded_and_faster_than_serial():
+    """Peak in-flight fetches never exceed max_concurrency; 24 tickers overlap"""
+    stub = StubProvider(latency=0.05)
+    tickers = [f'T{i}-UN.TO' for i in range(24)]
+
+    started = time.perf_counter()
+    make_collector(stub, max_concurrency=6).collect_sync(tickers)
+    elapsed = time.perf_counter() - started
+
+    assert stub.peak == 6
+    assert elapsed < 24 * 0.05 / 2
+
+
+def test_rate_limit_spaces_requests_per_provider():
+    """At 20 req/s, request starts are at least ~50ms apart regardless of concurrency"""
+    stub = StubProvider(latency=0)
+    collector = make_collector(stub, max_concurrency=8, rate_limits={'stub': 20.0})
+
+    collector.collect_sync([f'T{i}-UN.TO' for i in range(5)])
+
+    starts = sorted(t for _, t in stub.calls)
+    gaps = np.diff(starts)
+    assert min(gaps) >= 0.04
+
+
+def test_transient_failures_are_retried():
+    """A ticker that fails twice succeeds on the third attempt"""
+    stub = StubProvider(latency=0, failures={'AX-UN.TO': 2})
+    collector = make_collector(stub, max_retries=3)
+
+    prices = collector.collect_sync(['AX-UN.TO', 'REI-UN.TO'])
+
+    assert not prices['AX-UN.TO'].empty
+    assert sum(1 for s, _ in stub.calls if s == 'AX-UN.TO') == 3
+    assert collector.errors == {}
+
+
+def test_exhausted_retries_yield_empty_frame_and_error():
+    """Persistent failures do not abort the batch; the reason is recorded"""
+    stub = StubProvider(latency=0, failures={'AX-UN.TO': 10})
+    collector = make_collector(stub, max_retries=2)
+
+    prices = collector.collect_sync(['AX-UN.TO', 'REI-UN.TO', 'EMPTY-UN.TO'])
+
+    assert prices['AX-UN.TO'].empty
+    assert prices['EMPTY-UN.TO'].empty
+    assert not prices['REI-UN.TO'].empty
+    assert sum(1 for s, _ in stub.calls if s == 'AX-UN.TO') == 3
+    assert 'ConnectionError' in collector.errors['AX-UN.TO']
+    assert 'No price data' in collector.errors['EMPTY-UN.TO']
+
+
+def test_async_fetcher_is_awaited():
+    """Native coroutine fetchers run on the event loop without worker threads"""
+    async def fetcher(symbol, provider, start_date, end_date):
+        await asyncio.sleep(0)
+        return synthetic_prices(symbol)
+
+    collector = AsyncMarketDataCollector(provider='stub', fetcher=fetcher, rate_limits={})
+    prices = asyncio.run(collector.collect(['REI-UN.TO']))
+
+    assert len(prices['REI-UN.TO']) == 300
+
+
+def test_assessments_match_single_ticker_monitor():
+    """Batch assessments equal MarketDataMonitor.generate_market_assessment on the same prices"""
+    stub = StubProvider(latency=0)
+    tickers = ['REI-UN.TO', 'EMPTY-UN.TO']
+
+    assessments = collect_market_assessments(tickers, collector=make_collector(stub))
+
+    expected = MarketDataMonitor('REI-UN.TO', 'stub').generate_market_assessment(
+        price_df=synthetic_prices('REI-UN.TO').iloc[::-1].reset_index(drop=True)
+    )
+    for key in ('price_stress', 'volatility', 'momentum', 'risk_score', 'overall_assessment'):
+        assert assessments['REI-UN.TO'][key] == expected[key]
+    assert 'error' in assessments['EMPTY-UN.TO']
+
+
+def test_load_ticker_universe():
+    """The shipped REIT universe loads as a name -> ticker mapping"""
+    pytest.importorskip('yaml')
+    universe = load_ticker_universe(CONFIG)
+
+    assert universe['RioCan REIT'] == 'REI-UN.TO'
+    assert len(universe) >= 20
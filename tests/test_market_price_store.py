@@ -0,0 +1,258 @@
+"""
+Tests for the local OHLCV price store
+
+A stub provider serves a fixed synthetic history and records every request,
+so the tests can assert exactly which date ranges are downloaded on a first
+run, a next-day refresh, a weekend refresh, a refresh before the close, a
+longer backfill and offline.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+
+import market_price_store
+from market_price_store import PriceStore
+from openbb_market_monitor import AsyncMarketDataCollector, MarketDataMonitor
+
+
+class StubProvider:
+    """Serves rows of a fixed business-day history that fall inside the request"""
+
+    def __init__(self):
+        # Fixed start for the dated tests; runs through today for lookback-based calls
+        dates = pd.bdate_range('2023-01-02', max(pd.Timestamp.today(), pd.Timestamp('2025-12-31')))
+        rng = np.random.default_rng(7)
+        close = 15 * np.exp(np.cumsum(rng.normal(0, 0.012, len(dates))))
+        self.history = pd.DataFrame({
+            'date': dates,
+            'open': close,
+            'high': close * 1.01,
+            'low': close * 0.99,
+            'close': close,
+            'volume': rng.integers(10_000, 90_000, len(dates)),
+        })
+        self.requests = []
+        self.fail = False
+
+    def __call__(self, symbol, provider, start_date, end_date):
+        self.requests.append((start_date, end_date))
+        if self.fail:
+            raise ConnectionError('provider down')
+        mask = (self.history['date'] >= start_date) & (self.history['date'] <= end_date)
+        # Providers return the date as the index
+        return self.history[mask].set_index('date')
+
+    def window(self, start_date, end_date):
+        mask = (self.history['date'] >= start_date) & (self.history['date'] <= end_date)
+        return self.history[mask].reset_index(drop=True)
+
+
+@pytest.fixture
+def provider():
+    return StubProvider()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PriceStore(tmp_path / 'prices', file_format='csv')
+
+
+def test_first_run_fetches_full_window(store, provider):
+    """Empty store: one request for the whole window, rows match the provider"""
+    df = store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+
+    assert provider.requests == [('2024-10-01', '2025-10-01')]
+    pd.testing.assert_frame_equal(df, provider.window('2024-10-01', '2025-10-01'), check_dtype=False)
+
+
+def test_repeat_run_is_served_locally(store, provider):
+    """Same window again: no network request"""
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+    provider.requests.clear()
+
+    df = store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+
+    assert provider.requests == []
+    assert len(df) == len(provider.window('2024-10-01', '2025-10-01'))
+
+
+def test_next_day_fetches_only_missing_tail(store, provider):
+    """Daily refresh requests only the dates after the last covered date"""
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+    provider.requests.clear()
+
+    df = store.get_history('REI-UN.TO', 'tmx', '2024-10-02', '2025-10-03', provider)
+
+    assert provider.requests == [('2025-10-02', '2025-10-03')]
+    assert df['date'].iloc[-1] == pd.Timestamp('2025-10-03')
+    assert df['date'].iloc[0] >= pd.Timestamp('2024-10-02')
+
+
+def test_weekend_refresh_needs_no_request(store, provider):
+    """Friday data is complete; a Saturday/Sunday refresh stays local"""
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-03', provider)  # Friday
+    provider.requests.clear()
+
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-05', provider)  # Sunday
+
+    assert provider.requests == []
+
+
+def test_bar_fetched_before_the_close_is_refetched(store, provider, monkeypatch):
+    """Today's bar is provisional: coverage stops at yesterday until the next refresh"""
+    monkeypatch.setattr(market_price_store, '_today', lambda: pd.Timestamp('2025-10-01'))
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)  # Wednesday, mid-session
+    assert store.coverage('REI-UN.TO', 'tmx')[1] == pd.Timestamp('2025-09-30')
+
+    provider.history.loc[provider.history['date'] == '2025-10-01', 'close'] = 99.0  # final close
+    provider.requests.clear()
+    monkeypatch.setattr(market_price_store, '_today', lambda: pd.Timestamp('2025-10-02'))
+    df = store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+
+    assert provider.requests == [('2025-10-01', '2025-10-01')]
+    assert df['close'].iloc[-1] == 99.0
+    assert store.coverage('REI-UN.TO', 'tmx')[1] == pd.Timestamp('2025-10-01')
+
+
+def test_coverage_ends_at_last_bar_returned(store, provider):
+    """Days a lagging provider has not published yet are requested again"""
+    published = provider.history
+    provider.history = published[published['date'] <= '2025-10-01']
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-03', provider)
+    assert store.coverage('REI-UN.TO', 'tmx')[1] == pd.Timestamp('2025-10-01')
+
+    provider.history = published
+    provider.requests.clear()
+    df = store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-03', provider)
+
+    assert provider.requests == [('2025-10-02', '2025-10-03')]
+    assert df['date'].iloc[-1] == pd.Timestamp('2025-10-03')
+
+
+def test_longer_lookback_backfills_head_only(store, provider):
+    """Extending the window into the past requests only the missing head"""
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+    provider.requests.clear()
+
+    df = store.get_history('REI-UN.TO', 'tmx', '2023-10-01', '2025-10-01', provider)
+
+    assert provider.requests == [('2023-10-01', '2024-09-30')]
+    assert len(df) == len(provider.window('2023-10-01', '2025-10-01'))
+
+
+def test_stale_store_fetches_gap_to_keep_coverage_contiguous(store, provider):
+    """A window starting after the covered range still fetches the gap"""
+    store.get_history('REI-UN.TO', 'tmx', '2024-01-01', '2024-06-28', provider)
+    provider.requests.clear()
+
+    store.get_history('REI-UN.TO', 'tmx', '2024-09-02', '2025-01-31', provider)
+
+    assert provider.requests == [('2024-06-29', '2025-01-31')]
+    assert store.coverage('REI-UN.TO', 'tmx') == (pd.Timestamp('2024-01-01'), pd.Timestamp('2025-01-31'))
+
+
+def test_offline_store_never_calls_fetcher(store, provider, tmp_path):
+    """Offline mode serves stored history even when the window extends past it"""
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+    provider.requests.clear()
+
+    offline = PriceStore(store.root, offline=True)
+    df = offline.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-12-31', provider)
+
+    assert provider.requests == []
+    assert df['date'].iloc[-1] == pd.Timestamp('2025-10-01')
+
+
+def test_failed_fetch_keeps_stored_data_and_coverage(store, provider):
+    """A provider error does not extend coverage, so the next run retries the tail"""
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+    provider.fail = True
+
+    with pytest.raises(ConnectionError):
+        store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-08', provider)
+
+    assert store.coverage('REI-UN.TO', 'tmx')[1] == pd.Timestamp('2025-10-01')
+    assert store.missing_ranges('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-08') == [('2025-10-02', '2025-10-08')]
+
+
+def test_store_layout_keeps_exchange_suffix(store, provider):
+    """Tickers keep their '.TO' suffix on disk and are listed per provider"""
+    store.get_history('REI-UN.TO', 'tmx', '2025-09-01', '2025-10-01', provider)
+    store.get_history('AX-UN.TO', 'yfinance', '2025-09-01', '2025-10-01', provider)
+
+    assert (store.root / 'tmx' / 'REI-UN.TO.csv').exists()
+    assert (store.root / 'tmx' / 'REI-UN.TO.json').exists()
+    assert store.tickers('tmx') == ['REI-UN.TO']
+    assert store.summary('yfinance')['AX-UN.TO']['last_price_date'] == '2025-10-01'
+
+
+def test_parquet_round_trip(tmp_path, provider):
+    """Parquet files load back with the same rows as the provider"""
+    pytest.importorskip('pyarrow')
+    store = PriceStore(tmp_path / 'prices', file_format='parquet')
+
+    df = store.get_history('REI-UN.TO', 'tmx', '2025-01-01', '2025-10-01', provider)
+
+    assert (store.root / 'tmx' / 'REI-UN.TO.parquet').exists()
+    pd.testing.assert_frame_equal(df, provider.window('2025-01-01', '2025-10-01'), check_dtype=False)
+
+
+def test_monitor_analysis_from_store_matches_direct_fetch(store, provider):
+    """Price stress, volatility and momentum are identical on stored history"""
+    store.get_history('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01', provider)
+    stored = PriceStore(store.root, offline=True).load('REI-UN.TO', 'tmx', '2024-10-01', '2025-10-01')
+    direct = provider.window('2024-10-01', '2025-10-01')
+
+    monitor = MarketDataMonitor('REI-UN.TO', 'tmx')
+    assert monitor.detect_price_stress(stored) == monitor.detect_price_stress(direct)
+    assert monitor.calculate_volatility(stored) == monitor.calculate_volatility(direct)
+    assert monitor.calculate_momentum(stored) == monitor.calculate_momentum(direct)
+
+
+@pytest.fixture
+def after_close(monkeypatch):
+    """Treat today's bar as final, so lookbacks ending today are fully covered"""
+    monkeypatch.setattr(market_price_store, '_today', lambda: pd.Timestamp.today().normalize() + pd.Timedelta(days=1))
+
+
+def test_monitor_get_price_history_uses_store(store, provider, monkeypatch, after_close):
+    """get_price_history goes through the store and falls back to it on errors"""
+    import openbb_market_monitor
+
+    monkeypatch.setattr(openbb_market_monitor, '_fetch_openbb_history', provider)
+    monitor = MarketDataMonitor('REI-UN.TO', 'tmx', price_store=store)
+
+    first = monitor.get_price_history(lookback_days=365)
+    requests_after_first = len(provider.requests)
+    second = monitor.get_price_history(lookback_days=365)
+
+    assert len(provider.requests) == requests_after_first
+    pd.testing.assert_frame_equal(first, second)
+
+    provider.fail = True
+    monitor.price_store = PriceStore(store.root, file_format='csv')
+    assert len(monitor.get_price_history(lookback_days=400)) >= len(first)
+
+
+def test_collector_refresh_with_store_skips_stored_tickers(store, provider, after_close):
+    """A second universe collection makes no requests; data matches the first"""
+    collector = AsyncMarketDataCollector(provider='tmx', fetcher=provider, rate_limits={},
+                                         price_store=store)
+    tickers = ['REI-UN.TO', 'AX-UN.TO', 'DIR-UN.TO']
+
+    first = collector.collect_sync(tickers)
+    requests_after_first = len(provider.requests)
+    second = collector.collect_sync(tickers)
+
+    assert requests_after_first == len(tickers)
+    assert len(provider.requests) == requests_after_first
+    for ticker in tickers:
+        pd.testing.assert_frame_equal(first[ticker], second[ticker])
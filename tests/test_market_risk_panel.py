@@ -0,0 +1,151 @@
+"""
+Tests for the vectorized rolling market-risk panel
+
+Every (ticker, date) row of build_market_risk_panel() must equal what
+MarketDataMonitor computes on the price history available up to that date,
+without leaking windows across tickers or looking ahead.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+
+from market_risk_panel import build_market_risk_panel, features_as_of, lookup_market_risk
+from openbb_market_monitor import MarketDataMonitor
+
+
+def synthetic_prices(seed, days, end='2025-09-30', drift=0.0):
+    rng = np.random.default_rng(seed)
+    close = 20 * np.exp(np.cumsum(rng.normal(drift, 0.02, days)))
+    return pd.DataFrame({
+        'date': pd.bdate_range(end=end, periods=days),
+        'close': close,
+        'volume': rng.integers(20_000, 200_000, days),
+    })
+
+
+@pytest.fixture(scope='module')
+def prices():
+    return {
+        'REI-UN.TO': synthetic_prices(1, 400),
+        'AX-UN.TO': synthetic_prices(2, 300, drift=-0.003),   # distressed
+        'NEW-UN.TO': synthetic_prices(3, 70),                 # recent listing
+    }
+
+
+@pytest.fixture(scope='module')
+def panel(prices):
+    return build_market_risk_panel(prices)
+
+
+def _history_to(df, as_of_position, rows=None):
+    """Price history up to an as-of row (optionally only the last `rows` rows)"""
+    history = df.iloc[:as_of_position + 1]
+    return (history.tail(rows) if rows else history).reset_index(drop=True)
+
+
+@pytest.mark.parametrize('ticker,position', [
+    ('REI-UN.TO', 399), ('REI-UN.TO', 260), ('REI-UN.TO', 251), ('REI-UN.TO', 100),
+    ('AX-UN.TO', 299), ('AX-UN.TO', 89), ('NEW-UN.TO', 69),
+])
+def test_panel_row_matches_single_ticker_monitor(prices, panel, ticker, position):
+    """Volatility, momentum, drawdown, volume ratio and risk score match per as-of date"""
+    monitor = MarketDataMonitor(ticker, 'tmx')
+    history = _history_to(prices[ticker], position)
+    history_52w = _history_to(prices[ticker], position, rows=252)
+    row = panel[panel['ticker'] == ticker].iloc[position]
+
+    volatility = monitor.calculate_volatility(history)
+    for window in (30, 90, 252):
+        expected = volatility['metrics'].get(f'{window}d', {}).get('volatility_annualized_pct')
+        actual = row[f'volatility_{window}d_pct']
+        if expected is None:
+            assert np.isnan(actual)
+        else:
+            assert round(actual, 2) == expected
+
+    momentum = monitor.calculate_momentum(history)
+    for label in ('3_month', '6_month', '12_month'):
+        expected = momentum['metrics'].get(label, {}).get('total_return_pct')
+        actual = row[f'momentum_{label}_pct']
+        if expected is None:
+            assert np.isnan(actual)
+        else:
+            assert round(actual, 2) == expected
+
+    stress = monitor.detect_price_stress(history_52w)
+    assert round(row['high_52w'], 2) == stress['high_52w']
+    assert round(row['low_52w'], 2) == stress['low_52w']
+    assert round(row['decline_from_peak_pct'], 1) == stress['decline_from_peak_pct']
+    assert round(row['distance_from_low_pct'], 1) == stress['distance_from_low_pct']
+
+    volume = monitor.analyze_trading_volume(history)
+    if 'volume_vs_30d_avg' in volume:
+        assert round(row['volume_vs_30d_avg'], 2) == volume['volume_vs_30d_avg']
+
+    risk = monitor._calculate_risk_score(stress, volatility, momentum)
+    assert row['risk_score'] == risk['total_score']
+    assert row['risk_level'] == risk['risk_level']
+
+
+def test_windows_do_not_leak_across_tickers(panel):
+    """A ticker's first rows have no return-based features even though the previous ticker does"""
+    new = panel[panel['ticker'] == 'NEW-UN.TO']
+
+    assert new['volatility_252d_pct'].isna().all()
+    assert new['momentum_6_month_pct'].isna().all()
+    assert new['volatility_30d_pct'].iloc[:28].isna().all()
+    assert new['volatility_30d_pct'].iloc[29:].notna().all()
+    assert new['high_52w'].iloc[0] == new['close'].iloc[0]
+
+
+def test_panel_shape_and_order(prices, panel):
+    """One row per (ticker, date), sorted by ticker then date"""
+    assert len(panel) == sum(len(df) for df in prices.values())
+    assert not panel.duplicated(['ticker', 'date']).any()
+    assert panel.groupby('ticker')['date'].apply(lambda d: d.is_monotonic_increasing).all()
+
+
+def test_accepts_long_frame_and_provider_index(prices, panel):
+    """Long input and date-indexed provider frames give the same panel"""
+    long = pd.concat([df.assign(ticker=t) for t, df in prices.items()], ignore_index=True)
+    indexed = {t: df.set_index('date') for t, df in prices.items()}
+
+    pd.testing.assert_frame_equal(build_market_risk_panel(long), panel)
+    pd.testing.assert_frame_equal(build_market_risk_panel(indexed), panel)
+
+
+def test_features_as_of_is_point_in_time(panel):
+    """Weekend dates map to Friday; dates before the first price get no features"""
+    observations = pd.DataFrame({
+        'ticker': ['REI-UN.TO', 'AX-UN.TO', 'NEW-UN.TO', 'REI-UN.TO'],
+        'date': ['2025-09-27', '2025-06-30', '2020-01-01', '2025-09-26'],
+        'label': [1, 0, 0, 1],
+    })
+
+    features = features_as_of(panel, observations)
+
+    assert list(features['label']) == [1, 0, 0, 1]
+    assert features.loc[0, 'panel_date'] == pd.Timestamp('2025-09-26')  # Saturday -> Friday
+    assert features.loc[0, 'risk_score'] == features.loc[3, 'risk_score']
+    assert features.loc[1, 'panel_date'] == pd.Timestamp('2025-06-30')
+    assert pd.isna(features.loc[2, 'panel_date'])
+
+    single = lookup_market_risk(panel, 'AX-UN.TO', '2025-06-30')
+    assert single['volatility_90d_pct'] == features.loc[1, 'volatility_90d_pct']
+    assert lookup_market_risk(panel, 'NEW-UN.TO', '2020-01-01') is None
+
+
+def test_empty_input():
+    """No prices: empty panel with the feature columns"""
+    panel = build_market_risk_panel({})
+
+    assert len(panel) == 0
+    assert 'risk_score' in panel.columns
@@ -0,0 +1,235 @@
+"""
+Tests for self-describing model artifacts (scripts/model_artifact.py)
+
+The committed v2.2 sidecar must describe the v2.2 pickle exactly, load
+without unpickling anything, and reproduce the pickled selector + scaler
+transform; schema mismatches must fail before a prediction is made. The
+fused NumPy scorer must agree with the sklearn pipeline.
+"""
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+pytest.importorskip('sklearn')
+
+from model_artifact import (
+    ARTIFACT_FORMAT_VERSION,
+    ModelArtifact,
+    ModelSchemaError,
+    describe_model_bundle,
+    load_model_artifact,
+    metadata_path_for,
+    write_metadata,
+)
+
+
+MODEL_FILE = Path(__file__).parent.parent / 'models' / 'distribution_cut_logistic_regression_v2.2.pkl'
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture(scope='module')
+def bundle():
+    if not MODEL_FILE.exists():
+        pytest.skip('v2.2 model not available')
+    with open(MODEL_FILE, 'rb') as f:
+        return pickle.load(f)
+
+
+@pytest.fixture
+def artifact():
+    return ModelArtifact.load(MODEL_FILE)
+
+
+def _phase3_features(artifact):
+    from enrich_phase4_data import Phase4DataEnricher
+
+    rows = []
+    for fixture in ('phase3_artis_reit_metrics.json', 'sample_calculated_metrics.json'):
+        enricher = Phase4DataEnricher(str(FIXTURES / fixture), 'TEST-UN.TO', artifact=artifact)
+        rows.append(enricher._prepare_features({}, {}))
+    return rows
+
+
+def test_committed_sidecar_describes_the_pickle(bundle):
+    """Regenerating the sidecar from the pickle gives the committed metadata"""
+    with open(metadata_path_for(MODEL_FILE), 'r') as f:
+        committed = json.load(f)
+
+    assert describe_model_bundle(bundle, MODEL_FILE) == committed
+    assert committed['format_version'] == ARTIFACT_FORMAT_VERSION
+
+
+def test_load_reads_metadata_only(monkeypatch):
+    """Loading the artifact unpickles nothing until the estimator is used"""
+    def no_unpickle(*args, **kwargs):
+        raise AssertionError('estimator unpickled at load time')
+
+    monkeypatch.setattr(pickle, 'load', no_unpickle)
+    artifact = ModelArtifact.load(MODEL_FILE)
+
+    assert not artifact.is_loaded
+    assert len(artifact.feature_names) == 28
+    assert len(artifact.selected_features) == 15
+    assert artifact.encode('sector', 'Industrial') == 2
+    assert artifact.encode('sector', 'Shopping Malls') == 7
+    assert artifact.encode('dilution_materiality', 'high') == 3
+    assert artifact.decode_target(1) == 'target'
+
+
+def test_transform_matches_pickled_selector_and_scaler(bundle, artifact):
+    """Mask + scale from metadata equals SelectKBest + StandardScaler"""
+    rows = _phase3_features(artifact)
+    X = artifact.feature_matrix(rows)
+
+    expected = bundle['scaler'].transform(bundle['selector'].transform(pd.DataFrame(rows)))
+
+    np.testing.assert_array_equal(artifact.transform(X), expected)
+
+
+def test_lazy_estimator_matches_bundle(bundle, artifact):
+    """The estimator loads on first use and predicts like the bundled model"""
+    X = artifact.transform(artifact.feature_matrix(_phase3_features(artifact)))
+
+    np.testing.assert_array_equal(artifact.estimator.predict_proba(X), bundle['model'].predict_proba(X))
+    assert artifact.is_loaded
+
+
+def test_feature_mismatch_is_caught_up_front(artifact):
+    """Missing or unexpected features raise before scoring"""
+    row = _phase3_features(artifact)[0]
+
+    with pytest.raises(ModelSchemaError, match='missing'):
+        artifact.feature_matrix([{k: v for k, v in row.items() if k != 'sector'}])
+    with pytest.raises(ModelSchemaError, match='unexpected'):
+        artifact.feature_matrix([{**row, 'market_risk_score': 10}])
+    with pytest.raises(ModelSchemaError, match='monthly_burn_rate'):
+        artifact.check_columns([c for c in artifact.feature_names if c != 'monthly_burn_rate'])
+
+
+def test_estimator_feature_order_mismatch_raises(tmp_path):
+    """An estimator trained on a different column order is rejected on load"""
+    from sklearn.linear_model import LogisticRegression
+
+    X = pd.DataFrame({'b': [0.0, 1.0, 2.0, 3.0], 'a': [1.0, 0.0, 1.0, 0.0]})
+    model_path = tmp_path / 'model.pkl'
+    with open(model_path, 'wb') as f:
+        pickle.dump(LogisticRegression().fit(X, [0, 0, 1, 1]), f)
+
+    metadata = {
+        'format': 'issuer-credit-model', 'format_version': 1,
+        'estimator': {'file': 'model.pkl', 'key': None, 'loader': 'pickle', 'sha256': None},
+        'features': ['a', 'b'],
+    }
+    write_metadata(metadata, metadata_path_for(model_path))
+
+    with pytest.raises(ModelSchemaError, match='feature order'):
+        ModelArtifact.load(model_path).estimator
+
+
+def test_checksum_mismatch_raises(tmp_path, bundle):
+    """A pickle replaced after the sidecar was written is not loaded"""
+    model_path = tmp_path / 'model.pkl'
+    with open(model_path, 'wb') as f:
+        pickle.dump(bundle, f)
+    write_metadata(describe_model_bundle(bundle, model_path), metadata_path_for(model_path))
+
+    bundle_copy = dict(bundle, version='tampered')
+    with open(model_path, 'wb') as f:
+        pickle.dump(bundle_copy, f)
+
+    with pytest.raises(ModelSchemaError, match='checksum'):
+        ModelArtifact.load(model_path).estimator
+
+
+def test_newer_format_version_is_rejected(tmp_path):
+    """Artifacts from a newer format are refused rather than misread"""
+    path = tmp_path / 'model.model.json'
+    write_metadata({'format': 'issuer-credit-model', 'format_version': ARTIFACT_FORMAT_VERSION + 1,
+                    'features': []}, path)
+
+    with pytest.raises(ModelSchemaError, match='newer'):
+        ModelArtifact.load(path)
+
+
+def test_legacy_pickle_without_sidecar_still_loads(tmp_path, bundle, artifact):
+    """A v2.x bundle without a sidecar is described in memory with the same schema"""
+    model_path = tmp_path / 'legacy.pkl'
+    with open(model_path, 'wb') as f:
+        pickle.dump(bundle, f)
+
+    legacy = load_model_artifact(model_path)
+    rows = _phase3_features(artifact)
+
+    assert legacy.is_loaded
+    assert legacy.feature_names == artifact.feature_names
+    np.testing.assert_array_equal(legacy.transform(legacy.feature_matrix(rows)),
+                                  artifact.transform(artifact.feature_matrix(rows)))
+
+
+def _sklearn_artifact(artifact):
+    """Same artifact without the fused scorer (estimator pipeline path)"""
+    metadata = {k: v for k, v in artifact.metadata.items() if k != 'fused_scorer'}
+    return ModelArtifact(metadata, artifact.base_dir)
+
+
+def test_fused_scorer_matches_sklearn_pipeline(bundle, artifact):
+    """One dot product gives the selector + scaler + predict_proba result for a batch"""
+    rng = np.random.default_rng(0)
+    mean = np.zeros(len(artifact.feature_names))
+    scale = np.ones(len(artifact.feature_names))
+    mean[artifact.selector_mask] = artifact.scaler_mean
+    scale[artifact.selector_mask] = artifact.scaler_scale
+    X = mean + scale * rng.normal(0, 1.5, (500, len(mean)))
+
+    scaled = bundle['scaler'].transform(
+        bundle['selector'].transform(pd.DataFrame(X, columns=artifact.feature_names)))
+    expected = bundle['model'].predict_proba(scaled)[:, 1]
+    expected_class = bundle['model'].predict(scaled)
+
+    scorer = artifact.fused_scorer
+    np.testing.assert_allclose(scorer.predict_proba(X), expected, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(scorer.predict(X), expected_class)
+    np.testing.assert_allclose(scorer.contributions(X).sum(axis=1),
+                               scorer.decision_function(X) - scorer.intercept, atol=1e-9)
+    assert np.all(scorer.contributions(X)[:, ~artifact.selector_mask] == 0)
+
+
+def test_phase4_fused_results_identical_to_estimator_path(artifact):
+    """Phase 4 prediction sections are identical with and without the fused scorer"""
+    from enrich_phase4_data import Phase4DataEnricher
+
+    for fixture in ('phase3_artis_reit_metrics.json', 'sample_calculated_metrics.json'):
+        fused = Phase4DataEnricher(str(FIXTURES / fixture), 'TEST-UN.TO', artifact=artifact)
+        pipeline = Phase4DataEnricher(str(FIXTURES / fixture), 'TEST-UN.TO',
+                                      artifact=_sklearn_artifact(artifact))
+
+        assert fused.run_prediction_model({}, {}) == pipeline.run_prediction_model({}, {})
+        assert not fused.artifact.is_loaded and pipeline.artifact.is_loaded
+
+
+def test_fused_scoring_imports_no_sklearn_or_pandas():
+    """Loading the artifact and scoring a batch needs NumPy only"""
+    import subprocess
+
+    code = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(Path(__file__).parent.parent / 'scripts')!r})\n"
+        "from model_artifact import ModelArtifact\n"
+        f"artifact = ModelArtifact.load({str(MODEL_FILE)!r})\n"
+        "rows = [{name: float(i) for name in artifact.feature_names} for i in range(100)]\n"
+        "probabilities = artifact.fused_scorer.predict_proba(artifact.feature_matrix(rows))\n"
+        "assert len(probabilities) == 100\n"
+        "print(sorted(m for m in ('sklearn', 'pandas', 'scipy') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == '[]'
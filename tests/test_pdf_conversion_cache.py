@@ -0,0 +1,157 @@
+"""
+Tests for the Phase 1 conversion cache (scripts/pdf_conversion_cache.py)
+
+Conversions use the fake Docling converter from test_phase1_docling_parallel
+("PDFs" are text files with one line per page), so no PDF library is needed.
+"""
+
+import functools
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import preprocess_pdfs_docling
+from pdf_conversion_cache import ConversionCache, conversion_key, file_digest, main
+from preprocess_pdfs_docling import convert_pdfs_parallel, describe_converter
+from test_phase1_docling_parallel import FakeConverter, classify_by_marker, count_lines
+
+
+@pytest.fixture(autouse=True)
+def fresh_converter(monkeypatch):
+    monkeypatch.setattr(preprocess_pdfs_docling, '_docling_converters', {})
+
+
+@pytest.fixture
+def statements(tmp_path):
+    path = tmp_path / 'statements.pdf'
+    lines = [f"statements text on page {n}" for n in range(1, 13)]
+    lines[4] = 'scan of signed auditor report'
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _convert(pdf_paths, tmp_path, cache, **kwargs):
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    return convert_pdfs_parallel([str(p) for p in pdf_paths], str(tmp_path / 'md'), 'Test REIT', workers=1,
+                                 chunk_pages=4, converter_factory=factory, page_counter=count_lines,
+                                 page_classifier=classify_by_marker, cache=cache, **kwargs)
+
+
+def _constructions(tmp_path):
+    path = tmp_path / 'constructions.log'
+    return path.read_text().split() if path.exists() else []
+
+
+def test_repeat_conversion_is_served_from_cache(statements, tmp_path):
+    """The second run writes identical markdown and stats without building a converter"""
+    cache = ConversionCache(tmp_path / 'cache')
+    [first] = _convert([statements], tmp_path, cache)
+    markdown = Path(first['output']).read_text()
+    Path(first['output']).unlink()
+    (tmp_path / 'constructions.log').unlink()
+
+    [second] = _convert([statements], tmp_path, cache)
+
+    assert (first['cache_hit'], second['cache_hit']) == (False, True)
+    assert _constructions(tmp_path) == []
+    assert Path(second['output']).read_text() == markdown
+    for key in ('pages', 'converted_pages', 'chunks', 'ocr', 'tables', 'lines'):
+        assert second[key] == first[key]
+    assert second['page_seconds'] == 0.0
+
+
+def test_entry_holds_markdown_and_page_ranges(statements, tmp_path):
+    """Each entry stores the stitched markdown, per-range markdown and key material"""
+    cache = ConversionCache(tmp_path / 'cache')
+    [result] = _convert([statements], tmp_path, cache, ocr='all')
+
+    [entry] = cache.entries()
+    cached = cache.get(entry['key'])
+    assert cached['markdown'] == Path(result['output']).read_text()
+    assert sorted(cached['chunks']) == [(1, 4), (5, 8), (9, 12)]
+    assert cached['chunks'][(5, 8)].startswith('## Page 5')
+    assert cached['pdf_sha256'] == file_digest(str(statements))
+    assert entry['options'] == {'ocr': 'all', 'ranges': [[1, 4, True], [5, 8, True], [9, 12, True]]}
+    assert (Path(cache.cache_dir) / entry['key'] / 'pages' / '0005-0008.md').exists()
+
+
+def test_key_covers_content_converter_and_options(statements, tmp_path):
+    """A renamed copy hits; edited content, OCR mode or page selection misses"""
+    cache = ConversionCache(tmp_path / 'cache')
+    _convert([statements], tmp_path, cache)
+
+    renamed = tmp_path / 'copy' / 'renamed.pdf'
+    renamed.parent.mkdir()
+    renamed.write_bytes(statements.read_bytes())
+    assert _convert([renamed], tmp_path, cache)[0]['cache_hit'] is True
+
+    assert _convert([statements], tmp_path, cache, ocr='none')[0]['cache_hit'] is False
+    locator = lambda path: {'pages': [1, 2, 3], 'matched_pages': [2], 'sections': {}}
+    assert _convert([statements], tmp_path, cache, page_locator=locator)[0]['cache_hit'] is False
+
+    statements.write_text(statements.read_text().replace('page 12', 'page twelve'))
+    assert _convert([statements], tmp_path, cache)[0]['cache_hit'] is False
+    assert len(cache.entries()) == 4
+
+    key = conversion_key('0' * 64, describe_converter(), {'ocr': 'auto'})
+    assert key != conversion_key('0' * 64, describe_converter(functools.partial(FakeConverter, '.')), {'ocr': 'auto'})
+
+
+def test_failed_conversions_are_not_cached(statements, tmp_path):
+    cache = ConversionCache(tmp_path / 'cache')
+    factory = functools.partial(FakeConverter, str(tmp_path), failing_page=6)
+    [result] = convert_pdfs_parallel([str(statements)], str(tmp_path / 'md'), 'Test REIT', workers=1,
+                                     converter_factory=factory, page_classifier=classify_by_marker, cache=cache)
+
+    assert result['success'] is False
+    assert cache.entries() == []
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    """Entries over the size bound are evicted least recently used first"""
+    cache = ConversionCache(tmp_path / 'cache')
+    for n, key in enumerate(('a' * 64, 'b' * 64, 'c' * 64)):
+        cache.put(key, 'x' * 10_000, {(1, 1): 'x' * 10_000}, {'pdf': f'{n}.pdf'})
+        past = time.time() - 100 + n
+        os.utime(cache.cache_dir / key / 'entry.json', (past, past))
+
+    assert cache.get('a' * 64) is not None  # refreshes 'a'
+    removed = cache.evict(max_bytes=45_000)
+
+    assert removed == 1
+    assert [e['key'][0] for e in cache.entries()] == ['c', 'a']
+    assert cache.prune(max_bytes=10**9, older_than_days=50 / 86400) == 1
+    assert [e['key'][0] for e in cache.entries()] == ['a']
+
+
+def test_incomplete_entry_is_a_miss(tmp_path):
+    cache = ConversionCache(tmp_path / 'cache')
+    cache.put('d' * 64, 'doc', {(1, 2): 'doc'}, {'pdf': 'x.pdf'})
+    (cache.cache_dir / ('d' * 64) / 'pages' / '0001-0002.md').unlink()
+
+    assert cache.get('d' * 64) is None
+    assert cache.get('e' * 64) is None
+
+
+def test_cli_lists_and_prunes(tmp_path, capsys):
+    cache_dir = str(tmp_path / 'cache')
+    cache = ConversionCache(cache_dir)
+    cache.put('f' * 64, 'x' * 4096, {(1, 3): 'x' * 4096}, {'pdf': 'mda.pdf', 'converter': {'name': 'docling'},
+                                                           'options': {'ocr': 'auto'}})
+
+    assert main(['--cache-dir', cache_dir, 'list']) == 0
+    out = capsys.readouterr().out
+    assert 'ffffffffffff' in out and 'docling/ocr=auto' in out and 'mda.pdf' in out and '1 entry' in out
+
+    assert main(['--cache-dir', cache_dir, 'stats']) == 0
+    assert 'Entries: 1' in capsys.readouterr().out
+
+    assert main(['--cache-dir', cache_dir, 'prune', '--max-mb', '0']) == 0
+    assert 'Removed 1 entry' in capsys.readouterr().out
+    assert cache.entries() == []
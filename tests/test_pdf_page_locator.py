@@ -0,0 +1,142 @@
+"""
+Tests for the financial-statement page locator (scripts/pdf_page_locator.py)
+
+Page text is supplied directly (or read from text-file "PDFs" with one line
+per page), so no PDF library is required.
+"""
+
+import functools
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from pdf_page_locator import (
+    SECTION_MARKERS,
+    format_page_list,
+    locate_pages,
+    locate_pdf_pages,
+    score_page,
+)
+
+
+def statements_pages():
+    """A 30-page statements PDF: statements on 4-7, notes on 18-19 and 24, boilerplate elsewhere"""
+    pages = [f"Notes to the consolidated financial statements - general note {n}" for n in range(1, 31)]
+    pages[0] = "Interim Condensed Consolidated Financial Statements, June 30, 2025"
+    pages[3] = "Consolidated Balance Sheets (In thousands of Canadian dollars) Total assets Total liabilities"
+    pages[4] = "Consolidated Statements of Operations Revenue Property operating expenses Net income"
+    pages[5] = "Consolidated Statement of Comprehensive Income (Loss) Other comprehensive income"
+    pages[6] = "Consolidated Statements of Cash Flows Operating activities Financing activities"
+    pages[17] = "Mortgages and loans payable - Debt maturity schedule and Mortgage repayment schedule"
+    pages[18] = "Credit facilities: the REIT has unsecured credit facilities; available liquidity of $300M"
+    pages[23] = "Weighted-average units outstanding, diluted; restricted units and deferred units"
+    return pages
+
+
+def test_score_page_counts_matches_per_section():
+    """Markers match case-insensitively; sections without matches are omitted"""
+    scores = score_page("FFO and AFFO reconciliation. Funds from Operations (FFO) and ACFO for the period")
+
+    assert scores == {'ffo_affo': 2, 'acfo': 1}
+    assert score_page("Property operating costs increased") == {}
+
+
+def test_vocabulary_extends_the_section_indexer():
+    """The locator reuses ExtractionIndexer.SECTION_MARKERS and adds ACFO"""
+    from extraction_indexer import ExtractionIndexer
+
+    assert {k: v for k, v in SECTION_MARKERS.items() if k != 'acfo'} == ExtractionIndexer.SECTION_MARKERS
+    assert 'acfo' in SECTION_MARKERS
+
+
+def test_locate_pages_selects_matches_and_neighbours():
+    """Matched pages plus one neighbour each side; boilerplate notes are dropped"""
+    result = locate_pages(statements_pages(), min_score=1, neighbours=1)
+
+    assert result['total_pages'] == 30
+    assert result['matched_pages'] == [4, 5, 6, 7, 18, 19, 24]
+    assert result['pages'] == [3, 4, 5, 6, 7, 8, 17, 18, 19, 20, 23, 24, 25]
+    assert result['sections']['balance_sheet'] == [4]
+    assert result['sections']['cash_flow'] == [7]
+    assert result['sections']['debt_schedule'] == [18]
+    assert list(result['sections']) == [s for s in SECTION_MARKERS if s in result['sections']]
+
+
+def test_default_min_score_keeps_every_statement():
+    """Plural IFRS titles match, and a statement title alone selects its page"""
+    assert score_page("CONSOLIDATED STATEMENTS OF FINANCIAL POSITION") == {'balance_sheet': 1}
+    assert score_page("CONSOLIDATED STATEMENTS OF INCOME (LOSS)") == {'income_statement': 1}
+    assert score_page("CONSOLIDATED STATEMENTS OF CASH FLOWS") == {'cash_flow': 2}
+
+    result = locate_pages(statements_pages(), neighbours=0)
+
+    assert result['matched_pages'] == [4, 5, 6, 7, 18, 19, 24]
+    assert (result['sections']['balance_sheet'], result['sections']['cash_flow']) == ([4], [7])
+    assert result['sections']['income_statement'] == [5, 6]
+
+
+def test_min_score_filters_passing_mentions():
+    """A single passing mention is dropped at the default threshold"""
+    pages = ["Liquidity is discussed in section 7", "Liquidity and Capital Resources: credit facilities"]
+
+    assert locate_pages(pages, neighbours=0)['pages'] == [2]
+    assert locate_pages(pages, min_score=1, neighbours=0)['pages'] == [1, 2]
+
+
+def test_neighbours_are_clipped_to_the_document():
+    """Neighbour expansion never runs past the first or last page"""
+    pages = ["Consolidated Balance Sheet Balance Sheet", "x", "y", "Statement of Cash Flows Cash Flow Statement"]
+
+    assert locate_pages(pages, neighbours=2)['pages'] == [1, 2, 3, 4]
+    assert locate_pages([], neighbours=2)['pages'] == []
+
+
+def test_locate_pdf_pages_uses_text_reader(tmp_path):
+    """A custom reader (here: one line per page) replaces the pypdfium2 text layer"""
+    pdf = tmp_path / 'statements.pdf'
+    pdf.write_text("\n".join(statements_pages()) + "\n")
+
+    result = locate_pdf_pages(str(pdf), min_score=1, neighbours=0,
+                              text_reader=lambda path: Path(path).read_text().splitlines())
+
+    assert result['pdf'] == str(pdf)
+    assert result['pages'] == [4, 5, 6, 7, 18, 19, 24]
+
+
+def test_format_page_list():
+    assert format_page_list([1, 2, 3, 7, 9, 10]) == '1-3, 7, 9-10'
+    assert format_page_list([]) == ''
+
+
+def test_docling_converts_only_located_pages(tmp_path):
+    """Phase 1 converts only located pages; unmatched PDFs fall back to the full document"""
+    from test_phase1_docling_parallel import FakeConverter, count_lines
+    from preprocess_pdfs_docling import convert_pdfs_parallel
+    import preprocess_pdfs_docling
+
+    preprocess_pdfs_docling._docling_converters.clear()
+    statements = tmp_path / 'statements.pdf'
+    statements.write_text("\n".join(statements_pages()) + "\n")
+    scanned = tmp_path / 'scanned.pdf'
+    scanned.write_text("\n".join([''] * 5) + "\n")
+
+    lines = lambda path: Path(path).read_text().splitlines()
+    locator = functools.partial(locate_pdf_pages, min_score=1, neighbours=1, text_reader=lines)
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    results = convert_pdfs_parallel([str(statements), str(scanned)], str(tmp_path / 'md'), 'Test REIT',
+                                    workers=1, ocr='none', converter_factory=factory,
+                                    page_counter=count_lines, page_locator=locator)
+
+    markdown = Path(results[0]['output']).read_text()
+    assert (results[0]['pages'], results[0]['converted_pages']) == (30, 13)
+    assert results[0]['chunks'] == 3
+    assert '## Page 4\n' in markdown and '## Page 12\n' not in markdown
+    assert markdown.index('## Page 8\n') < markdown.index('## Page 17\n')
+    assert results[0]['page_selection']['sections']['income_statement'] == [5, 6]
+    assert results[0]['page_selection']['full_document'] is False
+
+    assert results[1]['converted_pages'] == 5
+    assert results[1]['page_selection']['full_document'] is True
+    preprocess_pdfs_docling._docling_converters.clear()
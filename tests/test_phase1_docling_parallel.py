@@ -0,0 +1,252 @@
+"""
+Tests for page-parallel Docling conversion (scripts/preprocess_pdfs_docling.py)
+
+Docling itself is not needed: a fake converter with Docling's
+convert(path, page_range=...) interface reads "PDFs" that are plain text
+files with one line per page. Constructions and OCR conversions are logged
+so converter reuse per worker and selective OCR routing can be checked.
+"""
+
+import functools
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import preprocess_pdfs_docling
+from preprocess_pdfs_docling import (
+    DEFAULT_OCR_SECONDS_PER_PAGE,
+    classify_page,
+    convert_pdfs_parallel,
+    plan_ocr_ranges,
+    plan_page_ranges,
+    stitch_markdown,
+)
+
+
+class FakeDocument:
+    def __init__(self, markdown):
+        self.markdown = markdown
+
+    def export_to_markdown(self):
+        return self.markdown
+
+
+class FakeResult:
+    def __init__(self, markdown):
+        self.document = FakeDocument(markdown)
+
+
+class FakeConverter:
+    """Docling-shaped converter; logs constructions (process id) and OCR'd pages"""
+
+    def __init__(self, log_dir, failing_page=None, do_ocr=True):
+        self.log_dir = Path(log_dir)
+        self.failing_page = failing_page
+        self.do_ocr = do_ocr
+        with open(self.log_dir / 'constructions.log', 'a') as f:
+            f.write(f"{os.getpid()}\n")
+
+    def convert(self, source, page_range=(1, sys.maxsize)):
+        pages = Path(source).read_text().splitlines()
+        first, last = page_range
+        if self.do_ocr:
+            with open(self.log_dir / 'ocr.log', 'a') as f:
+                f.writelines(f"{Path(source).name}:{n}\n" for n in range(first, last + 1))
+        if self.failing_page is not None and first <= self.failing_page <= last:
+            raise RuntimeError('TableFormer crashed')
+        return FakeResult("\n\n".join(f"## Page {n}\n\n{pages[n - 1]}" for n in range(first, last + 1)))
+
+
+def count_lines(path):
+    return len(Path(path).read_text().splitlines())
+
+
+def classify_by_marker(path):
+    """Pages whose text says 'scan' are scanned, 'chart' mixed, the rest text-native"""
+    return ['scanned' if 'scan' in line else 'mixed' if 'chart' in line else 'text'
+            for line in Path(path).read_text().splitlines()]
+
+
+@pytest.fixture(autouse=True)
+def fresh_converter(monkeypatch):
+    """Serial runs cache a converter per process; start each test without one"""
+    monkeypatch.setattr(preprocess_pdfs_docling, '_docling_converters', {})
+
+
+@pytest.fixture
+def filing(tmp_path):
+    """Statements (23 pages) and MD&A (9 pages) 'PDFs'"""
+    pdfs = []
+    for name, pages in (('statements.pdf', 23), ('mda.pdf', 9)):
+        path = tmp_path / name
+        path.write_text("\n".join(f"{name} text on page {n}" for n in range(1, pages + 1)) + "\n")
+        pdfs.append(str(path))
+    return pdfs
+
+
+def _constructions(tmp_path):
+    return (tmp_path / 'constructions.log').read_text().split()
+
+
+def _expected_markdown(pdf_path):
+    pages = Path(pdf_path).read_text().splitlines()
+    return "\n\n".join(f"## Page {n}\n\n{text}" for n, text in enumerate(pages, 1)) + "\n"
+
+
+def test_plan_page_ranges_covers_every_page_once():
+    """Ranges are 1-based, inclusive, contiguous and in page order"""
+    assert plan_page_ranges(23, 8) == [(1, 8), (9, 16), (17, 23)]
+    assert plan_page_ranges(8, 8) == [(1, 8)]
+    assert plan_page_ranges(0, 8) == []
+    with pytest.raises(ValueError):
+        plan_page_ranges(10, 0)
+
+
+def test_stitch_orders_ranges_by_page():
+    """Chunks finishing out of order are joined in page order"""
+    chunks = {(9, 16): 'middle\n', (17, 20): 'end', (1, 8): 'start\n\n'}
+    assert stitch_markdown(chunks) == 'start\n\nmiddle\n\nend\n'
+
+
+def test_parallel_output_equals_whole_document_conversion(filing, tmp_path):
+    """Stitched page ranges equal a single full-document conversion"""
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    results = convert_pdfs_parallel(filing, str(tmp_path / 'md'), 'Test REIT', workers=3, chunk_pages=4,
+                                    ocr='all', converter_factory=factory, page_counter=count_lines)
+
+    assert [r['success'] for r in results] == [True, True]
+    assert [(r['pages'], r['chunks']) for r in results] == [(23, 6), (9, 3)]
+    for pdf_path, result in zip(filing, results):
+        assert Path(result['output']).name == Path(pdf_path).stem + '.md'
+        assert Path(result['output']).read_text() == _expected_markdown(pdf_path)
+
+
+def test_converter_built_once_per_worker(filing, tmp_path):
+    """Nine page ranges over two workers load the models at most twice"""
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    convert_pdfs_parallel(filing, str(tmp_path / 'md'), 'Test REIT', workers=2, chunk_pages=4,
+                          ocr='all', converter_factory=factory, page_counter=count_lines)
+
+    constructions = _constructions(tmp_path)
+    assert 1 <= len(constructions) <= 2
+    assert len(set(constructions)) == len(constructions)
+    assert str(os.getpid()) not in constructions
+
+
+def test_serial_mode_reuses_one_converter_in_process(filing, tmp_path):
+    """workers=1 converts every range of every PDF with one in-process converter"""
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    results = convert_pdfs_parallel(filing, str(tmp_path / 'md'), 'Test REIT', workers=1, chunk_pages=5,
+                                    ocr='all', converter_factory=factory, page_counter=count_lines)
+
+    assert _constructions(tmp_path) == [str(os.getpid())]
+    assert Path(results[1]['output']).read_text() == _expected_markdown(filing[1])
+
+
+def test_serial_mode_builds_converters_from_the_current_factory(filing, tmp_path):
+    """A later serial run with another factory does not get the earlier factory's converter"""
+    convert_pdfs_parallel(filing, str(tmp_path / 'md'), 'Test REIT', workers=1, ocr='all',
+                          converter_factory=functools.partial(FakeConverter, str(tmp_path)), page_counter=count_lines)
+    failing = functools.partial(FakeConverter, str(tmp_path), failing_page=18)
+    results = convert_pdfs_parallel(filing, str(tmp_path / 'md2'), 'Test REIT', workers=1, ocr='all',
+                                    converter_factory=failing, page_counter=count_lines)
+
+    assert [r['success'] for r in results] == [False, True]
+    assert len(_constructions(tmp_path)) == 2
+    assert list(preprocess_pdfs_docling._docling_converters) == [(failing, True)]
+
+
+def test_failed_range_fails_only_its_pdf(filing, tmp_path):
+    """A crashing page range marks that PDF failed; the other PDF is written"""
+    factory = functools.partial(FakeConverter, str(tmp_path), failing_page=18)
+    results = convert_pdfs_parallel(filing, str(tmp_path / 'md'), 'Test REIT', workers=1, chunk_pages=4,
+                                    ocr='all', converter_factory=factory, page_counter=count_lines)
+
+    assert results[0]['success'] is False
+    assert 'pages 17-20' in results[0]['error']
+    assert not (tmp_path / 'md' / 'statements.md').exists()
+    assert results[1]['success'] is True
+
+
+def test_unreadable_pdf_is_reported(filing, tmp_path):
+    """A PDF whose pages cannot be counted is a failure, not an abort"""
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    results = convert_pdfs_parallel(filing + [str(tmp_path / 'missing.pdf')], str(tmp_path / 'md'),
+                                    'Test REIT', workers=1, ocr='all', converter_factory=factory,
+                                    page_counter=count_lines)
+
+    assert [r['success'] for r in results] == [True, True, False]
+    assert 'FileNotFoundError' in results[2]['error']
+
+
+def test_classify_page_thresholds():
+    """Text layer vs image coverage decides text-native, scanned or mixed"""
+    assert classify_page(text_chars=2400, image_coverage=0.0) == 'text'
+    assert classify_page(text_chars=0, image_coverage=0.0) == 'text'      # blank page: nothing to OCR
+    assert classify_page(text_chars=12, image_coverage=0.97) == 'scanned'
+    assert classify_page(text_chars=900, image_coverage=0.6) == 'mixed'   # digital page with a large chart
+    assert classify_page(text_chars=900, image_coverage=0.1) == 'text'    # logo
+
+
+def test_plan_ocr_ranges_split_at_ocr_boundaries():
+    """Ranges never mix OCR and text-layer pages and respect chunk_pages"""
+    classes = ['text'] * 5 + ['scanned'] * 2 + ['text'] + ['mixed'] + ['text'] * 3
+    assert plan_ocr_ranges(classes, chunk_pages=4) == [
+        ((1, 4), False), ((5, 5), False), ((6, 7), True), ((8, 8), False), ((9, 9), True), ((10, 12), False)]
+    assert plan_ocr_ranges([], 4) == []
+
+
+def test_selective_ocr_runs_ocr_only_where_needed(tmp_path):
+    """Only scanned/mixed pages reach the OCR converter; output is unchanged"""
+    pdf = tmp_path / 'statements.pdf'
+    lines = [f"statements text on page {n}" for n in range(1, 21)]
+    lines[11] = 'scan of signed auditor report'
+    lines[16] = 'chart with text'
+    pdf.write_text("\n".join(lines) + "\n")
+
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    [result] = convert_pdfs_parallel([str(pdf)], str(tmp_path / 'md'), 'Test REIT', workers=1, chunk_pages=8,
+                                     converter_factory=factory, page_classifier=classify_by_marker)
+
+    assert (tmp_path / 'ocr.log').read_text().split() == ['statements.pdf:12', 'statements.pdf:17']
+    assert Path(result['output']).read_text() == _expected_markdown(str(pdf))
+    assert len(_constructions(tmp_path)) == 2  # one text-layer and one OCR converter
+
+    ocr = result['ocr']
+    assert ocr['mode'] == 'auto'
+    assert ocr['ocr_pages'] == [12, 17]
+    assert ocr['ocr_skipped_pages'] == 18
+    assert ocr['pages_by_class'] == {'text': 18, 'scanned': 1, 'mixed': 1}
+    assert ocr['page_classes'][12] == 'scanned' and ocr['page_classes'][1] == 'text'
+    assert ocr['estimate_basis'] == 'measured'
+    assert ocr['estimated_seconds_saved'] >= 0
+
+
+def test_born_digital_filing_skips_ocr_entirely(filing, tmp_path):
+    """A text-native filing never builds the OCR converter; savings use the default estimate"""
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    results = convert_pdfs_parallel(filing, str(tmp_path / 'md'), 'Test REIT', workers=2, chunk_pages=8,
+                                    converter_factory=factory, page_classifier=classify_by_marker)
+
+    assert not (tmp_path / 'ocr.log').exists()
+    assert [r['ocr']['ocr_skipped_pages'] for r in results] == [23, 9]
+    assert results[0]['ocr']['estimated_seconds_saved'] == 23 * DEFAULT_OCR_SECONDS_PER_PAGE
+    assert results[0]['ocr']['estimate_basis'] == 'default'
+
+
+def test_ocr_all_matches_previous_behaviour(filing, tmp_path):
+    """--ocr all OCRs every page and reports no savings"""
+    factory = functools.partial(FakeConverter, str(tmp_path))
+    results = convert_pdfs_parallel(filing, str(tmp_path / 'md'), 'Test REIT', workers=1, ocr='all',
+                                    converter_factory=factory, page_counter=count_lines)
+
+    assert len((tmp_path / 'ocr.log').read_text().split()) == 23 + 9
+    assert [r['ocr']['ocr_skipped_pages'] for r in results] == [0, 0]
+    assert 'page_classes' not in results[0]['ocr']
+    with pytest.raises(ValueError):
+        convert_pdfs_parallel(filing, str(tmp_path / 'md'), 'Test REIT', ocr='sometimes')
@@ -0,0 +1,188 @@
+"""
+Tests for the Phase 2 field-level retry (scripts/phase2_field_retry.py)
+
+The end-to-end tests drive extract_key_metrics_efficient.main() through a
+failed extraction, the targeted retry prompt and the patch merge.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from phase2_field_retry import (
+    apply_retry_patch,
+    locate_fields,
+    merge_patch,
+    plan_field_retry,
+    retry_patch_path,
+)
+from validate_extraction_schema import error_paths, validate_schema
+
+FILLER = "\n".join(f"Commentary line {n}." for n in range(1, 46))
+
+STATEMENTS = f"""\
+# Test REIT - Interim Condensed Consolidated Financial Statements
+
+June 30, 2025 (In thousands of Canadian dollars)
+
+## Consolidated Balance Sheets
+
+|                             | June 30, 2025   | December 31, 2024   |
+|-----------------------------|-----------------|---------------------|
+| Total assets                | 2,611,435       | 2,734,077           |
+| Cash                        | 16,639          | 15,480              |
+| Mortgages payable (current) | 253,183         | 221,871             |
+| Mortgages payable (non-current) | 930,114     | 1,011,570           |
+| Credit facilities           | 437,590         | 250,480             |
+
+{FILLER}
+
+## FFO and AFFO
+
+|                       | Q2-25   | Q2-24   |
+|-----------------------|---------|---------|
+| FFO                   | 16,956  | 28,698  |
+| FFO per unit diluted  | 0.17    | 0.27    |
+
+{FILLER}
+"""
+
+
+def valid_extraction():
+    return {
+        'issuer_name': 'Test REIT',
+        'reporting_date': '2025-06-30',
+        'currency': 'CAD',
+        'balance_sheet': {'total_assets': 2611435, 'mortgages_noncurrent': 930114, 'mortgages_current': 253183,
+                          'credit_facilities': 437590, 'cash': 16639},
+        'income_statement': {'noi': 30729, 'interest_expense': 16937, 'revenue': 59082},
+        'ffo_affo': {'ffo': 16956, 'affo': 8204, 'ffo_per_unit': 0.17, 'affo_per_unit': 0.08,
+                     'distributions_per_unit': 0.15},
+    }
+
+
+@pytest.fixture
+def statements(tmp_path):
+    path = tmp_path / 'statements.md'
+    path.write_text(STATEMENTS)
+    return path
+
+
+def test_error_paths_from_validation_errors():
+    """Blocking errors map to dotted paths; warnings are ignored; unnamed errors are reported"""
+    data = valid_extraction()
+    del data['currency']
+    data['balance_sheet']['cash'] = '16,639'
+    data['ffo_affo'] = [0.17]
+    data['portfolio'] = {'occupancy_rate': 87.8}
+    _, errors = validate_schema(data)
+
+    paths, unmapped = error_paths(errors + ['Invalid JSON: Expecting value'])
+
+    assert paths == ['currency', 'balance_sheet.cash', 'ffo_affo.ffo', 'ffo_affo.affo', 'ffo_affo.ffo_per_unit',
+                     'ffo_affo.affo_per_unit', 'ffo_affo.distributions_per_unit']
+    assert unmapped == ['Invalid JSON: Expecting value']
+
+
+def test_locate_fields_uses_the_section_index(statements):
+    """Each field maps to its indexed section; top-level fields to the document header"""
+    ranges, unlocated = locate_fields([statements], ['ffo_affo.ffo_per_unit', 'balance_sheet.cash', 'currency'])
+
+    assert unlocated == []
+    assert [(r['start_line'], r['sections']) for r in ranges] == [(1, ['header', 'balance_sheet']),
+                                                                 (61, ['ffo_affo'])]
+    assert ranges[0]['fields'] == ['currency', 'balance_sheet.cash']
+    assert ranges[1]['end_line'] == len(STATEMENTS.splitlines())
+
+
+def test_plan_falls_back_when_a_field_cannot_be_targeted(statements):
+    """Unnamed errors or unindexed sections mean a full re-extraction"""
+    assert plan_field_retry([statements], ['Invalid JSON: Expecting value']) is None
+    assert plan_field_retry([statements], ["❌ Missing required field: portfolio.occupancy_rate"]) is None
+
+    plan = plan_field_retry([statements], ["❌ Missing required field: balance_sheet.mortgages_current"])
+    assert plan['paths'] == ['balance_sheet.mortgages_current']
+    assert plan['hints']['balance_sheet.mortgages_current']['value'] == 253183
+    assert plan['hints']['balance_sheet.mortgages_current']['line'] == 11
+    assert 0 < plan['estimated_tokens'] < len(STATEMENTS)
+
+
+def test_merge_patch_sets_paths_and_repairs_parents():
+    data = {'balance_sheet': {'cash': 0}, 'ffo_affo': [0.17]}
+
+    applied = merge_patch(data, {'balance_sheet.cash': 16639, 'ffo_affo.ffo': 16956, 'currency': 'CAD'})
+
+    assert applied == ['balance_sheet.cash', 'ffo_affo.ffo', 'currency']
+    assert data == {'balance_sheet': {'cash': 16639}, 'ffo_affo': {'ffo': 16956}, 'currency': 'CAD'}
+
+
+def test_apply_retry_patch(tmp_path):
+    output = tmp_path / 'phase2_extracted_data.json'
+    output.write_text(json.dumps({'balance_sheet': {'cash': 0}}))
+    assert apply_retry_patch(output) is None
+
+    retry_patch_path(output).write_text(json.dumps({'balance_sheet.cash': 16639}))
+    assert apply_retry_patch(output) == ['balance_sheet.cash']
+    assert json.loads(output.read_text()) == {'balance_sheet': {'cash': 16639}}
+    assert not retry_patch_path(output).exists()
+
+    retry_patch_path(output).write_text('[1, 2]')
+    with pytest.raises(ValueError):
+        apply_retry_patch(output)
+
+
+def _run_phase2(monkeypatch, args):
+    import extract_key_metrics_efficient
+
+    monkeypatch.setattr(sys, 'argv', ['extract_key_metrics_efficient.py'] + args)
+    with pytest.raises(SystemExit) as exit_info:
+        extract_key_metrics_efficient.main()
+    return exit_info.value.code
+
+
+def test_targeted_retry_round_trip(statements, tmp_path, monkeypatch):
+    """A failed extraction gets a field-level prompt; the patch is merged on the next run"""
+    output = tmp_path / 'temp' / 'phase2_extracted_data.json'
+    output.parent.mkdir()
+    data = valid_extraction()
+    del data['balance_sheet']['mortgages_current']
+    data['ffo_affo']['ffo_per_unit'] = None
+    output.write_text(json.dumps(data))
+    args = [str(statements), '--issuer-name', 'Test REIT', '--output', str(output)]
+
+    assert _run_phase2(monkeypatch, args) == 0
+
+    prompt = (output.parent / 'phase2_extraction_prompt_RETRY2.txt').read_text()
+    assert 'TARGETED RETRY' in prompt
+    assert '- `balance_sheet.mortgages_current`\n- `ffo_affo.ffo_per_unit`' in prompt
+    assert f'`{statements}` lines 5-' in prompt
+    assert '`balance_sheet.mortgages_current`: 253183 from `statements.md` line 11' in prompt
+    assert STATEMENTS.splitlines()[8] not in prompt  # source rows are referenced, not embedded
+
+    retry_patch_path(output).write_text(json.dumps({'balance_sheet.mortgages_current': 253183,
+                                                    'ffo_affo.ffo_per_unit': 0.17}))
+    assert _run_phase2(monkeypatch, args) == 0
+
+    merged = json.loads(output.read_text())
+    assert merged['balance_sheet']['mortgages_current'] == 253183
+    assert validate_schema(merged)[0] is True
+    assert not retry_patch_path(output).exists()
+
+
+def test_full_retry_flag_keeps_whole_document_retry(statements, tmp_path, monkeypatch):
+    schema = Path(__file__).parent.parent / '.claude' / 'knowledge' / 'phase2_extraction_schema_v2.json'
+    if not schema.exists():
+        pytest.skip('Phase 2 schema not available')
+    output = tmp_path / 'phase2_extracted_data.json'
+    data = valid_extraction()
+    del data['balance_sheet']['cash']
+    output.write_text(json.dumps(data))
+
+    assert _run_phase2(monkeypatch, [str(statements), '--issuer-name', 'Test REIT', '--output', str(output),
+                                     '--full-retry']) == 0
+    assert 'RETRY EXTRACTION' in (tmp_path / 'phase2_extraction_prompt_RETRY2.txt').read_text()
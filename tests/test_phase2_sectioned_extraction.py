@@ -0,0 +1,227 @@
+"""
+Tests for the concurrent sectioned Phase 2 extraction (scripts/phase2_sectioned_extraction.py)
+
+Uses a small inline schema with the shape of phase2_extraction_schema_v2.json
+and the local stub backend, so no network or model is involved.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from phase2_sectioned_extraction import (
+    SECTIONS_DIRNAME,
+    StubBackend,
+    extract_sectioned,
+    main,
+    parse_section_output,
+    plan_section_jobs,
+)
+from phase2_table_prefill import prefill_fields
+from validate_extraction_schema import validate_schema
+
+
+def _numbers(*names):
+    return {'type': 'object', 'properties': {name: {'type': 'number'} for name in names}, 'required': list(names)}
+
+
+SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'issuer_name': {'type': 'string'},
+        'reporting_date': {'type': 'string'},
+        'currency': {'type': 'string'},
+        'balance_sheet': _numbers('total_assets', 'mortgages_noncurrent', 'mortgages_current',
+                                  'credit_facilities', 'cash'),
+        'income_statement': _numbers('noi', 'interest_expense', 'revenue'),
+        'ffo_affo': _numbers('ffo', 'affo', 'ffo_per_unit', 'affo_per_unit', 'distributions_per_unit'),
+        'portfolio': _numbers('occupancy_rate'),
+        'debt': _numbers('weighted_average_rate'),
+    },
+    'required': ['issuer_name', 'reporting_date', 'currency', 'balance_sheet', 'income_statement', 'ffo_affo'],
+}
+
+STATEMENTS = """\
+# Test REIT - Interim Condensed Consolidated Financial Statements
+
+## Consolidated Balance Sheets
+
+|                             | June 30, 2025   | December 31, 2024   |
+|-----------------------------|-----------------|---------------------|
+| Total assets                | 2,611,435       | 2,734,077           |
+| Cash                        | 16,639          | 15,480              |
+"""
+
+
+class ScriptedBackend(StubBackend):
+    """Stub backend with fixed values, optional failures and a delay"""
+
+    def __init__(self, fail=(), delay=0.0):
+        super().__init__(issuer_name='Test REIT')
+        self.fail = set(fail)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, job):
+        with self.lock:
+            self.calls.append(job.name)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if job.name in self.fail:
+                raise RuntimeError(f'{job.name} timed out')
+            data = super().__call__(job)
+            if 'reporting_date' in data:
+                data.update(reporting_date='2025-06-30', currency='CAD')
+            return data
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def statements(tmp_path):
+    path = tmp_path / 'statements.md'
+    path.write_text(STATEMENTS)
+    return path
+
+
+def test_plan_splits_schema_into_section_jobs():
+    jobs = {job.name: job for job in plan_section_jobs(SCHEMA)}
+
+    assert list(jobs) == ['header', 'balance_sheet', 'income_statement', 'ffo_affo', 'portfolio', 'debt']
+    assert jobs['header'].properties == ['issuer_name', 'reporting_date', 'currency']
+    assert jobs['header'].schema['required'] == ['issuer_name', 'reporting_date', 'currency']
+    assert jobs['portfolio'].schema['required'] == []
+    assert jobs['ffo_affo'].template == {'ffo_affo': {'ffo': 0, 'affo': 0, 'ffo_per_unit': 0, 'affo_per_unit': 0,
+                                                      'distributions_per_unit': 0}}
+    assert [job.name for job in plan_section_jobs(SCHEMA, sections=['debt', 'header'])] == ['header', 'debt']
+
+
+def test_sections_run_concurrently_and_merge(statements, tmp_path):
+    output = tmp_path / 'phase2_extracted_data.json'
+    backend = ScriptedBackend(delay=0.2)
+
+    summary = extract_sectioned([statements], 'Test REIT', output, SCHEMA, backend, workers=6,
+                                prefill=prefill_fields([statements]))
+
+    assert backend.peak > 1
+    assert summary['wall_seconds'] < 0.2 * len(backend.calls)
+    assert summary['written'] and summary['is_valid'], summary['errors']
+    merged = json.loads(output.read_text())
+    assert list(merged) == list(SCHEMA['properties'])
+    assert merged['issuer_name'] == 'Test REIT'
+    assert validate_schema(merged)[0] is True
+
+    prompt = (tmp_path / SECTIONS_DIRNAME / 'balance_sheet_prompt.txt').read_text()
+    assert 'Extract ONLY these top-level fields: `balance_sheet`' in prompt
+    assert f'`{statements}` lines 3-' in prompt
+    assert '`balance_sheet.total_assets` (line 7 of statements.md)' in prompt
+    assert '"total_assets": 2611435' in prompt
+
+
+def test_failed_section_is_rerun_alone(statements, tmp_path):
+    output = tmp_path / 'phase2_extracted_data.json'
+
+    first = extract_sectioned([statements], 'Test REIT', output, SCHEMA, ScriptedBackend(fail={'ffo_affo'}))
+    assert first['failed'] == ['ffo_affo']
+    assert first['results']['ffo_affo']['error'] == 'ffo_affo timed out'
+    assert not first['written'] and not output.exists()
+
+    backend = ScriptedBackend()
+    second = extract_sectioned([statements], 'Test REIT', output, SCHEMA, backend)
+    assert backend.calls == ['ffo_affo']
+    assert {name: r['status'] for name, r in second['results'].items()}['balance_sheet'] == 'cached'
+    assert second['written'] and second['is_valid']
+
+
+def test_merge_reports_missing_required_sections(statements, tmp_path):
+    """Output without a job's properties fails that job; merged output is validated against the full schema"""
+    output = tmp_path / 'phase2_extracted_data.json'
+    schema = dict(SCHEMA, required=SCHEMA['required'] + ['portfolio'])
+
+    class DropsPortfolio(ScriptedBackend):
+        def __call__(self, job):
+            return {} if job.name == 'portfolio' else super().__call__(job)
+
+    class DropsPortfolioEmptyIncome(DropsPortfolio):
+        def __call__(self, job):
+            return {'income_statement': {}} if job.name == 'income_statement' else super().__call__(job)
+
+    summary = extract_sectioned([statements], 'Test REIT', output, schema, DropsPortfolioEmptyIncome())
+    assert summary['failed'] == ['portfolio']
+    assert 'missing portfolio' in summary['results']['portfolio']['error']
+
+    summary = extract_sectioned([statements], 'Test REIT', output, schema, ScriptedBackend(),
+                                sections=['portfolio'])
+    assert summary['written'] and not summary['is_valid']
+    assert '❌ Missing required field: income_statement.noi' in summary['errors']
+
+
+def test_parse_section_output():
+    assert parse_section_output('```json\n{"portfolio": {"occupancy_rate": 0.9}}\n```') == \
+        {'portfolio': {'occupancy_rate': 0.9}}
+    envelope = json.dumps({'type': 'result', 'result': 'Here it is:\n{"debt": {"weighted_average_rate": 0.04}}'})
+    assert parse_section_output(envelope) == {'debt': {'weighted_average_rate': 0.04}}
+    with pytest.raises(ValueError):
+        parse_section_output('no json here')
+
+
+def test_main_with_command_backend(statements, tmp_path):
+    schema_path = tmp_path / 'schema.json'
+    schema_path.write_text(json.dumps(SCHEMA))
+    output = tmp_path / 'phase2_extracted_data.json'
+    section = {'debt': {'weighted_average_rate': 0.04}}
+    agent = tmp_path / 'agent.py'
+    agent.write_text(f"import sys\nsys.stdin.read()\nprint({json.dumps(json.dumps(section))})\n")
+    command = f'{sys.executable} {agent}'
+
+    args = [str(statements), '--issuer-name', 'Test REIT', '--output', str(output), '--schema', str(schema_path),
+            '--backend', 'command', '--backend-command', command, '--workers', '2']
+
+    assert main(args) == 1  # every job but debt returns the wrong section
+    saved = json.loads((tmp_path / SECTIONS_DIRNAME / 'debt.json').read_text())
+    assert saved['data'] == section and saved['key']
+
+    main(args + ['--model-id', 'model-b'])
+    assert json.loads((tmp_path / SECTIONS_DIRNAME / 'debt.json').read_text())['key'] != saved['key']
+    with pytest.raises(SystemExit):
+        main(args[:-6] + ['--workers', '2'])  # no --backend: stub is never picked implicitly
+
+
+def test_saved_sections_are_reused_only_under_the_same_key(statements, tmp_path):
+    """Inputs, schema fragment and backend are part of each section's key; --force reruns all"""
+    output = tmp_path / 'phase2_extracted_data.json'
+
+    def calls(schema=SCHEMA, backend=None, **kwargs):
+        backend = backend or ScriptedBackend()
+        extract_sectioned([statements], 'Test REIT', output, schema, backend, **kwargs)
+        return backend.calls
+
+    every = sorted(job.name for job in plan_section_jobs(SCHEMA))
+    assert sorted(calls()) == every
+    assert calls() == []
+    assert sorted(calls(reuse=False)) == every
+
+    wider_debt = dict(SCHEMA, properties=dict(SCHEMA['properties'], debt=_numbers('weighted_average_rate', 'term')))
+    assert calls(wider_debt) == ['debt']
+
+    class OtherModel(ScriptedBackend):
+        backend_id = 'command:agent model:other'
+
+    assert sorted(calls(backend=OtherModel())) == every
+    assert calls(backend=OtherModel()) == []
+
+    statements.write_text(STATEMENTS.replace('16,639', '16,640'))
+    assert sorted(calls(backend=OtherModel())) == every
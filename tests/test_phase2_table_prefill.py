@@ -0,0 +1,179 @@
+"""
+Tests for the deterministic Phase 2 table pre-extraction (scripts/phase2_table_prefill.py)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from markdown_table_store import TableStore
+from phase2_table_prefill import (
+    FIELD_RULES,
+    FieldRule,
+    apply_prefill,
+    extract_field,
+    format_prefill_section,
+    main,
+    prefill_fields,
+)
+
+TESTS = Path(__file__).parent
+FIXTURES = TESTS / 'fixtures'
+
+DOCLING_BALANCE_SHEET = """\
+## Interim Condensed Consolidated Balance Sheets
+
+|                                   | Note   | June 30, 2025   | December 31, 2024   |
+|-----------------------------------|--------|-----------------|---------------------|
+| Total assets                      |        | $ 2,611,435     | $ 2,734,077         |
+| **Liabilities**                   |        |                 |                     |
+| Non-current liabilities:          |        |                 |                     |
+| Mortgages and loans payable       | 7      | 930,114         | 1,011,570           |
+| Credit facilities                 | 8      | 437,590         | 250,480             |
+| Current liabilities:              |        |                 |                     |
+| Mortgages and loans payable       | 7      | 253,183         | 221,871             |
+| Cash                              |        | 16,639          | —                   |
+| Total liabilities                 |        | 1,616,178       | 1,688,184           |
+
+## Interim Condensed Consolidated Statements of Operations
+
+|                      | Three months ended June 30, 2025   | Three months ended June 30, 2024   |
+|----------------------|------------------------------------|------------------------------------|
+| Interest expense     | (16,937)                           | (31,145)                           |
+| FFO per unit         | 15,000                             | 14,000                             |
+"""
+
+
+@pytest.fixture
+def statements(tmp_path):
+    path = tmp_path / 'statements.md'
+    path.write_text(DOCLING_BALANCE_SHEET)
+    return path
+
+
+def test_fixture_fills_required_fields_with_provenance(tmp_path):
+    """Every required table field of the sample statements is pre-filled from its row"""
+    markdown = tmp_path / 'sample.md'
+    markdown.write_text((FIXTURES / 'sample_financial_statement.md').read_text())
+
+    prefill = prefill_fields([markdown])
+    values = {path: field['value'] for path, field in prefill['fields'].items()}
+
+    assert values['balance_sheet.total_assets'] == 1500000
+    assert values['balance_sheet.mortgages_noncurrent'] == 250000
+    assert values['balance_sheet.mortgages_current'] == 150000
+    assert values['income_statement.noi'] == 30000
+    assert values['ffo_affo.ffo_per_unit'] == 0.25
+    assert values['ffo_affo.distributions_per_unit'] == 0.18
+    assert prefill['gaps'] == ['portfolio.occupancy_rate']
+
+    total_assets = prefill['fields']['balance_sheet.total_assets']
+    assert (total_assets['source'], total_assets['line'], total_assets['label']) == ('sample.md', 8, 'Total Assets')
+    assert total_assets['caption'] == 'Balance Sheet (June 30, 2025)'
+    assert total_assets['confidence'] == 1.0
+
+
+def test_sub_headings_split_current_and_noncurrent(statements):
+    """Repeated labels are told apart by the sub-heading they sit under"""
+    prefill = prefill_fields([statements])
+    fields = prefill['fields']
+
+    assert fields['balance_sheet.mortgages_noncurrent']['value'] == 930114
+    assert fields['balance_sheet.mortgages_current']['value'] == 253183
+    assert fields['balance_sheet.mortgages_current']['line'] == 11
+    assert fields['balance_sheet.total_liabilities']['value'] == 1616178
+
+
+def test_current_period_column_and_sign_rules(statements):
+    """Values come from the current-period column; expenses are positive; bad values are rejected"""
+    fields = prefill_fields([statements])['fields']
+
+    assert fields['balance_sheet.cash']['value'] == 16639
+    assert fields['balance_sheet.cash']['column'] == 'June 30, 2025'
+    assert fields['income_statement.interest_expense']['value'] == 16937
+    assert 'ffo_affo.ffo_per_unit' not in fields  # 15,000 is not a per-unit amount
+
+
+def test_real_mda_tables():
+    """Artis Q2-25 MD&A: headline values are read from the current quarter"""
+    prefill = prefill_fields([TESTS / 'docling_ArtisREIT_Q2_25_MDA.md'],
+                             store=TableStore.from_markdown(
+                                 (TESTS / 'docling_ArtisREIT_Q2_25_MDA.md').read_text(), source='mda.md'))
+    values = {path: field['value'] for path, field in prefill['fields'].items()}
+
+    assert values['balance_sheet.total_assets'] == 2611435
+    assert values['income_statement.noi'] == 30729
+    assert values['ffo_affo.ffo'] == 16956
+    assert values['ffo_affo.ffo_per_unit'] == 0.17
+    assert values['ffo_affo.affo_per_unit'] == 0.08
+    assert values['ffo_affo.distributions_per_unit'] == 0.15
+    assert values['portfolio.occupancy_rate'] == pytest.approx(0.878)
+
+
+def test_disagreeing_rows_lower_confidence():
+    """Conflicting rows vote; a split vote falls below the pre-fill threshold"""
+    store = TableStore.from_markdown("""\
+## Segment A
+| | Q2 |
+|---|---|
+| Revenue | 100 |
+
+## Segment B
+| | Q2 |
+|---|---|
+| Revenue | 200 |
+""", source='mda.md')
+    rule = FieldRule('income_statement.revenue', [r'^revenue$'], caption=r'operations')
+
+    field = extract_field(store, rule)
+    assert field['value'] == 100 and field['matches'] == 2
+    assert field['confidence'] == pytest.approx(0.7)
+
+    prefill = prefill_fields([], rules=[rule], store=store)
+    assert prefill['fields'] == {}
+    assert 'income_statement.revenue' in prefill['low_confidence']
+    assert prefill['gaps'] == ['income_statement.revenue']
+
+
+def test_template_and_prompt_section(statements):
+    """Pre-filled values are set in the template and listed with their source in the prompt"""
+    prefill = prefill_fields([statements])
+    template = {'balance_sheet': {'total_assets': 0, 'cash': 0}, 'ffo_affo': {'ffo': 0}}
+
+    filled = apply_prefill(template, prefill)
+    assert filled['balance_sheet'] == {'total_assets': 2611435, 'cash': 16639,
+                                       'mortgages_noncurrent': 930114, 'mortgages_current': 253183,
+                                       'credit_facilities': 437590, 'total_liabilities': 1616178}
+    assert filled['income_statement'] == {'interest_expense': 16937}
+    assert template['balance_sheet']['total_assets'] == 0
+
+    section = format_prefill_section(prefill)
+    assert '| `balance_sheet.total_assets` | 2611435 | 1.00 | statements.md:5 -' in section
+    assert '**Still to extract:** `balance_sheet.investment_properties`' in section
+    assert format_prefill_section({'fields': {}, 'gaps': []}) == ''
+
+
+def test_extraction_prompt_covers_only_gaps(statements):
+    """The Phase 2 prompt embeds the pre-filled values"""
+    schema = Path(__file__).parent.parent / '.claude' / 'knowledge' / 'phase2_extraction_schema_v2.json'
+    if not schema.exists():
+        pytest.skip('Phase 2 schema not available')
+    from extract_key_metrics_efficient import create_efficient_extraction_prompt
+
+    prefill = prefill_fields([statements])
+    prompt = create_efficient_extraction_prompt([str(statements)], 'out.json', 'Test REIT', prefill=prefill)
+
+    assert 'Pre-extracted Values' in prompt and '"total_assets": 2611435' in prompt
+
+
+def test_cli_writes_prefill(statements, tmp_path, capsys):
+    output = tmp_path / 'phase2_table_prefill.json'
+
+    assert main([str(statements), '--output', str(output)]) == 0
+    assert f'/{len(FIELD_RULES)} fields' in capsys.readouterr().out
+    assert json.loads(output.read_text())['fields']['balance_sheet.cash']['value'] == 16639
@@ -0,0 +1,188 @@
+"""
+Tests for the vectorized Phase 3 batch engine
+
+calculate_all_metrics_batch() must return the same numbers as the per-issuer
+calculate_all_metrics() path for every row it accepts, and must report rows
+the per-issuer path would reject instead of raising.
+"""
+
+import copy
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pd = pytest.importorskip('pandas')
+
+from calculate_credit_metrics import calculate_all_metrics
+from calculate_credit_metrics.batch import calculate_all_metrics_batch
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+FIXTURE_FILES = [
+    'sample_extracted_data.json',
+    'dream_industrial_reit_q2_2025_with_acfo.json',
+    'reit_burn_rate_high_risk.json',
+    'reit_negative_afcf_burn_scenario.json',
+]
+
+
+def _load(name):
+    with open(FIXTURES / name) as f:
+        return json.load(f)
+
+
+def _flatten(d, prefix=''):
+    flat = {}
+    for key, value in d.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f'{prefix}{key}.'))
+        else:
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+
+def _is_missing(value):
+    return value is None or pd.isna(value)
+
+
+def _assert_row_matches(row, expected):
+    """Every batch metric column equals the per-issuer value (or both are absent)"""
+    metric_columns = [c for c in row.index if '.' in c]
+    for column in metric_columns:
+        batch_value = row[column]
+        scalar_value = expected.get(column)
+        if scalar_value is None:
+            assert _is_missing(batch_value), f"{column}: expected missing, got {batch_value}"
+        else:
+            assert not _is_missing(batch_value), f"{column}: expected {scalar_value}, got missing"
+            assert batch_value == scalar_value, f"{column}: {batch_value} != {scalar_value}"
+
+
+@pytest.mark.parametrize('fixture_name', FIXTURE_FILES)
+def test_batch_matches_per_issuer_path(fixture_name):
+    """Each fixture produces identical metrics through both paths"""
+    data = _load(fixture_name)
+    expected = _flatten(calculate_all_metrics(copy.deepcopy(data)))
+
+    frame = calculate_all_metrics_batch([data])
+
+    assert len(frame) == 1
+    row = frame.iloc[0]
+    assert _is_missing(row['error'])
+    assert row['issuer_name'] == expected['issuer_name']
+    assert row['reporting_period'] == expected['reporting_period']
+    _assert_row_matches(row, expected)
+
+
+def test_batch_preserves_input_order_and_mixes_issuers():
+    """Mixed batch keeps one row per input in input order"""
+    records = [_load(name) for name in FIXTURE_FILES] * 3
+    frame = calculate_all_metrics_batch(records)
+
+    assert len(frame) == len(records)
+    assert list(frame['issuer_name']) == [r['issuer_name'] for r in records]
+
+    for i, record in enumerate(records):
+        expected = _flatten(calculate_all_metrics(copy.deepcopy(record)))
+        _assert_row_matches(frame.iloc[i], expected)
+
+
+def test_batch_burn_rate_columns_for_high_risk_scenario():
+    """Burn rate, runway and risk level columns are populated when AFCF < obligations"""
+    frame = calculate_all_metrics_batch([_load('reit_burn_rate_high_risk.json')])
+    row = frame.iloc[0]
+
+    assert bool(row['burn_rate_analysis.applicable']) is True
+    assert row['burn_rate_analysis.monthly_burn_rate'] < 0
+    assert row['cash_runway.runway_months'] > 0
+    assert row['liquidity_risk.risk_level'] in ('CRITICAL', 'HIGH', 'MODERATE', 'LOW')
+
+
+def test_batch_flags_rows_per_issuer_path_rejects():
+    """Invalid rows get an error message and NaN metrics; valid rows are unaffected"""
+    good = _load('sample_extracted_data.json')
+
+    missing_assets = copy.deepcopy(good)
+    del missing_assets['balance_sheet']['total_assets']
+
+    negative_debt = copy.deepcopy(good)
+    negative_debt['balance_sheet']['mortgages_current'] = -1
+
+    zero_interest = copy.deepcopy(good)
+    zero_interest['income_statement']['interest_expense'] = 0
+
+    for bad in (missing_assets, negative_debt, zero_interest):
+        with pytest.raises((KeyError, ValueError)):
+            calculate_all_metrics(copy.deepcopy(bad))
+
+    frame = calculate_all_metrics_batch([good, missing_assets, negative_debt, zero_interest])
+
+    assert 'balance_sheet.total_assets' in frame.loc[1, 'error']
+    assert 'mortgages_current' in frame.loc[2, 'error']
+    assert 'interest_expense' in frame.loc[3, 'error']
+    for i in (1, 2, 3):
+        assert math.isnan(frame.loc[i, 'leverage_metrics.total_debt'])
+        assert math.isnan(frame.loc[i, 'reit_metrics.ffo'])
+
+    _assert_row_matches(frame.iloc[0], _flatten(calculate_all_metrics(copy.deepcopy(good))))
+
+
+def test_batch_does_not_mutate_inputs():
+    """Unlike calculate_all_metrics, the batch path leaves Phase 2 dicts untouched"""
+    data = _load('reit_burn_rate_high_risk.json')
+    before = copy.deepcopy(data)
+
+    calculate_all_metrics_batch([data])
+
+    assert data == before
+
+
+def test_batch_empty_input():
+    """Empty input returns an empty frame with the identity columns"""
+    frame = calculate_all_metrics_batch([])
+
+    assert len(frame) == 0
+    assert 'issuer_name' in frame.columns
+    assert 'error' in frame.columns
+
+
+def _perturb(data, rnd):
+    """Copy of an extraction with every numeric field rescaled (whole numbers stay whole)"""
+    if isinstance(data, dict):
+        return {key: _perturb(value, rnd) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_perturb(value, rnd) for value in data]
+    if isinstance(data, bool) or not isinstance(data, (int, float)):
+        return data
+    scaled = data * rnd.choice([0.5, 0.75, 1, 1.05, 1.25, 1.5, 2, rnd.uniform(0.5, 2)])
+    return round(scaled) if isinstance(data, int) or abs(data) >= 100 else round(scaled, 3)
+
+
+def test_batch_matches_per_issuer_path_on_randomized_inputs():
+    """Seeded random rescalings of every fixture give identical metrics (incl. rounding of half values)"""
+    import random
+
+    rnd = random.Random(20251018)
+    records, expected = [], []
+    for name in FIXTURE_FILES:
+        base = _load(name)
+        for _ in range(150):
+            record = _perturb(base, rnd)
+            try:
+                expected.append(_flatten(calculate_all_metrics(copy.deepcopy(record))))
+            except (KeyError, ValueError):
+                continue
+            records.append(record)
+
+    frame = calculate_all_metrics_batch(records)
+
+    assert len(records) > 300
+    for i, row_expected in enumerate(expected):
+        _assert_row_matches(frame.iloc[i], row_expected)
@@ -0,0 +1,139 @@
+"""
+Tests for the content-addressed Phase 3 result cache
+
+Unchanged Phase 2 input + unchanged calculation code must return the stored
+result; any change to either must recompute.
+"""
+
+import copy
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from calculate_credit_metrics import calculate_all_metrics
+from calculate_credit_metrics.cache import (
+    MetricsCache,
+    cache_key,
+    calculate_all_metrics_cached,
+    calculation_fingerprint,
+)
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture
+def phase2_data():
+    with open(FIXTURES / 'dream_industrial_reit_q2_2025_with_acfo.json') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MetricsCache(tmp_path / 'cache')
+
+
+def test_cache_key_ignores_key_order(phase2_data):
+    """Canonicalization: the same data in a different key order hashes identically"""
+    reordered = json.loads(json.dumps(phase2_data, sort_keys=True))
+    reordered = dict(reversed(list(reordered.items())))
+
+    assert cache_key(reordered) == cache_key(phase2_data)
+
+
+def test_cache_key_changes_with_input(phase2_data):
+    """Any change to a Phase 2 value produces a new key"""
+    changed = copy.deepcopy(phase2_data)
+    changed['balance_sheet']['total_assets'] += 1
+
+    assert cache_key(changed) != cache_key(phase2_data)
+
+
+def test_cache_key_changes_with_calculation_code(phase2_data):
+    """Fingerprint covers the calculation source, so code changes invalidate entries"""
+    extra = str(Path(__file__).resolve())
+
+    assert calculation_fingerprint(extra) != calculation_fingerprint()
+    assert cache_key(phase2_data, calculation_fingerprint(extra)) != cache_key(phase2_data)
+
+
+def test_miss_then_hit_returns_identical_result(phase2_data, cache):
+    """Second run is served from the cache and matches a fresh calculation"""
+    first, first_hit = calculate_all_metrics_cached(phase2_data, cache=cache)
+    second, second_hit = calculate_all_metrics_cached(phase2_data, cache=cache)
+
+    assert first_hit is False
+    assert second_hit is True
+    assert second == json.loads(json.dumps(calculate_all_metrics(copy.deepcopy(phase2_data))))
+
+
+def test_cached_call_does_not_mutate_input(phase2_data, cache):
+    """The key is computed on the input as loaded, so it must not be annotated in place"""
+    before = copy.deepcopy(phase2_data)
+
+    calculate_all_metrics_cached(phase2_data, cache=cache)
+
+    assert phase2_data == before
+
+
+def test_use_cache_false_recomputes(phase2_data, cache):
+    """--no-cache path: always recompute, but refresh the stored entry"""
+    calls = []
+
+    def counting_calculate(data):
+        calls.append(1)
+        return calculate_all_metrics(data)
+
+    calculate_all_metrics_cached(phase2_data, cache=cache, calculate=counting_calculate)
+    calculate_all_metrics_cached(phase2_data, cache=cache, calculate=counting_calculate, use_cache=False)
+    _, hit = calculate_all_metrics_cached(phase2_data, cache=cache, calculate=counting_calculate)
+
+    assert len(calls) == 2
+    assert hit is True
+
+
+def test_failures_are_not_cached(phase2_data, cache):
+    """Invalid input raises as before and leaves no cache entry"""
+    bad = copy.deepcopy(phase2_data)
+    del bad['balance_sheet']['total_assets']
+
+    with pytest.raises(KeyError):
+        calculate_all_metrics_cached(bad, cache=cache)
+
+    assert not cache.cache_dir.exists() or not list(cache.cache_dir.glob('*.json'))
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    """Over the size bound, the least recently used entries are evicted first"""
+    cache = MetricsCache(tmp_path / 'cache', max_bytes=10**9)
+    payload = {'data': 'x' * 1000}
+
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.put(key, payload)
+        os.utime(cache.cache_dir / f'{key}.json', (1000 + i, 1000 + i))
+
+    # Touch 'a' so 'b' becomes the least recently used
+    assert cache.get('a') == payload
+
+    entry_size = (cache.cache_dir / 'a.json').stat().st_size
+    cache.max_bytes = entry_size * 2
+    removed = cache.evict()
+
+    assert removed == 1
+    assert cache.get('b') is None
+    assert cache.get('a') == payload
+    assert cache.get('c') == payload
+
+
+def test_unreadable_entry_is_a_miss(cache):
+    """A corrupted entry is treated as a miss rather than an error"""
+    cache.cache_dir.mkdir(parents=True)
+    (cache.cache_dir / 'deadbeef.json').write_text('{not json')
+
+    assert cache.get('deadbeef') is None
@@ -0,0 +1,240 @@
+"""
+Tests for multi-issuer Phase 4 enrichment (enrich_phase4_data.py --batch)
+
+Runs offline: market prices come from a stub provider and macro series from
+the fixture backend (tests/fixtures/macro). The real v2.2 model is used so
+batched predictions can be compared with single-issuer runs.
+"""
+
+import json
+import pickle
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+pytest.importorskip('sklearn')
+
+from enrich_phase4_data import (
+    Phase4DataEnricher,
+    discover_enrichment_jobs,
+    enrich_portfolio,
+    load_prediction_model,
+)
+from macro_series_cache import FixtureMacroBackend, MacroSeriesCache
+from openbb_macro_monitor import EnhancedMacroMonitor
+from openbb_market_monitor import AsyncMarketDataCollector
+
+
+REPO_ROOT = Path(__file__).parent.parent
+FIXTURES = Path(__file__).parent / 'fixtures'
+MODEL_FILE = REPO_ROOT / 'models' / 'distribution_cut_logistic_regression_v2.2.pkl'
+
+ISSUERS = {
+    'Artis_REIT': ('AX-UN.TO', 'phase3_artis_reit_metrics.json'),
+    'RioCan_REIT': ('REI-UN.TO', 'sample_calculated_metrics.json'),
+    'Allied_Properties': ('AP-UN.TO', 'sample_calculated_metrics.json'),
+}
+
+
+class StubProvider:
+    """Synthetic daily prices per symbol; records requests, can fail per symbol"""
+
+    def __init__(self, failing=()):
+        self.requests = []
+        self.failing = set(failing)
+
+    def __call__(self, symbol, provider, start_date, end_date):
+        self.requests.append(symbol)
+        if symbol in self.failing:
+            raise ConnectionError('provider down')
+        dates = pd.bdate_range(start_date, end_date)
+        rng = np.random.default_rng(sum(map(ord, symbol)))
+        close = 12 * np.exp(np.cumsum(rng.normal(-0.001, 0.015, len(dates))))
+        return pd.DataFrame({'close': close, 'volume': rng.integers(10_000, 90_000, len(dates))},
+                            index=pd.Index(dates, name='date'))
+
+
+@pytest.fixture(scope='module')
+def artifact():
+    if not MODEL_FILE.exists():
+        pytest.skip('v2.2 model not available')
+    return load_prediction_model(MODEL_FILE)
+
+
+@pytest.fixture
+def issuer_reports(tmp_path):
+    """Issuer_Reports/<Issuer>/temp/phase3_calculated_metrics.json tree"""
+    root = tmp_path / 'Issuer_Reports'
+    for folder, (_, fixture) in ISSUERS.items():
+        temp = root / folder / 'temp'
+        temp.mkdir(parents=True)
+        shutil.copy(FIXTURES / fixture, temp / 'phase3_calculated_metrics.json')
+    return root
+
+
+@pytest.fixture
+def macro_backend():
+    return FixtureMacroBackend(FIXTURES / 'macro')
+
+
+@pytest.fixture
+def macro_monitor(tmp_path, macro_backend):
+    return EnhancedMacroMonitor(MacroSeriesCache(tmp_path / 'macro', backend=macro_backend))
+
+
+def _jobs(issuer_reports):
+    jobs, skipped = discover_enrichment_jobs(str(issuer_reports / '*' / 'temp' / 'phase3_calculated_metrics.json'))
+    assert skipped == []
+    return jobs
+
+
+def _collector(provider):
+    return AsyncMarketDataCollector(provider='tmx', fetcher=provider, rate_limits={}, max_retries=1,
+                                    backoff_seconds=0)
+
+
+def test_batched_predictions_match_single_issuer_runs(issuer_reports, artifact, macro_monitor):
+    """Each issuer's batched prediction equals Phase4DataEnricher.run_prediction_model()"""
+    jobs = _jobs(issuer_reports)
+    summary = enrich_portfolio(jobs, collector=_collector(StubProvider()), macro_monitor=macro_monitor,
+                               artifact=artifact)
+
+    assert summary['succeeded'] == len(ISSUERS) and summary['failed'] == 0
+    for job in jobs:
+        with open(job['output'], 'r') as f:
+            enriched = json.load(f)
+
+        enricher = Phase4DataEnricher(job['phase3'], job['ticker'], artifact=artifact)
+        single = enricher.run_prediction_model(enriched['market_risk'], enriched['macro_environment'])
+        batched = enriched['distribution_cut_prediction']
+
+        assert set(enriched) == {'metadata', 'phase3_metrics', 'market_risk', 'macro_environment',
+                                 'distribution_history', 'distribution_cut_prediction'}
+        assert enriched['metadata']['ticker'] == job['ticker']
+        for key in ('cut_probability_pct', 'predicted_class', 'risk_level', 'risk_badge', 'confidence',
+                    'model_version', 'model_performance'):
+            assert batched[key] == single[key]
+        assert [d['feature'] for d in batched['top_drivers']] == [d['feature'] for d in single['top_drivers']]
+        assert [d['value'] for d in batched['top_drivers']] == pytest.approx(
+            [float(d['value']) for d in single['top_drivers']])
+
+
+def test_model_macro_and_market_are_shared(issuer_reports, macro_monitor, macro_backend, monkeypatch):
+    """One model load, one request per macro series, one market request per ticker"""
+    if not MODEL_FILE.exists():
+        pytest.skip('v2.2 model not available')
+    import enrich_phase4_data
+
+    loads = []
+    real_load = enrich_phase4_data.load_model_artifact
+    monkeypatch.setattr(enrich_phase4_data, 'load_model_artifact', lambda path: loads.append(path) or real_load(path))
+    unpickled = []
+    real_unpickle = pickle.load
+    monkeypatch.setattr(pickle, 'load', lambda f: unpickled.append(f.name) or real_unpickle(f))
+
+    provider = StubProvider()
+    summary = enrich_portfolio(_jobs(issuer_reports), model_file=str(MODEL_FILE),
+                               collector=_collector(provider), macro_monitor=macro_monitor)
+
+    assert summary['succeeded'] == len(ISSUERS)
+    assert len(loads) == 1
+    assert unpickled == []  # fused v2.2 scorer: no estimator unpickling
+    assert sorted(source for source, _, _ in macro_backend.calls) == ['boc', 'fred']
+    assert sorted(provider.requests) == sorted(ticker for ticker, _ in ISSUERS.values())
+    assert {'model_load_seconds', 'market_and_macro_seconds', 'scoring_seconds',
+            'wall_seconds'} <= set(summary['timing'])
+
+
+def test_jobs_sharing_a_ticker_keep_their_own_results(issuer_reports, artifact, macro_monitor, tmp_path):
+    """Two periods of one issuer: one market request, a prediction and output per job"""
+    artis = issuer_reports / 'Artis_REIT' / 'temp' / 'phase3_calculated_metrics.json'
+    other = issuer_reports / 'RioCan_REIT' / 'temp' / 'phase3_calculated_metrics.json'
+    jobs = [{'phase3': str(phase3), 'ticker': 'AX-UN.TO', 'output': str(tmp_path / f'{period}.json')}
+            for phase3, period in ((artis, 'q2'), (other, 'q3'))]
+    provider = StubProvider()
+
+    summary = enrich_portfolio(jobs, collector=_collector(provider), macro_monitor=macro_monitor, artifact=artifact)
+
+    assert summary['succeeded'] == 2
+    assert provider.requests == ['AX-UN.TO']
+    assert [r['output'] for r in summary['results']] == [job['output'] for job in jobs]
+    predictions = []
+    for job in jobs:
+        with open(job['output'], 'r') as f:
+            enriched = json.load(f)
+        single = Phase4DataEnricher(job['phase3'], job['ticker'], artifact=artifact).run_prediction_model(
+            enriched['market_risk'], enriched['macro_environment'])
+        assert enriched['metadata']['phase3_source'] == job['phase3']
+        assert enriched['distribution_cut_prediction']['cut_probability_pct'] == single['cut_probability_pct']
+        predictions.append(single['cut_probability_pct'])
+    assert predictions[0] != predictions[1]
+
+
+def test_market_failure_falls_back_for_that_issuer_only(issuer_reports, artifact, macro_monitor):
+    """A ticker without prices gets the market fallback; the portfolio still completes"""
+    jobs = _jobs(issuer_reports)
+    summary = enrich_portfolio(jobs, collector=_collector(StubProvider(failing={'AX-UN.TO'})),
+                               macro_monitor=macro_monitor, artifact=artifact)
+
+    assert summary['failed'] == 0
+    market_ok = {r['ticker']: r['market_data'] for r in summary['results']}
+    assert market_ok == {'AX-UN.TO': False, 'REI-UN.TO': True, 'AP-UN.TO': True}
+
+    with open(next(j['output'] for j in jobs if j['ticker'] == 'AX-UN.TO'), 'r') as f:
+        enriched = json.load(f)
+    assert enriched['market_risk']['error'] == 'Market data unavailable'
+    assert 'error' not in enriched['distribution_cut_prediction']
+
+
+def test_unreadable_phase3_is_reported_not_fatal(issuer_reports, artifact, macro_monitor, tmp_path):
+    """A job with a missing Phase 3 file is a failure; other issuers are written"""
+    jobs = _jobs(issuer_reports) + [{'phase3': str(tmp_path / 'missing.json'), 'ticker': 'HR-UN.TO',
+                                     'output': str(tmp_path / 'out.json')}]
+    summary = enrich_portfolio(jobs, collector=_collector(StubProvider()), macro_monitor=macro_monitor,
+                               artifact=artifact)
+
+    assert summary['total'] == len(ISSUERS) + 1
+    assert summary['succeeded'] == len(ISSUERS)
+    assert [f['ticker'] for f in summary['failures']] == ['HR-UN.TO']
+    assert not (tmp_path / 'out.json').exists()
+
+
+def test_discover_jobs_from_glob_resolves_tickers(issuer_reports):
+    """Folder names map to tickers (exact or unique prefix); unknown issuers are skipped"""
+    unknown = issuer_reports / 'Unknown_Trust' / 'temp'
+    unknown.mkdir(parents=True)
+    (unknown / 'phase3_calculated_metrics.json').write_text('{}')
+
+    jobs, skipped = discover_enrichment_jobs(str(issuer_reports / '*' / 'temp' / 'phase3_calculated_metrics.json'))
+
+    assert {Path(j['phase3']).parent.parent.name: j['ticker'] for j in jobs} == {
+        folder: ticker for folder, (ticker, _) in ISSUERS.items()}
+    assert all(Path(j['output']).name == 'phase4_enriched_data.json' for j in jobs)
+    assert skipped == [str(unknown / 'phase3_calculated_metrics.json')]
+
+
+def test_discover_jobs_from_manifest(issuer_reports):
+    """Manifest paths resolve against the manifest directory; bad entries raise"""
+    manifest = issuer_reports / 'manifest.json'
+    manifest.write_text(json.dumps([
+        {'phase3': 'Artis_REIT/temp/phase3_calculated_metrics.json', 'ticker': 'AX-UN.TO'},
+        {'phase3': 'RioCan_REIT/temp/phase3_calculated_metrics.json', 'ticker': 'REI-UN.TO',
+         'output': 'out/riocan.json'},
+    ]))
+
+    jobs, skipped = discover_enrichment_jobs(str(manifest))
+
+    assert skipped == []
+    assert jobs[0]['output'] == str(issuer_reports / 'Artis_REIT' / 'temp' / 'phase4_enriched_data.json')
+    assert jobs[1]['output'] == str(issuer_reports / 'out' / 'riocan.json')
+
+    manifest.write_text(json.dumps([{'phase3': 'Artis_REIT/temp/phase3_calculated_metrics.json'}]))
+    with pytest.raises(ValueError):
+        discover_enrichment_jobs(str(manifest))
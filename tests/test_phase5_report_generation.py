@@ -840,5 +840,261 @@ These securities are subordinate to senior debt but rank ahead of common units.
         assert 'Not applicable' in perpetual_securities or 'not applicable' in perpetual_securities.lower()
 
 
+
+class TestPhase5TemplateRendering:
+    """Test the compiled single-pass template renderer"""
+
+    def test_compile_template_splits_literals_and_keys(self):
+        """Template is split into alternating literal and placeholder segments"""
+        from generate_final_report import compile_template
+
+        literals, keys = compile_template("# {{ISSUER_NAME}}\n\nDebt: {{TOTAL_DEBT}} {{CURRENCY}}")
+
+        assert keys == ('ISSUER_NAME', 'TOTAL_DEBT', 'CURRENCY')
+        assert literals == ('# ', '\n\nDebt: ', ' ', '')
+
+    def test_compile_template_is_cached(self):
+        """Compiling the same template twice returns the cached segments"""
+        from generate_final_report import compile_template, load_template
+
+        template = load_template()
+
+        assert compile_template(template) is compile_template(template)
+
+    def test_render_matches_sequential_replace(self):
+        """Single-pass render produces the same output as per-key str.replace"""
+        from generate_final_report import compile_template, load_template, render_template
+
+        template = load_template()
+        _, keys = compile_template(template)
+        replacements = {key: f"<{key.lower()}>" for key in keys}
+
+        expected = template
+        for key, value in replacements.items():
+            expected = expected.replace(f"{{{{{key}}}}}", value)
+
+        report, unresolved = render_template(template, replacements)
+
+        assert report == expected
+        assert unresolved == []
+
+    def test_render_reports_unresolved_placeholders(self):
+        """Missing keys stay in the report and are returned to the caller"""
+        from generate_final_report import render_template
+
+        report, unresolved = render_template(
+            "{{A}} {{MISSING}} {{B}} {{MISSING}}",
+            {'A': 1, 'B': None}
+        )
+
+        assert report == "1 {{MISSING}} None {{MISSING}}"
+        assert unresolved == ['MISSING']
+
+    def test_render_does_not_rescan_values(self):
+        """Placeholder-like text inside a substituted value is emitted verbatim"""
+        from generate_final_report import render_template
+
+        report, unresolved = render_template(
+            "{{EXECUTIVE_SUMMARY}} / {{ISSUER_NAME}}",
+            {'EXECUTIVE_SUMMARY': 'See {{ISSUER_NAME}}', 'ISSUER_NAME': 'Test REIT'}
+        )
+
+        assert report == "See {{ISSUER_NAME}} / Test REIT"
+        assert unresolved == []
+
+
+    def test_render_resolves_callables_lazily(self):
+        """Callable values run only for referenced keys, once per render"""
+        from generate_final_report import render_template
+
+        calls = []
+
+        def resolver(name):
+            def resolve():
+                calls.append(name)
+                return name.lower()
+            return resolve
+
+        report, unresolved = render_template(
+            "{{USED}} and {{USED}} again",
+            {'USED': resolver('USED'), 'UNUSED': resolver('UNUSED')}
+        )
+
+        assert report == "used and used again"
+        assert calls == ['USED']
+        assert unresolved == []
+
+    def test_slim_template_skips_unreferenced_sections(self, monkeypatch):
+        """Reconciliation tables are not built when the template omits them"""
+        import generate_final_report as gfr
+
+        calls = []
+        monkeypatch.setattr(gfr, 'generate_ffo_affo_reconciliation', lambda data: calls.append('ffo_affo'))
+        monkeypatch.setattr(gfr, 'generate_acfo_reconciliation', lambda data: calls.append('acfo'))
+
+        metrics = {
+            'schema_version': '2.0.0',
+            'issuer_name': 'Test REIT',
+            'reporting_period': {'period_label': 'Q2 2025'},
+            'leverage_metrics': {'debt_to_assets_percent': 30.0},
+        }
+        analysis_sections = {'1. Credit Opinion Summary': 'Test summary'}
+
+        slim = "{{ISSUER_NAME}}: {{DEBT_TO_ASSETS}}% | {{PRED_DRIVER_1_NAME}}"
+        report = gfr.generate_final_report(metrics, analysis_sections, slim, None)
+
+        assert report == "Test REIT: 30.0% | N/A"
+        assert calls == []
+
+        gfr.generate_final_report(
+            metrics, analysis_sections,
+            "{{FFO_AFFO_RECONCILIATION_TABLE}}{{FFO_AFFO_RECONCILIATION_TABLE_DETAILED}}", None
+        )
+        assert calls == ['ffo_affo']
+
+
+
+class TestPhase5BatchMode:
+    """Test --batch report generation (one template load, many issuers)"""
+
+    @pytest.fixture
+    def issuer_tree(self, tmp_path):
+        """Issuer_Reports/{issuer}/temp/ folders: two renderable, one bad schema, one empty"""
+        import copy
+        from calculate_credit_metrics import calculate_all_metrics
+
+        fixtures = Path(__file__).parent / 'fixtures'
+        with open(fixtures / 'dream_industrial_reit_q2_2025_with_acfo.json') as f:
+            phase2 = json.load(f)
+        metrics = calculate_all_metrics(copy.deepcopy(phase2))
+        metrics['schema_version'] = '2.0.0'
+        analysis = (fixtures / 'phase4_sample_analysis.md').read_text()
+
+        root = tmp_path / 'Issuer_Reports'
+        for name, schema in (('Alpha_REIT', '2.0.0'), ('Beta_REIT', '2.0.0'), ('Gamma_REIT', '1.0')):
+            temp = root / name / 'temp'
+            temp.mkdir(parents=True)
+            issuer_metrics = dict(metrics, issuer_name=name.replace('_', ' '), schema_version=schema)
+            (temp / 'phase3_calculated_metrics.json').write_text(json.dumps(issuer_metrics))
+            (temp / 'phase4_credit_analysis.md').write_text(analysis)
+        (root / 'Alpha_REIT' / 'temp' / 'phase2_extracted_data.json').write_text(json.dumps(phase2))
+        (root / 'Empty_REIT' / 'temp').mkdir(parents=True)
+
+        return root
+
+    def test_discover_jobs_from_glob(self, issuer_tree):
+        """Glob over temp/ folders finds issuers with Phase 3 output and skips the rest"""
+        from generate_final_report import discover_batch_jobs
+
+        jobs, skipped = discover_batch_jobs(str(issuer_tree / '*' / 'temp'))
+
+        assert [Path(j['metrics']).parent.parent.name for j in jobs] == ['Alpha_REIT', 'Beta_REIT', 'Gamma_REIT']
+        assert all(j['analysis'].endswith('phase4_credit_analysis.md') for j in jobs)
+        assert len(skipped) == 1 and 'Empty_REIT' in skipped[0]
+
+    def test_discover_jobs_prefers_enriched_metrics(self, issuer_tree):
+        """phase4_enriched_data.json wins over the legacy enriched name and the Phase 3 metrics"""
+        from generate_final_report import discover_batch_jobs
+
+        alpha, beta = issuer_tree / 'Alpha_REIT' / 'temp', issuer_tree / 'Beta_REIT' / 'temp'
+        for temp in (alpha, beta):
+            (temp / 'phase3_enriched_data.json').write_text((temp / 'phase3_calculated_metrics.json').read_text())
+        (alpha / 'phase4_enriched_data.json').write_text((alpha / 'phase3_calculated_metrics.json').read_text())
+
+        jobs, _ = discover_batch_jobs(str(issuer_tree / '*' / 'temp'))
+
+        assert [Path(j['metrics']).name for j in jobs] == [
+            'phase4_enriched_data.json', 'phase3_enriched_data.json', 'phase3_calculated_metrics.json']
+
+    def test_discover_jobs_from_manifest(self, issuer_tree, tmp_path):
+        """Manifest entries may be temp/ folders or explicit metrics/analysis/output paths"""
+        from generate_final_report import discover_batch_jobs
+
+        manifest = tmp_path / 'manifest.json'
+        manifest.write_text(json.dumps([
+            'Issuer_Reports/Alpha_REIT/temp',
+            {
+                'metrics': 'Issuer_Reports/Beta_REIT/temp/phase3_calculated_metrics.json',
+                'analysis': 'Issuer_Reports/Beta_REIT/temp/phase4_credit_analysis.md',
+                'output': 'out/beta.md',
+            },
+        ]))
+
+        jobs, skipped = discover_batch_jobs(str(manifest))
+
+        assert len(jobs) == 2
+        assert skipped == []
+        assert jobs[0]['metrics'] == str(tmp_path / 'Issuer_Reports/Alpha_REIT/temp/phase3_calculated_metrics.json')
+        assert jobs[1]['output'] == str(tmp_path / 'out/beta.md')
+
+    def test_run_batch_reports_successes_and_failures(self, issuer_tree):
+        """Each issuer renders independently; failures are recorded, not raised"""
+        from generate_final_report import discover_batch_jobs, load_template, run_batch, summarize_batch
+
+        jobs, skipped = discover_batch_jobs(str(issuer_tree / '*' / 'temp'))
+        results = run_batch(jobs, load_template(), '2025-01-01_120000', workers=1)
+        summary = summarize_batch(results, skipped, 'credit_opinion_template.md', 1.0)
+
+        assert [r['status'] for r in results] == ['success', 'success', 'failed']
+        assert summary['succeeded'] == 2
+        assert summary['failed'] == 1
+        assert 'schema v2.0.0' in summary['failures'][0]['error']
+
+        alpha_report = Path(results[0]['output'])
+        assert alpha_report == issuer_tree / 'Alpha_REIT' / 'reports' / '2025-01-01_120000_Credit_Opinion_Alpha_REIT.md'
+        assert 'Alpha REIT' in alpha_report.read_text()
+        assert all(r['seconds'] >= 0 for r in results)
+
+    def test_run_batch_keeps_same_issuer_reports_apart(self, issuer_tree, tmp_path):
+        """Jobs sharing a default path get numbered filenames; new output folders are created"""
+        from generate_final_report import discover_batch_jobs, load_template, run_batch
+
+        manifest = tmp_path / 'manifest.json'
+        manifest.write_text(json.dumps([
+            'Issuer_Reports/Alpha_REIT/temp',
+            'Issuer_Reports/Beta_REIT/temp',
+            'Issuer_Reports/Alpha_REIT/temp',
+            {
+                'metrics': 'Issuer_Reports/Beta_REIT/temp/phase3_calculated_metrics.json',
+                'analysis': 'Issuer_Reports/Beta_REIT/temp/phase4_credit_analysis.md',
+                'output': 'new/folder/beta.md',
+            },
+        ]))
+
+        jobs, _ = discover_batch_jobs(str(manifest))
+        results = run_batch(jobs, load_template(), '2025-01-01_120000', workers=1)
+
+        assert [r['status'] for r in results] == ['success'] * 4
+        reports = issuer_tree / 'Alpha_REIT' / 'reports'
+        assert [Path(r['output']) for r in results] == [
+            reports / '2025-01-01_120000_Credit_Opinion_Alpha_REIT_1.md',
+            issuer_tree / 'Beta_REIT' / 'reports' / '2025-01-01_120000_Credit_Opinion_Beta_REIT.md',
+            reports / '2025-01-01_120000_Credit_Opinion_Alpha_REIT_3.md',
+            tmp_path / 'new' / 'folder' / 'beta.md',
+        ]
+        assert all(Path(r['output']).exists() for r in results)
+        assert 'output' not in jobs[0]
+
+    def test_batch_cli_writes_summary(self, issuer_tree, tmp_path):
+        """--batch renders every issuer, writes a summary and exits non-zero on failures"""
+        import subprocess
+
+        script = Path(__file__).parent.parent / 'scripts' / 'generate_final_report.py'
+        summary_path = tmp_path / 'summary.json'
+
+        result = subprocess.run(
+            [sys.executable, str(script), '--batch', str(issuer_tree / '*' / 'temp'),
+             '--workers', '2', '--summary', str(summary_path)],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 1, result.stdout + result.stderr
+        summary = json.loads(summary_path.read_text())
+        assert summary['total'] == 3
+        assert summary['succeeded'] == 2
+        assert len(list(issuer_tree.glob('*/reports/*_Credit_Opinion_*.md'))) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
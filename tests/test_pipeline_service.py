@@ -0,0 +1,299 @@
+"""
+Tests for the warm pipeline service (scripts/pipeline_service.py)
+
+Runs offline on an ephemeral localhost port (and a Unix socket where
+available): market prices come from a stub provider, macro series from the
+fixture backend, and Phase 3 results are cached in a temporary directory.
+Job results must match what the per-phase CLIs compute.
+"""
+
+import json
+import os
+import shutil
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+pytest.importorskip('sklearn')
+
+from calculate_credit_metrics import MetricsCache, calculate_all_metrics
+from enrich_phase4_data import Phase4DataEnricher, load_prediction_model
+from macro_series_cache import FixtureMacroBackend, MacroSeriesCache
+from openbb_macro_monitor import EnhancedMacroMonitor
+from openbb_market_monitor import AsyncMarketDataCollector
+from pipeline_service import PathNotAllowedError, PipelineClient, PipelineService, make_server
+
+
+REPO_ROOT = Path(__file__).parent.parent
+FIXTURES = Path(__file__).parent / 'fixtures'
+MODEL_FILE = REPO_ROOT / 'models' / 'distribution_cut_logistic_regression_v2.2.pkl'
+
+
+def stub_prices(symbol, provider, start_date, end_date):
+    dates = pd.bdate_range(start_date, end_date)
+    rng = np.random.default_rng(sum(map(ord, symbol)))
+    close = 12 * np.exp(np.cumsum(rng.normal(-0.001, 0.015, len(dates))))
+    return pd.DataFrame({'close': close, 'volume': rng.integers(10_000, 90_000, len(dates))},
+                        index=pd.Index(dates, name='date'))
+
+
+@pytest.fixture(scope='module')
+def artifact():
+    if not MODEL_FILE.exists():
+        pytest.skip('v2.2 model not available')
+    return load_prediction_model(MODEL_FILE)
+
+
+@pytest.fixture
+def service(tmp_path, artifact):
+    collector = AsyncMarketDataCollector(provider='tmx', fetcher=stub_prices, rate_limits={},
+                                         max_retries=0, backoff_seconds=0)
+    macro_monitor = EnhancedMacroMonitor(
+        MacroSeriesCache(tmp_path / 'macro', backend=FixtureMacroBackend(FIXTURES / 'macro')))
+    service = PipelineService(artifact=artifact, workers=2, metrics_cache=MetricsCache(tmp_path / 'phase3'),
+                              collector=collector, macro_monitor=macro_monitor,
+                              output_root=tmp_path / 'Issuer_Reports')
+    yield service.warm()
+    service.shutdown()
+
+
+@pytest.fixture
+def client(service):
+    server = make_server(service, port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield PipelineClient(port=server.server_address[1], timeout=30)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def issuer_temp(tmp_path):
+    """Issuer_Reports/Artis_REIT/temp with Phase 2, Phase 3 and Phase 4 inputs"""
+    temp = tmp_path / 'Issuer_Reports' / 'Artis_REIT' / 'temp'
+    temp.mkdir(parents=True)
+    shutil.copy(FIXTURES / 'sample_extracted_data.json', temp / 'phase2_extracted_data.json')
+    shutil.copy(FIXTURES / 'phase3_artis_reit_metrics.json', temp / 'phase3_calculated_metrics.json')
+    shutil.copy(FIXTURES / 'phase4_sample_analysis.md', temp / 'phase4_credit_analysis.md')
+    return temp
+
+
+def test_phase3_job_matches_calculate_all_metrics(client, issuer_temp, tmp_path):
+    """Phase 3 over HTTP equals the library result; the second run is a cache hit"""
+    with open(FIXTURES / 'sample_extracted_data.json', 'r') as f:
+        expected = calculate_all_metrics(json.load(f))
+    output = issuer_temp / 'metrics.json'
+
+    status, first = client.submit('phase3', {'phase2': str(issuer_temp / 'phase2_extracted_data.json'),
+                                             'output': str(output)})
+    _, second = client.submit('phase3', {'phase2': str(issuer_temp / 'phase2_extracted_data.json')})
+
+    assert status == 200 and first['status'] == 'done'
+    assert first['result']['metrics'] == json.loads(json.dumps(expected))
+    assert json.loads(output.read_text()) == first['result']['metrics']
+    assert (first['result']['cache_hit'], second['result']['cache_hit']) == (False, True)
+    assert second['result']['output'] == str(issuer_temp / 'phase3_calculated_metrics.json')
+
+
+def test_predict_job_matches_enricher(client, artifact):
+    """Single and batched predictions equal Phase4DataEnricher.run_prediction_model()"""
+    paths = [str(FIXTURES / 'phase3_artis_reit_metrics.json'), str(FIXTURES / 'sample_calculated_metrics.json')]
+
+    _, single = client.submit('predict', {'phase3': paths[0], 'ticker': 'AX-UN.TO'})
+    _, batch = client.submit('predict', {'issuers': [{'phase3': p, 'ticker': 'T'} for p in paths]})
+
+    for path, prediction in zip(paths, batch['result']['predictions']):
+        expected = Phase4DataEnricher(path, 'T', artifact=artifact).run_prediction_model({}, {})
+        assert {k: v for k, v in prediction.items() if k != 'ticker'} == json.loads(json.dumps(expected))
+    assert single['result']['predictions'][0]['ticker'] == 'AX-UN.TO'
+    assert single['result']['predictions'][0]['cut_probability_pct'] == \
+        batch['result']['predictions'][0]['cut_probability_pct']
+
+
+def test_report_job_renders_with_resident_template(client, service, issuer_temp, tmp_path):
+    """Phase 3 then Phase 5 in the service; the report renders from the warm template"""
+    _, phase3 = client.submit('phase3', {'phase2': str(issuer_temp / 'phase2_extracted_data.json')})
+    metrics = dict(phase3['result']['metrics'], schema_version='2.0.0')
+    (issuer_temp / 'phase3_calculated_metrics.json').write_text(json.dumps(metrics))
+
+    status, record = client.submit('report', {'metrics': str(issuer_temp / 'phase3_calculated_metrics.json'),
+                                              'analysis': str(issuer_temp / 'phase4_credit_analysis.md'),
+                                              'output': str(issuer_temp.parent / 'reports' / 'report.md')})
+
+    assert status == 200, record['error']
+    assert record['result']['issuer'] == 'Sample Real Estate Investment Trust'
+    assert record['result']['characters'] == len((issuer_temp.parent / 'reports' / 'report.md').read_text())
+    assert service.stats()['resident']['templates'] == ['credit_opinion_template.md']
+
+
+def test_template_reloaded_only_when_changed(artifact, tmp_path):
+    """The cached template is reused until the file's mtime changes"""
+    template_dir = tmp_path / 'templates'
+    template_dir.mkdir()
+    template = template_dir / 'slim.md'
+    template.write_text('# {{ISSUER_NAME}}\n')
+    service = PipelineService(artifact=artifact, template_dir=template_dir,
+                              metrics_cache=MetricsCache(tmp_path / 'phase3'))
+    mtime = template.stat().st_mtime_ns
+
+    assert service.template('slim.md') == '# {{ISSUER_NAME}}\n'
+    template.write_text('# Credit Opinion: {{ISSUER_NAME}}\n')
+    os.utime(template, ns=(mtime, mtime))
+    assert service.template('slim.md') == '# {{ISSUER_NAME}}\n'
+
+    os.utime(template, ns=(mtime, mtime + 10**9))
+    assert service.template('slim.md') == '# Credit Opinion: {{ISSUER_NAME}}\n'
+    with pytest.raises(FileNotFoundError):
+        service.template('missing.md')
+    (tmp_path / 'secret.md').write_text('outside')
+    for name in ('../secret.md', str(tmp_path / 'secret.md')):
+        with pytest.raises(PathNotAllowedError):
+            service.template(name)
+    service.shutdown()
+
+
+def test_enrich_job_runs_offline(client, issuer_temp, artifact):
+    """Enrichment uses the resident collector, macro monitor and model"""
+    status, record = client.submit('enrich', {'phase3': str(issuer_temp / 'phase3_calculated_metrics.json'),
+                                              'ticker': 'AX-UN.TO'})
+
+    assert status == 200
+    assert record['result']['succeeded'] == 1
+    with open(issuer_temp / 'phase4_enriched_data.json', 'r') as f:
+        enriched = json.load(f)
+    assert enriched['metadata']['ticker'] == 'AX-UN.TO'
+    assert 'error' not in enriched['market_risk']
+    assert enriched['macro_environment']['canada']['policy_rate']['current_rate'] == 2.5
+
+
+def test_stats_report_counts_latency_and_queue(client):
+    """Stats track per-type counts, failures and latency; the queue drains"""
+    path = str(FIXTURES / 'sample_calculated_metrics.json')
+    for _ in range(5):
+        client.submit('predict', {'phase3': path})
+    status, failed = client.submit('predict', {'phase3': '/nonexistent/phase3.json'})
+
+    assert status == 422 and failed['status'] == 'failed'
+    assert 'FileNotFoundError' in failed['error']
+
+    _, stats = client.stats()
+    predict = stats['jobs']['predict']
+    assert (predict['completed'], predict['failed']) == (5, 1)
+    assert set(predict['latency_ms']) == {'mean', 'p50', 'p95', 'max', 'last'}
+    assert predict['latency_ms']['p50'] <= predict['latency_ms']['p95'] <= predict['latency_ms']['max']
+    assert stats['queue_depth'] == 0 and stats['in_flight'] == 0
+    assert stats['resident']['model_version'] == '2.1'
+    assert stats['jobs']['report']['latency_ms'] is None
+
+
+def test_warm_prediction_is_sub_second(client):
+    """Warm predictions return well under a second round-trip"""
+    path = str(FIXTURES / 'sample_calculated_metrics.json')
+    client.submit('predict', {'phase3': path})
+
+    start = time.perf_counter()
+    status, _ = client.submit('predict', {'phase3': path})
+    assert status == 200
+    assert time.perf_counter() - start < 1.0
+
+
+def test_async_submit_and_poll(client):
+    """?wait=0 returns 202 with a job id that can be polled"""
+    status, record = client.submit('predict', {'phase3': str(FIXTURES / 'sample_calculated_metrics.json')},
+                                   wait=False)
+    assert status == 202
+
+    for _ in range(200):
+        _, polled = client.job(record['id'])
+        if polled['status'] in ('done', 'failed'):
+            break
+        time.sleep(0.01)
+    assert polled['status'] == 'done'
+    assert client.job('missing')[0] == 404
+
+
+def test_invalid_requests(client):
+    """Unknown job types 404, malformed payloads 400, bad endpoints 404"""
+    assert client.submit('train', {})[0] == 404
+    assert client.submit('report', {'metrics': 'x.json'})[0] == 422
+    assert client.request('POST', '/jobs/predict', [1, 2])[0] == 400
+    assert client.request('GET', '/nope')[0] == 404
+    assert client.health() == (200, {'status': 'ok', 'model_version': '2.1'})
+
+
+def test_requests_are_restricted_to_local_json_and_issuer_reports(client, issuer_temp, tmp_path):
+    """Non-JSON bodies 415, foreign Host headers 403, outputs outside Issuer_Reports/ 403"""
+    import http.client
+
+    def post(headers, body=b'{}'):
+        conn = http.client.HTTPConnection(client.host, client.port, timeout=30)
+        try:
+            conn.request('POST', '/jobs/predict', body=body, headers=headers)
+            return conn.getresponse().status
+        finally:
+            conn.close()
+
+    assert post({'Content-Type': 'text/plain'}) == 415
+    assert post({}) == 415
+    assert post({'Content-Type': 'application/json', 'Host': 'attacker.example:8765'}) == 403
+    assert post({'Content-Type': 'application/json; charset=utf-8', 'Host': 'localhost'}) == 422
+
+    phase2 = str(issuer_temp / 'phase2_extracted_data.json')
+    for output in (tmp_path / 'metrics.json', issuer_temp / '..' / '..' / '..' / 'metrics.json'):
+        status, body = client.submit('phase3', {'phase2': phase2, 'output': str(output)})
+        assert status == 403 and 'output must be under' in body['error']
+    status, body = client.submit('enrich', {'jobs': [{'phase3': phase2, 'ticker': 'T', 'output': '/tmp/x.json'}]})
+    assert status == 403
+    assert not (tmp_path / 'metrics.json').exists()
+
+
+def test_default_outputs_and_templates_stay_inside_their_roots(client, service, issuer_temp, tmp_path):
+    """Outputs derived from input paths or manifests are checked like explicit ones"""
+    outside = tmp_path / 'outside' / 'temp'
+    outside.mkdir(parents=True)
+    for name in ('phase2_extracted_data.json', 'phase3_calculated_metrics.json', 'phase4_credit_analysis.md'):
+        shutil.copy(issuer_temp / name, outside / name)
+
+    assert client.submit('phase3', {'phase2': str(outside / 'phase2_extracted_data.json')})[0] == 403
+    assert client.submit('enrich', {'phase3': str(outside / 'phase3_calculated_metrics.json'), 'ticker': 'T'})[0] == 403
+    manifest = tmp_path / 'Issuer_Reports' / 'manifest.json'
+    manifest.write_text(json.dumps([{'phase3': str(outside / 'phase3_calculated_metrics.json'), 'ticker': 'T'}]))
+    assert client.submit('enrich', {'batch': str(manifest)})[0] == 403
+    report = {'metrics': str(issuer_temp / 'phase3_calculated_metrics.json'),
+              'analysis': str(issuer_temp / 'phase4_credit_analysis.md')}
+    assert client.submit('report', dict(report, template='../../../etc/passwd'))[0] == 403
+    with pytest.raises(PathNotAllowedError):
+        service.submit('phase3', {'phase2': str(outside / 'phase2_extracted_data.json')})
+
+    status, record = client.submit('report', dict(report, metrics=str(outside / 'phase3_calculated_metrics.json')))
+    assert status == 422 and 'PathNotAllowedError' in record['error']
+    assert sorted(p.name for p in outside.parent.rglob('*') if p.is_file()) == \
+        ['phase2_extracted_data.json', 'phase3_calculated_metrics.json', 'phase4_credit_analysis.md']
+    assert not (outside.parent / 'reports').exists()
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Unix sockets not available')
+def test_unix_socket_server(service, tmp_path):
+    """The same API is served over a Unix socket"""
+    socket_path = tmp_path / 'pipeline.sock'
+    server = make_server(service, socket_path=str(socket_path), quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = PipelineClient(socket_path=str(socket_path), timeout=30)
+        status, record = client.submit('predict', {'phase3': str(FIXTURES / 'sample_calculated_metrics.json')})
+        assert status == 200 and record['status'] == 'done'
+        assert client.stats()[1]['jobs']['predict']['completed'] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not socket_path.exists()